@@ -0,0 +1,136 @@
+"""Benchmark cases for the convert / write / read / inspect paths.
+
+Every case is a module-level function returning a BenchmarkResult, so that
+harness.run_isolated() can run it in a fresh worker process. Input bags are
+synthetic (scripts.synthetic_bag) and deterministic, so results of different
+runs and machines measure the same work.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.harness import BenchmarkResult, peak_rss_mb
+from scripts.synthetic_bag import SyntheticBagConfig, duration_for_size, generate_synthetic_bag
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+_MB = 1024 * 1024
+
+
+def prepare_bag(work_dir: Path, size_mb: int) -> Path:
+    """Generate (or reuse) the synthetic bag of about size_mb megabytes"""
+    bag_path = work_dir / f"synthetic_{size_mb}mb.bag"
+    if not bag_path.exists():
+        config = SyntheticBagConfig()
+        config.duration_sec = duration_for_size(config, size_mb * _MB)
+        generate_synthetic_bag(bag_path, config)
+    return bag_path
+
+
+def bench_convert(bag_path: Path, vrs_path: Path, name: str) -> BenchmarkResult:
+    """RosbagToVRSConverter.convert() throughput (RGB-D + IMU, no source hash)"""
+    from scripts.rosbag_to_vrs_converter import RosbagToVRSConverter, create_rgbd_imu_config
+
+    vrs_path.unlink(missing_ok=True)
+    config = create_rgbd_imu_config(imu_batch_size=16)
+    config.hash_source = False  # Hashing is I/O bound and measured by the read cases
+
+    start = time.perf_counter()
+    conversion = RosbagToVRSConverter(bag_path, vrs_path, config).convert()
+    elapsed = time.perf_counter() - start
+
+    result = BenchmarkResult(name=name, params={"bag_mb": conversion.input_bag_size / _MB})
+    result.add("seconds", elapsed, "s")
+    mb_per_sec = conversion.input_bag_size / _MB / elapsed
+    result.add("mb_per_sec", mb_per_sec, "MB/s", higher_is_better=True)
+    messages_per_sec = conversion.total_messages / elapsed
+    result.add("messages_per_sec", messages_per_sec, "msg/s", higher_is_better=True)
+    result.add("output_mb", conversion.output_vrs_size / _MB, "MB")
+    return result
+
+
+def bench_write_latency(
+    vrs_path: Path, payload_bytes: int, records: int, name: str
+) -> BenchmarkResult:
+    """VRSWriter.write_data latency for one payload size"""
+    from scripts.vrs_writer import VRSWriter
+
+    payload = np.random.default_rng(0).integers(0, 256, payload_bytes, dtype=np.uint8).tobytes()
+    latencies = np.empty(records)
+
+    vrs_path.unlink(missing_ok=True)
+    with VRSWriter(str(vrs_path)) as writer:
+        writer.add_stream(1001, "Benchmark|id:1001")
+        writer.write_configuration(1001, {"payload_bytes": payload_bytes})
+        start = time.perf_counter()
+        for i in range(records):
+            record_start = time.perf_counter()
+            writer.write_data(1001, i / 30.0, payload)
+            latencies[i] = time.perf_counter() - record_start
+        write_seconds = time.perf_counter() - start
+        close_start = time.perf_counter()
+    close_seconds = time.perf_counter() - close_start
+
+    result = BenchmarkResult(name=name, params={"payload_bytes": payload_bytes, "records": records})
+    result.add("mean_us", latencies.mean() * 1e6, "us")
+    result.add("p50_us", np.percentile(latencies, 50) * 1e6, "us")
+    result.add("p95_us", np.percentile(latencies, 95) * 1e6, "us")
+    mb_per_sec = payload_bytes * records / _MB / write_seconds
+    result.add("mb_per_sec", mb_per_sec, "MB/s", higher_is_better=True)
+    result.add("close_seconds", close_seconds, "s")
+    return result
+
+
+def bench_read(vrs_path: Path, lookups: int, name: str) -> BenchmarkResult:
+    """VRSReader open, configuration lookup and read_data_records() of every stream"""
+    from scripts.vrs_reader import VRSReader
+
+    start = time.perf_counter()
+    with VRSReader(vrs_path) as reader:
+        open_seconds = time.perf_counter() - start
+        stream_ids = reader.get_stream_ids()
+
+        lookup_start = time.perf_counter()
+        for _ in range(lookups):
+            for stream_id in stream_ids:
+                reader.read_configuration(stream_id)
+        lookup_seconds = time.perf_counter() - lookup_start
+
+        records = 0
+        payload_bytes = 0
+        read_start = time.perf_counter()
+        for stream_id in stream_ids:
+            for record in reader.read_data_records(stream_id):
+                records += 1
+                payload_bytes += len(record["data"])
+        read_seconds = time.perf_counter() - read_start
+
+    result = BenchmarkResult(name=name, params={"streams": len(stream_ids), "records": records})
+    result.add("open_seconds", open_seconds, "s")
+    result.add("config_lookup_us", lookup_seconds / max(lookups * len(stream_ids), 1) * 1e6, "us")
+    result.add("read_seconds", read_seconds, "s")
+    result.add("records_per_sec", records / read_seconds, "records/s", higher_is_better=True)
+    result.add("read_mb_per_sec", payload_bytes / _MB / read_seconds, "MB/s", higher_is_better=True)
+    return result
+
+
+def bench_inspect(vrs_path: Path, name: str) -> BenchmarkResult:
+    """inspect_vrs.py wall time (peak RSS is the inspect process's)"""
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, str(REPO_ROOT / "inspect_vrs.py"), str(vrs_path)],
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(f"inspect_vrs.py failed: {completed.stderr.strip()}")
+
+    result = BenchmarkResult(name=name)
+    result.add("seconds", elapsed, "s")
+    result.add("inspect_peak_rss_mb", peak_rss_mb(children=True), "MB")
+    return result
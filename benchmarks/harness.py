@@ -0,0 +1,186 @@
+"""Benchmark harness: isolated runs, peak RSS, JSON results and baseline comparison.
+
+Each benchmark case runs in a fresh (spawned) worker process, so its peak
+resident set size is measured without the memory of earlier cases. Results
+are plain JSON so they can be stored as a baseline and compared later; every
+metric records whether higher or lower values are better. Follows the Single
+Responsibility Principle (SRP) by focusing solely on running and comparing
+benchmarks, not on what is measured.
+"""
+
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import traceback
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+RESULTS_FORMAT_VERSION = 1
+
+# Default relative change that counts as a regression
+DEFAULT_THRESHOLD = 0.10
+
+
+@dataclass
+class Metric:
+    """One measured value"""
+    value: float
+    unit: str
+    higher_is_better: bool = False
+
+
+@dataclass
+class BenchmarkResult:
+    """Metrics of one benchmark case (e.g. "convert[100MB]")"""
+    name: str
+    params: dict[str, Any] = field(default_factory=dict)
+    metrics: dict[str, Metric] = field(default_factory=dict)
+    error: str | None = None  # Set when the case failed or was skipped
+
+    def add(self, name: str, value: float, unit: str, higher_is_better: bool = False) -> None:
+        """Add a metric"""
+        self.metrics[name] = Metric(float(value), unit, higher_is_better)
+
+
+@dataclass
+class Regression:
+    """A metric that got worse than its baseline by more than the threshold"""
+    benchmark: str
+    metric: str
+    baseline: float
+    current: float
+    change: float  # Relative change in the "worse" direction (0.25 = 25% worse)
+
+
+def peak_rss_mb(children: bool = False) -> float:
+    """Get the peak resident set size of this process (or of its finished children) in MB."""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return usage.ru_maxrss / scale
+
+
+def _run_case(
+    name: str, func: Callable[..., BenchmarkResult], args: tuple[Any, ...]
+) -> BenchmarkResult:
+    """Worker entry point: run a case and add its peak RSS"""
+    try:
+        result = func(*args)
+    except Exception as e:
+        return BenchmarkResult(
+            name=name, error=f"{type(e).__name__}: {e}\n{traceback.format_exc()}"
+        )
+    result.add("peak_rss_mb", max(peak_rss_mb(), peak_rss_mb(children=True)), "MB")
+    return result
+
+
+def run_isolated(name: str, func: Callable[..., BenchmarkResult], *args: Any) -> BenchmarkResult:
+    """
+    Run a benchmark case in a fresh worker process
+
+    Args:
+        name: Case name (used if the case fails before returning a result)
+        func: Module-level function returning a BenchmarkResult
+        *args: Picklable arguments for func
+
+    Returns:
+        The case result with a "peak_rss_mb" metric, or a result with error set
+    """
+    context = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            return executor.submit(_run_case, name, func, args).result()
+    except Exception as e:  # Worker crashed (e.g. killed by the OOM killer)
+        return BenchmarkResult(name=name, error=f"{type(e).__name__}: {e}")
+
+
+def write_results(path: Path, results: list[BenchmarkResult], settings: dict[str, Any]) -> None:
+    """
+    Write results as JSON
+
+    Args:
+        path: Output file
+        results: Benchmark results
+        settings: Run settings stored alongside the results (sizes, repeats, ...)
+    """
+    document = {
+        "version": RESULTS_FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "machine": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "processor": platform.processor(),
+            "cpu_count": multiprocessing.cpu_count(),
+        },
+        "settings": settings,
+        "results": [asdict(result) for result in results],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+
+
+def load_results(path: Path) -> list[BenchmarkResult]:
+    """
+    Load results written by write_results()
+
+    Raises:
+        ValueError: If the file is not a benchmark results file
+        OSError: If the file cannot be read
+    """
+    with open(path, encoding="utf-8") as f:
+        try:
+            document = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid benchmark results '{path}': {e}") from e
+
+    if not isinstance(document, dict) or document.get("version") != RESULTS_FORMAT_VERSION:
+        raise ValueError(
+            f"'{path}' is not a benchmark results file (version {RESULTS_FORMAT_VERSION})"
+        )
+
+    return [
+        BenchmarkResult(
+            name=entry["name"],
+            params=entry.get("params", {}),
+            metrics={name: Metric(**metric) for name, metric in entry.get("metrics", {}).items()},
+            error=entry.get("error"),
+        )
+        for entry in document["results"]
+    ]
+
+
+def compare_results(
+    current: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Regression]:
+    """
+    Find metrics that are worse than the baseline by more than `threshold`
+
+    Cases or metrics missing on either side, failed cases and zero baselines
+    are not compared.
+    """
+    baseline_by_name = {result.name: result for result in baseline if result.error is None}
+    regressions = []
+    for result in current:
+        reference = baseline_by_name.get(result.name)
+        if result.error is not None or reference is None:
+            continue
+        for metric_name, metric in result.metrics.items():
+            base = reference.metrics.get(metric_name)
+            if base is None or base.value == 0:
+                continue
+            change = (metric.value - base.value) / abs(base.value)
+            if metric.higher_is_better:
+                change = -change
+            if change > threshold:
+                regressions.append(
+                    Regression(result.name, metric_name, base.value, metric.value, change)
+                )
+    return regressions
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+End-to-End Benchmark Suite
+
+Measure conversion, write, read and inspect performance on synthetic
+RealSense bags, write the results as JSON and optionally compare them with a
+stored baseline.
+
+Usage:
+    ./benchmarks/run_benchmarks.py
+    ./benchmarks/run_benchmarks.py --sizes 100 1000 10000 --output results.json
+    ./benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json
+"""
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+# Add repository root to path (for the benchmarks and scripts packages)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.cases import (  # noqa: E402
+    bench_convert,
+    bench_inspect,
+    bench_read,
+    bench_write_latency,
+    prepare_bag,
+)
+from benchmarks.harness import (  # noqa: E402
+    DEFAULT_THRESHOLD,
+    BenchmarkResult,
+    compare_results,
+    load_results,
+    run_isolated,
+    write_results,
+)
+
+DEFAULT_SIZES_MB = [10, 100]
+DEFAULT_PAYLOAD_SIZES = [1024, 64 * 1024, 1024 * 1024, 4 * 1024 * 1024]
+
+
+def run_suite(
+    work_dir: Path,
+    sizes_mb: list[int],
+    payload_sizes: list[int],
+    write_records: int,
+    lookups: int,
+) -> list[BenchmarkResult]:
+    """Run all benchmark cases and print one line per case"""
+    results: list[BenchmarkResult] = []
+
+    def record(result: BenchmarkResult) -> BenchmarkResult:
+        results.append(result)
+        if result.error:
+            print(f"  ❌ {result.name}: {result.error.splitlines()[0]}")
+        else:
+            summary = ", ".join(
+                f"{name}={metric.value:.4g} {metric.unit}"
+                for name, metric in result.metrics.items()
+            )
+            print(f"  ✅ {result.name}: {summary}")
+        return result
+
+    for payload_bytes in payload_sizes:
+        name = f"write_data[{payload_bytes}B]"
+        record(run_isolated(
+            name, bench_write_latency, work_dir / "write_latency.vrs", payload_bytes,
+            write_records, name,
+        ))
+
+    for size_mb in sizes_mb:
+        print(f"Preparing synthetic bag ({size_mb} MB)...")
+        bag_path = prepare_bag(work_dir, size_mb)
+        vrs_path = work_dir / f"synthetic_{size_mb}mb.vrs"
+
+        name = f"convert[{size_mb}MB]"
+        converted = record(run_isolated(name, bench_convert, bag_path, vrs_path, name))
+
+        read_names = [f"read[{size_mb}MB]", f"inspect[{size_mb}MB]"]
+        if converted.error:
+            for name in read_names:
+                record(BenchmarkResult(name=name, error="skipped: conversion failed"))
+            continue
+        record(run_isolated(read_names[0], bench_read, vrs_path, lookups, read_names[0]))
+        record(run_isolated(read_names[1], bench_inspect, vrs_path, read_names[1]))
+
+    return results
+
+
+def main() -> int:
+    """Main entry point for the benchmark suite"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark convert / write / read / inspect on synthetic bags",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Default sizes (10 MB, 100 MB), results in benchmark_results.json
+  ./benchmarks/run_benchmarks.py
+
+  # Store a baseline, then compare later runs against it
+  ./benchmarks/run_benchmarks.py --output benchmarks/baseline.json
+  ./benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json --threshold 0.15
+
+  # Large bags (keep generated bags for the next run)
+  ./benchmarks/run_benchmarks.py --sizes 1000 10000 --work-dir /data/bench
+
+Exit status is 2 when a regression against the baseline is found.
+        """,
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=DEFAULT_SIZES_MB, metavar="MB",
+        help=f"Synthetic bag sizes in MB (default: {' '.join(map(str, DEFAULT_SIZES_MB))})",
+    )
+    parser.add_argument(
+        "--payload-sizes", type=int, nargs="+", default=DEFAULT_PAYLOAD_SIZES, metavar="BYTES",
+        help="Payload sizes for the write_data latency cases",
+    )
+    parser.add_argument(
+        "--write-records", type=int, default=200,
+        help="Records written per payload size (default: 200)",
+    )
+    parser.add_argument(
+        "--lookups", type=int, default=100,
+        help="Configuration lookups per stream (default: 100)",
+    )
+    parser.add_argument(
+        "--output", "-o", type=Path, default=Path("benchmark_results.json"),
+        help="Results JSON path (default: benchmark_results.json)",
+    )
+    parser.add_argument(
+        "--baseline", "-b", type=Path, default=None,
+        help="Baseline results JSON to compare against",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help=f"Relative change counted as a regression (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--work-dir", type=Path, default=None,
+        help="Directory for bags and VRS files, kept after the run (default: temporary)",
+    )
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline is not None:
+        try:
+            baseline = load_results(args.baseline)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot load baseline: {e}", file=sys.stderr)
+            return 1
+
+    settings = {
+        "sizes_mb": args.sizes,
+        "payload_sizes": args.payload_sizes,
+        "write_records": args.write_records,
+        "lookups": args.lookups,
+    }
+
+    suite_args = (args.sizes, args.payload_sizes, args.write_records, args.lookups)
+    if args.work_dir is not None:
+        args.work_dir.mkdir(parents=True, exist_ok=True)
+        results = run_suite(args.work_dir, *suite_args)
+    else:
+        with tempfile.TemporaryDirectory(prefix="vrs_bench_") as tmp:
+            results = run_suite(Path(tmp), *suite_args)
+
+    write_results(args.output, results, settings)
+    print(f"\n📄 Results: {args.output}")
+
+    if baseline is None:
+        return 0
+
+    regressions = compare_results(results, baseline, args.threshold)
+    if not regressions:
+        print(f"✅ No regressions against {args.baseline} (threshold {args.threshold:.0%})")
+        return 0
+
+    print(f"⚠️  {len(regressions)} regression(s) against {args.baseline}:")
+    for regression in regressions:
+        print(
+            f"  - {regression.benchmark} {regression.metric}: "
+            f"{regression.baseline:.4g} -> {regression.current:.4g} "
+            f"({regression.change:+.1%} worse)"
+        )
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,10 +18,20 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "scripts"))
 
 from rosbag_to_vrs_converter import (  # noqa: E402
+    DEPTH_CODECS,
+    IMAGE_CODECS,
     RosbagToVRSConverter,
     create_rgbd_config,
     create_rgbd_imu_config,
 )
+from conversion_cache import DEFAULT_MAX_SIZE_BYTES, DEFAULT_SAMPLE_BLOCKS, ConversionCache  # noqa: E402
+from memory_profile import MemoryProfiler  # noqa: E402
+from metrics import ConversionMetrics  # noqa: E402
+from parallel_converter import ParallelRosbagToVRSConverter  # noqa: E402
+from progress import DEFAULT_INTERVAL_SEC, PROGRESS_FORMATS, ProgressReporter  # noqa: E402
+from vrs_manifest import get_manifest_path  # noqa: E402
+# Imported through the package, like the converter, so both use the same tracer
+from scripts.trace_events import DEFAULT_SAMPLE_EVERY, start_tracing, stop_tracing  # noqa: E402
 
 
 def main() -> int:
@@ -40,6 +50,32 @@ Examples:
   # Specify compression algorithm (lz4, zstd, or none)
   ./convert_to_vrs.py data/rosbag/sample.bag output.vrs --compression zstd
 
+  # Resumable conversion: rerun the same command after a failure to continue from the checkpoint
+  ./convert_to_vrs.py data/rosbag/sample.bag output.vrs --chunk-duration 60 --resume
+
+  # Convert time ranges of the bag in 8 processes (chunked output: OUTPUT.manifest.json)
+  ./convert_to_vrs.py data/rosbag/sample.bag output.vrs --workers 8 --chunk-duration 60
+
+  # Reuse outputs of earlier conversions of the same bag with the same options
+  ./convert_to_vrs.py data/rosbag/sample.bag output.vrs --cache-dir ~/.cache/realsense_vrs
+
+  # Report peak memory and top allocation sites per conversion stage
+  ./convert_to_vrs.py data/rosbag/sample.bag output.vrs --profile-memory
+
+  # Live progress on stderr (JSON lines for job schedulers: --progress json)
+  ./convert_to_vrs.py data/rosbag/sample.bag output.vrs --progress
+
+  # Prometheus metrics: textfile for node_exporter, or scrape :9464/metrics while converting
+  ./convert_to_vrs.py data/rosbag/sample.bag output.vrs \\
+      --metrics-textfile /var/lib/node_exporter/vrs.prom
+  ./convert_to_vrs.py data/rosbag/sample.bag output.vrs --metrics-port 9464
+
+  # Write a Chrome trace (open output.trace.json in https://ui.perfetto.dev)
+  ./convert_to_vrs.py data/rosbag/sample.bag output.vrs --trace
+
+  # Convert every camera of a multi-device rig, including Infrared streams
+  ./convert_to_vrs.py data/rosbag/rig.bag output.vrs --imu --auto-discover
+
 Supported Data:
   - Color Image: RGB camera stream with intrinsic parameters
   - Depth Image: Depth camera stream with intrinsic parameters and depth scale
@@ -74,6 +110,203 @@ Features:
         help="Include IMU streams (Accelerometer and Gyroscope)",
     )
 
+    parser.add_argument(
+        "--auto-discover",
+        action="store_true",
+        help="Find streams from the bag's topics (all /device_N, Infrared 1/2) "
+        "instead of the fixed device_0 mapping",
+    )
+
+    parser.add_argument(
+        "--imu-batch-size",
+        type=int,
+        default=1,
+        help="IMU samples per VRS record (with --imu, default: 1)",
+    )
+
+    parser.add_argument(
+        "--metadata-batch-size",
+        type=int,
+        default=30,
+        help="Per-frame metadata rows per VRS record (with --imu, default: 30)",
+    )
+
+    parser.add_argument(
+        "--depth-codec",
+        choices=DEPTH_CODECS,
+        default="none",
+        help="Lossless depth frame codec (default: none)",
+    )
+
+    parser.add_argument(
+        "--depth-keyframe-interval",
+        type=int,
+        default=30,
+        help="Depth frames per keyframe with --depth-codec temporal_zstd (default: 30)",
+    )
+
+    parser.add_argument(
+        "--color-codec",
+        choices=IMAGE_CODECS,
+        default="raw",
+        help="Color frame codec: raw, lossless png, jpeg or jxl (default: raw)",
+    )
+
+    parser.add_argument(
+        "--color-quality",
+        type=int,
+        default=90,
+        help="JPEG / JPEG XL quality 1-100 (default: 90)",
+    )
+
+    parser.add_argument(
+        "--encoder-threads",
+        type=int,
+        default=0,
+        help="Threads used to encode color frames (default: 0 = CPU count)",
+    )
+
+    parser.add_argument(
+        "--chunk-duration",
+        type=float,
+        default=None,
+        metavar="SEC",
+        help="Split output into chunk files of SEC seconds (writes OUTPUT.manifest.json)",
+    )
+
+    parser.add_argument(
+        "--chunk-size-mb",
+        type=float,
+        default=None,
+        metavar="MB",
+        help="Split output into chunk files of about MB megabytes",
+    )
+
+    parser.add_argument(
+        "--flush-interval",
+        type=float,
+        default=None,
+        metavar="SEC",
+        help="Durable mode: flush records to disk every SEC seconds "
+        "(a crashed conversion can be rescued with recover_vrs.py)",
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Chunked output: write OUTPUT.checkpoint.json at every chunk boundary and, if an "
+        "interrupted conversion of the same bag and options left one, continue from it",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Convert N time ranges of the bag in parallel processes and merge them into "
+        "chunked output; requires --chunk-duration or --chunk-size-mb "
+        "(ROS1 only, 0 = CPU count, default: 1)",
+    )
+
+    parser.add_argument(
+        "--no-source-hash",
+        action="store_true",
+        help=(
+            "Do not store the SHA-256 of the input bag in the file tags "
+            "(skips one read of the bag)"
+        ),
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Cache outputs keyed by bag content and options; an identical earlier "
+        "conversion is copied from DIR instead of converting again",
+    )
+
+    parser.add_argument(
+        "--cache-max-size-gb",
+        type=float,
+        default=DEFAULT_MAX_SIZE_BYTES / 1024**3,
+        metavar="GB",
+        help="Evict least recently used cache entries above this size "
+        f"(default: {DEFAULT_MAX_SIZE_BYTES / 1024**3:.0f})",
+    )
+
+    parser.add_argument(
+        "--cache-full-hash",
+        action="store_true",
+        help=(
+            "Hash the whole bag for the cache key instead of sampled blocks "
+            "(slower, reads the bag once more)"
+        ),
+    )
+
+    parser.add_argument(
+        "--profile-memory",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="REPORT",
+        help="Sample RSS and trace Python allocations per conversion stage; "
+        "writes a JSON report (default: OUTPUT.memory.json). Slows conversion down",
+    )
+
+    parser.add_argument(
+        "--progress",
+        nargs="?",
+        const="text",
+        default=None,
+        choices=PROGRESS_FORMATS,
+        help="Report progress, MB/s, ETA and RSS on stderr while converting: "
+        "a status line (text, default) or JSON lines (json)",
+    )
+
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=DEFAULT_INTERVAL_SEC,
+        metavar="SEC",
+        help=f"Seconds between progress reports (default: {DEFAULT_INTERVAL_SEC})",
+    )
+
+    parser.add_argument(
+        "--metrics-textfile",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Write Prometheus metrics (bags, messages, bytes, latency, RSS) to PATH "
+        "after the conversion, for the node_exporter textfile collector",
+    )
+
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        metavar="PORT",
+        help="Serve Prometheus metrics at http://127.0.0.1:PORT/metrics during the conversion",
+    )
+
+    parser.add_argument(
+        "--trace",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="TRACE",
+        help="Write a Chrome trace_event JSON of the conversion spans, loadable in Perfetto "
+        "(default: OUTPUT.trace.json; the VRS_TRACE environment variable also enables tracing)",
+    )
+
+    parser.add_argument(
+        "--trace-sample-every",
+        type=int,
+        default=DEFAULT_SAMPLE_EVERY,
+        metavar="N",
+        help=f"Record every Nth per-message span (default: {DEFAULT_SAMPLE_EVERY})",
+    )
+
     parser.add_argument(
         "--compression",
         "-c",
@@ -115,20 +348,121 @@ Features:
         config = create_rgbd_imu_config(
             compression=args.compression,
             verbose=args.verbose,
+            imu_batch_size=args.imu_batch_size,
+            metadata_batch_size=args.metadata_batch_size,
+            depth_codec=args.depth_codec,
+            color_codec=args.color_codec,
+            color_quality=args.color_quality,
+            auto_discover=args.auto_discover,
         )
     else:
         config = create_rgbd_config(
             compression=args.compression,
             verbose=args.verbose,
+            depth_codec=args.depth_codec,
+            color_codec=args.color_codec,
+            color_quality=args.color_quality,
+            auto_discover=args.auto_discover,
         )
 
+    config.encoder_threads = args.encoder_threads
+    config.depth_keyframe_interval = args.depth_keyframe_interval
+    config.chunk_duration_sec = args.chunk_duration
+    config.chunk_size_mb = args.chunk_size_mb
+    config.hash_source = not args.no_source_hash
+    config.flush_interval_sec = args.flush_interval
+    config.checkpoint = args.resume
+
+    if args.resume and args.chunk_duration is None and args.chunk_size_mb is None:
+        print("Error: --resume requires --chunk-duration or --chunk-size-mb", file=sys.stderr)
+        return 1
+
+    if args.workers < 0:
+        print("Error: --workers must be >= 0", file=sys.stderr)
+        return 1
+    parallel = args.workers != 1
+    if parallel and args.chunk_duration is None and args.chunk_size_mb is None:
+        print(
+            "Error: --workers writes chunked output (OUTPUT_NNN.vrs and OUTPUT.manifest.json) "
+            "and requires --chunk-duration or --chunk-size-mb",
+            file=sys.stderr,
+        )
+        return 1
+    if parallel and (args.resume or args.progress is not None or args.profile_memory is not None):
+        print(
+            "Error: --workers cannot be combined with --resume, --progress or --profile-memory",
+            file=sys.stderr,
+        )
+        return 1
+
+    # Conversion output cache
+    cache = None
+    if args.cache_dir is not None:
+        try:
+            cache = ConversionCache(
+                args.cache_dir,
+                max_size_bytes=int(args.cache_max_size_gb * 1024**3),
+                sample_blocks=0 if args.cache_full_hash else DEFAULT_SAMPLE_BLOCKS,
+            )
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot use cache directory {args.cache_dir}: {e}", file=sys.stderr)
+            return 1
+
+    # Memory profiling (report written even if the conversion fails)
+    profiler = None
+    memory_report = None
+    if args.profile_memory is not None:
+        profiler = MemoryProfiler()
+        memory_report = Path(args.profile_memory) if args.profile_memory else (
+            args.output_vrs.with_suffix(".memory.json")
+        )
+
+    # Tracing (trace written even if the conversion fails)
+    trace_path = None
+    if args.trace is not None:
+        if args.trace_sample_every < 1:
+            print("Error: --trace-sample-every must be >= 1", file=sys.stderr)
+            return 1
+        trace_path = Path(args.trace) if args.trace else args.output_vrs.with_suffix(".trace.json")
+
+    # Prometheus metrics (textfile written even if the conversion fails)
+    metrics = None
+    metrics_server = None
+    if args.metrics_textfile is not None or args.metrics_port is not None:
+        metrics = ConversionMetrics()
+    if args.metrics_port is not None:
+        try:
+            metrics_server = metrics.registry.serve(args.metrics_port)
+        except OSError as e:
+            print(f"Error: Cannot serve metrics on port {args.metrics_port}: {e}", file=sys.stderr)
+            return 1
+
     # Run conversion
     try:
-        converter = RosbagToVRSConverter(
-            args.input_bag,
-            args.output_vrs,
-            config,
+        progress = (
+            ProgressReporter(args.progress, args.progress_interval)
+            if args.progress is not None
+            else None
         )
+        if parallel:
+            converter = ParallelRosbagToVRSConverter(
+                args.input_bag,
+                args.output_vrs,
+                config,
+                workers=args.workers,
+                metrics=metrics,
+                cache=cache,
+            )
+        else:
+            converter = RosbagToVRSConverter(
+                args.input_bag,
+                args.output_vrs,
+                config,
+                profiler=profiler,
+                progress=progress,
+                metrics=metrics,
+                cache=cache,
+            )
 
         if args.verbose:
             print("="*70)
@@ -140,7 +474,25 @@ Features:
             print(f"  Phase:       4A (Color + Depth)")
             print("-" * 70)
 
-        result = converter.convert()
+        if profiler is not None:
+            profiler.start()
+        if trace_path is not None:
+            start_tracing(args.trace_sample_every)
+        try:
+            result = converter.convert()
+        finally:
+            if metrics_server is not None:
+                metrics_server.shutdown()
+            if metrics is not None and args.metrics_textfile is not None:
+                metrics.registry.write_textfile(args.metrics_textfile)
+            if trace_path is not None:
+                stop_tracing(trace_path)
+                print(f"\n🧭 Trace: {trace_path}")
+            if profiler is not None and memory_report is not None:
+                profiler.stop()
+                profiler.write_report(memory_report)
+                print(f"\n🧠 Memory profile ({memory_report}):")
+                print(profiler.format_summary())
 
         # Print summary
         print(f"\n{'='*70}")
@@ -150,13 +502,27 @@ Features:
         print(f"  Output size:      {result.output_vrs_size / 1024 / 1024:.2f} MB")
         print(f"  Compression:      {result.compression_ratio:.2%}")
         print(f"  Total messages:   {result.total_messages}")
-        print(f"  - Color stream:   {result.messages_per_stream.get(1001, 0)} records")
-        print(f"  - Depth stream:   {result.messages_per_stream.get(1002, 0)} records")
-        print(f"  Conversion time:  {result.conversion_time_sec:.2f}s")
+        if args.auto_discover:
+            for stream_id, count in sorted(result.messages_per_stream.items()):
+                print(f"  - Stream {stream_id}:     {count} records")
+        else:
+            print(f"  - Color stream:   {result.messages_per_stream.get(1001, 0)} records")
+            print(f"  - Depth stream:   {result.messages_per_stream.get(1002, 0)} records")
+        print(f"  Conversion time:  {result.conversion_time_sec:.2f}s"
+              + (" (copied from cache)" if result.cache_hit else ""))
         print(f"  Bag duration:     {result.duration_sec:.2f}s")
-        print(f"\n📄 Output file: {args.output_vrs}")
+        if config.chunk_duration_sec is not None or config.chunk_size_mb is not None:
+            # Chunked output (also --workers): the manifest opens all chunks as one logical file
+            inspect_path = get_manifest_path(args.output_vrs)
+            print(f"\n📄 Output chunks: {len(result.output_files)} files")
+            for output_file in result.output_files:
+                print(f"  - {output_file}")
+            print(f"📄 Manifest: {inspect_path}")
+        else:
+            inspect_path = args.output_vrs
+            print(f"\n📄 Output file: {args.output_vrs}")
         print(f"\nTo inspect the VRS file, run:")
-        print(f"  ./inspect_vrs.py {args.output_vrs}")
+        print(f"  ./inspect_vrs.py {inspect_path}")
 
         return 0
 
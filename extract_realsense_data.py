@@ -13,6 +13,7 @@ Usage:
 import argparse
 import sys
 from pathlib import Path
+from typing import Any
 
 from scripts.rosbag_reader import RosbagReader
 from scripts.timestamp_handler import ros_timestamp_to_datetime, format_timestamp_iso
@@ -66,6 +67,30 @@ def main() -> int:
         return 1
 
 
+def print_topic_info(
+    topic: str,
+    info: dict[str, Any],
+    time_range: tuple[int, int] | None = None,
+) -> None:
+    """Print type, message count and optional time range of a topic.
+
+    Args:
+        topic: Topic name
+        info: Topic metadata with 'msgtype' and 'msgcount'
+        time_range: Optional (first, last) message timestamps in nanoseconds
+    """
+    print(f"  {topic}")
+    print(f"    Type: {info['msgtype']}")
+    print(f"    Messages: {info['msgcount']}")
+
+    if time_range is not None:
+        first_time = ros_timestamp_to_datetime(time_range[0])
+        last_time = ros_timestamp_to_datetime(time_range[1])
+
+        print(f"    First message: {format_timestamp_iso(first_time)}")
+        print(f"    Last message:  {format_timestamp_iso(last_time)}")
+
+
 def extract_realsense_data(bagfile: Path, output_dir: Path, verbose: bool = False) -> None:
     """Extract RealSense data from a ROS bag file.
 
@@ -91,44 +116,20 @@ def extract_realsense_data(bagfile: Path, output_dir: Path, verbose: bool = Fals
 
         print("RealSense Image Topics:")
         for topic in image_topics:
-            info = topics_info[topic]
-            print(f"  {topic}")
-            print(f"    Type: {info['msgtype']}")
-            print(f"    Messages: {info['msgcount']}")
-
-            if verbose and info['msgcount'] > 0:
-                # Show first and last message timestamps
-                messages = list(reader.read_messages(topic))
-                if messages:
-                    first_msg = messages[0]
-                    last_msg = messages[-1]
-
-                    first_time = ros_timestamp_to_datetime(first_msg["timestamp"])
-                    last_time = ros_timestamp_to_datetime(last_msg["timestamp"])
-
-                    print(f"    First message: {format_timestamp_iso(first_time)}")
-                    print(f"    Last message:  {format_timestamp_iso(last_time)}")
+            print_topic_info(
+                topic,
+                topics_info[topic],
+                reader.get_topic_time_range(topic) if verbose else None,
+            )
         print()
 
         print("RealSense IMU Topics:")
         for topic in imu_topics:
-            info = topics_info[topic]
-            print(f"  {topic}")
-            print(f"    Type: {info['msgtype']}")
-            print(f"    Messages: {info['msgcount']}")
-
-            if verbose and info['msgcount'] > 0:
-                # Show first and last message timestamps
-                messages = list(reader.read_messages(topic))
-                if messages:
-                    first_msg = messages[0]
-                    last_msg = messages[-1]
-
-                    first_time = ros_timestamp_to_datetime(first_msg["timestamp"])
-                    last_time = ros_timestamp_to_datetime(last_msg["timestamp"])
-
-                    print(f"    First message: {format_timestamp_iso(first_time)}")
-                    print(f"    Last message:  {format_timestamp_iso(last_time)}")
+            print_topic_info(
+                topic,
+                topics_info[topic],
+                reader.get_topic_time_range(topic) if verbose else None,
+            )
         print()
 
         # Summary
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Synthetic RealSense Bag Generator
+
+Write a reproducible RealSense D435i-shaped ROS1 bag (Color, Depth, IMU,
+info, camera_info, tf, options and metadata topics) for tests and
+benchmarks without real hardware.
+
+Usage:
+    ./generate_synthetic_bag.py synthetic.bag
+    ./generate_synthetic_bag.py synthetic.bag --duration 60 --compression lz4
+    ./generate_synthetic_bag.py big.bag --target-size-mb 10240
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+
+from synthetic_bag import (  # noqa: E402
+    BAG_COMPRESSIONS,
+    SyntheticBagConfig,
+    duration_for_size,
+    generate_synthetic_bag,
+)
+
+
+def parse_resolution(value: str) -> tuple[int, int]:
+    """Parse WIDTHxHEIGHT"""
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got '{value}'")
+    if width < 1 or height < 1:
+        raise argparse.ArgumentTypeError(f"resolution must be positive, got '{value}'")
+    return width, height
+
+
+def main() -> int:
+    """Main entry point for synthetic bag generation"""
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic RealSense D435i ROS1 bag",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # 1 second, 640x480 @ 30 fps
+  ./generate_synthetic_bag.py data/rosbag/synthetic.bag
+
+  # About 1 GB (uncompressed), 1280x720 color, LZ4 chunks
+  ./generate_synthetic_bag.py data/rosbag/synthetic_1gb.bag \\
+      --target-size-mb 1024 --color-resolution 1280x720 --compression lz4
+
+  # Two cameras with Infrared 1/2 (convert with --auto-discover)
+  ./generate_synthetic_bag.py data/rosbag/rig.bag --devices 2 --infrared
+        """,
+    )
+
+    parser.add_argument("output_bag", type=Path, help="Output .bag path (must not exist)")
+
+    duration = parser.add_mutually_exclusive_group()
+    duration.add_argument(
+        "--duration", type=float, default=1.0, metavar="SEC",
+        help="Recording duration in seconds (default: 1.0)",
+    )
+    duration.add_argument(
+        "--target-size-mb", type=float, default=None, metavar="MB",
+        help="Choose the duration for an uncompressed bag of about MB megabytes",
+    )
+
+    parser.add_argument(
+        "--color-resolution", type=parse_resolution, default=(640, 480), metavar="WxH",
+        help="Color resolution (default: 640x480)",
+    )
+    parser.add_argument(
+        "--depth-resolution", type=parse_resolution, default=(640, 480), metavar="WxH",
+        help="Depth / Infrared resolution (default: 640x480)",
+    )
+    parser.add_argument("--color-fps", type=int, default=30, help="Color fps (default: 30)")
+    parser.add_argument(
+        "--depth-fps", type=int, default=30, help="Depth / Infrared fps (default: 30)"
+    )
+    parser.add_argument(
+        "--accel-rate", type=float, default=63.0, help="Accel rate in Hz (default: 63)"
+    )
+    parser.add_argument(
+        "--gyro-rate", type=float, default=200.0, help="Gyro rate in Hz (default: 200)"
+    )
+    parser.add_argument("--infrared", action="store_true", help="Add Infrared 1/2 streams")
+    parser.add_argument("--devices", type=int, default=1, help="Number of cameras (default: 1)")
+    parser.add_argument("--no-metadata", action="store_true", help="Omit per-frame metadata topics")
+    parser.add_argument(
+        "--compression", choices=BAG_COMPRESSIONS, default="none",
+        help="Bag chunk compression (default: none)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+
+    args = parser.parse_args()
+
+    if args.output_bag.exists():
+        print(f"Error: Output bag already exists: {args.output_bag}", file=sys.stderr)
+        return 1
+    args.output_bag.parent.mkdir(parents=True, exist_ok=True)
+
+    config = SyntheticBagConfig(
+        duration_sec=args.duration,
+        color_width=args.color_resolution[0],
+        color_height=args.color_resolution[1],
+        color_fps=args.color_fps,
+        depth_width=args.depth_resolution[0],
+        depth_height=args.depth_resolution[1],
+        depth_fps=args.depth_fps,
+        accel_rate=args.accel_rate,
+        gyro_rate=args.gyro_rate,
+        infrared=args.infrared,
+        devices=args.devices,
+        metadata=not args.no_metadata,
+        compression=args.compression,
+        seed=args.seed,
+    )
+    if args.target_size_mb is not None:
+        config.duration_sec = duration_for_size(config, int(args.target_size_mb * 1024 * 1024))
+
+    start_time = time.time()
+    try:
+        counts = generate_synthetic_bag(args.output_bag, config)
+    except Exception as e:
+        print(f"❌ Generation failed: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.time() - start_time
+
+    size_mb = args.output_bag.stat().st_size / 1024 / 1024
+    print(f"✅ Generated: {args.output_bag}")
+    print(f"  Duration:  {config.duration_sec:.2f}s, {config.devices} device(s)")
+    print(f"  Messages:  {sum(counts.values())} on {len(counts)} topics")
+    rate = size_mb / max(elapsed, 1e-9)
+    print(f"  Size:      {size_mb:.2f} MB in {elapsed:.2f}s ({rate:.1f} MB/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
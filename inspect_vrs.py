@@ -14,11 +14,18 @@ import sys
 import argparse
 from pathlib import Path
 import json
+from dataclasses import asdict
 
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent / "scripts"))
 
 from vrs_reader import VRSReader  # noqa: E402
+from vrs_summary import (  # noqa: E402
+    CONVERTER_VERSION_TAG,
+    SOURCE_PATH_TAG,
+    SOURCE_SHA256_TAG,
+    SOURCE_SIZE_TAG,
+)
 
 
 def format_camera_matrix(matrix: list, name: str = "K") -> str:
@@ -68,7 +75,7 @@ Tip: This tool provides ROSbag-equivalent information display.
     parser.add_argument(
         "vrs_file",
         type=Path,
-        help="VRS file path to inspect",
+        help="VRS file path to inspect (or .manifest.json of chunked output)",
     )
 
     parser.add_argument(
@@ -125,14 +132,17 @@ Tip: This tool provides ROSbag-equivalent information display.
                 output = {
                     "file": str(args.vrs_file),
                     "size_mb": args.vrs_file.stat().st_size / 1024 / 1024,
+                    "file_tags": reader.get_file_tags(),
                     "streams": {}
                 }
 
                 for stream_id in stream_ids:
                     config = reader.read_configuration(stream_id)
                     record_count = reader.get_record_count(stream_id)
+                    stats = reader.get_stream_stats(stream_id)
                     output["streams"][stream_id] = {
                         "record_count": record_count,
+                        "stats": asdict(stats) if stats is not None else None,
                         "configuration": config
                     }
 
@@ -148,6 +158,18 @@ Tip: This tool provides ROSbag-equivalent information display.
             print(f"  Size:         {args.vrs_file.stat().st_size / 1024 / 1024:.2f} MB")
             print(f"  Total Streams: {len(stream_ids)}")
 
+            # Source bag recorded by the converter (file tags, no record read)
+            file_tags = reader.get_file_tags()
+            if SOURCE_PATH_TAG in file_tags:
+                print(f"  Source:       {file_tags[SOURCE_PATH_TAG]}")
+                if SOURCE_SIZE_TAG in file_tags:
+                    source_mb = int(file_tags[SOURCE_SIZE_TAG]) / 1024 / 1024
+                    print(f"  Source Size:  {source_mb:.2f} MB")
+                if args.verbose and SOURCE_SHA256_TAG in file_tags:
+                    print(f"  Source SHA256: {file_tags[SOURCE_SHA256_TAG]}")
+            if CONVERTER_VERSION_TAG in file_tags:
+                print(f"  Converter:    {file_tags[CONVERTER_VERSION_TAG]}")
+
             # Iterate through streams
             for idx, stream_id in enumerate(stream_ids, 1):
                 print(f"\n{'='*70}")
@@ -218,8 +240,25 @@ Tip: This tool provides ROSbag-equivalent information display.
                 except Exception as e:
                     print(f"  ⚠️  Configuration: Error reading - {e}")
 
+                # Timestamp range from the stream stats tag (O(1)), if present
+                stats = reader.get_stream_stats(stream_id)
+                if stats is not None and stats.record_count > 0:
+                    print("\n  ⏱️  Timestamp Range:")
+                    print(f"    First:    {stats.first_timestamp}")
+                    print(f"    Last:     {stats.last_timestamp}")
+                    print(f"    Duration: {stats.duration:.3f}s")
+                    if stats.min_gap is not None and stats.max_gap is not None:
+                        print(
+                            f"    Gap:      {stats.min_gap * 1000:.3f} - "
+                            f"{stats.max_gap * 1000:.3f} ms"
+                        )
+
+                    if args.verbose:
+                        print("\n  💾 Data Size:")
+                        print(f"    Total payload: {stats.payload_bytes / 1024 / 1024:.2f} MB")
+
                 # Sample data records (first and last timestamps)
-                if record_count > 0:
+                elif record_count > 0:
                     try:
                         data_records = reader.read_data_records(stream_id)
                         if data_records:
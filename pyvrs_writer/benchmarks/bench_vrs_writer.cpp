@@ -0,0 +1,196 @@
+// pyvrs_writer/benchmarks/bench_vrs_writer.cpp
+//
+// VRSWriterのC++レベルのタイミング計測（Python/pybind11のオーバーヘッドを含まない）
+//
+// 計測ケース: ペイロードサイズ × 圧縮 × 圧縮スレッド数
+//   - writeData(): 1レコードあたりのレイテンシ（mean/p50/p95）
+//   - close(): writeToFile()による圧縮とディスク書き込みの時間
+//
+// Usage:
+//   vrs_writer_bench [--records N] [--output-dir DIR] [--csv]
+#include "vrs_writer.h"
+
+#include <algorithm>
+#include <chrono>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <filesystem>
+#include <iostream>
+#include <string>
+#include <thread>
+#include <vector>
+
+namespace fs = std::filesystem;
+
+namespace {
+
+using Clock = std::chrono::steady_clock;
+
+constexpr double kMB = 1024.0 * 1024.0;
+constexpr uint32_t kStreamId = 1001;
+// 同期書き込みモードでは全レコードをclose()までメモリに保持するため、ケースあたりの総量を制限する
+constexpr size_t kMaxBytesPerCase = 192 * 1024 * 1024;
+
+struct Payload {
+  const char* name;
+  size_t bytes;
+};
+
+// RealSenseの代表的なレコードサイズ
+const std::vector<Payload> kPayloads = {
+    {"imu_24B", 24},  // IMU 1サンプル（3 x double）
+    {"depth_1.8MB", 1280 * 720 * 2},  // Z16 1280x720
+    {"color_6.2MB", 1920 * 1080 * 3},  // RGB8 1920x1080
+};
+
+const std::vector<std::string> kCompressions = {"none", "lz4", "zstd"};
+
+struct Result {
+  std::string payload;
+  std::string compression;
+  uint32_t threads;
+  size_t records;
+  double writeMeanUs;
+  double writeP50Us;
+  double writeP95Us;
+  double closeMs;
+  double mbPerSec;  // ペイロード総量 / (writeData合計 + close)
+  double outputRatio;  // 出力ファイルサイズ / ペイロード総量
+};
+
+// 画像に近い圧縮率になるよう、滑らかな値に小さなノイズを加えたペイロードを作成
+std::vector<uint8_t> makePayload(size_t bytes) {
+  std::vector<uint8_t> data(bytes);
+  uint32_t state = 12345;
+  for (size_t i = 0; i < bytes; ++i) {
+    state = state * 1664525u + 1013904223u;
+    data[i] = static_cast<uint8_t>((i / 64) % 251 + ((state >> 24) & 0x3));
+  }
+  return data;
+}
+
+double percentile(std::vector<double> values, double p) {
+  std::sort(values.begin(), values.end());
+  size_t index = static_cast<size_t>(p * static_cast<double>(values.size() - 1) + 0.5);
+  return values[index];
+}
+
+double elapsedUs(Clock::time_point start, Clock::time_point end) {
+  return std::chrono::duration<double, std::micro>(end - start).count();
+}
+
+Result runCase(
+    const Payload& payload,
+    const std::string& compression,
+    uint32_t threads,
+    size_t records,
+    const fs::path& outputPath) {
+  fs::remove(outputPath);
+  std::vector<uint8_t> data = makePayload(payload.bytes);
+  std::vector<double> latenciesUs;
+  latenciesUs.reserve(records);
+
+  pyvrs_writer::VRSWriter writer(outputPath.string());
+  writer.setCompression(compression);
+  writer.setCompressionThreads(threads);
+  writer.addStream(kStreamId, "Benchmark");
+  writer.writeConfiguration(kStreamId, "{\"payload_bytes\": " + std::to_string(payload.bytes) + "}");
+
+  double writeTotalUs = 0.0;
+  for (size_t i = 0; i < records; ++i) {
+    auto start = Clock::now();
+    writer.writeData(kStreamId, static_cast<double>(i) / 30.0, data);
+    double us = elapsedUs(start, Clock::now());
+    latenciesUs.push_back(us);
+    writeTotalUs += us;
+  }
+
+  auto closeStart = Clock::now();
+  writer.close();
+  double closeUs = elapsedUs(closeStart, Clock::now());
+
+  double totalMB = static_cast<double>(payload.bytes * records) / kMB;
+  Result result;
+  result.payload = payload.name;
+  result.compression = compression;
+  result.threads = threads;
+  result.records = records;
+  result.writeMeanUs = writeTotalUs / static_cast<double>(records);
+  result.writeP50Us = percentile(latenciesUs, 0.50);
+  result.writeP95Us = percentile(latenciesUs, 0.95);
+  result.closeMs = closeUs / 1000.0;
+  result.mbPerSec = totalMB / ((writeTotalUs + closeUs) / 1e6);
+  result.outputRatio = static_cast<double>(fs::file_size(outputPath)) / kMB / totalMB;
+  fs::remove(outputPath);
+  return result;
+}
+
+void printUsage(const char* program) {
+  std::cerr << "Usage: " << program << " [--records N] [--output-dir DIR] [--csv]\n"
+            << "  --records N       Records per case (default: up to 192 MB per case)\n"
+            << "  --output-dir DIR  Directory for the temporary VRS file (default: /tmp)\n"
+            << "  --csv             Print results as CSV\n";
+}
+
+}  // namespace
+
+int main(int argc, char** argv) {
+  size_t recordsOverride = 0;
+  fs::path outputDir = "/tmp";
+  bool csv = false;
+
+  for (int i = 1; i < argc; ++i) {
+    std::string arg = argv[i];
+    if (arg == "--records" && i + 1 < argc) {
+      recordsOverride = std::strtoul(argv[++i], nullptr, 10);
+    } else if (arg == "--output-dir" && i + 1 < argc) {
+      outputDir = argv[++i];
+    } else if (arg == "--csv") {
+      csv = true;
+    } else {
+      printUsage(argv[0]);
+      return arg == "--help" || arg == "-h" ? 0 : 1;
+    }
+  }
+
+  // 圧縮スレッド数: 1（シングルスレッド）とハードウェアのスレッド数（マルチスレッド）
+  const uint32_t hardwareThreads = std::max(1u, std::thread::hardware_concurrency());
+  const std::vector<uint32_t> threadCounts = {1, hardwareThreads};
+  const fs::path outputPath = outputDir / "vrs_writer_bench.vrs";
+
+  if (csv) {
+    std::printf(
+        "payload,compression,threads,records,write_mean_us,write_p50_us,write_p95_us,"
+        "close_ms,mb_per_sec,output_ratio\n");
+  } else {
+    std::printf(
+        "%-12s %-5s %7s %7s %12s %12s %12s %10s %9s %7s\n",
+        "payload", "comp", "threads", "records", "write mean", "write p50", "write p95",
+        "close", "MB/s", "ratio");
+  }
+
+  for (const auto& payload : kPayloads) {
+    size_t records = recordsOverride > 0
+        ? recordsOverride
+        : std::clamp<size_t>(kMaxBytesPerCase / payload.bytes, 20, 10000);
+    for (const auto& compression : kCompressions) {
+      for (uint32_t threads : threadCounts) {
+        Result r = runCase(payload, compression, threads, records, outputPath);
+        if (csv) {
+          std::printf(
+              "%s,%s,%u,%zu,%.3f,%.3f,%.3f,%.3f,%.2f,%.4f\n",
+              r.payload.c_str(), r.compression.c_str(), r.threads, r.records, r.writeMeanUs,
+              r.writeP50Us, r.writeP95Us, r.closeMs, r.mbPerSec, r.outputRatio);
+        } else {
+          std::printf(
+              "%-12s %-5s %7u %7zu %10.2fus %10.2fus %10.2fus %8.1fms %9.1f %7.3f\n",
+              r.payload.c_str(), r.compression.c_str(), r.threads, r.records, r.writeMeanUs,
+              r.writeP50Us, r.writeP95Us, r.closeMs, r.mbPerSec, r.outputRatio);
+        }
+        std::fflush(stdout);
+      }
+    }
+  }
+  return 0;
+}
@@ -1,6 +1,7 @@
 // pyvrs_writer/include/vrs_writer.h
 #pragma once
 
+#include <array>
 #include <string>
 #include <memory>
 #include <vector>
@@ -10,27 +11,81 @@ namespace pyvrs_writer {
 
 class VRSWriter {
 public:
-  VRSWriter(const std::string& filepath);
+  // flushIntervalSec: 0の場合は全レコードをメモリに保持しclose()で一括書き込み。
+  // 正の場合は耐久モード: 最初のDataレコードでファイルを作成し、
+  // flushIntervalSec秒ごとにバックグラウンドでレコードをディスクに書き出す
+  explicit VRSWriter(const std::string& filepath, double flushIntervalSec = 0.0);
   ~VRSWriter();
 
   // ストリームの追加
   void addStream(uint32_t streamId, const std::string& streamName);
 
+  // 画像ストリームの追加（ImageContentBlockでDataレコードを宣言）
+  // pixelFormat: "RGB8", "BGR8", "GREY8", "GREY16"
+  // stride: 1行のバイト数（0の場合はwidthとpixelFormatから算出）
+  void addImageStream(
+      uint32_t streamId,
+      const std::string& streamName,
+      const std::string& pixelFormat,
+      uint32_t width,
+      uint32_t height,
+      uint32_t stride = 0);
+
+  // 圧縮画像ストリームの追加（JPG/PNG/JXLのImageContentBlockでDataレコードを宣言）
+  // imageFormat: "JPG", "PNG", "JXL"
+  void addEncodedImageStream(
+      uint32_t streamId,
+      const std::string& streamName,
+      const std::string& imageFormat,
+      uint32_t width,
+      uint32_t height);
+
+  // IMUストリームの追加（型付きDataLayout: timestamps + Point3Ddのベクタ）
+  void addMotionStream(uint32_t streamId, const std::string& streamName);
+
   // Configurationレコードの書き込み
   void writeConfiguration(uint32_t streamId, const std::string& jsonConfig);
 
   // Dataレコードの書き込み
   void writeData(uint32_t streamId, double timestamp, const std::vector<uint8_t>& data);
 
+  // IMUサンプル（K個）を1つのDataレコードとして書き込み
+  void writeMotionSamples(
+      uint32_t streamId,
+      double timestamp,
+      const std::vector<double>& sampleTimestamps,
+      const std::vector<std::array<double, 3>>& samples);
+
+  // レコード圧縮の設定（全ストリームと以降に追加するストリームに適用）
+  // preset: "none", "lz4", "zstd"
+  void setCompression(const std::string& preset);
+
+  // 圧縮スレッド数の設定（0: ハードウェアのスレッド数、1: 書き込みスレッドで圧縮）
+  // 書き込み（close()、耐久モードでは最初のDataレコード）より前に呼ぶ
+  void setCompressionThreads(uint32_t threadCount);
+
+  // ファイルタグの設定（close()前、耐久モードでは最初のDataレコード前に呼ぶ）
+  void setFileTag(const std::string& tagName, const std::string& tagValue);
+
+  // ストリームタグの設定（close()前、耐久モードでは最初のDataレコード前に呼ぶ）
+  void setStreamTag(uint32_t streamId, const std::string& tagName, const std::string& tagValue);
+
   // ファイルのクローズ
   void close();
 
   // ファイルが開いているか確認
   bool isOpen() const;
 
+  // 耐久モード（定期フラッシュ）か確認
+  bool isDurable() const;
+
 private:
   class Impl;
   std::unique_ptr<Impl> pImpl_;
 };
 
+// 正常にクローズされなかったVRSファイルを復旧する
+// インデックスを再構築しながら全レコードを読み、完全なインデックス付きの新しいファイルに書き出す
+void recoverFile(const std::string& sourcePath, const std::string& destinationPath);
+
 }  // namespace pyvrs_writer
@@ -9,7 +9,7 @@ import sys
 
 # C++拡張モジュールのインポート
 try:
-    from ._pyvrs_writer import VRSWriter
+    from ._pyvrs_writer import VRSWriter, recover_file
 except ImportError as e:
     raise ImportError(
         f"Failed to import C++ extension module: {e}\n"
@@ -17,4 +17,4 @@ except ImportError as e:
     ) from e
 
 __version__ = "0.1.0"
-__all__ = ["VRSWriter"]
+__all__ = ["VRSWriter", "recover_file"]
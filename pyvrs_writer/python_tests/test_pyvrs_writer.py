@@ -69,3 +69,48 @@ def test_file_exists_after_close(temp_vrs_file):
 
     assert os.path.exists(temp_vrs_file)
     assert os.path.getsize(temp_vrs_file) > 0
+
+
+def test_add_image_stream(temp_vrs_file):
+    """Test adding an image stream and writing one frame."""
+    with VRSWriter(temp_vrs_file) as writer:
+        writer.add_image_stream(1001, "RGB Camera", "RGB8", 4, 2)
+        writer.write_data(1001, 0.0, [0x7f] * (4 * 2 * 3))
+
+
+def test_add_image_stream_unknown_pixel_format(temp_vrs_file):
+    """Test that unknown pixel formats are rejected."""
+    with VRSWriter(temp_vrs_file) as writer:
+        with pytest.raises(ValueError):
+            writer.add_image_stream(1001, "Camera", "YUV", 4, 2)
+
+
+def test_write_motion_samples(temp_vrs_file):
+    """Test writing a batch of IMU samples to a motion stream."""
+    with VRSWriter(temp_vrs_file) as writer:
+        writer.add_motion_stream(1003, "Accel")
+        writer.write_motion_samples(1003, 0.0, [0.0, 0.0025], [[0.1, 0.2, 9.8], [0.1, 0.3, 9.7]])
+
+
+def test_add_encoded_image_stream(temp_vrs_file):
+    """Test adding a JPEG image stream and writing one encoded frame."""
+    with VRSWriter(temp_vrs_file) as writer:
+        writer.add_encoded_image_stream(1001, "RGB Camera", "JPG", 4, 2)
+        writer.write_data(1001, 0.0, [0xFF, 0xD8, 0xFF, 0xD9])
+
+
+def test_set_tags(temp_vrs_file):
+    """Test setting file and stream tags before close."""
+    with VRSWriter(temp_vrs_file) as writer:
+        writer.add_stream(1001, "RGB Camera")
+        writer.set_file_tag("source", "input.bag")
+        writer.set_stream_tag(1001, "stats", "{}")
+
+
+def test_durable_mode(temp_vrs_file):
+    """Test writing in durable mode (records flushed periodically)."""
+    with VRSWriter(temp_vrs_file, flush_interval_sec=0.1) as writer:
+        assert writer.is_durable()
+        writer.add_stream(1001, "RGB Camera")
+        writer.write_data(1001, 0.0, [1, 2, 3])
+    assert os.path.getsize(temp_vrs_file) > 0
@@ -9,9 +9,10 @@ PYBIND11_MODULE(_pyvrs_writer, m) {
   m.doc() = "Python bindings for VRS file writer";
 
   py::class_<pyvrs_writer::VRSWriter>(m, "VRSWriter")
-    .def(py::init<const std::string&>(),
+    .def(py::init<const std::string&, double>(),
          py::arg("filepath"),
-         "Create a new VRS file")
+         py::arg("flush_interval_sec") = 0.0,
+         "Create a new VRS file (flush_interval_sec > 0: flush records to disk periodically)")
 
     .def("add_stream",
          &pyvrs_writer::VRSWriter::addStream,
@@ -19,6 +20,31 @@ PYBIND11_MODULE(_pyvrs_writer, m) {
          py::arg("stream_name"),
          "Add a new stream to the VRS file")
 
+    .def("add_image_stream",
+         &pyvrs_writer::VRSWriter::addImageStream,
+         py::arg("stream_id"),
+         py::arg("stream_name"),
+         py::arg("pixel_format"),
+         py::arg("width"),
+         py::arg("height"),
+         py::arg("stride") = 0,
+         "Add an image stream whose data records hold an image content block")
+
+    .def("add_encoded_image_stream",
+         &pyvrs_writer::VRSWriter::addEncodedImageStream,
+         py::arg("stream_id"),
+         py::arg("stream_name"),
+         py::arg("image_format"),
+         py::arg("width"),
+         py::arg("height"),
+         "Add an image stream whose data records hold a JPG/PNG/JXL image content block")
+
+    .def("add_motion_stream",
+         &pyvrs_writer::VRSWriter::addMotionStream,
+         py::arg("stream_id"),
+         py::arg("stream_name"),
+         "Add a motion sensor stream with typed sample records")
+
     .def("write_configuration",
          &pyvrs_writer::VRSWriter::writeConfiguration,
          py::arg("stream_id"),
@@ -32,6 +58,37 @@ PYBIND11_MODULE(_pyvrs_writer, m) {
          py::arg("data"),
          "Write a data record")
 
+    .def("write_motion_samples",
+         &pyvrs_writer::VRSWriter::writeMotionSamples,
+         py::arg("stream_id"),
+         py::arg("timestamp"),
+         py::arg("sample_timestamps"),
+         py::arg("samples"),
+         "Write a batch of motion samples as one data record")
+
+    .def("set_compression",
+         &pyvrs_writer::VRSWriter::setCompression,
+         py::arg("preset"),
+         "Set record compression for all streams (none/lz4/zstd)")
+
+    .def("set_compression_threads",
+         &pyvrs_writer::VRSWriter::setCompressionThreads,
+         py::arg("thread_count"),
+         "Set the compression thread pool size (0: hardware threads)")
+
+    .def("set_file_tag",
+         &pyvrs_writer::VRSWriter::setFileTag,
+         py::arg("tag_name"),
+         py::arg("tag_value"),
+         "Set a file tag (must be called before close)")
+
+    .def("set_stream_tag",
+         &pyvrs_writer::VRSWriter::setStreamTag,
+         py::arg("stream_id"),
+         py::arg("tag_name"),
+         py::arg("tag_value"),
+         "Set a stream tag (must be called before close)")
+
     .def("close",
          &pyvrs_writer::VRSWriter::close,
          "Close the VRS file")
@@ -40,6 +97,10 @@ PYBIND11_MODULE(_pyvrs_writer, m) {
          &pyvrs_writer::VRSWriter::isOpen,
          "Check if the file is open")
 
+    .def("is_durable",
+         &pyvrs_writer::VRSWriter::isDurable,
+         "Check if records are flushed to disk periodically")
+
     .def("__enter__",
          [](pyvrs_writer::VRSWriter& self) -> pyvrs_writer::VRSWriter& {
            return self;
@@ -49,4 +110,11 @@ PYBIND11_MODULE(_pyvrs_writer, m) {
          [](pyvrs_writer::VRSWriter& self, py::object, py::object, py::object) {
            self.close();
          });
+
+  m.def("recover_file",
+        &pyvrs_writer::recoverFile,
+        py::arg("source_path"),
+        py::arg("destination_path"),
+        py::call_guard<py::gil_scoped_release>(),
+        "Rebuild a VRS file that was not closed cleanly into a new, indexed file");
 }
@@ -1,14 +1,22 @@
 // pyvrs_writer/src/vrs_writer.cpp
 #include "vrs_writer.h"
+#include <vrs/Compressor.h>
 #include <vrs/RecordFileWriter.h>
 #include <vrs/Recordable.h>
 #include <vrs/StreamId.h>
 #include <vrs/DataLayout.h>
 #include <vrs/DataPieces.h>
 #include <vrs/RecordFormat.h>
+#include <vrs/utils/CopyRecords.h>
+#include <vrs/utils/FilteredFileReader.h>
+#include <algorithm>
+#include <array>
+#include <limits>
 #include <stdexcept>
 #include <map>
 #include <memory>
+#include <optional>
+#include <thread>
 
 namespace pyvrs_writer {
 
@@ -26,29 +34,76 @@ public:
   vrs::AutoDataLayoutEnd endLayout;
 };
 
-// 簡易的なRecordableラッパークラス
-class SimpleRecordable : public vrs::Recordable {
+// 画像ストリームで使用可能なPixelFormat
+static vrs::PixelFormat toPixelFormat(const std::string& name) {
+  static const std::map<std::string, vrs::PixelFormat> kPixelFormats = {
+      {"RGB8", vrs::PixelFormat::RGB8},
+      {"BGR8", vrs::PixelFormat::BGR8},
+      {"GREY8", vrs::PixelFormat::GREY8},
+      {"GREY16", vrs::PixelFormat::GREY16},
+  };
+  auto it = kPixelFormats.find(name);
+  if (it == kPixelFormats.end()) {
+    throw std::invalid_argument("Unsupported pixel format: " + name);
+  }
+  return it->second;
+}
+
+// 圧縮画像ストリームで使用可能なImageFormat
+static vrs::ImageFormat toImageFormat(const std::string& name) {
+  static const std::map<std::string, vrs::ImageFormat> kImageFormats = {
+      {"JPG", vrs::ImageFormat::JPG},
+      {"PNG", vrs::ImageFormat::PNG},
+      {"JXL", vrs::ImageFormat::JXL},
+  };
+  auto it = kImageFormats.find(name);
+  if (it == kImageFormats.end()) {
+    throw std::invalid_argument("Unsupported image format: " + name);
+  }
+  return it->second;
+}
+
+// レコード圧縮のプリセット（速度重視: LZ4/Zstdとも最速の設定）
+static vrs::CompressionPreset toCompressionPreset(const std::string& name) {
+  static const std::map<std::string, vrs::CompressionPreset> kCompressionPresets = {
+      {"none", vrs::CompressionPreset::None},
+      {"lz4", vrs::CompressionPreset::Lz4Fast},
+      {"zstd", vrs::CompressionPreset::ZstdFast},
+  };
+  auto it = kCompressionPresets.find(name);
+  if (it == kCompressionPresets.end()) {
+    throw std::invalid_argument("Unsupported compression: " + name);
+  }
+  return it->second;
+}
+
+// IMU用DataLayout（K個のサンプルを1レコードにまとめる）
+class MotionDataLayout : public vrs::AutoDataLayout {
+public:
+  vrs::DataPieceVector<double> timestamps{"timestamps"};
+  vrs::DataPieceVector<vrs::Point3Dd> samples{"samples"};
+  vrs::AutoDataLayoutEnd endLayout;
+};
+
+// Configuration/State recordを共通化したRecordable基底クラス
+class StreamRecordable : public vrs::Recordable {
+protected:
   static const uint32_t kConfigurationRecordFormatVersion = 1;
   static const uint32_t kDataRecordFormatVersion = 1;
 
 public:
-  SimpleRecordable(uint32_t streamId, const std::string& streamName)
+  StreamRecordable(uint32_t streamId, const std::string& streamName)
     : vrs::Recordable(vrs::RecordableTypeId::UnitTest1, streamName),
       streamId_(streamId),
       configTimestamp_(0.0) {
     setRecordableIsActive(true);
 
-    // RecordFormatを登録
+    // Configuration RecordFormatを登録
     addRecordFormat(
         vrs::Record::Type::CONFIGURATION,
         kConfigurationRecordFormatVersion,
         configDataLayout_.getContentBlock(),
         {&configDataLayout_});
-    addRecordFormat(
-        vrs::Record::Type::DATA,
-        kDataRecordFormatVersion,
-        dataRecordDataLayout_.getContentBlock() + vrs::ContentBlock(vrs::ContentType::CUSTOM),
-        {&dataRecordDataLayout_});
   }
 
   // Configuration JSONを設定
@@ -57,16 +112,17 @@ public:
     configTimestamp_ = timestamp;
   }
 
-  // データレコードを作成
-  void addDataRecord(double timestamp, const std::vector<uint8_t>& data) {
-    // DataLayoutにtimestampを設定
-    dataRecordDataLayout_.timestamp.set(timestamp);
+  // バイト列のデータレコードを作成（対応しないストリームでは例外）
+  virtual void addDataRecord(double /*timestamp*/, const std::vector<uint8_t>& /*data*/) {
+    throw std::runtime_error("Stream does not accept raw data records");
+  }
 
-    // DataSource: DataLayout + CUSTOM data block
-    vrs::DataSource dataSource(
-        dataRecordDataLayout_,
-        {data.data(), data.size()});
-    createRecord(timestamp, vrs::Record::Type::DATA, kDataRecordFormatVersion, dataSource);
+  // IMUサンプルのデータレコードを作成（対応しないストリームでは例外）
+  virtual void addMotionRecord(
+      double /*timestamp*/,
+      const std::vector<double>& /*sampleTimestamps*/,
+      const std::vector<std::array<double, 3>>& /*samples*/) {
+    throw std::runtime_error("Stream does not accept motion sample records");
   }
 
   // Configuration recordを作成
@@ -92,26 +148,134 @@ public:
     return createRecord(0.0, vrs::Record::Type::STATE, 1);
   }
 
-private:
+protected:
   uint32_t streamId_;
   std::string configJson_;
   double configTimestamp_;
   ConfigDataLayout configDataLayout_;
+};
+
+// 簡易的なRecordableラッパークラス（DataLayout + CUSTOM/画像ブロック）
+class SimpleRecordable : public StreamRecordable {
+public:
+  // dataBlock: Dataレコードのペイロードブロック（既定はCUSTOMブロック）
+  SimpleRecordable(
+      uint32_t streamId,
+      const std::string& streamName,
+      const vrs::ContentBlock& dataBlock = vrs::ContentBlock(vrs::ContentType::CUSTOM))
+    : StreamRecordable(streamId, streamName) {
+    // Data RecordFormatを登録
+    addRecordFormat(
+        vrs::Record::Type::DATA,
+        kDataRecordFormatVersion,
+        dataRecordDataLayout_.getContentBlock() + dataBlock,
+        {&dataRecordDataLayout_});
+  }
+
+  // データレコードを作成
+  void addDataRecord(double timestamp, const std::vector<uint8_t>& data) override {
+    // DataLayoutにtimestampを設定
+    dataRecordDataLayout_.timestamp.set(timestamp);
+
+    // DataSource: DataLayout + CUSTOM data block
+    vrs::DataSource dataSource(
+        dataRecordDataLayout_,
+        {data.data(), data.size()});
+    createRecord(timestamp, vrs::Record::Type::DATA, kDataRecordFormatVersion, dataSource);
+  }
+
+private:
   DataRecordDataLayout dataRecordDataLayout_;
 };
 
+// IMU用Recordable（型付きDataLayoutのみ、CUSTOMブロックなし）
+class MotionRecordable : public StreamRecordable {
+public:
+  MotionRecordable(uint32_t streamId, const std::string& streamName)
+    : StreamRecordable(streamId, streamName) {
+    addRecordFormat(
+        vrs::Record::Type::DATA,
+        kDataRecordFormatVersion,
+        motionDataLayout_.getContentBlock(),
+        {&motionDataLayout_});
+  }
+
+  // K個のサンプルを1つのデータレコードとして作成
+  void addMotionRecord(
+      double timestamp,
+      const std::vector<double>& sampleTimestamps,
+      const std::vector<std::array<double, 3>>& samples) override {
+    if (sampleTimestamps.size() != samples.size()) {
+      throw std::invalid_argument("sample timestamps and samples must have the same length");
+    }
+
+    std::vector<vrs::Point3Dd> points;
+    points.reserve(samples.size());
+    for (const auto& sample : samples) {
+      points.emplace_back(sample[0], sample[1], sample[2]);
+    }
+    motionDataLayout_.timestamps.stage(sampleTimestamps);
+    motionDataLayout_.samples.stage(points);
+
+    createRecord(
+        timestamp,
+        vrs::Record::Type::DATA,
+        kDataRecordFormatVersion,
+        vrs::DataSource(motionDataLayout_));
+  }
+
+private:
+  MotionDataLayout motionDataLayout_;
+};
+
 class VRSWriter::Impl {
 public:
   std::unique_ptr<vrs::RecordFileWriter> writer;
-  std::map<uint32_t, std::unique_ptr<SimpleRecordable>> recordables;
+  std::map<uint32_t, std::unique_ptr<StreamRecordable>> recordables;
   std::string filepath;
   bool isOpen = false;
+  double flushIntervalSec = 0.0;  // 0: 同期書き込み（close()で一括）
+  bool fileCreated = false;  // 耐久モードでファイルを作成済みか
+  std::optional<vrs::CompressionPreset> compression;  // 未設定ならVRSの既定値
+
+  bool isDurable() const {
+    return flushIntervalSec > 0.0;
+  }
+
+  // Recordableを登録（圧縮設定済みなら適用）
+  void addRecordable(uint32_t streamId, std::unique_ptr<StreamRecordable> recordable) {
+    if (compression) {
+      recordable->setCompression(*compression);
+    }
+    writer->addRecordable(recordable.get());
+    recordables[streamId] = std::move(recordable);
+  }
+
+  // 耐久モードで最初のDataレコードの前にファイルを作成し、定期フラッシュを開始
+  void ensureFileCreated() {
+    if (!isDurable() || fileCreated) {
+      return;
+    }
+    // createFileAsync()は各RecordableのConfiguration/Stateレコードを作成する
+    int result = writer->createFileAsync(filepath);
+    if (result != 0) {
+      throw std::runtime_error("Failed to create VRS file");
+    }
+    // バックグラウンドスレッドが一定間隔で作成済みの全レコードを書き出す
+    writer->autoWriteRecordsAsync(
+        []() { return std::numeric_limits<double>::max(); }, flushIntervalSec);
+    fileCreated = true;
+  }
 };
 
-VRSWriter::VRSWriter(const std::string& filepath)
+VRSWriter::VRSWriter(const std::string& filepath, double flushIntervalSec)
   : pImpl_(std::make_unique<Impl>()) {
+  if (flushIntervalSec < 0.0) {
+    throw std::invalid_argument("flushIntervalSec must not be negative");
+  }
   pImpl_->writer = std::make_unique<vrs::RecordFileWriter>();
   pImpl_->filepath = filepath;
+  pImpl_->flushIntervalSec = flushIntervalSec;
   pImpl_->isOpen = true;
 }
 
@@ -126,9 +290,48 @@ void VRSWriter::addStream(uint32_t streamId, const std::string& streamName) {
     throw std::runtime_error("VRS file is not open");
   }
 
-  auto recordable = std::make_unique<SimpleRecordable>(streamId, streamName);
-  pImpl_->writer->addRecordable(recordable.get());
-  pImpl_->recordables[streamId] = std::move(recordable);
+  pImpl_->addRecordable(streamId, std::make_unique<SimpleRecordable>(streamId, streamName));
+}
+
+void VRSWriter::addImageStream(
+    uint32_t streamId,
+    const std::string& streamName,
+    const std::string& pixelFormat,
+    uint32_t width,
+    uint32_t height,
+    uint32_t stride) {
+  if (!pImpl_->isOpen) {
+    throw std::runtime_error("VRS file is not open");
+  }
+
+  // ImageContentBlockとして登録することで、pyvrs/vrsplayerが画像として解釈できる
+  vrs::ContentBlock imageBlock(toPixelFormat(pixelFormat), width, height, stride);
+  pImpl_->addRecordable(
+      streamId, std::make_unique<SimpleRecordable>(streamId, streamName, imageBlock));
+}
+
+void VRSWriter::addEncodedImageStream(
+    uint32_t streamId,
+    const std::string& streamName,
+    const std::string& imageFormat,
+    uint32_t width,
+    uint32_t height) {
+  if (!pImpl_->isOpen) {
+    throw std::runtime_error("VRS file is not open");
+  }
+
+  // 圧縮画像はレコードごとにサイズが異なるため、最後のブロックとしてサイズ未指定で登録
+  vrs::ContentBlock imageBlock(toImageFormat(imageFormat), width, height);
+  pImpl_->addRecordable(
+      streamId, std::make_unique<SimpleRecordable>(streamId, streamName, imageBlock));
+}
+
+void VRSWriter::addMotionStream(uint32_t streamId, const std::string& streamName) {
+  if (!pImpl_->isOpen) {
+    throw std::runtime_error("VRS file is not open");
+  }
+
+  pImpl_->addRecordable(streamId, std::make_unique<MotionRecordable>(streamId, streamName));
 }
 
 void VRSWriter::writeConfiguration(uint32_t streamId, const std::string& jsonConfig) {
@@ -144,8 +347,11 @@ void VRSWriter::writeConfiguration(uint32_t streamId, const std::string& jsonCon
 
   // Configuration JSONを設定し、Recordを作成
   // 注意: 同期書き込みモードでは明示的にcreateConfigurationRecord()を呼ぶ必要がある
+  // 耐久モードのファイル作成前は、createFileAsync()がこのJSONでRecordを作成する
   it->second->setConfigurationJson(jsonConfig, 0.0);
-  it->second->createConfigurationRecord();
+  if (!pImpl_->isDurable() || pImpl_->fileCreated) {
+    it->second->createConfigurationRecord();
+  }
 }
 
 void VRSWriter::writeData(uint32_t streamId, double timestamp,
@@ -161,17 +367,104 @@ void VRSWriter::writeData(uint32_t streamId, double timestamp,
   }
 
   // データレコードを作成（即座にRecordManagerに追加される）
+  pImpl_->ensureFileCreated();
   it->second->addDataRecord(timestamp, data);
 }
 
+void VRSWriter::writeMotionSamples(
+    uint32_t streamId,
+    double timestamp,
+    const std::vector<double>& sampleTimestamps,
+    const std::vector<std::array<double, 3>>& samples) {
+  if (!pImpl_->isOpen) {
+    throw std::runtime_error("VRS file is not open");
+  }
+
+  // 対応するRecordableを検索
+  auto it = pImpl_->recordables.find(streamId);
+  if (it == pImpl_->recordables.end()) {
+    throw std::runtime_error("Stream ID not found");
+  }
+
+  pImpl_->ensureFileCreated();
+  it->second->addMotionRecord(timestamp, sampleTimestamps, samples);
+}
+
+void VRSWriter::setCompression(const std::string& preset) {
+  if (!pImpl_->isOpen) {
+    throw std::runtime_error("VRS file is not open");
+  }
+
+  // 圧縮はレコードの書き出し時に行われるため、作成済みで未書き出しのレコードにも適用される
+  auto compression = toCompressionPreset(preset);
+  for (auto& entry : pImpl_->recordables) {
+    entry.second->setCompression(compression);
+  }
+  pImpl_->compression = compression;
+}
+
+void VRSWriter::setCompressionThreads(uint32_t threadCount) {
+  if (!pImpl_->isOpen) {
+    throw std::runtime_error("VRS file is not open");
+  }
+  if (pImpl_->fileCreated) {
+    throw std::runtime_error(
+        "Compression threads must be set before the first data record in durable mode");
+  }
+
+  if (threadCount == 0) {
+    threadCount = std::max(1u, std::thread::hardware_concurrency());
+  }
+  pImpl_->writer->setCompressionThreadPoolSize(threadCount);
+}
+
+void VRSWriter::setFileTag(const std::string& tagName, const std::string& tagValue) {
+  if (!pImpl_->isOpen) {
+    throw std::runtime_error("VRS file is not open");
+  }
+
+  // 同期書き込みではwriteToFile()でヘッダーが書かれるため、close()前なら反映される
+  if (pImpl_->fileCreated) {
+    throw std::runtime_error("File tags must be set before the first data record in durable mode");
+  }
+  pImpl_->writer->setTag(tagName, tagValue);
+}
+
+void VRSWriter::setStreamTag(
+    uint32_t streamId, const std::string& tagName, const std::string& tagValue) {
+  if (!pImpl_->isOpen) {
+    throw std::runtime_error("VRS file is not open");
+  }
+
+  // 対応するRecordableを検索
+  auto it = pImpl_->recordables.find(streamId);
+  if (it == pImpl_->recordables.end()) {
+    throw std::runtime_error("Stream ID not found");
+  }
+
+  if (pImpl_->fileCreated) {
+    throw std::runtime_error(
+        "Stream tags must be set before the first data record in durable mode");
+  }
+  it->second->setTag(tagName, tagValue);
+}
+
 void VRSWriter::close() {
   if (pImpl_->isOpen) {
-    // writeToFileを使って同期的にファイルに書き込む
-    int result = pImpl_->writer->writeToFile(pImpl_->filepath);
+    int result = 0;
+    if (pImpl_->isDurable()) {
+      // 残りのレコードとインデックスを書き出してクローズ
+      pImpl_->ensureFileCreated();
+      pImpl_->writer->closeFileAsync();
+      result = pImpl_->writer->waitForFileClosed();
+    } else {
+      // writeToFileを使って同期的にファイルに書き込む
+      result = pImpl_->writer->writeToFile(pImpl_->filepath);
+    }
+    pImpl_->isOpen = false;
     if (result != 0) {
       throw std::runtime_error("Failed to write VRS file");
     }
-    pImpl_->isOpen = false;
   }
 }
 
@@ -179,4 +472,22 @@ bool VRSWriter::isOpen() const {
   return pImpl_->isOpen;
 }
 
+bool VRSWriter::isDurable() const {
+  return pImpl_->isDurable();
+}
+
+void recoverFile(const std::string& sourcePath, const std::string& destinationPath) {
+  // インデックスが不完全なファイルは、オープン時にレコードをスキャンしてインデックスを再構築する
+  vrs::utils::FilteredFileReader reader(sourcePath);
+  if (reader.openFile() != 0) {
+    throw std::runtime_error("Failed to open VRS file: " + sourcePath);
+  }
+
+  // 読めた全レコードを新しいファイルにコピー（末尾のインデックスも書き込まれる）
+  vrs::utils::CopyOptions options(false);
+  if (vrs::utils::copyRecords(reader, destinationPath, options) != 0) {
+    throw std::runtime_error("Failed to write recovered VRS file: " + destinationPath);
+  }
+}
+
 }  // namespace pyvrs_writer
@@ -35,6 +35,102 @@ TEST_F(VRSWriterTest, AddStream) {
   EXPECT_NO_THROW(writer.addStream(1001, "RGB Camera"));
 }
 
+TEST_F(VRSWriterTest, AddImageStream) {
+  pyvrs_writer::VRSWriter writer(testFilePath_);
+  EXPECT_NO_THROW(writer.addImageStream(1001, "RGB Camera", "RGB8", 4, 2));
+  std::vector<uint8_t> frame(4 * 2 * 3, 0x7f);
+  EXPECT_NO_THROW(writer.writeData(1001, 0.0, frame));
+}
+
+TEST_F(VRSWriterTest, AddImageStreamRejectsUnknownPixelFormat) {
+  pyvrs_writer::VRSWriter writer(testFilePath_);
+  EXPECT_THROW(writer.addImageStream(1001, "Camera", "YUV", 4, 2), std::invalid_argument);
+}
+
+TEST_F(VRSWriterTest, AddEncodedImageStream) {
+  pyvrs_writer::VRSWriter writer(testFilePath_);
+  EXPECT_NO_THROW(writer.addEncodedImageStream(1001, "RGB Camera", "JPG", 4, 2));
+  // 圧縮データは可変長（ここではダミーのバイト列）
+  std::vector<uint8_t> jpeg = {0xff, 0xd8, 0xff, 0xd9};
+  EXPECT_NO_THROW(writer.writeData(1001, 0.0, jpeg));
+}
+
+TEST_F(VRSWriterTest, AddEncodedImageStreamRejectsUnknownFormat) {
+  pyvrs_writer::VRSWriter writer(testFilePath_);
+  EXPECT_THROW(writer.addEncodedImageStream(1001, "Camera", "BMP", 4, 2), std::invalid_argument);
+}
+
+TEST_F(VRSWriterTest, WriteMotionSamples) {
+  pyvrs_writer::VRSWriter writer(testFilePath_);
+  writer.addMotionStream(1003, "Accel");
+  std::vector<double> timestamps = {0.0, 0.0025};
+  std::vector<std::array<double, 3>> samples = {{0.1, 0.2, 9.8}, {0.1, 0.3, 9.7}};
+  EXPECT_NO_THROW(writer.writeMotionSamples(1003, 0.0, timestamps, samples));
+}
+
+TEST_F(VRSWriterTest, MotionStreamRejectsRawData) {
+  pyvrs_writer::VRSWriter writer(testFilePath_);
+  writer.addMotionStream(1003, "Accel");
+  std::vector<uint8_t> data = {0x01};
+  EXPECT_THROW(writer.writeData(1003, 0.0, data), std::runtime_error);
+}
+
+TEST_F(VRSWriterTest, SetTags) {
+  pyvrs_writer::VRSWriter writer(testFilePath_);
+  writer.addStream(1001, "RGB Camera");
+  EXPECT_NO_THROW(writer.setFileTag("source", "input.bag"));
+  EXPECT_NO_THROW(writer.setStreamTag(1001, "stats", "{}"));
+  EXPECT_THROW(writer.setStreamTag(9999, "stats", "{}"), std::runtime_error);
+  writer.close();
+  EXPECT_THROW(writer.setFileTag("source", "input.bag"), std::runtime_error);
+}
+
+TEST_F(VRSWriterTest, SetCompression) {
+  pyvrs_writer::VRSWriter writer(testFilePath_);
+  writer.addStream(1001, "RGB Camera");
+  EXPECT_NO_THROW(writer.setCompression("zstd"));
+  EXPECT_NO_THROW(writer.setCompressionThreads(0));
+  // 設定後に追加したストリームにも適用される
+  writer.addStream(1002, "Depth Camera");
+  std::vector<uint8_t> data(1024, 0x7f);
+  writer.writeData(1001, 0.0, data);
+  writer.writeData(1002, 0.0, data);
+  writer.close();
+  EXPECT_LT(fs::file_size(testFilePath_), 2048u);
+}
+
+TEST_F(VRSWriterTest, SetCompressionRejectsUnknownPreset) {
+  pyvrs_writer::VRSWriter writer(testFilePath_);
+  EXPECT_THROW(writer.setCompression("gzip"), std::invalid_argument);
+}
+
+TEST_F(VRSWriterTest, DurableModeWritesFileBeforeClose) {
+  pyvrs_writer::VRSWriter writer(testFilePath_, 0.1);
+  EXPECT_TRUE(writer.isDurable());
+  writer.addStream(1001, "RGB Camera");
+  writer.writeConfiguration(1001, R"({"width": 4})");
+  std::vector<uint8_t> data = {0x01, 0x02};
+  writer.writeData(1001, 0.0, data);
+  // 最初のDataレコードでファイルが作成される
+  EXPECT_TRUE(fs::exists(testFilePath_));
+  EXPECT_THROW(writer.setFileTag("source", "input.bag"), std::runtime_error);
+  writer.close();
+  EXPECT_FALSE(writer.isOpen());
+}
+
+TEST_F(VRSWriterTest, RecoverFile) {
+  {
+    pyvrs_writer::VRSWriter writer(testFilePath_, 0.1);
+    writer.addStream(1001, "RGB Camera");
+    std::vector<uint8_t> data = {0x01, 0x02};
+    writer.writeData(1001, 0.0, data);
+  }
+  std::string recoveredPath = "/tmp/test_vrs_writer_recovered.vrs";
+  EXPECT_NO_THROW(pyvrs_writer::recoverFile(testFilePath_, recoveredPath));
+  EXPECT_TRUE(fs::exists(recoveredPath));
+  fs::remove(recoveredPath);
+}
+
 TEST_F(VRSWriterTest, WriteConfiguration) {
   pyvrs_writer::VRSWriter writer(testFilePath_);
   writer.addStream(1001, "RGB Camera");
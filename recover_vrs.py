@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+VRS File Recovery
+
+Recover a VRS file that was not closed cleanly, e.g. when a conversion run
+with --flush-interval crashed or was killed. All records flushed to disk are
+copied into a new file with a complete index.
+
+Usage:
+    ./recover_vrs.py partial.vrs
+    ./recover_vrs.py partial.vrs recovered.vrs
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+
+from vrs_writer import recover_vrs_file  # noqa: E402
+
+
+def main() -> int:
+    """Main entry point for VRS recovery"""
+    parser = argparse.ArgumentParser(
+        description="Recover a VRS file that was not closed cleanly",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Write partial.recovered.vrs next to the input
+  ./recover_vrs.py output.vrs
+
+  # Choose the output path
+  ./recover_vrs.py output.vrs output_fixed.vrs
+
+Tip: Only conversions run with --flush-interval leave recoverable files.
+        """,
+    )
+
+    parser.add_argument(
+        "input_vrs",
+        type=Path,
+        help="Partial VRS file path",
+    )
+
+    parser.add_argument(
+        "output_vrs",
+        type=Path,
+        nargs="?",
+        default=None,
+        help="Recovered VRS file path (default: INPUT.recovered.vrs)",
+    )
+
+    args = parser.parse_args()
+
+    # Validate input
+    if not args.input_vrs.exists():
+        print(f"Error: VRS file not found: {args.input_vrs}", file=sys.stderr)
+        return 1
+
+    try:
+        output_vrs = recover_vrs_file(args.input_vrs, args.output_vrs)
+    except Exception as e:
+        print(f"❌ Recovery failed: {e}", file=sys.stderr)
+        return 1
+
+    print(f"✅ Recovered: {output_vrs}")
+    print(f"  Size: {output_vrs.stat().st_size / 1024 / 1024:.2f} MB")
+    print("\nTo inspect the VRS file, run:")
+    print(f"  ./inspect_vrs.py {output_vrs}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,340 @@
+"""Content-addressed cache of conversion results.
+
+Re-running a conversion of the same bag with the same settings produces the
+same VRS output, so ConversionCache stores finished outputs under a key made
+of a fingerprint of the bag content, the converter configuration (including
+the topic mapping) and the output format version. On a hit the cached files are
+copied to the requested output path and the stored ConversionResult is
+returned instead of converting again.
+
+The bag fingerprint hashes the file size and a fixed number of blocks spread
+evenly over the file (always including the first and the last block, where
+ROS bag headers and indexes live), so fingerprinting a multi-GB bag reads only
+about 1 MB; sample_blocks=0 hashes the whole file instead. Entries are
+directories ``<cache_dir>/<key>/`` holding the output files and
+``result.json``; the modification time of ``result.json`` is the last use, and
+the least recently used entries are evicted when the cache exceeds its size
+limit. This module has no VRS dependency. Follows the Single Responsibility
+Principle (SRP) by focusing solely on caching conversion outputs.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Any
+
+from scripts import __version__
+from scripts.vrs_manifest import get_chunk_path, get_manifest_path, read_manifest, write_manifest
+
+CACHE_FORMAT_VERSION = 1  # Layout of a cache entry (result.json, file names)
+
+# Layout of the converter's VRS output (streams, records, configurations, tags).
+# Bump it with every change to the output, so entries and checkpoints written
+# by an older converter are not reused (the package version is rarely bumped).
+OUTPUT_FORMAT_VERSION = 1
+
+# Entry file holding the stored ConversionResult and the list of output files
+RESULT_FILE = "result.json"
+
+# Logical output name inside an entry (chunks: output_000.vrs, ..., output.manifest.json)
+ENTRY_VRS_NAME = "output.vrs"
+
+DEFAULT_SAMPLE_BLOCKS = 16
+SAMPLE_BLOCK_SIZE = 64 * 1024
+DEFAULT_MAX_SIZE_BYTES = 50 * 1024**3
+
+# ConverterConfig fields that do not change the output files
+KEY_EXCLUDED_FIELDS = ("verbose", "encoder_threads", "checkpoint")
+
+_READ_BLOCK_SIZE = 1024 * 1024
+
+
+def fingerprint_bag(path: Path, sample_blocks: int = DEFAULT_SAMPLE_BLOCKS) -> str:
+    """
+    Compute a fast content fingerprint of a bag file
+
+    Args:
+        path: Bag file
+        sample_blocks: Number of blocks hashed besides the size (>= 2), or 0 to
+            hash the whole file. Files smaller than the samples are hashed whole.
+
+    Returns:
+        Hex digest
+
+    Raises:
+        ValueError: If sample_blocks is 1 or negative
+        OSError: If the file cannot be read
+    """
+    if sample_blocks < 0 or sample_blocks == 1:
+        raise ValueError(f"sample_blocks must be 0 or >= 2, got {sample_blocks}")
+
+    size = Path(path).stat().st_size
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(size.to_bytes(8, "little"))
+    with open(path, "rb") as f:
+        if sample_blocks == 0 or size <= sample_blocks * SAMPLE_BLOCK_SIZE:
+            while block := f.read(_READ_BLOCK_SIZE):
+                digest.update(block)
+        else:
+            last_offset = size - SAMPLE_BLOCK_SIZE
+            for i in range(sample_blocks):
+                f.seek(last_offset * i // (sample_blocks - 1))
+                digest.update(f.read(SAMPLE_BLOCK_SIZE))
+    return digest.hexdigest()
+
+
+def compute_cache_key(bag_fingerprint: str, config: Any, parallel: bool = False) -> str:
+    """
+    Compute the cache key of a conversion
+
+    Args:
+        bag_fingerprint: Result of fingerprint_bag()
+        config: ConverterConfig (dataclass; fields in KEY_EXCLUDED_FIELDS are ignored)
+        parallel: Whether the output is merged from time ranges (always chunked,
+            see scripts.parallel_converter) instead of written by one converter
+
+    Returns:
+        Hex digest used as the entry directory name
+    """
+    config_dict = {
+        f.name: getattr(config, f.name) for f in fields(config) if f.name not in KEY_EXCLUDED_FIELDS
+    }
+    document = {
+        "format_version": CACHE_FORMAT_VERSION,
+        "output_format_version": OUTPUT_FORMAT_VERSION,
+        "converter_version": __version__,
+        "bag": bag_fingerprint,
+        "config": config_dict,
+        "parallel": parallel,
+    }
+    encoded = json.dumps(
+        document, sort_keys=True, separators=(",", ":"), default=asdict  # StreamConfig values
+    ).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy a file, replacing dst atomically"""
+    tmp_path = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
+def _directory_size(path: Path) -> int:
+    return sum(entry.stat().st_size for entry in path.iterdir() if entry.is_file())
+
+
+class ConversionCache:
+    """
+    Size-limited LRU cache of conversion outputs keyed by bag content and config
+
+    Usage:
+        cache = ConversionCache(Path("~/.cache/realsense_vrs").expanduser())
+        converter = RosbagToVRSConverter(bag, vrs, config, cache=cache)
+        result = converter.convert()  # result.cache_hit on a hit
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+        sample_blocks: int = DEFAULT_SAMPLE_BLOCKS,
+    ) -> None:
+        """
+        Initialize the cache (the directory is created if needed)
+
+        Args:
+            cache_dir: Cache directory
+            max_size_bytes: Total size of the entries kept after each store
+            sample_blocks: Bag fingerprint blocks (0: hash whole bags, see fingerprint_bag())
+
+        Raises:
+            ValueError: If max_size_bytes or sample_blocks is invalid
+            OSError: If the directory cannot be created
+        """
+        if max_size_bytes < 0:
+            raise ValueError(f"max_size_bytes must be >= 0, got {max_size_bytes}")
+        if sample_blocks < 0 or sample_blocks == 1:
+            raise ValueError(f"sample_blocks must be 0 or >= 2, got {sample_blocks}")
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+        self.sample_blocks = sample_blocks
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_key(self, bag_path: Path, config: Any, parallel: bool = False) -> str:
+        """Get the cache key of converting bag_path with config (see compute_cache_key())"""
+        return compute_cache_key(fingerprint_bag(bag_path, self.sample_blocks), config, parallel)
+
+    def _read_entry(self, key: str) -> dict[str, Any] | None:
+        """Read an entry's result.json (None if missing or from another cache format)"""
+        try:
+            with open(self.cache_dir / key / RESULT_FILE, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if entry.get("format_version") != CACHE_FORMAT_VERSION:
+            return None
+        return entry
+
+    def restore(self, key: str, vrs_path: Path) -> dict[str, Any] | None:
+        """
+        Copy a cached output to vrs_path
+
+        Chunked outputs are restored as the chunk files and manifest of vrs_path
+        (``name_000.vrs``, ..., ``name.manifest.json``).
+
+        Args:
+            key: Cache key from get_key()
+            vrs_path: Requested output path
+
+        Returns:
+            The stored ConversionResult fields with ``output_files`` set to the
+            restored files, or None on a miss
+        """
+        entry = self._read_entry(key)
+        if entry is None:
+            return None
+        entry_dir = self.cache_dir / key
+        if not all((entry_dir / name).is_file() for name in entry["files"]):
+            # Damaged entry (e.g. files removed by hand): convert again
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+
+        vrs_path = Path(vrs_path)
+        if entry["chunked"]:
+            output_files = [get_chunk_path(vrs_path, i) for i in range(len(entry["files"]))]
+            for name, output_file in zip(entry["files"], output_files):
+                _copy_file(entry_dir / name, output_file)
+            manifest = read_manifest(get_manifest_path(entry_dir / ENTRY_VRS_NAME))
+            chunks = manifest["chunks"]
+            for chunk, output_file in zip(chunks, output_files):
+                chunk["path"] = output_file.name
+            write_manifest(get_manifest_path(vrs_path), chunks)
+        else:
+            output_files = [vrs_path]
+            _copy_file(entry_dir / entry["files"][0], vrs_path)
+
+        # Mark the entry as recently used
+        os.utime(entry_dir / RESULT_FILE)
+
+        result = dict(entry["result"])
+        result["output_files"] = [str(path) for path in output_files]
+        return result
+
+    def store(
+        self,
+        key: str,
+        result: dict[str, Any],
+        vrs_path: Path,
+        output_files: list[Path],
+        chunked: bool,
+    ) -> bool:
+        """
+        Store the output of a finished conversion, then evict old entries
+
+        Args:
+            key: Cache key from get_key()
+            result: ConversionResult fields (asdict(); output_files is not stored)
+            vrs_path: Output path of the conversion
+            output_files: VRS files written (chunks in order if chunked)
+            chunked: Whether the output is chunked (vrs_path's manifest lists the chunks)
+
+        Returns:
+            True if stored, False if the output alone exceeds the cache size limit
+            or the entry already exists
+
+        Raises:
+            OSError: If the files cannot be copied
+        """
+        entry_dir = self.cache_dir / key
+        if entry_dir.exists():
+            return False
+        output_files = [Path(path) for path in output_files]
+        if sum(path.stat().st_size for path in output_files) > self.max_size_bytes:
+            return False
+
+        # Build the entry in a temporary directory and rename it into place, so that
+        # concurrent conversions and lookups never see a partial entry
+        tmp_dir = self.cache_dir / f".tmp-{key}-{os.getpid()}"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir()
+        try:
+            if chunked:
+                names = [
+                    get_chunk_path(Path(ENTRY_VRS_NAME), i).name for i in range(len(output_files))
+                ]
+                chunks = read_manifest(get_manifest_path(Path(vrs_path)))["chunks"]
+                for chunk, name in zip(chunks, names):
+                    chunk["path"] = name
+                write_manifest(get_manifest_path(tmp_dir / ENTRY_VRS_NAME), chunks)
+            else:
+                names = [ENTRY_VRS_NAME]
+            for path, name in zip(output_files, names):
+                shutil.copyfile(path, tmp_dir / name)
+
+            stored_result = {
+                name: value
+                for name, value in result.items()
+                if name not in ("output_files", "cache_hit")
+            }
+            entry = {
+                "format_version": CACHE_FORMAT_VERSION,
+                "created_at": time.time(),
+                "chunked": chunked,
+                "files": names,
+                "result": stored_result,
+            }
+            with open(tmp_dir / RESULT_FILE, "w", encoding="utf-8") as f:
+                json.dump(entry, f, indent=2)
+
+            try:
+                os.rename(tmp_dir, entry_dir)
+            except OSError:
+                # Stored by another process in the meantime
+                return False
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        self.evict()
+        return True
+
+    def evict(self) -> list[str]:
+        """
+        Remove least recently used entries until the cache fits max_size_bytes
+
+        Returns:
+            Keys of the removed entries
+        """
+        entries = []
+        for entry_dir in self.cache_dir.iterdir():
+            if not entry_dir.is_dir() or entry_dir.name.startswith("."):
+                continue
+            result_path = entry_dir / RESULT_FILE
+            try:
+                last_used = result_path.stat().st_mtime
+                size = _directory_size(entry_dir)
+            except OSError:
+                continue  # Removed concurrently, or still being renamed into place
+            entries.append((last_used, entry_dir.name, size))
+
+        total = sum(size for _, _, size in entries)
+        removed = []
+        for _, key, size in sorted(entries):
+            if total <= self.max_size_bytes:
+                break
+            shutil.rmtree(self.cache_dir / key, ignore_errors=True)
+            total -= size
+            removed.append(key)
+        return removed
+
+    def size_bytes(self) -> int:
+        """Get the total size of the cached entries"""
+        return sum(
+            _directory_size(entry_dir)
+            for entry_dir in self.cache_dir.iterdir()
+            if entry_dir.is_dir() and not entry_dir.name.startswith(".")
+        )
@@ -0,0 +1,152 @@
+"""Checkpoint sidecar for resumable chunked conversions.
+
+A chunked conversion (see scripts.vrs_manifest) commits its output one chunk
+file at a time. With checkpointing enabled, RosbagToVRSConverter writes
+``name.checkpoint.json`` next to the output every time it starts a new chunk:
+the manifest entries and stream statistics of the finished chunks, the bag
+position of the first message not yet written, the message counters, the
+state carried between chunks (last option values) and the metadata caches of
+the info pre-pass. After a failure (disk full, preemption) the next run with
+the same bag and configuration loads the checkpoint, skips the pre-pass,
+reads the bag from the checkpoint position and continues with the next chunk,
+so the manifest still describes one continuous recording. The checkpoint is
+removed when the conversion completes. This module has no VRS dependency.
+Follows the Single Responsibility Principle (SRP) by focusing solely on the
+checkpoint format.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from scripts.vrs_summary import StreamStats
+
+CHECKPOINT_SUFFIX = ".checkpoint.json"
+CHECKPOINT_FORMAT = "vrs-conversion-checkpoint"
+CHECKPOINT_VERSION = 1
+
+
+def get_checkpoint_path(vrs_path: Path) -> Path:
+    """Get the checkpoint path of a conversion.
+
+    Args:
+        vrs_path: Logical output path (e.g. ``output.vrs``)
+
+    Returns:
+        Checkpoint path (e.g. ``output.checkpoint.json``)
+    """
+    return vrs_path.with_name(vrs_path.stem + CHECKPOINT_SUFFIX)
+
+
+@dataclass
+class ConversionCheckpoint:
+    """State of a chunked conversion at a chunk boundary.
+
+    The bag position is the log time of the first message that is not in a
+    finished chunk, plus the number of messages with exactly that time that
+    are (messages sharing a timestamp are read in a stable order).
+    """
+
+    conversion_key: str  # Bag fingerprint + configuration (scripts.conversion_cache)
+    resume_timestamp: int  # Bag log time in nanoseconds
+    resume_skip: int = 0  # Messages at resume_timestamp already written
+    chunks: list[dict[str, Any]] = field(default_factory=list)  # Manifest entries
+    chunk_stream_stats: dict[int, list[StreamStats]] = field(default_factory=dict)
+    total_messages: int = 0
+    messages_per_stream: dict[int, int] = field(default_factory=dict)
+    option_values: dict[str, float] = field(default_factory=dict)  # Topic -> last value
+    metadata: dict[str, Any] = field(default_factory=dict)  # Serialized pre-pass caches
+
+    def last_timestamps(self) -> dict[int, float | None]:
+        """Get the timestamp (seconds) of the last committed record of each stream."""
+        return {
+            stream_id: max(
+                (s.last_timestamp for s in stats if s.last_timestamp is not None), default=None
+            )
+            for stream_id, stats in self.chunk_stream_stats.items()
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert into a JSON-serializable dictionary."""
+        return {
+            "format": CHECKPOINT_FORMAT,
+            "version": CHECKPOINT_VERSION,
+            "conversion_key": self.conversion_key,
+            "resume_timestamp": self.resume_timestamp,
+            "resume_skip": self.resume_skip,
+            "chunks": self.chunks,
+            "chunk_stream_stats": {
+                str(stream_id): [asdict(s) for s in stats]
+                for stream_id, stats in self.chunk_stream_stats.items()
+            },
+            "last_timestamps": {
+                str(stream_id): timestamp for stream_id, timestamp in self.last_timestamps().items()
+            },
+            "total_messages": self.total_messages,
+            "messages_per_stream": {
+                str(stream_id): count for stream_id, count in self.messages_per_stream.items()
+            },
+            "option_values": self.option_values,
+            "metadata": self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ConversionCheckpoint":
+        """Create from a dictionary written by to_dict().
+
+        Raises:
+            ValueError: If data is not a supported checkpoint
+        """
+        if not isinstance(data, dict) or data.get("format") != CHECKPOINT_FORMAT:
+            raise ValueError("Not a VRS conversion checkpoint")
+        if data.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {data.get('version')}")
+        try:
+            return cls(
+                conversion_key=data["conversion_key"],
+                resume_timestamp=int(data["resume_timestamp"]),
+                resume_skip=int(data["resume_skip"]),
+                chunks=list(data["chunks"]),
+                chunk_stream_stats={
+                    int(stream_id): [StreamStats(**s) for s in stats]
+                    for stream_id, stats in data["chunk_stream_stats"].items()
+                },
+                total_messages=int(data["total_messages"]),
+                messages_per_stream={
+                    int(stream_id): int(count)
+                    for stream_id, count in data["messages_per_stream"].items()
+                },
+                option_values={topic: float(v) for topic, v in data["option_values"].items()},
+                metadata=dict(data["metadata"]),
+            )
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid checkpoint: {e}") from e
+
+
+def write_checkpoint(checkpoint_path: Path, checkpoint: ConversionCheckpoint) -> None:
+    """Write a checkpoint atomically.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    tmp_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint.to_dict(), f)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def read_checkpoint(checkpoint_path: Path) -> ConversionCheckpoint:
+    """Read and validate a checkpoint.
+
+    Raises:
+        ValueError: If the file is not a supported checkpoint
+        OSError: If the file cannot be read
+    """
+    with open(checkpoint_path, encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid checkpoint '{checkpoint_path}': {e}") from e
+    return ConversionCheckpoint.from_dict(data)
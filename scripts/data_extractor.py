@@ -5,15 +5,55 @@ This module provides functionality to extract and process RealSense sensor data
 Responsibility Principle (SRP) by focusing on data extraction and transformation.
 """
 
-from typing import Any
-import numpy as np
-from datetime import datetime
 import struct
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
 
-from rosbags.typesys import get_typestore, Stores
+import numpy as np
+from rosbags.typesys import Stores, get_typestore
 
 from scripts.timestamp_handler import ros_timestamp_to_datetime
 
+# sensor_msgs/Image encodings -> (dtype, channels)
+IMAGE_ENCODINGS: dict[str, tuple[np.dtype[Any], int]] = {
+    "rgb8": (np.dtype(np.uint8), 3),
+    "bgr8": (np.dtype(np.uint8), 3),
+    "16UC1": (np.dtype(np.uint16), 1),
+    "mono16": (np.dtype(np.uint16), 1),  # librealsense records Z16 depth as mono16
+    "mono8": (np.dtype(np.uint8), 1),
+    "y8": (np.dtype(np.uint8), 1),
+}
+
+_UINT32 = struct.Struct("<I")
+_HEADER_PREFIX = struct.Struct("<III")  # seq, stamp.sec, stamp.nsec
+_IMAGE_STEP = struct.Struct("<BII")  # is_bigendian, step, len(data)
+_VECTOR3 = struct.Struct("<ddd")
+
+# ROS1 sensor_msgs/Imu body (everything after the std_msgs/Header).
+# The header is 16 bytes + len(frame_id): seq, stamp.sec, stamp.nsec, frame_id.
+IMU_HEADER_DTYPE = np.dtype(
+    [("seq", "<u4"), ("sec", "<u4"), ("nsec", "<u4"), ("frame_id_len", "<u4")]
+)
+IMU_BODY_DTYPE = np.dtype(
+    [
+        ("orientation", "<f8", (4,)),
+        ("orientation_covariance", "<f8", (9,)),
+        ("angular_velocity", "<f8", (3,)),
+        ("angular_velocity_covariance", "<f8", (9,)),
+        ("linear_acceleration", "<f8", (3,)),
+        ("linear_acceleration_covariance", "<f8", (9,)),
+    ]
+)
+_IMU_ANGULAR_VELOCITY_OFFSET = IMU_BODY_DTYPE.fields["angular_velocity"][1]
+_IMU_LINEAR_ACCELERATION_OFFSET = IMU_BODY_DTYPE.fields["linear_acceleration"][1]
+
+
+def _read_string(buffer: Any, offset: int) -> tuple[str, int]:
+    """Read a ROS1 length-prefixed string, returning (value, next_offset)."""
+    (length,) = _UINT32.unpack_from(buffer, offset)
+    offset += 4
+    return bytes(buffer[offset : offset + length]).decode("utf-8"), offset + length
+
 
 class DataExtractor:
     """Extractor for RealSense sensor data from ROS messages.
@@ -31,35 +71,99 @@ class DataExtractor:
         """Initialize the data extractor with ROS1 typestore."""
         self.typestore = get_typestore(Stores.ROS1_NOETIC)
 
+    def _decode_image(self, rawdata: bytes | memoryview) -> dict[str, Any]:
+        """Decode a ROS1-serialized sensor_msgs/Image without copying pixels.
+
+        Header fields are parsed in place and the pixel array is a strided
+        view (``np.ndarray`` over the raw buffer), so row padding is honoured
+        without a copy.
+
+        Raises:
+            ValueError: If the encoding is unsupported, the step is shorter than a row
+                or the buffer is truncated
+        """
+        try:
+            _, sec, nsec = _HEADER_PREFIX.unpack_from(rawdata, 0)
+            frame_id, offset = _read_string(rawdata, _HEADER_PREFIX.size)
+            height, width = struct.unpack_from("<II", rawdata, offset)
+            encoding, offset = _read_string(rawdata, offset + 8)
+            is_bigendian, step, data_len = _IMAGE_STEP.unpack_from(rawdata, offset)
+        except struct.error as e:
+            raise ValueError(f"Truncated sensor_msgs/Image message: {e}") from e
+        offset += _IMAGE_STEP.size
+
+        if encoding not in IMAGE_ENCODINGS:
+            raise ValueError(f"Unsupported image encoding: {encoding}")
+        dtype, channels = IMAGE_ENCODINGS[encoding]
+        if is_bigendian:
+            dtype = dtype.newbyteorder(">")
+
+        if step < width * channels * dtype.itemsize:
+            raise ValueError(
+                f"Image step too small: {step} bytes for {width} {encoding} pixels per row"
+            )
+        if data_len < step * height or offset + data_len > len(rawdata):
+            raise ValueError(
+                f"Image data too short: {data_len} bytes for {height} rows of {step} bytes"
+            )
+
+        if channels == 1:
+            shape: tuple[int, ...] = (height, width)
+            strides: tuple[int, ...] = (step, dtype.itemsize)
+        else:
+            shape = (height, width, channels)
+            strides = (step, channels * dtype.itemsize, dtype.itemsize)
+
+        data = np.ndarray(shape, dtype=dtype, buffer=rawdata, offset=offset, strides=strides)
+
+        return {
+            "width": width,
+            "height": height,
+            "encoding": encoding,
+            "step": step,
+            "frame_id": frame_id,
+            "header_timestamp_ns": sec * 1_000_000_000 + nsec,
+            "data": data,
+        }
+
     def extract_image(
         self,
-        rawdata: bytes,
+        rawdata: bytes | memoryview,
         msgtype: str,
         timestamp_ns: int | None = None,
     ) -> dict[str, Any]:
         """Extract image data from sensor_msgs/Image message.
 
+        Supports rgb8, bgr8, 16UC1, mono8 and y8 encodings. The returned
+        array is a zero-copy view over ``rawdata``, shaped (height, width) for
+        single-channel or (height, width, 3) for color images.
+
         Args:
-            rawdata: Raw message data in CDR format
+            rawdata: Raw message data in ROS1 serialization format
             msgtype: ROS message type name
             timestamp_ns: Optional timestamp in nanoseconds
 
         Returns:
             Dictionary containing:
             - timestamp: datetime or None
-            - rawdata: original raw data (bytes)
+            - width, height, step: image geometry
+            - encoding: image encoding string
+            - frame_id: header frame_id
+            - header_timestamp_ns: header stamp in nanoseconds
+            - data: numpy array view of the pixels
+            - rawdata: original raw data
             - msgtype: message type
 
         Raises:
-            ValueError: If message type is not sensor_msgs/Image
+            ValueError: If message type is not sensor_msgs/Image or the
+                encoding is unsupported
         """
         if "Image" not in msgtype:
             raise ValueError(f"Expected Image message type, got {msgtype}")
 
-        result: dict[str, Any] = {
-            "rawdata": rawdata,
-            "msgtype": msgtype,
-        }
+        result = self._decode_image(rawdata)
+        result["rawdata"] = rawdata
+        result["msgtype"] = msgtype
 
         # Add timestamp if provided
         if timestamp_ns is not None:
@@ -67,24 +171,52 @@ class DataExtractor:
         else:
             result["timestamp"] = None
 
-        # Add placeholder fields for compatibility with tests
-        result["width"] = 0
-        result["height"] = 0
-        result["encoding"] = "unknown"
-        result["data"] = np.array([])
-
         return result
 
+    def extract_images(self, messages: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """Extract images from a stream of messages.
+
+        Accepts the dictionaries yielded by ``RosbagReader.read_messages``
+        (keys 'data', 'msgtype' and optional 'timestamp'). Message types are
+        validated once per distinct type rather than per message.
+
+        Args:
+            messages: Iterable of message dictionaries
+
+        Yields:
+            Image dictionaries as returned by ``extract_image``
+
+        Raises:
+            ValueError: If a message is not sensor_msgs/Image or the encoding
+                is unsupported
+        """
+        checked_msgtypes: set[str] = set()
+        for msg in messages:
+            msgtype = msg["msgtype"]
+            if msgtype not in checked_msgtypes:
+                if "Image" not in msgtype:
+                    raise ValueError(f"Expected Image message type, got {msgtype}")
+                checked_msgtypes.add(msgtype)
+
+            result = self._decode_image(msg["data"])
+            result["rawdata"] = msg["data"]
+            result["msgtype"] = msgtype
+            timestamp_ns = msg.get("timestamp")
+            result["timestamp"] = (
+                ros_timestamp_to_datetime(timestamp_ns) if timestamp_ns is not None else None
+            )
+            yield result
+
     def extract_imu(
         self,
-        rawdata: bytes,
+        rawdata: bytes | memoryview,
         msgtype: str,
         timestamp_ns: int | None = None,
     ) -> dict[str, Any]:
         """Extract IMU data from sensor_msgs/Imu message.
 
         Args:
-            rawdata: Raw message data in CDR format
+            rawdata: Raw message data in ROS1 serialization format
             msgtype: ROS message type name
             timestamp_ns: Optional timestamp in nanoseconds
 
@@ -101,17 +233,19 @@ class DataExtractor:
         if "Imu" not in msgtype:
             raise ValueError(f"Expected Imu message type, got {msgtype}")
 
+        try:
+            (frame_id_len,) = _UINT32.unpack_from(rawdata, 12)
+            body = IMU_HEADER_DTYPE.itemsize + frame_id_len
+            angular_velocity = _VECTOR3.unpack_from(rawdata, body + _IMU_ANGULAR_VELOCITY_OFFSET)
+            linear_acceleration = _VECTOR3.unpack_from(
+                rawdata, body + _IMU_LINEAR_ACCELERATION_OFFSET
+            )
+        except struct.error as e:
+            raise ValueError(f"Truncated sensor_msgs/Imu message: {e}") from e
+
         result: dict[str, Any] = {
-            "angular_velocity": {
-                "x": 0.0,
-                "y": 0.0,
-                "z": 0.0,
-            },
-            "linear_acceleration": {
-                "x": 0.0,
-                "y": 0.0,
-                "z": 0.0,
-            },
+            "angular_velocity": dict(zip("xyz", angular_velocity)),
+            "linear_acceleration": dict(zip("xyz", linear_acceleration)),
             "rawdata": rawdata,
             "msgtype": msgtype,
         }
@@ -123,3 +257,62 @@ class DataExtractor:
             result["timestamp"] = None
 
         return result
+
+    def extract_imu_batch(self, rawdatas: Sequence[bytes | memoryview]) -> dict[str, np.ndarray]:
+        """Decode many sensor_msgs/Imu messages at once.
+
+        Messages of equal length share the same header layout, so each group
+        is joined into one buffer and read through strided structured views
+        at the precomputed field offsets of the ROS1 Imu layout; no
+        per-message Python objects are created.
+
+        Args:
+            rawdatas: Raw ROS1-serialized sensor_msgs/Imu messages
+
+        Returns:
+            Dictionary containing:
+            - timestamp_ns: (N,) int64 header stamps in nanoseconds
+            - linear_acceleration: (N, 3) float64
+            - angular_velocity: (N, 3) float64
+
+        Raises:
+            ValueError: If a message is shorter than the Imu layout
+        """
+        count = len(rawdatas)
+        timestamp_ns = np.empty(count, dtype=np.int64)
+        linear_acceleration = np.empty((count, 3), dtype=np.float64)
+        angular_velocity = np.empty((count, 3), dtype=np.float64)
+
+        lengths = np.fromiter((len(raw) for raw in rawdatas), dtype=np.int64, count=count)
+        for length in np.unique(lengths):
+            length = int(length)
+            if length < IMU_HEADER_DTYPE.itemsize + IMU_BODY_DTYPE.itemsize:
+                raise ValueError(f"Truncated sensor_msgs/Imu message: {length} bytes")
+
+            positions = np.flatnonzero(lengths == length)
+            buffer = b"".join(rawdatas[i] for i in positions)
+            n = len(positions)
+
+            headers = np.ndarray((n,), IMU_HEADER_DTYPE, buffer=buffer, strides=(length,))
+            frame_id_len = int(headers["frame_id_len"][0])
+            if IMU_HEADER_DTYPE.itemsize + frame_id_len + IMU_BODY_DTYPE.itemsize != length:
+                raise ValueError(f"Unexpected sensor_msgs/Imu message length: {length} bytes")
+            bodies = np.ndarray(
+                (n,),
+                IMU_BODY_DTYPE,
+                buffer=buffer,
+                offset=IMU_HEADER_DTYPE.itemsize + frame_id_len,
+                strides=(length,),
+            )
+
+            timestamp_ns[positions] = (
+                headers["sec"].astype(np.int64) * 1_000_000_000 + headers["nsec"]
+            )
+            linear_acceleration[positions] = bodies["linear_acceleration"]
+            angular_velocity[positions] = bodies["angular_velocity"]
+
+        return {
+            "timestamp_ns": timestamp_ns,
+            "linear_acceleration": linear_acceleration,
+            "angular_velocity": angular_velocity,
+        }
@@ -0,0 +1,250 @@
+"""Lossless codecs for 16-bit depth frames.
+
+Depth frames (16UC1, millimeters) are smooth along image rows, so predicting
+each pixel from its left neighbour leaves small residuals. The ``delta_zstd``
+codec stores these residuals zigzag-encoded, split into low/high byte planes
+(the high plane is almost entirely zero) and compressed with zstd. All steps
+are vectorized with NumPy, so encoding a 1280x720 frame takes a few
+milliseconds.
+
+For mostly static scenes the ``temporal_zstd`` codec stores a keyframe
+(``delta_zstd``) every N frames and, in between, the XOR of each frame with
+its keyframe. Every frame depends only on its keyframe, so random access
+decodes at most two frames. Each temporal frame starts with a 1-byte frame
+type; delta frames add the distance (in frames) back to their keyframe.
+Follows the Single Responsibility Principle (SRP) by focusing solely on depth
+frame encoding and decoding.
+"""
+
+import struct
+from typing import Any
+
+import numpy as np
+
+# Codec names accepted in the depth stream configuration ("depth_codec")
+DEPTH_CODEC_NONE = "none"
+DEPTH_CODEC_DELTA_ZSTD = "delta_zstd"
+DEPTH_CODEC_TEMPORAL_ZSTD = "temporal_zstd"
+DEPTH_CODECS = (DEPTH_CODEC_NONE, DEPTH_CODEC_DELTA_ZSTD, DEPTH_CODEC_TEMPORAL_ZSTD)
+
+DEFAULT_ZSTD_LEVEL = 3
+DEFAULT_KEYFRAME_INTERVAL = 30
+
+# Frame type prefix of temporal_zstd frames
+FRAME_TYPE_KEY = 0
+FRAME_TYPE_DELTA = 1
+_DELTA_HEADER = struct.Struct("<BI")  # frame type, distance to keyframe
+
+
+def _get_zstd() -> Any:
+    """Import the zstandard module on first use (optional dependency)."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstandard is required for the delta_zstd depth codec. "
+            "Install with: uv add zstandard"
+        ) from e
+    return zstandard
+
+
+def _check_codec(codec: str) -> None:
+    """Raise ValueError for unknown codec names and for the stateful temporal codec."""
+    if codec == DEPTH_CODEC_TEMPORAL_ZSTD:
+        raise ValueError(
+            "temporal_zstd frames depend on their keyframe; "
+            "use TemporalDepthEncoder/decode_temporal_depth"
+        )
+    if codec not in DEPTH_CODECS:
+        raise ValueError(f"Unknown depth codec '{codec}', expected one of {DEPTH_CODECS}")
+
+
+def _check_frame(frame: np.ndarray) -> None:
+    """Raise ValueError unless the frame is a 2D uint16 array."""
+    if frame.dtype != np.uint16 or frame.ndim != 2:
+        raise ValueError(
+            f"Depth frame must be a 2D uint16 array, got {frame.ndim}D {frame.dtype}"
+        )
+
+
+def _compress_planes(values: np.ndarray, level: int) -> bytes:
+    """Split uint16 values into low/high byte planes and compress them with zstd."""
+    # Low/high byte planes compress far better than interleaved bytes
+    planes = np.stack([values & 0xFF, values >> 8]).astype(np.uint8)
+    return bytes(_get_zstd().ZstdCompressor(level=level).compress(planes.tobytes()))
+
+
+def _decompress_planes(data: bytes, width: int, height: int) -> np.ndarray:
+    """Inverse of _compress_planes(); returns a (height, width) uint16 array."""
+    frame_size = width * height * 2
+    raw = _get_zstd().ZstdDecompressor().decompress(data, max_output_size=frame_size)
+    if len(raw) != frame_size:
+        raise ValueError(
+            f"Decoded depth frame has {len(raw)} bytes, expected {frame_size} "
+            f"for {width}x{height}"
+        )
+    planes = np.frombuffer(raw, dtype=np.uint8).reshape(2, height, width).astype(np.uint16)
+    return planes[0] | (planes[1] << 8)
+
+
+def encode_depth(frame: np.ndarray, codec: str, level: int = DEFAULT_ZSTD_LEVEL) -> bytes:
+    """Encode a depth frame.
+
+    Args:
+        frame: Depth image as a (height, width) uint16 array
+        codec: One of DEPTH_CODECS
+        level: zstd compression level (delta_zstd only)
+
+    Returns:
+        Encoded frame bytes
+
+    Raises:
+        ValueError: If the codec is unknown or the frame is not 2D uint16
+    """
+    _check_codec(codec)
+    _check_frame(frame)
+
+    if codec == DEPTH_CODEC_NONE:
+        return frame.astype("<u2", copy=False).tobytes()
+
+    # Horizontal delta prediction (modulo 2^16), first column kept as-is
+    residuals = frame.copy()
+    residuals[:, 1:] -= frame[:, :-1]
+
+    # Zigzag: map small signed residuals to small unsigned values
+    signed = residuals.view(np.int16)
+    zigzag = ((signed << 1) ^ (signed >> 15)).view(np.uint16)
+
+    return _compress_planes(zigzag, level)
+
+
+def decode_depth(data: bytes, width: int, height: int, codec: str) -> np.ndarray:
+    """Decode a depth frame produced by encode_depth().
+
+    Args:
+        data: Encoded frame bytes
+        width: Image width in pixels
+        height: Image height in pixels
+        codec: Codec the frame was encoded with
+
+    Returns:
+        Depth image as a (height, width) uint16 array
+
+    Raises:
+        ValueError: If the codec is unknown or the data does not match the size
+    """
+    _check_codec(codec)
+
+    if codec == DEPTH_CODEC_NONE:
+        if len(data) != width * height * 2:
+            raise ValueError(
+                f"Depth frame has {len(data)} bytes, expected {width * height * 2} "
+                f"for {width}x{height}"
+            )
+        return np.frombuffer(data, dtype="<u2").reshape(height, width).astype(np.uint16)
+
+    zigzag = _decompress_planes(data, width, height)
+
+    # Inverse zigzag, then undo the delta prediction with a wrapping cumulative sum
+    residuals = (zigzag >> 1) ^ (0 - (zigzag & 1)).astype(np.uint16)
+    return np.cumsum(residuals, axis=1, dtype=np.uint16)
+
+
+class TemporalDepthEncoder:
+    """Stateful encoder for the temporal_zstd depth codec.
+
+    Frames must be encoded in stream order. The first frame, every
+    ``keyframe_interval``-th frame and any frame whose resolution changes are
+    keyframes; the others are stored as XOR residuals against the keyframe.
+    """
+
+    def __init__(
+        self, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL, level: int = DEFAULT_ZSTD_LEVEL
+    ) -> None:
+        """Initialize the encoder.
+
+        Args:
+            keyframe_interval: Number of frames per keyframe (1 = keyframes only)
+            level: zstd compression level
+
+        Raises:
+            ValueError: If keyframe_interval is less than 1
+        """
+        if keyframe_interval < 1:
+            raise ValueError(f"keyframe_interval must be >= 1, got {keyframe_interval}")
+        self.keyframe_interval = keyframe_interval
+        self.level = level
+        self._keyframe: np.ndarray | None = None
+        self._frames_since_keyframe = 0
+
+    def encode(self, frame: np.ndarray) -> bytes:
+        """Encode the next depth frame of the stream.
+
+        Args:
+            frame: Depth image as a (height, width) uint16 array
+
+        Returns:
+            Encoded frame bytes (frame type prefix + payload)
+
+        Raises:
+            ValueError: If the frame is not 2D uint16
+        """
+        _check_frame(frame)
+
+        if (
+            self._keyframe is None
+            or self._keyframe.shape != frame.shape
+            or self._frames_since_keyframe + 1 >= self.keyframe_interval
+        ):
+            self._keyframe = frame.copy()
+            self._frames_since_keyframe = 0
+            payload = encode_depth(frame, DEPTH_CODEC_DELTA_ZSTD, self.level)
+            return bytes([FRAME_TYPE_KEY]) + payload
+
+        self._frames_since_keyframe += 1
+        header = _DELTA_HEADER.pack(FRAME_TYPE_DELTA, self._frames_since_keyframe)
+        return header + _compress_planes(frame ^ self._keyframe, self.level)
+
+
+def is_keyframe(data: bytes) -> bool:
+    """Check whether a temporal_zstd frame is a keyframe."""
+    return len(data) > 0 and data[0] == FRAME_TYPE_KEY
+
+
+def get_keyframe_distance(data: bytes) -> int:
+    """Get how many frames before a temporal_zstd frame its keyframe is (0 for keyframes).
+
+    Raises:
+        ValueError: If the frame type is unknown
+    """
+    if is_keyframe(data):
+        return 0
+    if len(data) < _DELTA_HEADER.size or data[0] != FRAME_TYPE_DELTA:
+        raise ValueError("Invalid temporal depth frame header")
+    return int(_DELTA_HEADER.unpack_from(data)[1])
+
+
+def decode_temporal_depth(
+    data: bytes, width: int, height: int, keyframe: np.ndarray | None = None
+) -> np.ndarray:
+    """Decode a temporal_zstd frame.
+
+    Args:
+        data: Encoded frame bytes
+        width: Image width in pixels
+        height: Image height in pixels
+        keyframe: Decoded keyframe of the frame (required for delta frames)
+
+    Returns:
+        Depth image as a (height, width) uint16 array
+
+    Raises:
+        ValueError: If the data is invalid or a delta frame has no keyframe
+    """
+    if is_keyframe(data):
+        return decode_depth(data[1:], width, height, DEPTH_CODEC_DELTA_ZSTD)
+
+    get_keyframe_distance(data)  # Validate header
+    if keyframe is None or keyframe.shape != (height, width):
+        raise ValueError("A delta depth frame requires its decoded keyframe")
+    return _decompress_planes(data[_DELTA_HEADER.size :], width, height) ^ keyframe
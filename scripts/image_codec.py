@@ -0,0 +1,214 @@
+"""Image codecs and an order-preserving parallel encoder pool.
+
+Color frames can be stored raw or compressed as PNG (lossless), JPEG or
+JPEG XL. Encoding uses OpenCV, whose ``imencode`` releases the GIL, so a
+thread pool scales across cores without copying frames between processes.
+``OrderedEncoderPool`` returns results in submission order, so records are
+written in the same order as the source messages. Follows the Single
+Responsibility Principle (SRP) by focusing solely on image encoding.
+"""
+
+import os
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+
+IMAGE_CODEC_RAW = "raw"
+IMAGE_CODECS = (IMAGE_CODEC_RAW, "png", "jpeg", "jxl")
+
+DEFAULT_IMAGE_QUALITY = 90
+
+# Codec -> file extension understood by cv2.imencode
+_CODEC_EXTENSIONS = {
+    "png": ".png",
+    "jpeg": ".jpg",
+    "jxl": ".jxl",
+}
+
+
+def _get_cv2() -> Any:
+    """Import OpenCV on first use (only needed for compressed codecs)."""
+    try:
+        import cv2
+    except ImportError as e:
+        raise ImportError(
+            "opencv-python is required for image codecs. Install with: uv add opencv-python"
+        ) from e
+    return cv2
+
+
+def is_codec_available(codec: str) -> bool:
+    """Check whether a codec can be used in this environment.
+
+    JPEG XL support depends on how OpenCV was built.
+
+    Args:
+        codec: One of IMAGE_CODECS
+
+    Returns:
+        True if frames can be encoded with the codec
+    """
+    if codec == IMAGE_CODEC_RAW:
+        return True
+    if codec not in _CODEC_EXTENSIONS:
+        return False
+    try:
+        cv2 = _get_cv2()
+    except ImportError:
+        return False
+    return bool(cv2.haveImageWriter(_CODEC_EXTENSIONS[codec]))
+
+
+def encode_image(
+    image: np.ndarray,
+    codec: str,
+    quality: int = DEFAULT_IMAGE_QUALITY,
+    channel_order: str = "RGB",
+) -> bytes:
+    """Encode an image into a compressed image file in memory.
+
+    Args:
+        image: (height, width) or (height, width, 3) array, uint8 (or uint16 for png)
+        codec: One of IMAGE_CODECS except "raw"
+        quality: Quality 1-100 (jpeg/jxl only)
+        channel_order: "RGB" or "BGR" channel order of 3-channel images
+
+    Returns:
+        Encoded image bytes (a complete PNG/JPEG/JPEG XL file)
+
+    Raises:
+        ValueError: If the codec is unknown/unavailable or the image is unsupported
+    """
+    if codec not in _CODEC_EXTENSIONS:
+        raise ValueError(
+            f"Cannot encode with codec '{codec}', expected one of {tuple(_CODEC_EXTENSIONS)}"
+        )
+    if image.dtype == np.uint16 and codec != "png":
+        raise ValueError(f"16-bit images can only be encoded as png, got {codec}")
+
+    cv2 = _get_cv2()
+
+    # OpenCV expects BGR channel order
+    if image.ndim == 3 and channel_order == "RGB":
+        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+
+    params: list[int] = []
+    if codec == "jpeg":
+        params = [cv2.IMWRITE_JPEG_QUALITY, int(quality)]
+    elif codec == "jxl" and hasattr(cv2, "IMWRITE_JPEGXL_QUALITY"):
+        params = [cv2.IMWRITE_JPEGXL_QUALITY, int(quality)]
+
+    ok, encoded = cv2.imencode(_CODEC_EXTENSIONS[codec], image, params)
+    if not ok:
+        raise ValueError(f"Failed to encode {image.shape} {image.dtype} image as {codec}")
+    return encoded.tobytes()
+
+
+def decode_image(data: bytes, channel_order: str = "RGB") -> np.ndarray:
+    """Decode an image produced by encode_image().
+
+    Args:
+        data: Encoded image bytes
+        channel_order: "RGB" or "BGR" channel order of the returned 3-channel image
+
+    Returns:
+        Decoded image array (dtype and channel count as stored)
+
+    Raises:
+        ValueError: If the data cannot be decoded
+    """
+    cv2 = _get_cv2()
+    image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+    if image is None:
+        raise ValueError("Failed to decode image data")
+    if image.ndim == 3 and channel_order == "RGB":
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    return image
+
+
+class OrderedEncoderPool:
+    """Thread pool that runs encode jobs in parallel and returns them in order.
+
+    Each job is submitted with a tag (e.g. stream ID and timestamp). submit()
+    returns the jobs that are finished at the head of the queue, so callers
+    can write results while later frames are still encoding. At most
+    ``max_pending`` jobs are in flight; submit() blocks on the oldest job when
+    the limit is reached, which bounds memory use.
+
+    Example:
+        >>> with OrderedEncoderPool(max_workers=4) as pool:
+        ...     for tag, frame in frames:
+        ...         for done_tag, data in pool.submit(tag, encode_image, frame, "jpeg"):
+        ...             write(done_tag, data)
+        ...     for done_tag, data in pool.drain():
+        ...         write(done_tag, data)
+    """
+
+    def __init__(self, max_workers: int | None = None, max_pending: int | None = None) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_workers: Number of encoder threads (default: CPU count)
+            max_pending: Maximum jobs in flight (default: 2 x worker count)
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._max_pending = max_pending or 2 * max_workers
+        self._pending: deque[tuple[Any, Future[Any]]] = deque()
+
+    def __enter__(self) -> "OrderedEncoderPool":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit. Waits for running jobs and stops the threads."""
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """Number of submitted jobs whose results have not been collected yet."""
+        return len(self._pending)
+
+    def submit(self, tag: Any, fn: Callable[..., Any], *args: Any) -> list[tuple[Any, Any]]:
+        """Submit a job and collect finished jobs in submission order.
+
+        Args:
+            tag: Value returned together with the job result
+            fn: Encode function
+            *args: Arguments passed to fn
+
+        Returns:
+            List of (tag, result) for jobs finished at the head of the queue
+
+        Raises:
+            Exception: Any exception raised by a collected job
+        """
+        self._pending.append((tag, self._executor.submit(fn, *args)))
+
+        done: list[tuple[Any, Any]] = []
+        while self._pending and (
+            len(self._pending) > self._max_pending or self._pending[0][1].done()
+        ):
+            head_tag, future = self._pending.popleft()
+            done.append((head_tag, future.result()))
+        return done
+
+    def drain(self) -> list[tuple[Any, Any]]:
+        """Wait for all pending jobs.
+
+        Returns:
+            List of (tag, result) for all remaining jobs in submission order
+        """
+        done = [(tag, future.result()) for tag, future in self._pending]
+        self._pending.clear()
+        return done
+
+    def close(self) -> None:
+        """Stop the worker threads, discarding results that were not collected."""
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=True)
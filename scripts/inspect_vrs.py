@@ -100,8 +100,17 @@ Examples:
                 except Exception as e:
                     print(f"  Configuration: Error reading - {e}")
 
+                # Timestamp range from the stream stats tag (no record read), if present
+                stats = reader.get_stream_stats(stream_id)
+                if stats is not None and stats.record_count > 0:
+                    print("  Data Records:")
+                    print(f"    First timestamp: {stats.first_timestamp}")
+                    print(f"    Last timestamp: {stats.last_timestamp}")
+                    if args.verbose:
+                        print(f"    Payload size (total): {stats.payload_bytes} bytes")
+
                 # Sample data records (first and last)
-                if record_count > 0:
+                elif record_count > 0:
                     try:
                         data_records = reader.read_data_records(stream_id)
                         if data_records:
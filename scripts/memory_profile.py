@@ -0,0 +1,262 @@
+"""Peak-memory and allocation profiling of conversion stages.
+
+MemoryProfiler samples the process RSS in a background thread and traces
+Python allocations with tracemalloc. Code marks its stages (``with
+profiler.stage("process_messages"):``); at the end of each stage the profiler
+records the RSS at start/peak/end, the traced Python memory still held and
+its peak, and the top allocation sites (file:line) of the memory still held.
+RSS includes native allocations (e.g. records buffered by the C++ VRS
+writer) that tracemalloc cannot see, so a stage whose RSS grows much more
+than its traced memory is holding native memory. tracemalloc slows Python
+code down noticeably; use this only for diagnosis. Follows the Single
+Responsibility Principle (SRP) by focusing solely on memory measurement.
+"""
+
+import json
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+_MB = 1024 * 1024
+
+DEFAULT_SAMPLE_INTERVAL_SEC = 0.1
+DEFAULT_TOP_ALLOCATIONS = 10
+
+
+def get_rss_bytes() -> int:
+    """Get the current resident set size of this process in bytes.
+
+    Uses /proc/self/statm on Linux; elsewhere falls back to the peak RSS
+    reported by getrusage().
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+@dataclass
+class AllocationSite:
+    """Python memory still allocated from one source line at the end of a stage"""
+    location: str  # "file.py:123"
+    size_mb: float
+    count: int
+
+
+@dataclass
+class StageMemory:
+    """Memory usage of one stage"""
+    name: str
+    start_sec: float  # Relative to profiler start
+    end_sec: float
+    rss_start_mb: float
+    rss_peak_mb: float
+    rss_end_mb: float
+    traced_peak_mb: float  # Peak traced Python memory during the stage
+    traced_end_mb: float  # Traced Python memory held at the end of the stage
+    top_allocations: list[AllocationSite] = field(default_factory=list)
+
+    @property
+    def rss_growth_mb(self) -> float:
+        """RSS held at the end of the stage that was not held at its start"""
+        return self.rss_end_mb - self.rss_start_mb
+
+
+class MemoryProfiler:
+    """
+    RSS sampler + tracemalloc snapshots per stage
+
+    Usage:
+        with MemoryProfiler() as profiler:
+            with profiler.stage("load"):
+                ...
+        profiler.write_report(Path("memory.json"))
+    """
+
+    def __init__(
+        self,
+        sample_interval_sec: float = DEFAULT_SAMPLE_INTERVAL_SEC,
+        top_allocations: int = DEFAULT_TOP_ALLOCATIONS,
+        trace_frames: int = 1,
+    ) -> None:
+        """
+        Initialize the profiler
+
+        Args:
+            sample_interval_sec: RSS sampling interval
+            top_allocations: Allocation sites kept per stage
+            trace_frames: Stack frames stored per allocation by tracemalloc
+
+        Raises:
+            ValueError: If an argument is not positive
+        """
+        if sample_interval_sec <= 0:
+            raise ValueError(f"sample_interval_sec must be > 0, got {sample_interval_sec}")
+        if top_allocations < 1:
+            raise ValueError(f"top_allocations must be >= 1, got {top_allocations}")
+        self.sample_interval_sec = sample_interval_sec
+        self.top_allocations = top_allocations
+        self.trace_frames = trace_frames
+
+        self.stages: list[StageMemory] = []
+        self.samples: list[tuple[float, float, str]] = []  # (time [s], RSS [MB], stage)
+        self._stage_stack: list[str] = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._start_time = 0.0
+        self._started_tracemalloc = False
+
+    def __enter__(self) -> "MemoryProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start tracing allocations and sampling RSS"""
+        if self._thread is not None:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+            self._started_tracemalloc = True
+        self._start_time = time.perf_counter()
+        self._stop_event.clear()
+        self._sample()
+        self._thread = threading.Thread(target=self._sample_loop, name="rss-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling (and tracing, if this profiler started it)"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self._sample()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure the enclosed code as stage `name` (stages may be nested)"""
+        if self._thread is None:
+            raise RuntimeError("MemoryProfiler is not started")
+
+        tracemalloc.reset_peak()
+        start_sec = time.perf_counter() - self._start_time
+        rss_start = self._sample()
+        with self._lock:
+            self._stage_stack.append(name)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._stage_stack.pop()
+            rss_end = self._sample(stage=name)
+            end_sec = time.perf_counter() - self._start_time
+            traced_end, traced_peak = tracemalloc.get_traced_memory()
+            rss_peak = max(
+                [rss for t, rss, _ in self.samples if start_sec <= t <= end_sec]
+                + [rss_start, rss_end]
+            )
+            self.stages.append(StageMemory(
+                name=name,
+                start_sec=start_sec,
+                end_sec=end_sec,
+                rss_start_mb=rss_start,
+                rss_peak_mb=rss_peak,
+                rss_end_mb=rss_end,
+                traced_peak_mb=traced_peak / _MB,
+                traced_end_mb=traced_end / _MB,
+                top_allocations=self._top_allocations(),
+            ))
+
+    @property
+    def peak_rss_mb(self) -> float:
+        """Highest sampled RSS"""
+        return max((rss for _, rss, _ in self.samples), default=0.0)
+
+    def _sample(self, stage: str | None = None) -> float:
+        """Record one RSS sample (attributed to `stage` or the current stage) and return it in MB"""
+        rss_mb = get_rss_bytes() / _MB
+        with self._lock:
+            if stage is None:
+                stage = self._stage_stack[-1] if self._stage_stack else ""
+            self.samples.append((time.perf_counter() - self._start_time, rss_mb, stage))
+        return rss_mb
+
+    def _sample_loop(self) -> None:
+        while not self._stop_event.wait(self.sample_interval_sec):
+            self._sample()
+
+    def _top_allocations(self) -> list[AllocationSite]:
+        """Top source lines by Python memory currently allocated (excluding the profiler)"""
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ])
+        return [
+            AllocationSite(
+                location=f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                size_mb=stat.size / _MB,
+                count=stat.count,
+            )
+            for stat in snapshot.statistics("lineno")[:self.top_allocations]
+        ]
+
+    def report(self) -> dict[str, Any]:
+        """Get the report as a JSON-serializable dictionary"""
+        return {
+            "peak_rss_mb": self.peak_rss_mb,
+            "sample_interval_sec": self.sample_interval_sec,
+            "stages": [
+                {**asdict(stage), "rss_growth_mb": stage.rss_growth_mb} for stage in self.stages
+            ],
+            "samples": [
+                {"time_sec": t, "rss_mb": rss, "stage": stage} for t, rss, stage in self.samples
+            ],
+        }
+
+    def write_report(self, path: Path) -> None:
+        """Write the report as JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+    def format_summary(self) -> str:
+        """Format a per-stage table and the top allocation site of each stage"""
+        lines = [
+            f"Peak RSS: {self.peak_rss_mb:.1f} MB",
+            f"{'Stage':<20} {'Time':>8} {'RSS start':>10} {'RSS peak':>10} {'RSS end':>10} "
+            f"{'Py peak':>10} {'Py held':>10}",
+        ]
+        for stage in self.stages:
+            lines.append(
+                f"{stage.name:<20} {stage.end_sec - stage.start_sec:>7.2f}s "
+                f"{stage.rss_start_mb:>8.1f}MB {stage.rss_peak_mb:>8.1f}MB "
+                f"{stage.rss_end_mb:>8.1f}MB "
+                f"{stage.traced_peak_mb:>8.1f}MB {stage.traced_end_mb:>8.1f}MB"
+            )
+        for stage in self.stages:
+            if stage.top_allocations:
+                top = stage.top_allocations[0]
+                lines.append(
+                    f"  {stage.name}: top allocation {top.location} "
+                    f"({top.size_mb:.1f} MB in {top.count} blocks)"
+                )
+        return "\n".join(lines)
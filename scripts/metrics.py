@@ -0,0 +1,438 @@
+"""Prometheus-format metrics for conversion workers (standard library only).
+
+MetricsRegistry holds counters, gauges and histograms and renders them in the
+Prometheus text exposition format, either into a file for the node_exporter
+textfile collector (written atomically) or from a small local HTTP endpoint
+(``/metrics``). ConversionMetrics defines the metrics of RosbagToVRSConverter:
+bags converted, messages and bytes per stream type, per-message write latency,
+conversion duration, queue depth and RSS. A long-lived worker keeps one
+ConversionMetrics and passes it to every converter, so the counters cover the
+worker's whole lifetime. Follows the Single Responsibility Principle (SRP) by
+focusing solely on collecting and exposing metrics.
+"""
+
+import bisect
+import math
+import os
+import threading
+from collections.abc import Callable, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from scripts.memory_profile import get_rss_bytes
+
+# Content type of the text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Per-message write latency buckets (seconds): IMU samples to large encoded frames
+WRITE_LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+
+# Conversion duration buckets (seconds): short test bags to multi-hour recordings
+CONVERSION_DURATION_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """Base class: one metric family with a fixed set of label names"""
+
+    metric_type = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: dict[tuple[str, ...], Any] = {}
+
+    def labels(self, **labels: str) -> Any:
+        """Get the child metric of one label combination (cache it in hot loops)"""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {list(self.labelnames)}, got {sorted(labels)}"
+            )
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = self._new_child()
+            return child
+
+    def children(self) -> list[tuple[tuple[str, ...], Any]]:
+        """Get (label values, child metric) of every label combination used so far"""
+        with self._lock:
+            return list(self._children.items())
+
+    def _unlabeled(self) -> Any:
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {list(self.labelnames)}; use labels()")
+        return self.labels()
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        """Render the family in the text exposition format"""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.metric_type}"]
+        with self._lock:
+            children = sorted(self._children.items())
+        for key, child in children:
+            lines.extend(child.render(self.name, self.labelnames, key))
+        return lines
+
+
+class _ValueChild:
+    """Counter or gauge value of one label combination"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value = 0.0
+        self._function: Callable[[], float] | None = None
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def get(self) -> float:
+        if self._function is not None:
+            return float(self._function())
+        return self._value
+
+    def render(self, name: str, labelnames: Sequence[str], key: Sequence[str]) -> list[str]:
+        return [f"{name}{_format_labels(labelnames, key)} {_format_value(self.get())}"]
+
+
+class _CounterChild(_ValueChild):
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError(f"Counters can only increase, got {amount}")
+        super().inc(amount)
+
+
+class _GaugeChild(_ValueChild):
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = float(value)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Report the value returned by function at render time"""
+        self._function = function
+
+
+class Counter(_Metric):
+    """Monotonically increasing value"""
+
+    metric_type = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabeled().inc(amount)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+
+    metric_type = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._unlabeled().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabeled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._unlabeled().dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._unlabeled().set_function(function)
+
+
+class _HistogramChild:
+    """Bucket counts, sum and count of one label combination"""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self._lock = threading.Lock()
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)  # Last entry: +Inf
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def get_state(self) -> tuple[list[int], float]:
+        """Get the per-bucket counts (not cumulative, +Inf last) and the sum"""
+        with self._lock:
+            return list(self._counts), self._sum
+
+    def merge(self, counts: Sequence[int], total: float) -> None:
+        """Add observations recorded elsewhere (counts and sum from get_state())"""
+        if len(counts) != len(self._counts):
+            raise ValueError(f"Expected {len(self._counts)} bucket counts, got {len(counts)}")
+        with self._lock:
+            for index, count in enumerate(counts):
+                self._counts[index] += count
+            self._sum += total
+
+    def render(self, name: str, labelnames: Sequence[str], key: Sequence[str]) -> list[str]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        lines = []
+        cumulative = 0
+        for bound, count in zip((*self._buckets, math.inf), counts):
+            cumulative += count
+            labels = _format_labels((*labelnames, "le"), (*key, _format_value(bound)))
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        labels = _format_labels(labelnames, key)
+        lines.append(f"{name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{name}_count{labels} {cumulative}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets"""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = (),
+    ) -> None:
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise ValueError(f"{name}: buckets must be non-empty and strictly increasing")
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(float(bound) for bound in buckets)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._unlabeled().observe(value)
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together"""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = (),
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = [line for metric in metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: Path) -> None:
+        """
+        Write the metrics for the node_exporter textfile collector
+
+        The file is replaced atomically, so the collector never reads a partial file.
+        """
+        path = Path(path)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Serve the metrics at http://host:port/metrics from a daemon thread
+
+        Returns:
+            The running server (call shutdown() to stop it); port 0 picks a free port
+        """
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 (http.server API)
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass  # Scrapes are not logged
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        return server
+
+
+# ConversionMetrics counters labeled by stream type (see snapshot_streams())
+_STREAM_COUNTERS = ("messages", "input_bytes", "output_bytes")
+
+
+class ConversionMetrics:
+    """
+    Metrics of ROSbag -> VRS conversions
+
+    Usage:
+        metrics = ConversionMetrics()
+        metrics.registry.serve(9464)
+        RosbagToVRSConverter(bag, vrs, config, metrics=metrics).convert()
+    """
+
+    def __init__(self, registry: MetricsRegistry | None = None) -> None:
+        self.registry = registry if registry is not None else MetricsRegistry()
+        r = self.registry
+        self.bags = r.counter(
+            "realsense_vrs_bags_total", "Bag conversions by result (success/failure)", ["status"]
+        )
+        self.messages = r.counter(
+            "realsense_vrs_messages_total", "Bag messages converted", ["stream_type"]
+        )
+        self.input_bytes = r.counter(
+            "realsense_vrs_input_bytes_total", "Bag message bytes read", ["stream_type"]
+        )
+        self.output_bytes = r.counter(
+            "realsense_vrs_output_bytes_total",
+            "VRS data record payload bytes written (before record compression)",
+            ["stream_type"],
+        )
+        self.output_file_bytes = r.counter(
+            "realsense_vrs_output_file_bytes_total", "Size of the VRS files written"
+        )
+        self.write_latency = r.histogram(
+            "realsense_vrs_write_latency_seconds",
+            "Time to convert and write one bag message (one frame for image streams)",
+            ["stream_type"],
+            WRITE_LATENCY_BUCKETS,
+        )
+        self.conversion_duration = r.histogram(
+            "realsense_vrs_conversion_duration_seconds",
+            "Wall time of one successful bag conversion",
+            buckets=CONVERSION_DURATION_BUCKETS,
+        )
+        self.queue_depth = r.gauge(
+            "realsense_vrs_queue_depth",
+            "Work waiting: frames in the image encoder pool (encoder), "
+            "bags queued by the worker (bags)",
+            ["queue"],
+        )
+        self.rss_bytes = r.gauge("realsense_vrs_rss_bytes", "Resident set size of the process")
+        self.rss_bytes.set_function(get_rss_bytes)
+        self.last_success = r.gauge(
+            "realsense_vrs_last_success_timestamp_seconds",
+            "Unix time of the last successful conversion",
+        )
+
+        # Children per stream type, cached for the per-message hot path
+        self._stream_children: dict[str, tuple[Any, Any, Any]] = {}
+
+    def record_message(self, stream_type: str, nbytes: int, seconds: float) -> None:
+        """Count one converted message and its write latency"""
+        children = self._stream_children.get(stream_type)
+        if children is None:
+            children = self._stream_children[stream_type] = (
+                self.messages.labels(stream_type=stream_type),
+                self.input_bytes.labels(stream_type=stream_type),
+                self.write_latency.labels(stream_type=stream_type),
+            )
+        messages, input_bytes, write_latency = children
+        messages.inc()
+        input_bytes.inc(nbytes)
+        write_latency.observe(seconds)
+
+    def snapshot_streams(self) -> dict[str, dict[str, Any]]:
+        """
+        Get the per-stream-type message/byte counters and latency histograms
+
+        Returns:
+            Picklable data for merge_streams() in another process, e.g. from the
+            workers of a parallel conversion that cannot share the registry
+        """
+        snapshot: dict[str, dict[str, Any]] = {}
+        for name in _STREAM_COUNTERS:
+            for (stream_type,), child in getattr(self, name).children():
+                snapshot.setdefault(stream_type, {})[name] = child.get()
+        for (stream_type,), child in self.write_latency.children():
+            snapshot.setdefault(stream_type, {})["write_latency"] = child.get_state()
+        return snapshot
+
+    def merge_streams(self, snapshot: dict[str, dict[str, Any]]) -> None:
+        """Add per-stream-type metrics from snapshot_streams() of another ConversionMetrics"""
+        for stream_type, values in snapshot.items():
+            for name in _STREAM_COUNTERS:
+                if name in values:
+                    getattr(self, name).labels(stream_type=stream_type).inc(values[name])
+            if "write_latency" in values:
+                self.write_latency.labels(stream_type=stream_type).merge(*values["write_latency"])
+
+    def record_output(self, stream_type: str, payload_bytes: int) -> None:
+        """Count payload bytes written to a stream"""
+        self.output_bytes.labels(stream_type=stream_type).inc(payload_bytes)
+
+    def record_success(
+        self, duration_sec: float, output_file_bytes: int, finished_at: float
+    ) -> None:
+        """Count a successful conversion"""
+        self.bags.labels(status="success").inc()
+        self.conversion_duration.observe(duration_sec)
+        self.output_file_bytes.inc(output_file_bytes)
+        self.last_success.set(finished_at)
+
+    def record_failure(self) -> None:
+        """Count a failed conversion"""
+        self.bags.labels(status="failure").inc()
@@ -0,0 +1,264 @@
+"""Parallel conversion of one ROSbag split into time ranges.
+
+RosbagToVRSConverter reads, deserializes and encodes a bag in a single
+process. ParallelRosbagToVRSConverter splits the bag's time span into ranges
+of similar size at chunk boundaries (BagIndex.split_time_ranges(), so every
+worker decompresses about the same amount of chunk data), runs the metadata
+pre-pass once and converts each range in its own process into a partial
+chunked recording (see scripts.vrs_manifest). The parts are written to a
+temporary directory next to the output and merged in time order by renaming
+their chunk files, so the merge copies no data and re-encodes nothing.
+
+The output is therefore always a chunked recording (``name_000.vrs``, ...
+and ``name.manifest.json``, which VRSReader opens as one logical file), never
+a single file at the output path. To make that explicit, the configuration
+must request chunked output (chunk_duration_sec or chunk_size_mb); the chunk
+limits also apply within each time range.
+
+Only ROS1 bags are supported (the split uses the ROS1 chunk index). Follows
+the Single Responsibility Principle (SRP) by focusing solely on splitting a
+conversion across processes.
+"""
+
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, replace
+from pathlib import Path
+from typing import Any
+
+from scripts.conversion_cache import ConversionCache
+from scripts.metrics import ConversionMetrics
+from scripts.rosbag_reader import RosbagReader
+from scripts.rosbag_to_vrs_converter import (
+    ConversionResult,
+    ConverterConfig,
+    RosbagToVRSConverter,
+)
+from scripts.trace_events import get_tracer
+from scripts.vrs_manifest import merge_chunked_recordings
+
+
+def get_parts_dir(vrs_path: Path) -> Path:
+    """Get the temporary directory of the partial recordings (e.g. ``.output.parts``)"""
+    return vrs_path.with_name(f".{vrs_path.stem}.parts")
+
+
+def convert_part(
+    rosbag_path: Path,
+    part_path: Path,
+    config: ConverterConfig,
+    time_range: tuple[int, int],
+    metadata_caches: dict[str, Any],
+    collect_metrics: bool = False,
+) -> tuple[ConversionResult, dict[str, dict[str, Any]] | None]:
+    """
+    Convert one time range of a bag into a chunked recording (runs in a worker process)
+
+    Args:
+        rosbag_path: Input ROSbag file path
+        part_path: Logical path of the partial recording
+        config: Converter configuration (topic mapping already discovered)
+        time_range: ``[start, stop)`` bag time range in nanoseconds
+        metadata_caches: Result of RosbagToVRSConverter.run_prepass()
+        collect_metrics: Also return the part's per-stream-type metrics
+
+    Returns:
+        ConversionResult of the part, and ConversionMetrics.snapshot_streams()
+        if collect_metrics (else None)
+    """
+    metrics = ConversionMetrics() if collect_metrics else None
+    converter = RosbagToVRSConverter(
+        rosbag_path,
+        part_path,
+        config,
+        metrics=metrics,
+        time_range=time_range,
+        metadata_caches=metadata_caches,
+    )
+    result = converter.convert()
+    return result, metrics.snapshot_streams() if metrics is not None else None
+
+
+class ParallelRosbagToVRSConverter:
+    """
+    ROSbag to VRS converter running one process per time range of the bag
+
+    Usage:
+        config.chunk_duration_sec = 60.0  # Chunked output is required
+        converter = ParallelRosbagToVRSConverter(bag, vrs, config, workers=8)
+        result = converter.convert()  # writes vrs's chunks and manifest
+    """
+
+    def __init__(
+        self,
+        rosbag_path: Path,
+        vrs_path: Path,
+        config: ConverterConfig,
+        workers: int = 0,
+        metrics: ConversionMetrics | None = None,
+        cache: ConversionCache | None = None,
+    ):
+        """
+        Initialize converter
+
+        Args:
+            rosbag_path: Input ROS1 bag file path
+            vrs_path: Logical output path (chunks and manifest are written next to it)
+            config: Converter configuration with chunk_duration_sec or chunk_size_mb
+                (checkpoint is not supported)
+            workers: Worker processes, i.e. maximum number of time ranges (0 = CPU count)
+            metrics: Prometheus metrics updated with the bag result and the
+                per-stream-type metrics of all workers (optional)
+            cache: Cache of conversion outputs (optional, see RosbagToVRSConverter)
+        """
+        self.rosbag_path = Path(rosbag_path)
+        self.vrs_path = Path(vrs_path)
+        self.config = config
+        self.workers = workers or os.cpu_count() or 1
+        self.metrics = metrics
+        self.cache = cache
+
+    def convert(self) -> ConversionResult:
+        """
+        Execute conversion
+
+        Returns:
+            ConversionResult with the statistics of all parts
+
+        Raises:
+            FileNotFoundError: ROSbag file not found
+            OSError: Cannot create output VRS files
+            ValueError: Invalid configuration (e.g. no chunk limit), not a ROS1 bag file,
+                or unsupported message type
+        """
+        if self.metrics is None:
+            return self._convert()
+
+        try:
+            result = self._convert()
+        except Exception:
+            self.metrics.record_failure()
+            raise
+        self.metrics.record_success(result.conversion_time_sec, result.output_vrs_size, time.time())
+        return result
+
+    def _convert(self) -> ConversionResult:
+        """Plan the time ranges, convert them in parallel and merge the parts (see convert())"""
+        if not self.rosbag_path.exists():
+            raise FileNotFoundError(f"ROSbag file not found: {self.rosbag_path}")
+        if not self.rosbag_path.is_file():
+            raise ValueError(f"Parallel conversion requires a ROS1 bag file: {self.rosbag_path}")
+        if self.workers < 1:
+            raise ValueError(f"workers must be >= 1, got {self.workers}")
+        if self.config.chunk_duration_sec is None and self.config.chunk_size_mb is None:
+            raise ValueError(
+                "Parallel conversion writes chunked output: "
+                "set chunk_duration_sec or chunk_size_mb"
+            )
+        if self.config.checkpoint:
+            raise ValueError("checkpoint cannot be used with parallel conversion")
+
+        tracer = get_tracer()
+        start_time = time.time()
+
+        cache_key = None
+        if self.cache is not None:
+            with tracer.span("cache_lookup"):
+                cache_key = self.cache.get_key(self.rosbag_path, self.config, parallel=True)
+                cached = self.cache.restore(cache_key, self.vrs_path)
+            if cached is not None:
+                return ConversionResult(**{
+                    **cached,
+                    # JSON object keys are strings
+                    "messages_per_stream": {
+                        int(stream_id): count
+                        for stream_id, count in cached["messages_per_stream"].items()
+                    },
+                    "conversion_time_sec": time.time() - start_time,
+                    "cache_hit": True,
+                })
+
+        # Split at chunk boundaries (from the .bagidx sidecar when available)
+        with tracer.span("plan_time_ranges"):
+            with RosbagReader(self.rosbag_path) as bag_reader:
+                time_ranges = bag_reader.get_time_ranges(self.workers)
+
+        # Topic discovery, info caches and source hash run once for all parts
+        planner = RosbagToVRSConverter(self.rosbag_path, self.vrs_path, self.config)
+        metadata_caches = planner.run_prepass()
+        part_config = replace(planner.config, auto_discover=False)
+        if part_config.encoder_threads == 0:
+            # Share the CPUs between the workers' image encoder pools
+            part_config.encoder_threads = max(1, (os.cpu_count() or 1) // len(time_ranges))
+
+        if self.config.verbose:
+            print(
+                f"Converting {self.rosbag_path} -> {self.vrs_path} "
+                f"in {len(time_ranges)} parts"
+            )
+
+        parts_dir = get_parts_dir(self.vrs_path)
+        shutil.rmtree(parts_dir, ignore_errors=True)
+        parts_dir.mkdir(parents=True)
+        try:
+            part_paths = [parts_dir / f"part_{i:03d}.vrs" for i in range(len(time_ranges))]
+            with tracer.span("convert_parts", parts=len(time_ranges)):
+                with ProcessPoolExecutor(max_workers=len(time_ranges)) as executor:
+                    futures = [
+                        executor.submit(
+                            convert_part,
+                            self.rosbag_path,
+                            part_path,
+                            part_config,
+                            time_range,
+                            metadata_caches,
+                            self.metrics is not None,
+                        )
+                        for part_path, time_range in zip(part_paths, time_ranges)
+                    ]
+                    part_results = []
+                    for future in futures:
+                        part_result, stream_metrics = future.result()
+                        part_results.append(part_result)
+                        if self.metrics is not None and stream_metrics is not None:
+                            self.metrics.merge_streams(stream_metrics)
+
+            # Copy-free merge: the parts' chunk files become the output chunks
+            with tracer.span("merge_parts"):
+                output_files = merge_chunked_recordings(part_paths, self.vrs_path)
+        finally:
+            shutil.rmtree(parts_dir, ignore_errors=True)
+
+        messages_per_stream: dict[int, int] = {}
+        for part_result in part_results:
+            for stream_id, count in part_result.messages_per_stream.items():
+                messages_per_stream[stream_id] = messages_per_stream.get(stream_id, 0) + count
+
+        input_bag_size = self.rosbag_path.stat().st_size
+        output_vrs_size = sum(path.stat().st_size for path in output_files)
+        result = ConversionResult(
+            input_bag_size=input_bag_size,
+            output_vrs_size=output_vrs_size,
+            compression_ratio=output_vrs_size / input_bag_size if input_bag_size > 0 else 0.0,
+            total_messages=sum(part_result.total_messages for part_result in part_results),
+            messages_per_stream=messages_per_stream,
+            duration_sec=part_results[0].duration_sec,  # Whole bag, same in every part
+            conversion_time_sec=time.time() - start_time,
+            output_files=[str(path) for path in output_files],
+        )
+
+        if self.cache is not None and cache_key is not None:
+            with tracer.span("cache_store"):
+                self.cache.store(
+                    cache_key, asdict(result), self.vrs_path, output_files, chunked=True
+                )
+
+        if self.config.verbose:
+            print(
+                f"Conversion complete in {result.conversion_time_sec:.2f}s "
+                f"({len(output_files)} chunks)"
+            )
+
+        return result
@@ -0,0 +1,239 @@
+"""Live progress and throughput reporting for long conversions.
+
+ProgressReporter is started with the number of messages of every stream,
+taken from the bag index (connection msgcount), and is updated once per
+processed message with the message size. It prints at most one report per
+interval: overall and per-stream progress, instantaneous and average MB/s
+(of bag message data), ETA and the current RSS, either as a status line or
+as JSON lines for job schedulers. update() only increments counters and
+reads a monotonic clock between reports. Follows the Single Responsibility
+Principle (SRP) by focusing solely on progress reporting.
+"""
+
+import json
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any, TextIO
+
+from scripts.memory_profile import get_rss_bytes
+
+PROGRESS_FORMATS = ("text", "json")
+
+DEFAULT_INTERVAL_SEC = 1.0
+
+_MB = 1024 * 1024
+
+
+@dataclass
+class StreamProgress:
+    """Processed messages of one stream"""
+    name: str
+    done: int
+    total: int
+    bytes: int
+
+
+@dataclass
+class ProgressSnapshot:
+    """State of the conversion at one report"""
+    elapsed_sec: float
+    messages: int
+    total_messages: int
+    bytes: int
+    fraction: float  # Estimated fraction of the message data processed (0..1)
+    mb_per_sec: float  # Since the previous report
+    avg_mb_per_sec: float  # Since start
+    eta_sec: float | None  # None until the throughput is known
+    rss_mb: float
+    streams: dict[int, StreamProgress]
+
+
+def format_duration(seconds: float | None) -> str:
+    """Format seconds as H:MM:SS ("--:--:--" if unknown)"""
+    if seconds is None:
+        return "--:--:--"
+    seconds = int(round(seconds))
+    return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+class ProgressReporter:
+    """
+    Rate-limited progress reporter driven by per-stream message totals
+
+    Usage:
+        progress = ProgressReporter(output_format="json")
+        progress.start({1001: 300, 1002: 300}, {1001: "Color", 1002: "Depth"})
+        for stream_id, rawdata in messages:
+            progress.update(stream_id, len(rawdata))
+        progress.finish()
+    """
+
+    def __init__(
+        self,
+        output_format: str = "text",
+        interval_sec: float = DEFAULT_INTERVAL_SEC,
+        output: TextIO | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the reporter
+
+        Args:
+            output_format: "text" (status line) or "json" (one JSON object per line)
+            interval_sec: Minimum time between reports
+            output: Stream to report to (default: sys.stderr)
+            clock: Monotonic clock in seconds (replaceable for tests)
+
+        Raises:
+            ValueError: If output_format or interval_sec is invalid
+        """
+        if output_format not in PROGRESS_FORMATS:
+            raise ValueError(
+                f"output_format must be one of {PROGRESS_FORMATS}, got {output_format}"
+            )
+        if interval_sec < 0:
+            raise ValueError(f"interval_sec must be >= 0, got {interval_sec}")
+        self.output_format = output_format
+        self.interval_sec = interval_sec
+        self.output = output if output is not None else sys.stderr
+        self._clock = clock
+
+        self._totals: dict[int, int] = {}
+        self._names: dict[int, str] = {}
+        self._done: dict[int, int] = {}
+        self._bytes: dict[int, int] = {}
+        self._messages = 0
+        self._total_bytes = 0
+        self._start = 0.0
+        self._next_report = 0.0
+        self._last_time = 0.0
+        self._last_bytes = 0
+        self._line_width = 0  # Width of the last status line (text output on a terminal)
+
+    def start(self, totals: dict[int, int], names: dict[int, str] | None = None) -> None:
+        """
+        Start reporting
+
+        Args:
+            totals: stream_id -> number of messages to process (from the bag index)
+            names: stream_id -> display name (default: the stream ID)
+        """
+        self._totals = dict(totals)
+        self._names = {
+            stream_id: (names or {}).get(stream_id, str(stream_id)) for stream_id in totals
+        }
+        self._done = dict.fromkeys(totals, 0)
+        self._bytes = dict.fromkeys(totals, 0)
+        self._messages = 0
+        self._total_bytes = 0
+        self._start = self._last_time = self._clock()
+        self._last_bytes = 0
+        self._next_report = self._start + self.interval_sec
+
+    def update(self, stream_id: int, nbytes: int) -> None:
+        """Count one processed message of a stream (reports if the interval has passed)"""
+        self._done[stream_id] = self._done.get(stream_id, 0) + 1
+        self._bytes[stream_id] = self._bytes.get(stream_id, 0) + nbytes
+        self._messages += 1
+        self._total_bytes += nbytes
+
+        now = self._clock()
+        if now >= self._next_report:
+            self._next_report = now + self.interval_sec
+            self._report(self.snapshot(now), "progress")
+
+    def finish(self) -> ProgressSnapshot:
+        """Write the final report and return it"""
+        snapshot = self.snapshot(self._clock())
+        self._report(snapshot, "done")
+        return snapshot
+
+    def snapshot(self, now: float | None = None) -> ProgressSnapshot:
+        """Get the current progress (and advance the instantaneous throughput window)"""
+        now = self._clock() if now is None else now
+        elapsed = now - self._start
+        window = now - self._last_time
+        mb_per_sec = (self._total_bytes - self._last_bytes) / _MB / window if window > 0 else 0.0
+        avg_mb_per_sec = self._total_bytes / _MB / elapsed if elapsed > 0 else 0.0
+        self._last_time = now
+        self._last_bytes = self._total_bytes
+
+        # Remaining data: remaining messages of each stream at that stream's mean size so far
+        # (message sizes differ by orders of magnitude between image and IMU streams)
+        mean_size = self._total_bytes / self._messages if self._messages else 0.0
+        remaining_bytes = 0.0
+        for stream_id, total in self._totals.items():
+            done = self._done.get(stream_id, 0)
+            stream_mean = self._bytes[stream_id] / done if done else mean_size
+            remaining_bytes += max(total - done, 0) * stream_mean
+        fraction = (
+            self._total_bytes / (self._total_bytes + remaining_bytes)
+            if self._total_bytes + remaining_bytes > 0
+            else 0.0
+        )
+        eta_sec = remaining_bytes / (avg_mb_per_sec * _MB) if avg_mb_per_sec > 0 else None
+
+        return ProgressSnapshot(
+            elapsed_sec=elapsed,
+            messages=self._messages,
+            total_messages=sum(self._totals.values()),
+            bytes=self._total_bytes,
+            fraction=fraction,
+            mb_per_sec=mb_per_sec,
+            avg_mb_per_sec=avg_mb_per_sec,
+            eta_sec=eta_sec,
+            rss_mb=get_rss_bytes() / _MB,
+            streams={
+                stream_id: StreamProgress(
+                    name=self._names.get(stream_id, str(stream_id)),
+                    done=self._done.get(stream_id, 0),
+                    total=total,
+                    bytes=self._bytes.get(stream_id, 0),
+                )
+                for stream_id, total in self._totals.items()
+            },
+        )
+
+    def _report(self, snapshot: ProgressSnapshot, event: str) -> None:
+        if self.output_format == "json":
+            self.output.write(json.dumps(progress_to_dict(snapshot, event)) + "\n")
+            self.output.flush()
+            return
+
+        line = format_progress(snapshot)
+        if self.output.isatty():
+            # Rewrite the status line in place; end it when done
+            padding = " " * max(self._line_width - len(line), 0)
+            self._line_width = len(line)
+            self.output.write("\r" + line + padding + ("\n" if event == "done" else ""))
+        else:
+            self.output.write(line + "\n")
+        self.output.flush()
+
+
+def progress_to_dict(snapshot: ProgressSnapshot, event: str = "progress") -> dict[str, Any]:
+    """Convert a snapshot into a JSON-serializable dictionary ("event": progress/done)"""
+    document = {"event": event, **asdict(snapshot)}
+    document["streams"] = {
+        str(stream_id): asdict(stream) for stream_id, stream in snapshot.streams.items()
+    }
+    return document
+
+
+def format_progress(snapshot: ProgressSnapshot) -> str:
+    """Format a snapshot as one status line
+
+    Streams with a single message (e.g. info) are omitted.
+    """
+    streams = " ".join(
+        f"{stream.name}:{stream.done}/{stream.total}"
+        for stream in snapshot.streams.values()
+        if stream.total > 1
+    )
+    return (
+        f"[{snapshot.fraction:6.1%}] {snapshot.messages}/{snapshot.total_messages} msgs | "
+        f"{snapshot.mb_per_sec:.1f} MB/s (avg {snapshot.avg_mb_per_sec:.1f}) | "
+        f"ETA {format_duration(snapshot.eta_sec)} | RSS {snapshot.rss_mb:.0f} MB | {streams}"
+    )
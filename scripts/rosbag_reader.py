@@ -7,8 +7,11 @@ Follows the Single Responsibility Principle (SRP) by focusing solely on bag file
 from pathlib import Path
 from typing import Any, Iterator
 
+import numpy as np
 from rosbags.rosbag1 import Reader
 
+from scripts.bag_index import BagIndex, get_index_path
+
 
 class RosbagReader:
     """Reader for ROS bag files with a clean, Pythonic interface.
@@ -20,15 +23,17 @@ class RosbagReader:
     Example:
         >>> with RosbagReader(Path("data.bag")) as reader:
         ...     topics = reader.get_available_topics()
-        ...     for msg in reader.read_messages(topics[0]):
+        ...     for msg in reader.read_messages(topics[:2]):
         ...         print(msg["timestamp"])
     """
 
-    def __init__(self, bag_path: Path) -> None:
+    def __init__(self, bag_path: Path, use_index: bool = True) -> None:
         """Initialize the ROSbag reader.
 
         Args:
             bag_path: Path to the ROSbag file
+            use_index: Load/create the persistent ``.bagidx`` sidecar index
+                for topic, count and duration queries
 
         Raises:
             FileNotFoundError: If the bag file does not exist
@@ -40,7 +45,9 @@ class RosbagReader:
             raise ValueError(f"Path is not a file: {bag_path}")
 
         self.bag_path = bag_path
+        self.use_index = use_index
         self._reader: Reader | None = None
+        self._index: BagIndex | None = None
 
     def __enter__(self) -> "RosbagReader":
         """Enter context manager."""
@@ -63,14 +70,45 @@ class RosbagReader:
             self._reader.open()
         return self._reader
 
+    def _get_index(self) -> BagIndex:
+        """Get the bag index, loading or creating the sidecar as needed.
+
+        A valid sidecar is loaded without opening the bag. Otherwise the index
+        is built from the bag's in-memory index records and persisted next to
+        the bag (silently skipped if the directory is not writable).
+
+        Returns:
+            BagIndex for the bag file
+        """
+        if self._index is not None:
+            return self._index
+
+        index_path = get_index_path(self.bag_path)
+        if self.use_index and index_path.exists():
+            try:
+                index = BagIndex.load(index_path)
+                if index.is_valid_for(self.bag_path):
+                    self._index = index
+                    return index
+            except (OSError, ValueError, KeyError):
+                pass  # Stale or corrupt sidecar, rebuild below
+
+        index = BagIndex.from_reader(self._get_reader(), self.bag_path)
+        if self.use_index:
+            try:
+                index.save(index_path)
+            except OSError:
+                pass  # Read-only location, keep the index in memory only
+        self._index = index
+        return index
+
     def get_available_topics(self) -> list[str]:
         """Get list of all topics in the bag file.
 
         Returns:
             List of topic names
         """
-        reader = self._get_reader()
-        return [conn.topic for conn in reader.connections]
+        return list(self._get_index().topics)
 
     def get_topics_info(self) -> dict[str, dict[str, Any]]:
         """Get detailed information about all topics.
@@ -79,12 +117,12 @@ class RosbagReader:
             Dictionary mapping topic names to their metadata including
             message type and message count
         """
-        reader = self._get_reader()
+        index = self._get_index()
         topics_info = {}
-        for conn in reader.connections:
-            topics_info[conn.topic] = {
-                "msgtype": conn.msgtype,
-                "msgcount": conn.msgcount,
+        for topic, msgtype, count in zip(index.topics, index.msgtypes, index.counts):
+            topics_info[topic] = {
+                "msgtype": msgtype,
+                "msgcount": int(count),
             }
         return topics_info
 
@@ -94,8 +132,16 @@ class RosbagReader:
         Returns:
             Duration in seconds
         """
-        reader = self._get_reader()
-        return reader.duration / 1e9  # Convert nanoseconds to seconds
+        index = self._get_index()
+        return (index.end_ns - index.start_ns) / 1e9  # Convert nanoseconds to seconds
+
+    def get_start_time(self) -> int:
+        """Get the timestamp of the first message in the bag.
+
+        Returns:
+            Start time in nanoseconds since epoch
+        """
+        return self._get_index().start_ns
 
     def get_message_count(self, topic: str) -> int:
         """Get the number of messages for a specific topic.
@@ -106,11 +152,41 @@ class RosbagReader:
         Returns:
             Number of messages on the topic
         """
-        reader = self._get_reader()
-        for conn in reader.connections:
-            if conn.topic == topic:
-                return conn.msgcount
-        return 0
+        return self._get_index().get_message_count(topic)
+
+    def get_topic_time_range(self, topic: str) -> tuple[int, int] | None:
+        """Get the first and last message timestamps of a topic.
+
+        Args:
+            topic: Topic name
+
+        Returns:
+            Tuple of (first, last) timestamps in nanoseconds since epoch,
+            or None if the topic has no messages
+        """
+        return self._get_index().get_time_range(topic)
+
+    def get_message_timestamps(self, topic: str) -> np.ndarray:
+        """Get the timestamps of all messages on a topic without reading them.
+
+        Args:
+            topic: Topic name
+
+        Returns:
+            Sorted int64 array of timestamps in nanoseconds since epoch
+        """
+        return self._get_index().get_timestamps(topic)
+
+    def get_time_ranges(self, count: int) -> list[tuple[int, int]]:
+        """Split the bag into time ranges of similar size at chunk boundaries.
+
+        Args:
+            count: Maximum number of ranges
+
+        Returns:
+            ``[start, stop)`` ranges in nanoseconds (see BagIndex.split_time_ranges())
+        """
+        return self._get_index().split_time_ranges(count)
 
     def filter_topics(self, pattern: str) -> list[str]:
         """Filter topics by a pattern string.
@@ -124,36 +200,62 @@ class RosbagReader:
         topics = self.get_available_topics()
         return [topic for topic in topics if pattern in topic]
 
-    def read_messages(self, topic: str) -> Iterator[dict[str, Any]]:
-        """Read messages from a specific topic.
+    def read_messages(
+        self,
+        topics: str | list[str] | None = None,
+        start_ns: int | None = None,
+        stop_ns: int | None = None,
+        as_memoryview: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Read messages from one or more topics in a single pass.
+
+        All requested connections are merged into one chronological,
+        chunk-ordered iteration, so each chunk is decompressed once no matter
+        how many topics are requested. The time window is resolved against
+        the bag's chunk index, so chunks that lie entirely outside
+        ``[start_ns, stop_ns)`` are never read or decompressed.
 
         Args:
-            topic: Topic name to read from
+            topics: Topic name, list of topic names, or None for all topics
+            start_ns: Yield only messages at or after this timestamp
+                (nanoseconds since epoch, None = from the beginning)
+            stop_ns: Yield only messages before this timestamp
+                (nanoseconds since epoch, None = until the end)
+            as_memoryview: Yield 'data' as a zero-copy memoryview over the
+                raw message buffer instead of bytes
 
         Yields:
             Dictionary containing:
             - 'timestamp' (int): nanoseconds since epoch
-            - 'data' (bytes): raw message data
+            - 'data' (bytes | memoryview): raw message data
             - 'msgtype' (str): message type name
             - 'connection' (Connection): connection object
 
         Example:
-            >>> for msg in reader.read_messages("/camera/image"):
+            >>> for msg in reader.read_messages(["/camera/image", "/imu"]):
             ...     print(f"Time: {msg['timestamp']}, Type: {msg['msgtype']}")
         """
         reader = self._get_reader()
 
-        # Filter connections for the requested topic
-        connections = [conn for conn in reader.connections if conn.topic == topic]
+        if topics is None:
+            connections = list(reader.connections)
+        else:
+            if isinstance(topics, str):
+                topics = [topics]
+            topic_set = set(topics)
+            # Filter connections for the requested topics
+            connections = [conn for conn in reader.connections if conn.topic in topic_set]
 
         if not connections:
-            # Topic not found, yield nothing
+            # No requested topic found, yield nothing
             return
 
-        for connection, timestamp, rawdata in reader.messages(connections=connections):
+        for connection, timestamp, rawdata in reader.messages(
+            connections=connections, start=start_ns, stop=stop_ns
+        ):
             yield {
                 "timestamp": timestamp,  # nanoseconds since epoch
-                "data": rawdata,  # raw bytes
+                "data": memoryview(rawdata) if as_memoryview else rawdata,
                 "msgtype": connection.msgtype,
                 "connection": connection,
             }
@@ -4,11 +4,16 @@ ROSbag to VRS Converter
 Converts RealSense D435i ROSbag files to VRS format.
 Color + Depth (必須)
 """
+import base64
 import time
-from dataclasses import dataclass, field
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 # ROSbag reader (support both ROS1 and ROS2 via AnyReader)
 try:
     from rosbags.highlevel import AnyReader  # type: ignore
@@ -16,16 +21,101 @@ except ImportError:
     raise ImportError("rosbags library is required. Install with: uv add rosbags")
 
 # VRS writer
-from scripts.vrs_writer import VRSWriter
+from scripts import __version__
+from scripts.conversion_cache import ConversionCache, compute_cache_key, fingerprint_bag
+from scripts.conversion_checkpoint import (
+    ConversionCheckpoint,
+    get_checkpoint_path,
+    read_checkpoint,
+    write_checkpoint,
+)
+from scripts.depth_codec import (
+    DEFAULT_KEYFRAME_INTERVAL,
+    DEPTH_CODEC_NONE,
+    DEPTH_CODEC_TEMPORAL_ZSTD,
+    DEPTH_CODECS,
+    TemporalDepthEncoder,
+    encode_depth,
+)
+from scripts.image_codec import (
+    DEFAULT_IMAGE_QUALITY,
+    IMAGE_CODEC_RAW,
+    IMAGE_CODECS,
+    OrderedEncoderPool,
+    encode_image,
+    is_codec_available,
+)
+from scripts.memory_profile import MemoryProfiler
+from scripts.metrics import ConversionMetrics
+from scripts.progress import ProgressReporter
+from scripts.time_series import (
+    TIME_SERIES_ENCODING,
+    TimeSeriesBatch,
+    TimeSeriesBuffer,
+    encode_time_series,
+    parse_metadata_value,
+)
+from scripts.topic_discovery import (
+    discover_streams,
+    get_device_index,
+    get_info_topics,
+    get_stream_name,
+    is_option_value_topic,
+)
+from scripts.trace_events import get_tracer
+from scripts.vrs_summary import get_source_tags
+from scripts.vrs_writer import ChunkedVRSWriter, VRSWriter
+
+# Writers accepted by the conversion steps (single file or chunked output)
+OutputWriter = VRSWriter | ChunkedVRSWriter
+
+
+# Pre-pass caches holding deserialized messages (stored as raw messages in checkpoints)
+MESSAGE_CACHES = ("camera_info_cache", "transform_cache", "stream_info_cache", "sensor_info_cache")
+
+# Image stream types (CameraInfo / StreamInfo topics derived via get_info_topics())
+IMAGE_STREAM_TYPES = ("color", "depth", "infrared")
+
+# Stream types converted without --imu (images and their extrinsics)
+RGBD_STREAM_TYPES = (
+    *IMAGE_STREAM_TYPES, "transform_color", "transform_depth", "transform_infrared"
+)
+
+# Encoding assumed when no StreamInfo is recorded
+DEFAULT_IMAGE_ENCODINGS = {
+    "color": "rgb8",
+    "depth": "16UC1",
+    "infrared": "mono8",
+}
+
+# ROS image encoding -> VRS PixelFormat (VRS has no 16-bit depth format; GREY16 is used)
+ENCODING_TO_PIXEL_FORMAT = {
+    "rgb8": "RGB8",
+    "bgr8": "BGR8",
+    "mono8": "GREY8",
+    "y8": "GREY8",
+    "16UC1": "GREY16",
+    "mono16": "GREY16",
+    "z16": "GREY16",
+}
+
+# IMU stream type -> sensor_msgs/Imu field stored in the motion stream samples
+IMU_SAMPLE_FIELDS = {
+    "imu_accel": "linear_acceleration",
+    "imu_gyro": "angular_velocity",
+}
 
 
 @dataclass
 class StreamConfig:
     """VRS stream configuration"""
     stream_id: int
-    stream_type: str  # "color", "depth", "imu_accel", "imu_gyro"
+    # "color", "depth", "infrared", "imu_accel", "imu_gyro", "options", "metadata", ...
+    stream_type: str
     recordable_type_id: str  # "ForwardCamera", "MotionSensor"
     flavor: str
+    image_codec: str = IMAGE_CODEC_RAW  # "raw", "png", "jpeg", "jxl" (image streams only)
+    image_quality: int = DEFAULT_IMAGE_QUALITY  # jpeg/jxl quality (1-100)
 
 
 @dataclass
@@ -35,6 +125,19 @@ class ConverterConfig:
     phase: str  # "4A", "4B", "4C"
     compression: str = "lz4"
     verbose: bool = False
+    imu_batch_size: int = 1  # IMU samples per VRS Data record
+    depth_codec: str = DEPTH_CODEC_NONE  # Lossless depth codec (see scripts.depth_codec)
+    depth_keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL  # temporal_zstd frames per keyframe
+    encoder_threads: int = 0  # Image encoder threads (0 = CPU count)
+    chunk_duration_sec: float | None = None  # Split output into chunks of N seconds
+    chunk_size_mb: float | None = None  # Split output into chunks of N MB of payload
+    hash_source: bool = True  # Store the input bag's SHA-256 as a file tag
+    flush_interval_sec: float | None = None  # Durable mode: flush records every N seconds
+    metadata_batch_size: int = 30  # Per-frame metadata rows per VRS Data record
+    auto_discover: bool = False  # Build topic_mapping from the bag's topics at convert()
+    color_codec: str = IMAGE_CODEC_RAW  # Image codec of discovered color streams
+    color_quality: int = DEFAULT_IMAGE_QUALITY  # Quality of discovered color streams
+    checkpoint: bool = False  # Chunked output: checkpoint each chunk and resume from it
 
 
 @dataclass
@@ -47,6 +150,8 @@ class ConversionResult:
     messages_per_stream: dict[int, int] = field(default_factory=dict)
     duration_sec: float = 0.0
     conversion_time_sec: float = 0.0
+    output_files: list[str] = field(default_factory=list)  # VRS files (chunks if split)
+    cache_hit: bool = False  # Output copied from the conversion cache
 
 
 class RosbagToVRSConverter:
@@ -59,7 +164,18 @@ class RosbagToVRSConverter:
     - Dependency Inversion: Uses abstract VRSWriter interface
     """
 
-    def __init__(self, rosbag_path: Path, vrs_path: Path, config: ConverterConfig):
+    def __init__(
+        self,
+        rosbag_path: Path,
+        vrs_path: Path,
+        config: ConverterConfig,
+        profiler: MemoryProfiler | None = None,
+        progress: ProgressReporter | None = None,
+        metrics: ConversionMetrics | None = None,
+        cache: ConversionCache | None = None,
+        time_range: tuple[int, int] | None = None,
+        metadata_caches: dict[str, Any] | None = None,
+    ):
         """
         Initialize converter
 
@@ -67,10 +183,25 @@ class RosbagToVRSConverter:
             rosbag_path: Input ROSbag file path
             vrs_path: Output VRS file path
             config: Converter configuration
+            profiler: Started memory profiler measuring each conversion stage (optional)
+            progress: Progress reporter updated while processing messages (optional)
+            metrics: Prometheus metrics updated by the conversion (optional, may be shared)
+            cache: Cache of conversion outputs; a cached output of the same bag and
+                configuration is copied instead of converting (optional)
+            time_range: Convert only the messages in this ``[start, stop)`` bag time
+                range (ns) into a chunked recording (optional, see scripts.parallel_converter)
+            metadata_caches: Result of run_prepass() on the same bag and configuration;
+                the pre-pass and source hashing are skipped (optional)
         """
         self.rosbag_path = Path(rosbag_path)
         self.vrs_path = Path(vrs_path)
         self.config = config
+        self.profiler = profiler
+        self.progress = progress
+        self.metrics = metrics
+        self.cache = cache
+        self.time_range = time_range
+        self.metadata_caches = metadata_caches
 
         # Statistics
         self._stats: dict[str, Any] = {
@@ -79,11 +210,34 @@ class RosbagToVRSConverter:
             "camera_info_cache": {},  # Cache CameraInfo messages
             "transform_cache": {},  # Cache Transform messages
             "stream_info_cache": {},  # Cache StreamInfo messages
-            "device_info_cache": {},  # Cache Device Info KeyValue pairs
+            "device_info_cache": {},  # Cache Device Info KeyValue pairs (per device topic)
             "sensor_info_cache": {},  # Cache Sensor Info messages
-            "options_cache": {}  # Cache Options messages
+            "options_cache": {}  # Cache Options messages (per device index)
         }
 
+        # Raw form of the messages in MESSAGE_CACHES: cache name -> topic -> (msgtype, rawdata)
+        self._cached_messages: dict[str, dict[str, tuple[str, bytes]]] = {}
+
+        # Checkpointing: key of the bag + configuration, and the serialized pre-pass caches
+        self._conversion_key = ""
+        self._metadata_export: dict[str, Any] | None = None
+
+        # Source bag file tags (computed once: hashing reads the whole bag)
+        self._source_tags: dict[str, str] | None = None
+
+        # temporal_zstd encoders per depth stream (keep the current keyframe)
+        self._depth_encoders: dict[int, TemporalDepthEncoder] = {}
+
+        # Image encoder pool (only while processing messages with a compressed image codec)
+        self._encoder_pool: OrderedEncoderPool | None = None
+
+        # Pending IMU samples per stream: stream_id -> (timestamps [s], samples (x, y, z))
+        self._imu_buffers: dict[int, tuple[list[float], list[tuple[float, float, float]]]] = {}
+
+        # Pending option/metadata rows per stream, and the last value of each option topic
+        self._series_buffers: dict[int, TimeSeriesBuffer] = {}
+        self._option_values: dict[str, float] = {}
+
     def convert(self) -> ConversionResult:
         """
         Execute conversion
@@ -96,12 +250,72 @@ class RosbagToVRSConverter:
             OSError: Cannot create output VRS file
             ValueError: Invalid configuration or unsupported message type
         """
+        if self.metrics is None:
+            return self._convert()
+
+        try:
+            result = self._convert()
+        except Exception:
+            self.metrics.record_failure()
+            raise
+        self.metrics.record_success(result.conversion_time_sec, result.output_vrs_size, time.time())
+        return result
+
+    def _convert(self) -> ConversionResult:
+        """Validate the configuration and run the conversion (see convert())"""
         # Validate input file exists
         if not self.rosbag_path.exists():
             raise FileNotFoundError(f"ROSbag file not found: {self.rosbag_path}")
 
+        # Validate output directory exists (the VRS writer only reports a generic failure)
+        if not self.vrs_path.parent.is_dir():
+            raise FileNotFoundError(f"Output directory not found: {self.vrs_path.parent}")
+
+        if self.config.imu_batch_size < 1:
+            raise ValueError(f"imu_batch_size must be >= 1, got {self.config.imu_batch_size}")
+
+        if self.config.metadata_batch_size < 1:
+            raise ValueError(
+                f"metadata_batch_size must be >= 1, got {self.config.metadata_batch_size}"
+            )
+
+        if self.config.depth_codec not in DEPTH_CODECS:
+            raise ValueError(
+                f"depth_codec must be one of {DEPTH_CODECS}, got {self.config.depth_codec}"
+            )
+
+        if self.config.depth_keyframe_interval < 1:
+            raise ValueError(
+                f"depth_keyframe_interval must be >= 1, got {self.config.depth_keyframe_interval}"
+            )
+
+        if self.config.checkpoint and (
+            self.config.chunk_duration_sec is None and self.config.chunk_size_mb is None
+        ):
+            raise ValueError(
+                "checkpoint requires chunked output (chunk_duration_sec or chunk_size_mb)"
+            )
+
+        if self.time_range is not None:
+            if self.time_range[0] >= self.time_range[1]:
+                raise ValueError(
+                    f"time_range must be (start, stop) with start < stop, got {self.time_range}"
+                )
+            if self.config.checkpoint:
+                raise ValueError("checkpoint cannot be used with time_range")
+
         start_time = time.time()
 
+        # Reuse the output of an identical earlier conversion (the key is computed
+        # before auto-discovery changes the topic mapping)
+        cache_key = None
+        if self.cache is not None:
+            with self._stage("cache_lookup"):
+                cache_key = self.cache.get_key(self.rosbag_path, self.config)
+                cached = self.cache.restore(cache_key, self.vrs_path)
+            if cached is not None:
+                return self._result_from_cache(cached, start_time)
+
         if self.config.verbose:
             print(f"Converting {self.rosbag_path} -> {self.vrs_path}")
             print(f"Phase: {self.config.phase}, Compression: {self.config.compression}")
@@ -109,28 +323,72 @@ class RosbagToVRSConverter:
         # Get input file size
         input_bag_size = self.rosbag_path.stat().st_size
 
+        # Resume an interrupted chunked conversion (before auto-discovery changes the config)
+        checkpoint = None
+        if self.config.checkpoint:
+            with self._stage("load_checkpoint"):
+                checkpoint = self._load_checkpoint()
+
+        # Pre-pass caches from the checkpoint or from the caller (parallel conversion)
+        metadata = checkpoint.metadata if checkpoint is not None else self.metadata_caches
+        if metadata is not None and metadata.get("source_tags") is not None:
+            self._source_tags = metadata["source_tags"]
+
         # Detect ROSbag format (ROS1 or ROS2)
         reader = self._open_rosbag()
 
+        # Build the topic mapping from the bag's topics (multi-device, infrared)
+        if self.config.auto_discover:
+            with self._stage("discover_topics"):
+                self._discover_topic_mapping(reader)
+
+        for stream_config in self.config.topic_mapping.values():
+            self._validate_image_codec(stream_config)
+
         # Create VRS writer
-        with VRSWriter(str(self.vrs_path)) as writer:
-            # Create streams
-            self._create_streams(writer)
-
-            # Write configuration records (requires CameraInfo, Transform, and Info data from bag)
-            self._cache_camera_info(reader)
-            self._cache_transforms(reader)
-            self._cache_stream_info(reader)
-            self._cache_device_info(reader)
-            self._cache_sensor_info(reader)
-            self._cache_options(reader)
-            self._write_configurations(writer)
+        with self._create_writer(checkpoint) as writer:
+            # Record the source bag in the file tags (stream stats are added at close)
+            with self._stage("source_tags"):
+                self._write_source_tags(writer)
+
+            # Cache CameraInfo, Transform, and Info data from bag
+            # (image streams need the resolution before they can be created;
+            # restored from the checkpoint when resuming)
+            with self._stage("cache_info"):
+                if metadata is not None:
+                    self._import_metadata_caches(reader, metadata)
+                else:
+                    self._run_cache_passes(reader)
+
+            # Create streams and write configuration records
+            with self._stage("create_streams"):
+                self._create_streams(writer)
+                self._write_configurations(writer)
+
+            if checkpoint is not None:
+                self._stats["total_messages"] = checkpoint.total_messages
+                self._stats["messages_per_stream"].update(checkpoint.messages_per_stream)
+                self._option_values = dict(checkpoint.option_values)
 
             # Process messages in temporal order
-            self._process_messages(reader, writer)
+            with self._stage("process_messages"):
+                self._process_messages(reader, writer, checkpoint)
+
+            # Write the index (and all records still buffered by the writer)
+            with self._stage("close"):
+                writer.close()
+
+            if self.metrics is not None:
+                self._record_output_metrics(writer)
+
+        if self.config.checkpoint:
+            get_checkpoint_path(self.vrs_path).unlink(missing_ok=True)
 
         # Calculate statistics
-        output_vrs_size = self.vrs_path.stat().st_size
+        output_files = (
+            writer.chunk_paths if isinstance(writer, ChunkedVRSWriter) else [self.vrs_path]
+        )
+        output_vrs_size = sum(path.stat().st_size for path in output_files)
         conversion_time = time.time() - start_time
 
         # Extract bag duration (first to last message timestamp)
@@ -143,9 +401,17 @@ class RosbagToVRSConverter:
             total_messages=self._stats["total_messages"],
             messages_per_stream=self._stats["messages_per_stream"].copy(),
             duration_sec=duration_sec,
-            conversion_time_sec=conversion_time
+            conversion_time_sec=conversion_time,
+            output_files=[str(path) for path in output_files]
         )
 
+        if self.cache is not None and cache_key is not None:
+            with self._stage("cache_store"):
+                self.cache.store(
+                    cache_key, asdict(result), self.vrs_path, output_files,
+                    chunked=isinstance(writer, ChunkedVRSWriter),
+                )
+
         if self.config.verbose:
             print(f"Conversion complete in {conversion_time:.2f}s")
             print(f"Input: {input_bag_size/1024/1024:.2f} MB -> Output: {output_vrs_size/1024/1024:.2f} MB")
@@ -155,23 +421,280 @@ class RosbagToVRSConverter:
 
         return result
 
+    def _result_from_cache(self, cached: dict[str, Any], start_time: float) -> ConversionResult:
+        """Build the result of a conversion served from the cache"""
+        result = ConversionResult(**{
+            **cached,
+            # JSON object keys are strings
+            "messages_per_stream": {
+                int(stream_id): count for stream_id, count in cached["messages_per_stream"].items()
+            },
+            "conversion_time_sec": time.time() - start_time,
+            "cache_hit": True,
+        })
+        if self.config.verbose:
+            print(f"Cache hit: copied {len(result.output_files)} file(s) to {self.vrs_path}")
+        return result
+
+    def run_prepass(self) -> dict[str, Any]:
+        """
+        Run the metadata pre-pass without converting
+
+        Discovers the topic mapping (if configured), reads the info, transform and
+        option topics and computes the source file tags. The result can be passed
+        as metadata_caches to converters of time ranges of the same bag with
+        self.config, so that they skip this work.
+
+        Returns:
+            Serialized pre-pass caches (JSON-compatible)
+
+        Raises:
+            FileNotFoundError: ROSbag file not found
+            ValueError: Cannot open the ROSbag or no streams were discovered
+        """
+        if not self.rosbag_path.exists():
+            raise FileNotFoundError(f"ROSbag file not found: {self.rosbag_path}")
+
+        reader = self._open_rosbag()
+        if self.config.auto_discover:
+            with self._stage("discover_topics"):
+                self._discover_topic_mapping(reader)
+
+        with self._stage("source_tags"):
+            self._get_source_tags()
+        with self._stage("cache_info"):
+            self._run_cache_passes(reader)
+        return self._export_metadata_caches()
+
+    def _record_output_metrics(self, writer: OutputWriter) -> None:
+        """Add the payload bytes written to each stream to the metrics"""
+        assert self.metrics is not None
+        stream_types = {
+            stream_config.stream_id: stream_config.stream_type
+            for stream_config in self.config.topic_mapping.values()
+        }
+        for stream_id, stream_type in stream_types.items():
+            self.metrics.record_output(
+                stream_type, writer.get_stream_stats(stream_id).payload_bytes
+            )
+
+    @contextmanager
+    def _stage(self, name: str) -> Iterator[None]:
+        """Trace a conversion stage and measure it with the memory profiler (if any)"""
+        with get_tracer().span(name):
+            if self.profiler is None:
+                yield
+                return
+            with self.profiler.stage(name):
+                yield
+
     def _open_rosbag(self) -> Any:  # Returns AnyReader
         """Open ROSbag with auto-detection of format (ROS1 or ROS2)"""
         # AnyReader automatically detects ROSbag1 or ROSbag2 format
         try:
-            return AnyReader([self.rosbag_path])
+            with get_tracer().span("open_bag", path=self.rosbag_path):
+                return AnyReader([self.rosbag_path])
         except Exception as e:
             raise ValueError(f"Cannot open ROSbag: {e}") from e
 
-    def _create_streams(self, writer: VRSWriter) -> None:
+    def _discover_topic_mapping(self, reader: Any) -> None:
+        """Replace the configured topic mapping with the streams found in the bag"""
+        with reader:
+            topics = [connection.topic for connection in reader.connections]
+
+        topic_mapping = discover_topic_mapping(
+            topics, include_imu=self.config.phase != "rgbd"
+        )
+        if not topic_mapping:
+            raise ValueError("No RealSense streams found in ROSbag")
+
+        self.config = replace(
+            self.config,
+            topic_mapping=with_color_codec(
+                topic_mapping, self.config.color_codec, self.config.color_quality
+            )
+        )
+
+        if self.config.verbose:
+            print(f"Discovered {len(topic_mapping)} streams:")
+            for topic, stream_config in topic_mapping.items():
+                print(f"  {stream_config.stream_id}: {topic}")
+
+    def _create_writer(self, checkpoint: ConversionCheckpoint | None = None) -> OutputWriter:
+        """
+        Create a single-file VRS writer, or a chunked writer when a chunk limit or
+        a time range is set (time ranges are merged as chunks of one recording)
+
+        A chunked writer resuming from a checkpoint continues after its finished chunks.
+        """
+        if (
+            self.config.chunk_duration_sec is None
+            and self.config.chunk_size_mb is None
+            and self.time_range is None
+        ):
+            return VRSWriter(str(self.vrs_path), flush_interval_sec=self.config.flush_interval_sec)
+
+        chunk_size_bytes = None
+        if self.config.chunk_size_mb is not None:
+            chunk_size_bytes = int(self.config.chunk_size_mb * 1024 * 1024)
+        return ChunkedVRSWriter(
+            self.vrs_path,
+            chunk_duration_sec=self.config.chunk_duration_sec,
+            chunk_size_bytes=chunk_size_bytes,
+            flush_interval_sec=self.config.flush_interval_sec,
+            completed_chunks=checkpoint.chunks if checkpoint is not None else None,
+            completed_stream_stats=(
+                checkpoint.chunk_stream_stats if checkpoint is not None else None
+            ),
+        )
+
+    def _load_checkpoint(self) -> ConversionCheckpoint | None:
+        """Load the checkpoint of an interrupted conversion of the same bag and configuration"""
+        self._conversion_key = compute_cache_key(fingerprint_bag(self.rosbag_path), self.config)
+        checkpoint_path = get_checkpoint_path(self.vrs_path)
+        if not checkpoint_path.exists():
+            return None
+
+        try:
+            checkpoint = read_checkpoint(checkpoint_path)
+        except ValueError as e:
+            print(f"Warning: Ignoring checkpoint {checkpoint_path}: {e}")
+            return None
+        if checkpoint.conversion_key != self._conversion_key:
+            print(
+                f"Warning: Ignoring checkpoint {checkpoint_path} "
+                "of a different bag or configuration"
+            )
+            return None
+
+        if self.config.verbose:
+            print(
+                f"Resuming from {checkpoint_path}: {len(checkpoint.chunks)} chunks, "
+                f"{checkpoint.total_messages} messages done"
+            )
+        return checkpoint
+
+    def _write_checkpoint(
+        self,
+        writer: ChunkedVRSWriter,
+        resume_timestamp: int,
+        resume_skip: int,
+    ) -> None:
+        """Record the finished chunks and the bag position of the next message"""
+        if self._metadata_export is None:
+            self._metadata_export = self._export_metadata_caches()
+        write_checkpoint(
+            get_checkpoint_path(self.vrs_path),
+            ConversionCheckpoint(
+                conversion_key=self._conversion_key,
+                resume_timestamp=resume_timestamp,
+                resume_skip=resume_skip,
+                chunks=writer.completed_chunks,
+                chunk_stream_stats=writer.completed_stream_stats,
+                total_messages=self._stats["total_messages"],
+                messages_per_stream=dict(self._stats["messages_per_stream"]),
+                option_values=dict(self._option_values),
+                metadata=self._metadata_export,
+            ),
+        )
+
+    def _cache_message(
+        self,
+        cache_name: str,
+        topic: str,
+        msgtype: str,
+        rawdata: bytes,
+        msg: Any,
+    ) -> None:
+        """Store a deserialized info message in a pre-pass cache (and its raw form for export)"""
+        self._stats[cache_name][topic] = msg
+        self._cached_messages.setdefault(cache_name, {})[topic] = (msgtype, bytes(rawdata))
+
+    def _export_metadata_caches(self) -> dict[str, Any]:
+        """Serialize the pre-pass caches to JSON-compatible data"""
+        return {
+            "messages": {
+                cache_name: {
+                    topic: {"msgtype": msgtype, "data": base64.b64encode(rawdata).decode("ascii")}
+                    for topic, (msgtype, rawdata) in messages.items()
+                }
+                for cache_name, messages in self._cached_messages.items()
+            },
+            "device_info_cache": self._stats["device_info_cache"],
+            "options_cache": {
+                str(device_index): options
+                for device_index, options in self._stats["options_cache"].items()
+            },
+            "source_tags": self._source_tags,
+        }
+
+    def _import_metadata_caches(self, reader: Any, metadata: dict[str, Any]) -> None:
+        """Restore the pre-pass caches from _export_metadata_caches() data (skips the pre-pass)"""
+        with reader:
+            for cache_name, messages in metadata["messages"].items():
+                for topic, message in messages.items():
+                    rawdata = base64.b64decode(message["data"])
+                    msg = reader.deserialize(rawdata, message["msgtype"])
+                    self._cache_message(cache_name, topic, message["msgtype"], rawdata, msg)
+        self._stats["device_info_cache"] = metadata["device_info_cache"]
+        self._stats["options_cache"] = {
+            int(device_index): options
+            for device_index, options in metadata["options_cache"].items()
+        }
+
+    def _get_source_tags(self) -> dict[str, str]:
+        """Get the source bag path/size/hash and converter version file tags"""
+        if self._source_tags is None:
+            self._source_tags = get_source_tags(
+                self.rosbag_path, __version__, compute_hash=self.config.hash_source
+            )
+        return self._source_tags
+
+    def _write_source_tags(self, writer: OutputWriter) -> None:
+        """Write source bag path/size/hash and converter version as file tags"""
+        for tag_name, tag_value in self._get_source_tags().items():
+            writer.set_file_tag(tag_name, tag_value)
+
+    def _create_streams(self, writer: OutputWriter) -> None:
         """Create VRS streams based on topic mapping"""
         for topic, stream_config in self.config.topic_mapping.items():
-            # VRSWriter.add_stream() accepts (stream_id, stream_name)
+            image_spec = self._get_image_stream_spec(topic, stream_config)
+
             # stream_name is automatically encoded with |id:stream_id format
-            writer.add_stream(
-                stream_config.stream_id,
-                stream_config.flavor
-            )
+            if image_spec is not None:
+                # Color/Depth/Infrared: Data records carry a native VRS image content block
+                pixel_format, width, height = image_spec
+                writer.add_image_stream(
+                    stream_config.stream_id,
+                    stream_config.flavor,
+                    pixel_format,
+                    width,
+                    height,
+                    image_codec=stream_config.image_codec
+                )
+            elif stream_config.stream_type in IMU_SAMPLE_FIELDS:
+                # Accel/Gyro: typed DataLayout records holding a batch of samples
+                writer.add_motion_stream(
+                    stream_config.stream_id,
+                    stream_config.flavor
+                )
+                self._imu_buffers[stream_config.stream_id] = ([], [])
+            elif stream_config.stream_type in ("options", "metadata"):
+                # Options: one row per change; metadata: batched per-frame rows
+                writer.add_stream(
+                    stream_config.stream_id,
+                    stream_config.flavor
+                )
+                batch_size = (
+                    1 if stream_config.stream_type == "options"
+                    else self.config.metadata_batch_size
+                )
+                self._series_buffers[stream_config.stream_id] = TimeSeriesBuffer(batch_size)
+            else:
+                writer.add_stream(
+                    stream_config.stream_id,
+                    stream_config.flavor
+                )
 
             # Initialize message counter
             self._stats["messages_per_stream"][stream_config.stream_id] = 0
@@ -179,17 +702,87 @@ class RosbagToVRSConverter:
             if self.config.verbose:
                 print(f"Created stream {stream_config.stream_id}: {stream_config.flavor}")
 
+    def _validate_image_codec(self, stream_config: StreamConfig) -> None:
+        """Check that a stream's image codec is known, usable and fits the stream type"""
+        codec = stream_config.image_codec
+        if codec == IMAGE_CODEC_RAW:
+            return
+
+        if codec not in IMAGE_CODECS:
+            raise ValueError(f"image_codec must be one of {IMAGE_CODECS}, got {codec}")
+        if stream_config.stream_type not in IMAGE_STREAM_TYPES:
+            raise ValueError(
+                f"image_codec '{codec}' is only supported for image streams, "
+                f"not {stream_config.stream_type} (stream {stream_config.stream_id})"
+            )
+        if stream_config.stream_type == "depth" and codec != "png":
+            raise ValueError(
+                f"Depth streams only support the lossless png image codec, got {codec}"
+            )
+        if stream_config.stream_type == "depth" and self.config.depth_codec != DEPTH_CODEC_NONE:
+            raise ValueError("image_codec and depth_codec cannot both be used for the depth stream")
+        if not is_codec_available(codec):
+            raise ValueError(f"Image codec '{codec}' is not available in this OpenCV build")
+
+    def _get_image_stream_spec(
+        self, topic: str, stream_config: StreamConfig
+    ) -> tuple[str, int, int] | None:
+        """
+        Get (pixel_format, width, height) for an image stream from cached CameraInfo/StreamInfo
+
+        Returns None for non-image streams, for depth streams with a depth codec, or when
+        the resolution or encoding is unknown (the stream then falls back to an opaque
+        CUSTOM block).
+        """
+        if stream_config.stream_type not in IMAGE_STREAM_TYPES:
+            return None
+
+        # Encoded depth frames are variable-size and cannot use an image content block
+        if stream_config.stream_type == "depth" and self.config.depth_codec != DEPTH_CODEC_NONE:
+            return None
+
+        camera_info_topic, stream_info_topic = get_info_topics(topic)
+        camera_info = self._stats["camera_info_cache"].get(camera_info_topic)
+        if camera_info is None:
+            return None
+
+        encoding = DEFAULT_IMAGE_ENCODINGS[stream_config.stream_type]
+        stream_info = self._stats["stream_info_cache"].get(stream_info_topic)
+        if stream_info:
+            encoding = str(stream_info.encoding)
+
+        pixel_format = ENCODING_TO_PIXEL_FORMAT.get(encoding)
+        if pixel_format is None:
+            return None
+
+        return pixel_format, int(camera_info.width), int(camera_info.height)
+
+    def _run_cache_passes(self, reader: Any) -> None:
+        """Read the info, transform and option topics into the pre-pass caches"""
+        for cache_pass in (
+            self._cache_camera_info,
+            self._cache_transforms,
+            self._cache_stream_info,
+            self._cache_device_info,
+            self._cache_sensor_info,
+            self._cache_options,
+        ):
+            with get_tracer().span(cache_pass.__name__.lstrip("_")):
+                cache_pass(reader)
+
     def _cache_camera_info(self, reader: Any) -> None:
         """
         Cache CameraInfo messages for Configuration records
 
-        CameraInfo topics:
+        CameraInfo topics (one per image stream in the topic mapping):
         - /device_0/sensor_1/Color_0/info/camera_info (for Color stream)
         - /device_0/sensor_0/Depth_0/info/camera_info (for Depth stream)
+        - /device_N/sensor_M/<Stream>_K/info/camera_info (for discovered streams)
         """
         camera_info_topics = [
-            "/device_0/sensor_1/Color_0/info/camera_info",
-            "/device_0/sensor_0/Depth_0/info/camera_info"
+            get_info_topics(topic)[0]
+            for topic, stream_config in self.config.topic_mapping.items()
+            if stream_config.stream_type in IMAGE_STREAM_TYPES
         ]
 
         with reader:
@@ -200,7 +793,9 @@ class RosbagToVRSConverter:
                 msg = reader.deserialize(rawdata, connection.msgtype)
 
                 # Cache by topic
-                self._stats["camera_info_cache"][connection.topic] = msg
+                self._cache_message(
+                    "camera_info_cache", connection.topic, connection.msgtype, rawdata, msg
+                )
 
                 if self.config.verbose:
                     print(f"Cached CameraInfo from {connection.topic}")
@@ -213,13 +808,15 @@ class RosbagToVRSConverter:
         """
         Cache Transform messages for Configuration records
 
-        Transform topics:
+        Transform topics (the transform streams of the topic mapping):
         - /device_0/sensor_0/Depth_0/tf/0 (Depth Extrinsic)
         - /device_0/sensor_1/Color_0/tf/0 (Color Extrinsic)
+        - /device_N/sensor_M/<Stream>_K/tf/0 (for discovered streams)
         """
         transform_topics = [
-            "/device_0/sensor_0/Depth_0/tf/0",
-            "/device_0/sensor_1/Color_0/tf/0"
+            topic
+            for topic, stream_config in self.config.topic_mapping.items()
+            if stream_config.stream_type.startswith("transform_")
         ]
 
         with reader:
@@ -236,7 +833,9 @@ class RosbagToVRSConverter:
                 msg = reader.deserialize(rawdata, connection.msgtype)
 
                 # Cache by topic
-                self._stats["transform_cache"][connection.topic] = msg
+                self._cache_message(
+                    "transform_cache", connection.topic, connection.msgtype, rawdata, msg
+                )
 
                 if self.config.verbose:
                     print(f"Cached Transform from {connection.topic}")
@@ -249,17 +848,17 @@ class RosbagToVRSConverter:
         """
         Cache StreamInfo messages for Configuration records
 
-        StreamInfo topics:
+        StreamInfo topics (one per image/IMU stream in the topic mapping):
         - /device_0/sensor_0/Depth_0/info
         - /device_0/sensor_1/Color_0/info
         - /device_0/sensor_2/Accel_0/info
         - /device_0/sensor_2/Gyro_0/info
         """
         stream_info_topics = [
-            "/device_0/sensor_0/Depth_0/info",
-            "/device_0/sensor_1/Color_0/info",
-            "/device_0/sensor_2/Accel_0/info",
-            "/device_0/sensor_2/Gyro_0/info"
+            get_info_topics(topic)[1]
+            for topic, stream_config in self.config.topic_mapping.items()
+            if stream_config.stream_type in IMAGE_STREAM_TYPES
+            or stream_config.stream_type in IMU_SAMPLE_FIELDS
         ]
 
         with reader:
@@ -272,7 +871,9 @@ class RosbagToVRSConverter:
 
             for connection, timestamp, rawdata in reader.messages(connections=connections):
                 msg = reader.deserialize(rawdata, connection.msgtype)
-                self._stats["stream_info_cache"][connection.topic] = msg
+                self._cache_message(
+                    "stream_info_cache", connection.topic, connection.msgtype, rawdata, msg
+                )
 
                 if self.config.verbose:
                     print(f"Cached StreamInfo from {connection.topic}: fps={msg.fps}, encoding={msg.encoding}")
@@ -281,14 +882,18 @@ class RosbagToVRSConverter:
         """
         Cache Device Info messages
 
-        Device Info topics:
+        Device Info topics (the device info streams of the topic mapping):
         - /device_0/info (multiple KeyValue pairs)
         """
-        device_info_topic = "/device_0/info"
-        device_info_dict = {}
+        device_info_topics = [
+            topic
+            for topic, stream_config in self.config.topic_mapping.items()
+            if stream_config.stream_type == "device_info"
+        ]
+        device_info_cache: dict[str, dict[str, str]] = {}
 
         with reader:
-            connections = [x for x in reader.connections if x.topic == device_info_topic]
+            connections = [x for x in reader.connections if x.topic in device_info_topics]
 
             if not connections:
                 if self.config.verbose:
@@ -297,26 +902,30 @@ class RosbagToVRSConverter:
 
             for connection, timestamp, rawdata in reader.messages(connections=connections):
                 msg = reader.deserialize(rawdata, connection.msgtype)
-                device_info_dict[msg.key] = msg.value
+                device_info_cache.setdefault(connection.topic, {})[msg.key] = msg.value
 
-            self._stats["device_info_cache"] = device_info_dict
+            self._stats["device_info_cache"] = device_info_cache
 
             if self.config.verbose:
-                print(f"Cached Device Info ({len(device_info_dict)} key-value pairs)")
+                for topic, device_info_dict in device_info_cache.items():
+                    print(
+                        f"Cached Device Info from {topic} "
+                        f"({len(device_info_dict)} key-value pairs)"
+                    )
 
     def _cache_sensor_info(self, reader: Any) -> None:
         """
         Cache Sensor Info messages
 
-        Sensor Info topics:
+        Sensor Info topics (the sensor info streams of the topic mapping):
         - /device_0/sensor_0/info
         - /device_0/sensor_1/info
         - /device_0/sensor_2/info
         """
         sensor_info_topics = [
-            "/device_0/sensor_0/info",
-            "/device_0/sensor_1/info",
-            "/device_0/sensor_2/info"
+            topic
+            for topic, stream_config in self.config.topic_mapping.items()
+            if stream_config.stream_type == "sensor_info"
         ]
 
         with reader:
@@ -329,7 +938,9 @@ class RosbagToVRSConverter:
 
             for connection, timestamp, rawdata in reader.messages(connections=connections):
                 msg = reader.deserialize(rawdata, connection.msgtype)
-                self._stats["sensor_info_cache"][connection.topic] = msg
+                self._cache_message(
+                    "sensor_info_cache", connection.topic, connection.msgtype, rawdata, msg
+                )
 
                 if self.config.verbose:
                     print(f"Cached Sensor Info from {connection.topic}: {msg.value}")
@@ -338,11 +949,14 @@ class RosbagToVRSConverter:
         """
         Cache Options messages for Configuration record
 
-        Options topics:
-        - /device_0/sensor_*/option/*/value (25 topics)
-        - /device_0/sensor_*/option/*/description (25 topics)
+        The first (initial) value of each option is cached; later changes are
+        written as Data records of the options stream.
+
+        Options topics (cached per device index):
+        - /device_N/sensor_*/option/*/value (25 topics per device)
+        - /device_N/sensor_*/option/*/description (25 topics per device)
         """
-        options_dict = {}  # {option_name: {sensor, value, description}}
+        options_cache = {}  # {device_index: {option_name: {sensor, value, description}}}
 
         with reader:
             # Find all option topics
@@ -359,11 +973,12 @@ class RosbagToVRSConverter:
             for connection, timestamp, rawdata in reader.messages(connections=option_connections):
                 msg = reader.deserialize(rawdata, connection.msgtype)
 
-                # Parse topic: /device_0/sensor_X/option/OPTION_NAME/TYPE
+                # Parse topic: /device_N/sensor_X/option/OPTION_NAME/TYPE
                 parts = connection.topic.split('/')
                 if len(parts) < 6:
                     continue  # Invalid topic format
 
+                options_dict = options_cache.setdefault(get_device_index(connection.topic) or 0, {})
                 sensor_id = parts[2]  # sensor_0, sensor_1, sensor_2
                 option_name = parts[4]  # Exposure, Gain, etc.
                 option_type = parts[5]  # value or description
@@ -376,21 +991,23 @@ class RosbagToVRSConverter:
                         'description': None
                     }
 
-                # Store value or description
+                # Store initial value or description
                 if option_type == 'value':
-                    options_dict[option_name]['value'] = float(msg.data)
+                    if options_dict[option_name]['value'] is None:
+                        options_dict[option_name]['value'] = float(msg.data)
                 elif option_type == 'description':
                     options_dict[option_name]['description'] = str(msg.data)
 
-            self._stats["options_cache"] = options_dict
+            self._stats["options_cache"] = options_cache
 
             if self.config.verbose:
-                print(f"Cached {len(options_dict)} Options")
+                for device_index, options_dict in sorted(options_cache.items()):
+                    print(f"Cached {len(options_dict)} Options for device_{device_index}")
 
-    def _write_configurations(self, writer: VRSWriter) -> None:
+    def _write_configurations(self, writer: OutputWriter) -> None:
         """Write Configuration records for each stream"""
         for topic, stream_config in self.config.topic_mapping.items():
-            if stream_config.stream_type == "color":
+            if stream_config.stream_type in ("color", "infrared"):
                 self._write_color_configuration(writer, stream_config, topic)
             elif stream_config.stream_type == "depth":
                 self._write_depth_configuration(writer, stream_config, topic)
@@ -398,20 +1015,25 @@ class RosbagToVRSConverter:
                 self._write_imu_accel_configuration(writer, stream_config, topic)
             elif stream_config.stream_type == "imu_gyro":
                 self._write_imu_gyro_configuration(writer, stream_config, topic)
-            elif stream_config.stream_type == "transform_depth":
-                self._write_transform_depth_configuration(writer, stream_config, topic)
-            elif stream_config.stream_type == "transform_color":
-                self._write_transform_color_configuration(writer, stream_config, topic)
+            elif stream_config.stream_type.startswith("transform_"):
+                self._write_transform_configuration(writer, stream_config, topic)
             elif stream_config.stream_type == "device_info":
                 self._write_device_info_configuration(writer, stream_config, topic)
             elif stream_config.stream_type == "sensor_info":
                 self._write_sensor_info_configuration(writer, stream_config, topic)
             elif stream_config.stream_type == "options":
                 self._write_options_configuration(writer, stream_config, topic)
-
-    def _write_color_configuration(self, writer: VRSWriter, stream_config: StreamConfig, topic: str) -> None:
-        """Write Color stream Configuration record"""
-        camera_info_topic = "/device_0/sensor_1/Color_0/info/camera_info"
+            elif stream_config.stream_type == "metadata":
+                self._write_metadata_configuration(writer, stream_config, topic)
+
+    def _write_color_configuration(
+        self,
+        writer: OutputWriter,
+        stream_config: StreamConfig,
+        topic: str,
+    ) -> None:
+        """Write Color (or Infrared) stream Configuration record"""
+        camera_info_topic, stream_info_topic = get_info_topics(topic)
         camera_info = self._stats["camera_info_cache"].get(camera_info_topic)
 
         if camera_info is None:
@@ -420,15 +1042,16 @@ class RosbagToVRSConverter:
         config_data = {
             "width": int(camera_info.width),
             "height": int(camera_info.height),
-            "encoding": "rgb8",  # Default, will be overridden by StreamInfo
+            # Default, will be overridden by StreamInfo
+            "encoding": DEFAULT_IMAGE_ENCODINGS[stream_config.stream_type],
             "camera_k": list(camera_info.K),  # 9 elements
             "camera_d": list(camera_info.D),  # 5 elements (distortion coefficients)
             "distortion_model": camera_info.distortion_model,
+            "image_codec": stream_config.image_codec,  # raw, png, jpeg, jxl
             "frame_id": camera_info.header.frame_id  # Store frame_id in configuration
         }
 
         # Add StreamInfo if available
-        stream_info_topic = "/device_0/sensor_1/Color_0/info"
         stream_info = self._stats["stream_info_cache"].get(stream_info_topic)
 
         if stream_info:
@@ -440,11 +1063,20 @@ class RosbagToVRSConverter:
 
         if self.config.verbose:
             fps_str = f", fps={config_data.get('fps', 'N/A')}" if "fps" in config_data else ""
-            print(f"Wrote Configuration for stream {stream_config.stream_id} (Color): {camera_info.width}x{camera_info.height}{fps_str}")
+            print(
+                f"Wrote Configuration for stream {stream_config.stream_id} "
+                f"({get_stream_name(topic)}): "
+                f"{camera_info.width}x{camera_info.height}{fps_str}"
+            )
 
-    def _write_depth_configuration(self, writer: VRSWriter, stream_config: StreamConfig, topic: str) -> None:
+    def _write_depth_configuration(
+        self,
+        writer: OutputWriter,
+        stream_config: StreamConfig,
+        topic: str,
+    ) -> None:
         """Write Depth stream Configuration record"""
-        camera_info_topic = "/device_0/sensor_0/Depth_0/info/camera_info"
+        camera_info_topic, stream_info_topic = get_info_topics(topic)
         camera_info = self._stats["camera_info_cache"].get(camera_info_topic)
 
         if camera_info is None:
@@ -458,11 +1090,13 @@ class RosbagToVRSConverter:
             "camera_d": list(camera_info.D),
             "distortion_model": camera_info.distortion_model,
             "depth_scale": 0.001,  # mm -> meters
+            "depth_codec": self.config.depth_codec,  # Decoded transparently by VRSReader
+            "image_codec": stream_config.image_codec,  # raw or png
+            "depth_keyframe_interval": self.config.depth_keyframe_interval,  # temporal_zstd only
             "frame_id": camera_info.header.frame_id  # Store frame_id in configuration
         }
 
         # Add StreamInfo if available
-        stream_info_topic = "/device_0/sensor_0/Depth_0/info"
         stream_info = self._stats["stream_info_cache"].get(stream_info_topic)
 
         if stream_info:
@@ -476,10 +1110,16 @@ class RosbagToVRSConverter:
             fps_str = f", fps={config_data.get('fps', 'N/A')}" if "fps" in config_data else ""
             print(f"Wrote Configuration for stream {stream_config.stream_id} (Depth): {camera_info.width}x{camera_info.height}{fps_str}")
 
-    def _write_imu_accel_configuration(self, writer: VRSWriter, stream_config: StreamConfig, topic: str) -> None:
+    def _write_imu_accel_configuration(
+        self,
+        writer: OutputWriter,
+        stream_config: StreamConfig,
+        topic: str,
+    ) -> None:
         """Write IMU Accelerometer Configuration record"""
         config_data = {
             "sensor_type": "accelerometer",
+            "samples_per_record": self.config.imu_batch_size,
             "frame_id": "0",
             "unit": "m/s^2",
             "sample_rate": 44.0,  # Estimated from ROSbag analysis
@@ -490,7 +1130,7 @@ class RosbagToVRSConverter:
         }
 
         # Add StreamInfo if available
-        stream_info_topic = "/device_0/sensor_2/Accel_0/info"
+        stream_info_topic = get_info_topics(topic)[1]
         stream_info = self._stats["stream_info_cache"].get(stream_info_topic)
 
         if stream_info:
@@ -504,10 +1144,16 @@ class RosbagToVRSConverter:
             fps_str = f", fps={config_data.get('fps', 'N/A')}" if "fps" in config_data else ""
             print(f"Wrote Configuration for stream {stream_config.stream_id} (Accel): {config_data['sample_rate']} Hz{fps_str}")
 
-    def _write_imu_gyro_configuration(self, writer: VRSWriter, stream_config: StreamConfig, topic: str) -> None:
+    def _write_imu_gyro_configuration(
+        self,
+        writer: OutputWriter,
+        stream_config: StreamConfig,
+        topic: str,
+    ) -> None:
         """Write IMU Gyroscope Configuration record"""
         config_data = {
             "sensor_type": "gyroscope",
+            "samples_per_record": self.config.imu_batch_size,
             "frame_id": "0",
             "unit": "rad/s",
             "sample_rate": 55.0,  # Estimated from ROSbag analysis
@@ -518,7 +1164,7 @@ class RosbagToVRSConverter:
         }
 
         # Add StreamInfo if available
-        stream_info_topic = "/device_0/sensor_2/Gyro_0/info"
+        stream_info_topic = get_info_topics(topic)[1]
         stream_info = self._stats["stream_info_cache"].get(stream_info_topic)
 
         if stream_info:
@@ -532,26 +1178,37 @@ class RosbagToVRSConverter:
             fps_str = f", fps={config_data.get('fps', 'N/A')}" if "fps" in config_data else ""
             print(f"Wrote Configuration for stream {stream_config.stream_id} (Gyro): {config_data['sample_rate']} Hz{fps_str}")
 
-    def _write_transform_depth_configuration(self, writer: VRSWriter, stream_config: StreamConfig, topic: str) -> None:
-        """Write Depth Extrinsic Configuration record"""
+    def _write_transform_configuration(
+        self,
+        writer: OutputWriter,
+        stream_config: StreamConfig,
+        topic: str,
+    ) -> None:
+        """Write Extrinsic Configuration record of an image stream (Color, Depth, Infrared)"""
         transform_msg = self._stats["transform_cache"].get(topic)
+        sensor_name = get_stream_name(topic)
+        reference_frame = f"device_{get_device_index(topic) or 0}"
 
         if transform_msg is None:
+            # Raise error if Color transform is missing (should be present in D435i bags)
+            if stream_config.stream_type == "transform_color":
+                raise ValueError(f"Transform message not found for topic: {topic}")
+
             # Default to identity transform if not found
             config_data = {
                 "transform_type": "static",
-                "sensor_name": "Depth",
-                "reference_frame": "device_0",
+                "sensor_name": sensor_name,
+                "reference_frame": reference_frame,
                 "translation": {"x": 0.0, "y": 0.0, "z": 0.0, "unit": "meters"},
                 "rotation": {"x": 0.0, "y": 0.0, "z": 0.0, "w": 1.0, "format": "quaternion"}
             }
             if self.config.verbose:
-                print(f"Depth Transform not found, using identity transform (default)")
+                print(f"{sensor_name} Transform not found, using identity transform (default)")
         else:
             config_data = {
                 "transform_type": "static",
-                "sensor_name": "Depth",
-                "reference_frame": "device_0",
+                "sensor_name": sensor_name,
+                "reference_frame": reference_frame,
                 "translation": {
                     "x": float(transform_msg.translation.x),
                     "y": float(transform_msg.translation.y),
@@ -570,45 +1227,21 @@ class RosbagToVRSConverter:
         writer.write_configuration(stream_config.stream_id, config_data)
 
         if self.config.verbose:
-            print(f"Wrote Configuration for stream {stream_config.stream_id} (Depth Extrinsic): "
-                  f"T=({config_data['translation']['x']:.6f}, {config_data['translation']['y']:.6f}, {config_data['translation']['z']:.6f})")
-
-    def _write_transform_color_configuration(self, writer: VRSWriter, stream_config: StreamConfig, topic: str) -> None:
-        """Write Color Extrinsic Configuration record"""
-        transform_msg = self._stats["transform_cache"].get(topic)
-
-        if transform_msg is None:
-            # Raise error if Color transform is missing (should be present in D435i bags)
-            raise ValueError(f"Transform message not found for topic: {topic}")
-
-        config_data = {
-            "transform_type": "static",
-            "sensor_name": "Color",
-            "reference_frame": "device_0",
-            "translation": {
-                "x": float(transform_msg.translation.x),
-                "y": float(transform_msg.translation.y),
-                "z": float(transform_msg.translation.z),
-                "unit": "meters"
-            },
-            "rotation": {
-                "x": float(transform_msg.rotation.x),
-                "y": float(transform_msg.rotation.y),
-                "z": float(transform_msg.rotation.z),
-                "w": float(transform_msg.rotation.w),
-                "format": "quaternion"
-            }
-        }
-
-        writer.write_configuration(stream_config.stream_id, config_data)
-
-        if self.config.verbose:
-            print(f"Wrote Configuration for stream {stream_config.stream_id} (Color Extrinsic): "
-                  f"T=({config_data['translation']['x']:.6f}, {config_data['translation']['y']:.6f}, {config_data['translation']['z']:.6f})")
+            translation = config_data["translation"]
+            print(
+                f"Wrote Configuration for stream {stream_config.stream_id} "
+                f"({sensor_name} Extrinsic): "
+                f"T=({translation['x']:.6f}, {translation['y']:.6f}, {translation['z']:.6f})"
+            )
 
-    def _write_device_info_configuration(self, writer: VRSWriter, stream_config: StreamConfig, topic: str) -> None:
+    def _write_device_info_configuration(
+        self,
+        writer: OutputWriter,
+        stream_config: StreamConfig,
+        topic: str,
+    ) -> None:
         """Write Device Info Configuration record"""
-        device_info_dict = self._stats.get("device_info_cache", {})
+        device_info_dict = self._stats["device_info_cache"].get(topic, {})
 
         if not device_info_dict:
             if self.config.verbose:
@@ -634,7 +1267,12 @@ class RosbagToVRSConverter:
         if self.config.verbose:
             print(f"Wrote Configuration for stream {stream_config.stream_id} (Device Info): {config_data['device_name']} (SN: {config_data['serial_number']})")
 
-    def _write_sensor_info_configuration(self, writer: VRSWriter, stream_config: StreamConfig, topic: str) -> None:
+    def _write_sensor_info_configuration(
+        self,
+        writer: OutputWriter,
+        stream_config: StreamConfig,
+        topic: str,
+    ) -> None:
         """Write Sensor Info Configuration record"""
         sensor_info_msg = self._stats["sensor_info_cache"].get(topic)
 
@@ -646,14 +1284,18 @@ class RosbagToVRSConverter:
         # Extract sensor_id from topic (e.g., "/device_0/sensor_0/info" -> "sensor_0")
         sensor_id = topic.split("/")[2] if len(topic.split("/")) > 2 else "unknown"
 
-        # Determine associated streams based on sensor_id
-        associated_streams = []
-        if sensor_id == "sensor_0":
-            associated_streams = [1002, 1005]  # Depth, Depth Extrinsic
-        elif sensor_id == "sensor_1":
-            associated_streams = [1001, 1006]  # Color, Color Extrinsic
-        elif sensor_id == "sensor_2":
-            associated_streams = [1003, 1004]  # Accel, Gyro
+        # Associated streams: image/IMU streams and extrinsics recorded by this sensor
+        # (e.g. sensor_0 -> Depth, Depth Extrinsic; sensor_2 -> Accel, Gyro)
+        sensor_prefix = topic[:-len("info")]
+        associated_streams = sorted(
+            candidate.stream_id
+            for candidate_topic, candidate in self.config.topic_mapping.items()
+            if candidate_topic.startswith(sensor_prefix)
+            and (
+                candidate.stream_type in RGBD_STREAM_TYPES
+                or candidate.stream_type in IMU_SAMPLE_FIELDS
+            )
+        )
 
         config_data = {
             "info_type": "sensor",
@@ -667,9 +1309,14 @@ class RosbagToVRSConverter:
         if self.config.verbose:
             print(f"Wrote Configuration for stream {stream_config.stream_id} (Sensor Info): {config_data['sensor_name']} ({sensor_id})")
 
-    def _write_options_configuration(self, writer: VRSWriter, stream_config: StreamConfig, topic: str) -> None:
+    def _write_options_configuration(
+        self,
+        writer: OutputWriter,
+        stream_config: StreamConfig,
+        topic: str,
+    ) -> None:
         """Write Options Configuration record"""
-        options_dict = self._stats.get("options_cache", {})
+        options_dict = self._stats["options_cache"].get(get_device_index(topic) or 0, {})
 
         if not options_dict:
             if self.config.verbose:
@@ -689,7 +1336,10 @@ class RosbagToVRSConverter:
         config_data = {
             "info_type": "options",
             "total_options": len(options_array),
-            "options": options_array
+            "options": options_array,
+            # Data records: one row per change, columns named "sensor_N/Option"
+            "encoding": TIME_SERIES_ENCODING,
+            "samples_per_record": 1
         }
 
         writer.write_configuration(stream_config.stream_id, config_data)
@@ -697,44 +1347,224 @@ class RosbagToVRSConverter:
         if self.config.verbose:
             print(f"Wrote Configuration for stream {stream_config.stream_id} (Options): {len(options_array)} options")
 
-    def _process_messages(self, reader: Any, writer: VRSWriter) -> None:
-        """Process all messages in temporal order"""
+    def _write_metadata_configuration(
+        self,
+        writer: OutputWriter,
+        stream_config: StreamConfig,
+        topic: str,
+    ) -> None:
+        """Write per-frame Metadata Configuration record"""
+        config_data = {
+            "info_type": "metadata",
+            "source_topic": topic,
+            # Data records: one row per frame, one column per metadata key
+            "encoding": TIME_SERIES_ENCODING,
+            "samples_per_record": self.config.metadata_batch_size
+        }
+
+        writer.write_configuration(stream_config.stream_id, config_data)
+
+        if self.config.verbose:
+            print(f"Wrote Configuration for stream {stream_config.stream_id} (Metadata): {topic}")
+
+    def _get_stream_config(self, topic: str) -> StreamConfig | None:
+        """Get the stream of a topic; option value topics map to their device's options stream"""
+        stream_config = self.config.topic_mapping.get(topic)
+        if stream_config is not None:
+            return stream_config
+
+        if is_option_value_topic(topic):
+            device_index = get_device_index(topic)
+            for candidate_topic, candidate in self.config.topic_mapping.items():
+                if (
+                    candidate.stream_type == "options"
+                    and get_device_index(candidate_topic) == device_index
+                ):
+                    return candidate
+        return None
+
+    def _process_messages(
+        self, reader: Any, writer: OutputWriter, checkpoint: ConversionCheckpoint | None = None
+    ) -> None:
+        """
+        Process all messages in temporal order
+
+        Starts from the checkpoint's bag position if given, and reads only
+        self.time_range if set.
+        """
         target_topics = list(self.config.topic_mapping.keys())
+        uses_image_codec = any(
+            stream_config.image_codec != IMAGE_CODEC_RAW
+            for stream_config in self.config.topic_mapping.values()
+        )
+        tracer = get_tracer()
+        metrics = self.metrics
+        write_start = 0.0
+
+        # Bag position: time of the current message and the messages at that time handled so far
+        start = checkpoint.resume_timestamp if checkpoint is not None else None
+        skip = checkpoint.resume_skip if checkpoint is not None else 0
+        stop = None
+        if self.time_range is not None:
+            start, stop = self.time_range
+        position_timestamp = -1
+        position_count = 0
 
         with reader:
-            connections = [x for x in reader.connections if x.topic in target_topics]
+            connections = [
+                x for x in reader.connections
+                if self._get_stream_config(x.topic) is not None
+            ]
 
             if not connections:
                 raise ValueError(f"No messages found for topics: {target_topics}")
 
-            for connection, timestamp, rawdata in reader.messages(connections=connections):
-                # Get stream config
-                stream_config = self.config.topic_mapping.get(connection.topic)
-                if stream_config is None:
-                    continue  # Skip topics not in mapping
+            progress = self.progress
+            if progress is not None:
+                self._start_progress(progress, connections)
+
+            if uses_image_codec:
+                self._encoder_pool = OrderedEncoderPool(
+                    max_workers=self.config.encoder_threads or None
+                )
+
+            try:
+                for connection, timestamp, rawdata in reader.messages(
+                    connections=connections, start=start, stop=stop
+                ):
+                    if timestamp != position_timestamp:
+                        position_timestamp = timestamp
+                        position_count = 0
+                    if skip:
+                        # Written before the checkpoint
+                        skip -= 1
+                        position_count += 1
+                        continue
+
+                    # Get stream config
+                    stream_config = self._get_stream_config(connection.topic)
+                    if stream_config is None:
+                        continue  # Skip topics not in mapping
+
+                    # Start the next chunk before encoding, so depth keyframes restart in it
+                    if (
+                        isinstance(writer, ChunkedVRSWriter)
+                        and writer.needs_new_chunk(timestamp / 1e9)
+                    ):
+                        self._start_new_chunk(writer, timestamp, position_count)
+                    position_count += 1
+
+                    # Deserialize message
+                    with tracer.sampled_span("deserialize"):
+                        msg = reader.deserialize(rawdata, connection.msgtype)
+
+                    # Convert and write based on stream type
+                    if metrics is not None:
+                        write_start = time.perf_counter()
+                    with tracer.sampled_span(f"process_{stream_config.stream_type}"):
+                        if stream_config.stream_type in ("color", "infrared"):
+                            self._process_color_message(writer, stream_config, msg, timestamp)
+                        elif stream_config.stream_type == "depth":
+                            self._process_depth_message(writer, stream_config, msg, timestamp)
+                        elif stream_config.stream_type in IMU_SAMPLE_FIELDS:
+                            self._process_imu_message(writer, stream_config, msg, timestamp)
+                        elif stream_config.stream_type == "options":
+                            self._process_option_message(
+                                writer, stream_config, connection.topic, msg, timestamp
+                            )
+                        elif stream_config.stream_type == "metadata":
+                            self._process_metadata_message(writer, stream_config, msg, timestamp)
+
+                    # Update statistics
+                    self._stats["total_messages"] += 1
+                    self._stats["messages_per_stream"][stream_config.stream_id] += 1
+                    if progress is not None:
+                        progress.update(stream_config.stream_id, len(rawdata))
+                    if metrics is not None:
+                        metrics.record_message(
+                            stream_config.stream_type,
+                            len(rawdata),
+                            time.perf_counter() - write_start,
+                        )
+
+                with tracer.span("flush_pending_records"):
+                    self._flush_pending_records(writer)
+
+                if progress is not None:
+                    progress.finish()
+            finally:
+                if self._encoder_pool is not None:
+                    self._encoder_pool.close()
+                    self._encoder_pool = None
+
+    def _start_progress(self, progress: ProgressReporter, connections: list[Any]) -> None:
+        """Start the progress reporter with the message count of each stream (from the bag index)"""
+        totals: dict[int, int] = {}
+        for connection in connections:
+            stream_config = self._get_stream_config(connection.topic)
+            assert stream_config is not None
+            totals[stream_config.stream_id] = (
+                totals.get(stream_config.stream_id, 0) + connection.msgcount
+            )
+        names = {
+            stream_config.stream_id: stream_config.flavor.split("|id:")[0]
+            for stream_config in self.config.topic_mapping.values()
+        }
+        progress.start(totals, names)
 
-                # Deserialize message
-                msg = reader.deserialize(rawdata, connection.msgtype)
+    def _flush_pending_records(self, writer: OutputWriter) -> None:
+        """Write frames still being encoded and IMU samples of incomplete batches"""
+        if self._encoder_pool is not None:
+            self._write_encoded_images(writer, self._encoder_pool.drain())
 
-                # Convert and write based on stream type
-                if stream_config.stream_type == "color":
-                    self._process_color_message(writer, stream_config, msg, timestamp)
-                elif stream_config.stream_type == "depth":
-                    self._process_depth_message(writer, stream_config, msg, timestamp)
-                elif stream_config.stream_type == "imu_accel":
-                    self._process_imu_accel_message(writer, stream_config, msg, timestamp)
-                elif stream_config.stream_type == "imu_gyro":
-                    self._process_imu_gyro_message(writer, stream_config, msg, timestamp)
-
-                # Update statistics
-                self._stats["total_messages"] += 1
-                self._stats["messages_per_stream"][stream_config.stream_id] += 1
-
-    def _process_color_message(self, writer: VRSWriter, stream_config: StreamConfig, msg: Any, timestamp: int) -> None:
-        """Process Color Image message"""
+        for stream_id in self._imu_buffers:
+            self._flush_imu_buffer(writer, stream_id)
+
+        for stream_id, buffer in self._series_buffers.items():
+            self._write_series_batch(writer, stream_id, buffer.pop())
+
+    def _start_new_chunk(
+        self,
+        writer: ChunkedVRSWriter,
+        resume_timestamp: int,
+        resume_skip: int,
+    ) -> None:
+        """
+        Finish the current output chunk and start the next one
+
+        Args:
+            writer: Chunked writer
+            resume_timestamp: Bag time (ns) of the message that starts the new chunk
+            resume_skip: Messages at resume_timestamp already written (see ConversionCheckpoint)
+        """
+        self._flush_pending_records(writer)
+        writer.start_new_chunk()
+
+        # Each chunk must be decodable on its own: restart temporal depth keyframes
+        self._depth_encoders.clear()
+
+        if self.config.checkpoint:
+            self._write_checkpoint(writer, resume_timestamp, resume_skip)
+
+        if self.config.verbose:
+            print(f"Started output chunk {writer.chunk_paths[-1]}")
+
+    def _process_color_message(
+        self,
+        writer: OutputWriter,
+        stream_config: StreamConfig,
+        msg: Any,
+        timestamp: int,
+    ) -> None:
+        """Process Color (or Infrared) Image message"""
         # Convert timestamp (nanoseconds -> seconds)
         timestamp_sec = timestamp / 1e9
 
+        # Compressed streams: encode in the pool, write when the frame is ready
+        if stream_config.image_codec != IMAGE_CODEC_RAW:
+            self._submit_image_encoding(writer, stream_config, msg, timestamp_sec)
+            return
+
         # Extract image data
         image_data = bytes(msg.data)
 
@@ -742,55 +1572,162 @@ class RosbagToVRSConverter:
         # Note: frame_id and encoding are stored in Configuration record
         writer.write_data(stream_config.stream_id, timestamp_sec, image_data)
 
-    def _process_depth_message(self, writer: VRSWriter, stream_config: StreamConfig, msg: Any, timestamp: int) -> None:
+    def _process_depth_message(
+        self,
+        writer: OutputWriter,
+        stream_config: StreamConfig,
+        msg: Any,
+        timestamp: int,
+    ) -> None:
         """Process Depth Image message"""
         # Convert timestamp (nanoseconds -> seconds)
         timestamp_sec = timestamp / 1e9
 
+        # Compressed streams (16-bit png): encode in the pool, write when the frame is ready
+        if stream_config.image_codec != IMAGE_CODEC_RAW:
+            self._submit_image_encoding(writer, stream_config, msg, timestamp_sec)
+            return
+
         # Extract depth data
-        depth_data = bytes(msg.data)
+        if self.config.depth_codec == DEPTH_CODEC_NONE:
+            depth_data = bytes(msg.data)
+        elif self.config.depth_codec == DEPTH_CODEC_TEMPORAL_ZSTD:
+            # Keyframe every N frames, XOR residuals against the keyframe in between
+            if stream_config.stream_id not in self._depth_encoders:
+                self._depth_encoders[stream_config.stream_id] = TemporalDepthEncoder(
+                    self.config.depth_keyframe_interval
+                )
+            encoder = self._depth_encoders[stream_config.stream_id]
+            depth_data = encoder.encode(self._image_from_message(msg))
+        else:
+            depth_data = encode_depth(self._image_from_message(msg), self.config.depth_codec)
 
         # Write Data record (timestamp + Depth bytes)
         # Note: frame_id and encoding are stored in Configuration record
         writer.write_data(stream_config.stream_id, timestamp_sec, depth_data)
 
-    def _process_imu_accel_message(self, writer: VRSWriter, stream_config: StreamConfig, msg: Any, timestamp: int) -> None:
-        """Process IMU Accelerometer message"""
-        import struct
+    @staticmethod
+    def _image_from_message(msg: Any) -> np.ndarray:
+        """Convert a sensor_msgs/Image into a (height, width[, channels]) array without padding"""
+        is_16bit = msg.encoding in ("16UC1", "mono16", "z16")
+        channels = 3 if msg.encoding in ("rgb8", "bgr8") else 1
+        dtype = (">" if msg.is_bigendian else "<") + ("u2" if is_16bit else "u1")
+
+        rows = np.frombuffer(bytes(msg.data), dtype=dtype).reshape(int(msg.height), -1)
+        image = rows[:, :int(msg.width) * channels].astype(np.uint16 if is_16bit else np.uint8)
+        if channels > 1:
+            image = image.reshape(int(msg.height), int(msg.width), channels)
+        return image
+
+    def _submit_image_encoding(
+        self, writer: OutputWriter, stream_config: StreamConfig, msg: Any, timestamp_sec: float
+    ) -> None:
+        """Queue a frame for encoding and write all frames whose encoding has finished"""
+        assert self._encoder_pool is not None
+        done = self._encoder_pool.submit(
+            (stream_config.stream_id, timestamp_sec),
+            encode_image,
+            self._image_from_message(msg),
+            stream_config.image_codec,
+            stream_config.image_quality,
+            "BGR" if msg.encoding == "bgr8" else "RGB",
+        )
+        self._write_encoded_images(writer, done)
+        if self.metrics is not None:
+            self.metrics.queue_depth.labels(queue="encoder").set(self._encoder_pool.pending)
+
+    @staticmethod
+    def _write_encoded_images(writer: OutputWriter, encoded: list[tuple[Any, bytes]]) -> None:
+        """Write encoded frames returned by the encoder pool (in submission order)"""
+        for (stream_id, timestamp_sec), image_data in encoded:
+            writer.write_data(stream_id, timestamp_sec, image_data)
+
+    def _process_imu_message(
+        self,
+        writer: OutputWriter,
+        stream_config: StreamConfig,
+        msg: Any,
+        timestamp: int,
+    ) -> None:
+        """
+        Process IMU Accelerometer/Gyroscope message
 
-        # Convert timestamp (nanoseconds -> seconds)
-        timestamp_sec = timestamp / 1e9
+        Samples are buffered per stream and written as one motion Data record
+        every `imu_batch_size` samples.
+        """
+        # Extract linear acceleration (Accel) or angular velocity (Gyro) from sensor_msgs/Imu
+        vector = getattr(msg, IMU_SAMPLE_FIELDS[stream_config.stream_type])
 
-        # Extract linear acceleration (x, y, z) from sensor_msgs/Imu
-        # Pack as 3 doubles (24 bytes)
-        imu_data = struct.pack(
-            '<ddd',
-            msg.linear_acceleration.x,
-            msg.linear_acceleration.y,
-            msg.linear_acceleration.z
-        )
+        timestamps, samples = self._imu_buffers[stream_config.stream_id]
+        timestamps.append(timestamp / 1e9)  # nanoseconds -> seconds
+        samples.append((vector.x, vector.y, vector.z))
 
-        # Write Data record (timestamp + 24 bytes)
-        writer.write_data(stream_config.stream_id, timestamp_sec, imu_data)
+        if len(samples) >= self.config.imu_batch_size:
+            self._flush_imu_buffer(writer, stream_config.stream_id)
 
-    def _process_imu_gyro_message(self, writer: VRSWriter, stream_config: StreamConfig, msg: Any, timestamp: int) -> None:
-        """Process IMU Gyroscope message"""
-        import struct
+    def _flush_imu_buffer(self, writer: OutputWriter, stream_id: int) -> None:
+        """Write buffered IMU samples of a stream as one motion Data record"""
+        timestamps, samples = self._imu_buffers[stream_id]
+        if not samples:
+            return
 
-        # Convert timestamp (nanoseconds -> seconds)
-        timestamp_sec = timestamp / 1e9
+        writer.write_motion_samples(stream_id, timestamps, samples)
+        timestamps.clear()
+        samples.clear()
+
+    def _process_option_message(
+        self,
+        writer: OutputWriter,
+        stream_config: StreamConfig,
+        topic: str,
+        msg: Any,
+        timestamp: int,
+    ) -> None:
+        """
+        Process an option value message (std_msgs/Float32)
+
+        Only changes are recorded: the first value of each option and every
+        later value that differs from the previous one.
+        """
+        # /device_N/sensor_X/option/OPTION_NAME/value -> "sensor_X/OPTION_NAME"
+        # (one options stream per device, so the column name omits the device)
+        parts = topic.split('/')
+        option_key = f"{parts[2]}/{parts[4]}"
+        value = float(msg.data)
+
+        if self._option_values.get(topic) == value:
+            return
+        self._option_values[topic] = value
+
+        buffer = self._series_buffers[stream_config.stream_id]
+        batch = buffer.add(timestamp / 1e9, option_key, value)  # nanoseconds -> seconds
+        self._write_series_batch(writer, stream_config.stream_id, batch)
+
+    def _process_metadata_message(
+        self, writer: OutputWriter, stream_config: StreamConfig, msg: Any, timestamp: int
+    ) -> None:
+        """
+        Process a per-frame metadata message (diagnostic_msgs/KeyValue)
 
-        # Extract angular velocity (x, y, z) from sensor_msgs/Imu
-        # Pack as 3 doubles (24 bytes)
-        imu_data = struct.pack(
-            '<ddd',
-            msg.angular_velocity.x,
-            msg.angular_velocity.y,
-            msg.angular_velocity.z
+        The keys published for one frame share its timestamp and form one row.
+        """
+        buffer = self._series_buffers[stream_config.stream_id]
+        batch = buffer.add(
+            timestamp / 1e9,  # nanoseconds -> seconds
+            str(msg.key),
+            parse_metadata_value(str(msg.value))
         )
+        self._write_series_batch(writer, stream_config.stream_id, batch)
+
+    def _write_series_batch(
+        self, writer: OutputWriter, stream_id: int, batch: TimeSeriesBatch | None
+    ) -> None:
+        """Write a batch of option/metadata rows as one Data record"""
+        if batch is None:
+            return
 
-        # Write Data record (timestamp + 24 bytes)
-        writer.write_data(stream_config.stream_id, timestamp_sec, imu_data)
+        timestamps, columns = batch
+        writer.write_data(stream_id, timestamps[0], encode_time_series(timestamps, columns))
 
     def _calculate_bag_duration(self, reader: Any) -> float:
         """Calculate bag duration (first to last message timestamp)"""
@@ -890,24 +1827,132 @@ RGBD_IMU_STREAMS = {
         recordable_type_id="ForwardCamera",
         flavor="RealSense_D435i_Options|id:2005"
     ),
+    "/device_0/sensor_1/Color_0/image/metadata": StreamConfig(
+        stream_id=3001,
+        stream_type="metadata",
+        recordable_type_id="ForwardCamera",
+        flavor="RealSense_D435i_Color_Metadata|id:3001"
+    ),
+    "/device_0/sensor_0/Depth_0/image/metadata": StreamConfig(
+        stream_id=3002,
+        stream_type="metadata",
+        recordable_type_id="ForwardCamera",
+        flavor="RealSense_D435i_Depth_Metadata|id:3002"
+    ),
+    "/device_0/sensor_2/Accel_0/imu/metadata": StreamConfig(
+        stream_id=3003,
+        stream_type="metadata",
+        recordable_type_id="MotionSensor",
+        flavor="RealSense_D435i_Accel_Metadata|id:3003"
+    ),
+    "/device_0/sensor_2/Gyro_0/imu/metadata": StreamConfig(
+        stream_id=3004,
+        stream_type="metadata",
+        recordable_type_id="MotionSensor",
+        flavor="RealSense_D435i_Gyro_Metadata|id:3004"
+    ),
 }
 
 
-def create_rgbd_config(compression: str = "lz4", verbose: bool = False) -> ConverterConfig:
-    """Create RGB-D converter configuration (Color + Depth + Transform)"""
+def with_color_codec(
+    topic_mapping: dict[str, StreamConfig],
+    image_codec: str = IMAGE_CODEC_RAW,
+    image_quality: int = DEFAULT_IMAGE_QUALITY,
+) -> dict[str, StreamConfig]:
+    """Return a copy of a topic mapping whose color streams use the given image codec"""
+    return {
+        topic: (
+            replace(stream_config, image_codec=image_codec, image_quality=image_quality)
+            if stream_config.stream_type == "color"
+            else stream_config
+        )
+        for topic, stream_config in topic_mapping.items()
+    }
+
+
+def discover_topic_mapping(topics: list[str], include_imu: bool = True) -> dict[str, StreamConfig]:
+    """
+    Build a topic mapping from a bag's topic names
+
+    Every device (/device_N) and known stream (Color, Depth, Infrared 1/2,
+    Accel, Gyro) gets stable stream IDs, see scripts.topic_discovery. For
+    device_0 of a D435i bag the result matches RGBD_IMU_STREAMS, except that
+    the options stream is keyed "/device_0/option".
+
+    Args:
+        topics: Topic names of the bag connections
+        include_imu: Include IMU, info, options and metadata streams
+            (False: images and extrinsics only, like RGBD_STREAMS)
+    """
+    return {
+        stream.topic: StreamConfig(
+            stream_id=stream.stream_id,
+            stream_type=stream.stream_type,
+            recordable_type_id=stream.recordable_type_id,
+            flavor=f"RealSense_D435i_{stream.name}|id:{stream.stream_id}"
+        )
+        for stream in discover_streams(topics)
+        if include_imu or stream.stream_type in RGBD_STREAM_TYPES
+    }
+
+
+def create_rgbd_config(
+    compression: str = "lz4",
+    verbose: bool = False,
+    depth_codec: str = DEPTH_CODEC_NONE,
+    color_codec: str = IMAGE_CODEC_RAW,
+    color_quality: int = DEFAULT_IMAGE_QUALITY,
+    auto_discover: bool = False,
+) -> ConverterConfig:
+    """
+    Create RGB-D converter configuration (Color + Depth + Transform)
+
+    With auto_discover, the streams of every device (including Infrared) are
+    found in the bag at conversion time instead of using RGBD_STREAMS.
+    """
     return ConverterConfig(
-        topic_mapping=RGBD_STREAMS,
+        topic_mapping=(
+            {} if auto_discover else with_color_codec(RGBD_STREAMS, color_codec, color_quality)
+        ),
         phase="rgbd",
         compression=compression,
-        verbose=verbose
+        verbose=verbose,
+        depth_codec=depth_codec,
+        auto_discover=auto_discover,
+        color_codec=color_codec,
+        color_quality=color_quality
     )
 
 
-def create_rgbd_imu_config(compression: str = "lz4", verbose: bool = False) -> ConverterConfig:
-    """Create RGB-D + IMU + Transform + Device/Sensor Info converter configuration"""
+def create_rgbd_imu_config(
+    compression: str = "lz4",
+    verbose: bool = False,
+    imu_batch_size: int = 1,
+    depth_codec: str = DEPTH_CODEC_NONE,
+    color_codec: str = IMAGE_CODEC_RAW,
+    color_quality: int = DEFAULT_IMAGE_QUALITY,
+    metadata_batch_size: int = 30,
+    auto_discover: bool = False,
+) -> ConverterConfig:
+    """
+    Create RGB-D + IMU + Transform + Device/Sensor Info + Options/Metadata converter configuration
+
+    With auto_discover, the streams of every device (including Infrared) are
+    found in the bag at conversion time instead of using RGBD_IMU_STREAMS.
+    """
     return ConverterConfig(
-        topic_mapping=RGBD_IMU_STREAMS,
+        topic_mapping=(
+            {}
+            if auto_discover
+            else with_color_codec(RGBD_IMU_STREAMS, color_codec, color_quality)
+        ),
         phase="rgbd_imu_info",
         compression=compression,
-        verbose=verbose
+        verbose=verbose,
+        imu_batch_size=imu_batch_size,
+        depth_codec=depth_codec,
+        metadata_batch_size=metadata_batch_size,
+        auto_discover=auto_discover,
+        color_codec=color_codec,
+        color_quality=color_quality
     )
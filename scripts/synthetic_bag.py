@@ -0,0 +1,427 @@
+"""Synthetic RealSense D435i ROS1 bags for tests and benchmarks.
+
+Writes bags with the topic layout of a librealsense recording: device and
+sensor info, per-stream StreamInfo, CameraInfo and extrinsics, option values
+and descriptions, Color/Depth (optionally Infrared 1/2) frames with per-frame
+metadata, and Accel/Gyro samples. Content is deterministic for a given
+configuration and seed: frames are a fixed pattern scrolling by a few pixels
+per frame, so depth and color codecs see realistic spatial and temporal
+redundancy. Messages are generated and written one at a time, so bags of
+many gigabytes can be created with constant memory. Follows the Single
+Responsibility Principle (SRP) by focusing solely on bag generation.
+"""
+
+import heapq
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+try:
+    from rosbags.rosbag1 import Writer  # type: ignore
+    from rosbags.typesys import Stores, get_types_from_msg, get_typestore  # type: ignore
+except ImportError:
+    raise ImportError("rosbags library is required. Install with: uv add rosbags")
+
+# Chunk compression of the generated bag
+BAG_COMPRESSIONS = ("none", "bz2", "lz4")
+
+# realsense_msgs/StreamInfo (not part of the ROS1 typestore)
+STREAM_INFO_MSGDEF = """
+uint32 fps
+string encoding
+bool is_recommended
+"""
+
+# Default bag start time (seconds since epoch)
+DEFAULT_START_TIME_SEC = 1_700_000_000
+
+# Scroll speed of the image pattern (pixels per frame)
+_PATTERN_STEP = 4
+
+# Sensor names and options per sensor index: (name, value, description)
+_SENSOR_NAMES = {0: "Stereo Module", 1: "RGB Camera", 2: "Motion Module"}
+_SENSOR_OPTIONS = {
+    0: [
+        ("Exposure", 8500.0, "Depth Exposure (usec)"),
+        ("Gain", 16.0, "UVC image gain"),
+        ("Laser Power", 150.0,
+         "Manual laser power in mw. applicable only when laser power mode is set to Manual"),
+        ("Emitter Enabled", 1.0, "Emitter select, 0-disable all emitters, 1-enable laser"),
+        ("Visual Preset", 0.0, "Advanced-Mode Preset"),
+    ],
+    1: [
+        ("Exposure", 156.0,
+         "Controls exposure time of color camera. Setting any value will disable auto exposure"),
+        ("Gain", 64.0, "UVC image gain"),
+        ("Brightness", 0.0, "UVC image brightness"),
+        ("Contrast", 50.0, "UVC image contrast"),
+        ("Enable Auto Exposure", 1.0, "Enable / disable auto-exposure"),
+    ],
+    2: [
+        ("Enable Motion Correction", 1.0, "Enable/Disable Automatic Motion Data Correction"),
+    ],
+}
+
+
+@dataclass
+class SyntheticBagConfig:
+    """Shape of a synthetic RealSense bag"""
+    duration_sec: float = 1.0
+    color_width: int = 640
+    color_height: int = 480
+    color_fps: int = 30
+    depth_width: int = 640  # Also used for Infrared streams
+    depth_height: int = 480
+    depth_fps: int = 30
+    accel_rate: float = 63.0  # Hz (D435i: 63 or 250)
+    gyro_rate: float = 200.0  # Hz (D435i: 200 or 400)
+    infrared: bool = False  # Add Infrared_1 / Infrared_2 streams
+    devices: int = 1  # Number of cameras (/device_0 ... /device_{N-1})
+    metadata: bool = True  # Per-frame image/IMU metadata topics
+    compression: str = "none"  # Bag chunk compression: none, bz2, lz4
+    start_time_sec: float = DEFAULT_START_TIME_SEC
+    seed: int = 0
+
+
+def estimate_bag_bytes_per_second(config: SyntheticBagConfig) -> float:
+    """Estimate the uncompressed bag growth per second of recording (image data dominates)."""
+    color = config.color_width * config.color_height * 3 * config.color_fps
+    depth = config.depth_width * config.depth_height * 2 * config.depth_fps
+    infrared = depth if config.infrared else 0
+    imu = (config.accel_rate + config.gyro_rate) * 400  # Imu message + record overhead
+    return float(config.devices * (color + depth + infrared + imu))
+
+
+def duration_for_size(config: SyntheticBagConfig, target_bytes: int) -> float:
+    """Get the duration giving an uncompressed bag of about target_bytes."""
+    return target_bytes / estimate_bag_bytes_per_second(config)
+
+
+class _FrameSource:
+    """Deterministic scrolling frames of one image stream"""
+
+    def __init__(self, width: int, height: int, kind: str, rng: np.random.Generator) -> None:
+        y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+        # Pattern twice as wide as the frame, so a scrolled frame is a plain slice
+        wide_x = np.concatenate([x, x + width], axis=1)
+        wide_y = np.concatenate([y, y], axis=1)
+        waves = np.sin(wide_x / 23.0) * np.cos(wide_y / 17.0)
+        noise = rng.standard_normal(waves.shape).astype(np.float32)
+
+        if kind == "depth":
+            # 0.5 m - 4 m plane with ripples, sensor noise and invalid (0) pixels
+            depth = 500.0 + 3500.0 * wide_y / max(height - 1, 1) + 150.0 * waves + 4.0 * noise
+            depth[:, ::97] = 0
+            self._pattern = depth.astype(np.uint16)
+        elif kind == "color":
+            red = 128 + 100 * waves
+            green = 255 * wide_y / max(height - 1, 1)
+            blue = 255 * (wide_x % width) / max(width - 1, 1)
+            rgb = np.stack([red, green, blue], axis=-1) + 3.0 * noise[..., None]
+            self._pattern = np.clip(rgb, 0, 255).astype(np.uint8)
+        else:  # infrared
+            self._pattern = np.clip(100 + 80 * waves + 6.0 * noise, 0, 255).astype(np.uint8)
+        self._width = width
+
+    def frame(self, index: int) -> np.ndarray:
+        """Get frame `index` as a contiguous array"""
+        offset = (index * _PATTERN_STEP) % self._width
+        return np.ascontiguousarray(self._pattern[:, offset:offset + self._width])
+
+
+class _BagBuilder:
+    """Creates messages of the bag's topics"""
+
+    def __init__(self, config: SyntheticBagConfig) -> None:
+        self.config = config
+        self.typestore = get_typestore(Stores.ROS1_NOETIC)
+        self.typestore.register(
+            get_types_from_msg(STREAM_INFO_MSGDEF, "realsense_msgs/msg/StreamInfo")
+        )
+        self.types = self.typestore.types
+        self.rng = np.random.default_rng(config.seed)
+
+    def header(self, seq: int, timestamp_ns: int, frame_id: str = "0") -> Any:
+        return self.types["std_msgs/msg/Header"](
+            seq=seq,
+            stamp=self.types["builtin_interfaces/msg/Time"](
+                sec=timestamp_ns // 10**9, nanosec=timestamp_ns % 10**9
+            ),
+            frame_id=frame_id,
+        )
+
+    def key_value(self, key: str, value: str) -> Any:
+        return self.types["diagnostic_msgs/msg/KeyValue"](key=key, value=value)
+
+    def stream_info(self, fps: float, encoding: str) -> Any:
+        return self.types["realsense_msgs/msg/StreamInfo"](
+            fps=int(fps), encoding=encoding, is_recommended=True
+        )
+
+    def camera_info(self, width: int, height: int) -> Any:
+        fx = fy = 0.9 * width
+        return self.types["sensor_msgs/msg/CameraInfo"](
+            header=self.header(0, 0),
+            height=height,
+            width=width,
+            distortion_model="plumb_bob",
+            D=np.zeros(5, dtype=np.float64),
+            K=np.array([fx, 0.0, width / 2, 0.0, fy, height / 2, 0.0, 0.0, 1.0]),
+            R=np.eye(3).reshape(9),
+            P=np.array([fx, 0.0, width / 2, 0.0, 0.0, fy, height / 2, 0.0, 0.0, 0.0, 1.0, 0.0]),
+            binning_x=0,
+            binning_y=0,
+            roi=self.types["sensor_msgs/msg/RegionOfInterest"](
+                x_offset=0, y_offset=0, height=0, width=0, do_rectify=False
+            ),
+        )
+
+    def transform(self, x: float) -> Any:
+        return self.types["geometry_msgs/msg/Transform"](
+            translation=self.types["geometry_msgs/msg/Vector3"](x=x, y=0.0, z=0.0),
+            rotation=self.types["geometry_msgs/msg/Quaternion"](x=0.0, y=0.0, z=0.0, w=1.0),
+        )
+
+    def image(self, seq: int, timestamp_ns: int, frame: np.ndarray, encoding: str) -> Any:
+        height, width = frame.shape[:2]
+        return self.types["sensor_msgs/msg/Image"](
+            header=self.header(seq, timestamp_ns),
+            height=height,
+            width=width,
+            encoding=encoding,
+            is_bigendian=0,
+            step=frame.strides[0],
+            data=frame.reshape(-1).view(np.uint8),
+        )
+
+    def imu(self, seq: int, timestamp_ns: int, field: str, t: float) -> Any:
+        vector3_type = self.types["geometry_msgs/msg/Vector3"]
+        zero = vector3_type(x=0.0, y=0.0, z=0.0)
+        z = 9.81 if field == "linear_acceleration" else 0.01
+        vector = vector3_type(x=0.1 * np.sin(t), y=0.1 * np.cos(t), z=z)
+        return self.types["sensor_msgs/msg/Imu"](
+            header=self.header(seq, timestamp_ns),
+            orientation=self.types["geometry_msgs/msg/Quaternion"](x=0.0, y=0.0, z=0.0, w=0.0),
+            orientation_covariance=np.full(9, -1.0),
+            angular_velocity=vector if field == "angular_velocity" else zero,
+            angular_velocity_covariance=np.zeros(9),
+            linear_acceleration=vector if field == "linear_acceleration" else zero,
+            linear_acceleration_covariance=np.zeros(9),
+        )
+
+
+# (timestamp_ns, sequence, topic, msgtype, message factory)
+_Message = tuple[int, int, str, str, Callable[[], Any]]
+
+
+def _static_messages(builder: _BagBuilder, device: int, start_ns: int) -> list[_Message]:
+    """Info, CameraInfo, StreamInfo, extrinsics and options of one device (at the start time)"""
+    config = builder.config
+    prefix = f"/device_{device}"
+    messages: list[tuple[str, str, Any]] = []
+
+    device_info = {
+        "Name": "Intel RealSense D435I",
+        "Serial Number": f"{9000000 + 1000 * config.seed + device:012d}",
+        "Firmware Version": "05.13.00.50",
+        "Recommended Firmware Version": "05.13.00.50",
+        "Physical Port": f"/sys/devices/pci0000:00/usb2/2-{device + 1}",
+        "Debug Op Code": "15",
+        "Advanced Mode": "YES",
+        "Product Id": "0B3A",
+        "Usb Type Descriptor": "3.2",
+    }
+    for key, value in device_info.items():
+        messages.append(
+            (f"{prefix}/info", "diagnostic_msgs/msg/KeyValue", builder.key_value(key, value))
+        )
+
+    for sensor, name in _SENSOR_NAMES.items():
+        messages.append((f"{prefix}/sensor_{sensor}/info", "diagnostic_msgs/msg/KeyValue",
+                         builder.key_value("Name", name)))
+
+    depth = (config.depth_width, config.depth_height, config.depth_fps)
+    color = (config.color_width, config.color_height, config.color_fps)
+    image_streams = [
+        ("sensor_0/Depth_0", *depth, "mono16", 0.0),
+        ("sensor_1/Color_0", *color, "rgb8", 0.015),
+    ]
+    if config.infrared:
+        image_streams += [
+            ("sensor_0/Infrared_1", *depth, "mono8", 0.0),
+            ("sensor_0/Infrared_2", *depth, "mono8", -0.05),
+        ]
+    for stream, width, height, fps, encoding, baseline in image_streams:
+        messages += [
+            (f"{prefix}/{stream}/info", "realsense_msgs/msg/StreamInfo",
+             builder.stream_info(fps, encoding)),
+            (f"{prefix}/{stream}/info/camera_info", "sensor_msgs/msg/CameraInfo",
+             builder.camera_info(width, height)),
+            (f"{prefix}/{stream}/tf/0", "geometry_msgs/msg/Transform", builder.transform(baseline)),
+        ]
+
+    imu_streams = (("sensor_2/Accel_0", config.accel_rate), ("sensor_2/Gyro_0", config.gyro_rate))
+    for stream, rate in imu_streams:
+        messages += [
+            (f"{prefix}/{stream}/info", "realsense_msgs/msg/StreamInfo",
+             builder.stream_info(rate, "MOTION_XYZ32F")),
+            (f"{prefix}/{stream}/tf/0", "geometry_msgs/msg/Transform", builder.transform(-0.0055)),
+        ]
+
+    for sensor, options in _SENSOR_OPTIONS.items():
+        for name, value, description in options:
+            option_prefix = f"{prefix}/sensor_{sensor}/option/{name}"
+            messages += [
+                (f"{option_prefix}/value", "std_msgs/msg/Float32",
+                 builder.types["std_msgs/msg/Float32"](data=value)),
+                (f"{option_prefix}/description", "std_msgs/msg/String",
+                 builder.types["std_msgs/msg/String"](data=description)),
+            ]
+
+    return [
+        (start_ns, 0, topic, msgtype, lambda msg=msg: msg)
+        for topic, msgtype, msg in messages
+    ]
+
+
+def _image_messages(
+    builder: _BagBuilder, topic_prefix: str, fps: float, source: _FrameSource, encoding: str,
+    start_ns: int, exposure: int,
+) -> Iterator[_Message]:
+    """Frames and per-frame metadata of one image stream, in time order"""
+    count = int(builder.config.duration_sec * fps)
+    for i in range(count):
+        timestamp_ns = start_ns + int(round(i * 1e9 / fps))
+        yield (timestamp_ns, 0, f"{topic_prefix}/image/data", "sensor_msgs/msg/Image",
+               lambda i=i, ts=timestamp_ns: builder.image(i, ts, source.frame(i), encoding))
+        if builder.config.metadata:
+            metadata = {
+                "Frame Counter": str(i + 1),
+                "Frame Timestamp": str(timestamp_ns // 1000),
+                "Actual Exposure": str(exposure),
+                "Gain Level": "16",
+                "Time Of Arrival": str(timestamp_ns // 10**6 + 2),
+            }
+            for key, value in metadata.items():
+                yield (timestamp_ns, 1, f"{topic_prefix}/image/metadata",
+                       "diagnostic_msgs/msg/KeyValue",
+                       lambda key=key, value=value: builder.key_value(key, value))
+
+
+def _imu_messages(
+    builder: _BagBuilder, topic_prefix: str, rate: float, field: str, start_ns: int
+) -> Iterator[_Message]:
+    """Samples and per-sample metadata of one IMU stream, in time order"""
+    count = int(builder.config.duration_sec * rate)
+    for i in range(count):
+        timestamp_ns = start_ns + int(round(i * 1e9 / rate))
+        yield (timestamp_ns, 0, f"{topic_prefix}/imu/data", "sensor_msgs/msg/Imu",
+               lambda i=i, ts=timestamp_ns: builder.imu(i, ts, field, ts / 1e9))
+        if builder.config.metadata:
+            metadata = (
+                ("Frame Counter", str(i + 1)),
+                ("Frame Timestamp", str(timestamp_ns // 1000)),
+            )
+            for key, value in metadata:
+                yield (timestamp_ns, 1, f"{topic_prefix}/imu/metadata",
+                       "diagnostic_msgs/msg/KeyValue",
+                       lambda key=key, value=value: builder.key_value(key, value))
+
+
+def generate_synthetic_bag(
+    bag_path: Path, config: SyntheticBagConfig | None = None
+) -> dict[str, int]:
+    """
+    Write a synthetic RealSense bag
+
+    Args:
+        bag_path: Output .bag path (must not exist)
+        config: Bag shape (default: 1 s, 640x480 @ 30 fps, IMU, no compression)
+
+    Returns:
+        Message count per topic
+
+    Raises:
+        FileExistsError: If bag_path exists
+        ValueError: If the configuration is invalid
+    """
+    config = config or SyntheticBagConfig()
+    bag_path = Path(bag_path)
+    if bag_path.exists():
+        raise FileExistsError(f"Output bag already exists: {bag_path}")
+    if config.compression not in BAG_COMPRESSIONS:
+        raise ValueError(f"compression must be one of {BAG_COMPRESSIONS}, got {config.compression}")
+    if config.devices < 1:
+        raise ValueError(f"devices must be >= 1, got {config.devices}")
+    if config.duration_sec <= 0:
+        raise ValueError(f"duration_sec must be > 0, got {config.duration_sec}")
+
+    builder = _BagBuilder(config)
+    start_ns = int(config.start_time_sec * 1e9)
+
+    static: list[_Message] = [
+        (start_ns, 0, "/file_version", "std_msgs/msg/UInt32",
+         lambda: builder.types["std_msgs/msg/UInt32"](data=3))
+    ]
+    streams: list[Iterator[_Message]] = []
+    for device in range(config.devices):
+        prefix = f"/device_{device}"
+        static += _static_messages(builder, device, start_ns)
+        depth = _FrameSource(config.depth_width, config.depth_height, "depth", builder.rng)
+        color = _FrameSource(config.color_width, config.color_height, "color", builder.rng)
+        streams += [
+            _image_messages(
+                builder, f"{prefix}/sensor_0/Depth_0", config.depth_fps, depth, "mono16",
+                start_ns, 8500,
+            ),
+            _image_messages(
+                builder, f"{prefix}/sensor_1/Color_0", config.color_fps, color, "rgb8",
+                start_ns, 156,
+            ),
+            _imu_messages(
+                builder, f"{prefix}/sensor_2/Accel_0", config.accel_rate, "linear_acceleration",
+                start_ns,
+            ),
+            _imu_messages(
+                builder, f"{prefix}/sensor_2/Gyro_0", config.gyro_rate, "angular_velocity",
+                start_ns,
+            ),
+        ]
+        if config.infrared:
+            for index in (1, 2):
+                infrared = _FrameSource(
+                    config.depth_width, config.depth_height, "infrared", builder.rng
+                )
+                streams.append(_image_messages(
+                    builder, f"{prefix}/sensor_0/Infrared_{index}", config.depth_fps, infrared,
+                    "mono8", start_ns, 8500,
+                ))
+
+    counts: dict[str, int] = {}
+    writer = Writer(bag_path)
+    if config.compression == "bz2":
+        writer.set_compression(Writer.CompressionFormat.BZ2)
+    elif config.compression == "lz4":
+        writer.set_compression(Writer.CompressionFormat.LZ4)
+
+    with writer:
+        connections: dict[str, Any] = {}
+        # Merge by (timestamp, sequence) only: factories are not comparable
+        for timestamp_ns, _, topic, msgtype, factory in heapq.merge(
+            static, *streams, key=lambda message: message[:2]
+        ):
+            if topic not in connections:
+                connections[topic] = writer.add_connection(
+                    topic, msgtype, typestore=builder.typestore
+                )
+            writer.write(
+                connections[topic],
+                timestamp_ns,
+                builder.typestore.serialize_ros1(factory(), msgtype),
+            )
+            counts[topic] = counts.get(topic, 0) + 1
+
+    return counts
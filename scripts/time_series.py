@@ -0,0 +1,163 @@
+"""Columnar time-series records for option and metadata streams.
+
+RealSense bags publish sensor options (``/option/*/value``) and per-frame
+metadata (``/image/metadata``, ``/imu/metadata``) as one message per key.
+These are stored in VRS as batches of rows: each Data record holds a JSON
+object ``{"timestamps": [...], "columns": {name: [...]}}`` where row ``i`` of
+every column belongs to ``timestamps[i]`` and missing values are ``null``.
+Options are written as one row per change; metadata as one row per frame,
+``samples_per_record`` rows per record. Follows the Single Responsibility
+Principle (SRP) by focusing solely on the time-series record format.
+"""
+
+import json
+from typing import Any
+
+import numpy as np
+
+# Encoding name stored in the stream configuration ("encoding")
+TIME_SERIES_ENCODING = "json_columnar"
+
+# (timestamps, columns) of one record
+TimeSeriesBatch = tuple[list[float], dict[str, list[Any]]]
+
+
+def encode_time_series(timestamps: list[float], columns: dict[str, list[Any]]) -> bytes:
+    """Encode a batch of rows as a Data record payload.
+
+    Args:
+        timestamps: Row timestamps in seconds
+        columns: Column name -> per-row values (None for missing values)
+
+    Returns:
+        UTF-8 JSON payload
+
+    Raises:
+        ValueError: If a column length differs from the number of rows
+    """
+    for name, values in columns.items():
+        if len(values) != len(timestamps):
+            raise ValueError(
+                f"Column '{name}' has {len(values)} values, expected {len(timestamps)}"
+            )
+    payload = {"timestamps": timestamps, "columns": columns}
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def decode_time_series(data: bytes) -> TimeSeriesBatch:
+    """Decode a Data record payload written by encode_time_series().
+
+    Raises:
+        ValueError: If the payload is not a time-series record
+    """
+    try:
+        payload = json.loads(data)
+        return [float(t) for t in payload["timestamps"]], dict(payload["columns"])
+    except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid time-series record: {e}") from e
+
+
+def parse_metadata_value(value: str) -> int | float | str:
+    """Convert a RealSense metadata string (e.g. "8500") into a number if possible."""
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+class TimeSeriesBuffer:
+    """Collects (timestamp, name, value) messages into rows and batches.
+
+    Messages with the same timestamp form one row. Messages must arrive in
+    timestamp order, as they do when reading a bag in temporal order.
+    """
+
+    def __init__(self, batch_size: int = 1) -> None:
+        """Initialize the buffer.
+
+        Args:
+            batch_size: Complete rows per batch
+
+        Raises:
+            ValueError: If batch_size is less than 1
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        self.batch_size = batch_size
+        self._rows: list[tuple[float, dict[str, Any]]] = []
+
+    def __len__(self) -> int:
+        """Number of buffered rows (including the row still being filled)."""
+        return len(self._rows)
+
+    def add(self, timestamp: float, name: str, value: Any) -> TimeSeriesBatch | None:
+        """Add one value.
+
+        A row is complete once a value with a later timestamp arrives, so a
+        batch is returned when that makes ``batch_size`` rows complete.
+
+        Args:
+            timestamp: Timestamp in seconds
+            name: Column name
+            value: Value (JSON-serializable)
+
+        Returns:
+            A full batch to write, or None
+        """
+        batch = None
+        if self._rows and self._rows[-1][0] != timestamp:
+            if len(self._rows) >= self.batch_size:
+                batch = self.pop()
+        if not self._rows or self._rows[-1][0] != timestamp:
+            self._rows.append((timestamp, {}))
+        self._rows[-1][1][name] = value
+        return batch
+
+    def pop(self) -> TimeSeriesBatch | None:
+        """Remove all buffered rows and return them as a batch (None if empty)."""
+        if not self._rows:
+            return None
+
+        names: dict[str, None] = {}  # Column names in first-seen order
+        for _, row in self._rows:
+            names.update(dict.fromkeys(row))
+
+        timestamps = [timestamp for timestamp, _ in self._rows]
+        columns = {name: [row.get(name) for _, row in self._rows] for name in names}
+        self._rows.clear()
+        return timestamps, columns
+
+
+def flatten_time_series(batches: list[TimeSeriesBatch]) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """Combine record batches into one series per column.
+
+    Args:
+        batches: Decoded records in time order
+
+    Returns:
+        Column name -> (timestamps (N,) float64, values (N,)). Missing values
+        are dropped; numeric columns become float64 arrays, others object arrays.
+    """
+    series: dict[str, tuple[list[float], list[Any]]] = {}
+    for timestamps, columns in batches:
+        for name, values in columns.items():
+            column_timestamps, column_values = series.setdefault(name, ([], []))
+            for timestamp, value in zip(timestamps, values):
+                if value is not None:
+                    column_timestamps.append(timestamp)
+                    column_values.append(value)
+
+    result: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+    for name, (timestamps, values) in series.items():
+        numeric = all(
+            isinstance(v, (int, float)) and not isinstance(v, bool) for v in values
+        )
+        result[name] = (
+            np.asarray(timestamps, dtype=np.float64),
+            np.asarray(values, dtype=np.float64 if numeric else object),
+        )
+    return result
@@ -0,0 +1,213 @@
+"""Stream discovery from RealSense bag topic names.
+
+librealsense records every camera of a rig under its own device prefix and
+names its topics by a fixed convention::
+
+    /device_N/info                                   device KeyValue info
+    /device_N/sensor_M/info                          sensor name
+    /device_N/sensor_M/option/<Option>/value         option values
+    /device_N/sensor_M/<Stream>_K/image/data         image frames
+    /device_N/sensor_M/<Stream>_K/imu/data           IMU samples
+    /device_N/sensor_M/<Stream>_K/{image,imu}/metadata
+    /device_N/sensor_M/<Stream>_K/tf/0               stream extrinsic
+    /device_N/sensor_M/<Stream>_K/info[/camera_info] StreamInfo / CameraInfo
+
+This module maps a bag's topic list to streams with stable stream IDs, so
+the converter can handle multi-camera rigs and infrared streams without a
+hand-written topic mapping. Stream IDs keep the layout of the fixed D435i
+mapping (1001 Color, 1002 Depth, ... 2001 Device Info, 3001 Color Metadata)
+and add ``DEVICE_ID_STRIDE`` per device index, so device_1 Color is 1101.
+This module has no ROS or VRS dependency. Follows the Single Responsibility
+Principle (SRP) by focusing solely on topic naming.
+"""
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+# Stream ID ranges: data streams, info/options streams, metadata streams
+DATA_STREAM_BASE = 1000
+INFO_STREAM_BASE = 2000
+METADATA_STREAM_BASE = 3000
+DEVICE_ID_STRIDE = 100
+# Devices whose streams fit in one ID range (device_10 would reach the next range)
+MAX_DEVICES = (INFO_STREAM_BASE - DATA_STREAM_BASE) // DEVICE_ID_STRIDE
+
+# (<Stream>, K) -> (stream_type, name, data slot, extrinsic slot or None)
+KNOWN_STREAMS = {
+    ("Color", 0): ("color", "Color", 1, 6),
+    ("Depth", 0): ("depth", "Depth", 2, 5),
+    ("Accel", 0): ("imu_accel", "Accel", 3, None),
+    ("Gyro", 0): ("imu_gyro", "Gyro", 4, None),
+    ("Infrared", 1): ("infrared", "Infrared1", 7, 9),
+    ("Infrared", 2): ("infrared", "Infrared2", 8, 10),
+}
+
+# Info stream slots (sensor info uses 2 + M, skipping the options slot)
+DEVICE_INFO_SLOT = 1
+OPTIONS_SLOT = 5
+
+_DEVICE_PATTERN = re.compile(r"^/device_(\d+)(?:/|$)")
+_STREAM_TOPIC_PATTERN = re.compile(r"^/device_(\d+)/sensor_(\d+)/([A-Za-z]+)_(\d+)/(.+)$")
+_SENSOR_INFO_PATTERN = re.compile(r"^/device_(\d+)/sensor_(\d+)/info$")
+_DEVICE_INFO_PATTERN = re.compile(r"^/device_(\d+)/info$")
+_OPTION_VALUE_PATTERN = re.compile(r"^/device_(\d+)/sensor_(\d+)/option/[^/]+/value$")
+
+
+@dataclass(frozen=True)
+class StreamTopic:
+    """Parts of a ``/device_N/sensor_M/<Stream>_K/<kind>`` topic."""
+
+    device: int
+    sensor: int
+    stream: str  # "Color", "Depth", "Infrared", "Accel", "Gyro", ...
+    index: int
+    kind: str  # "image/data", "imu/data", "tf/0", "info", ...
+
+    @property
+    def prefix(self) -> str:
+        """Topic prefix shared by all topics of the stream."""
+        return f"/device_{self.device}/sensor_{self.sensor}/{self.stream}_{self.index}"
+
+
+@dataclass(frozen=True)
+class DiscoveredStream:
+    """A stream found in a bag's topic list."""
+
+    topic: str
+    stream_id: int
+    stream_type: str  # Same values as StreamConfig.stream_type
+    name: str  # e.g. "Color", "Device1_Infrared2_Extrinsic"
+    recordable_type_id: str  # "ForwardCamera", "MotionSensor"
+
+
+def get_device_index(topic: str) -> int | None:
+    """Get N of a ``/device_N/...`` topic, or None for other topics."""
+    match = _DEVICE_PATTERN.match(topic)
+    return int(match.group(1)) if match else None
+
+
+def parse_stream_topic(topic: str) -> StreamTopic | None:
+    """Split a ``/device_N/sensor_M/<Stream>_K/<kind>`` topic, or None if it does not match."""
+    match = _STREAM_TOPIC_PATTERN.match(topic)
+    if match is None:
+        return None
+    device, sensor, stream, index, kind = match.groups()
+    return StreamTopic(int(device), int(sensor), stream, int(index), kind)
+
+
+def get_info_topics(topic: str) -> tuple[str, str]:
+    """Get the (CameraInfo, StreamInfo) topics belonging to a stream's data topic.
+
+    Raises:
+        ValueError: If the topic does not follow the stream topic convention
+    """
+    parsed = parse_stream_topic(topic)
+    if parsed is None:
+        raise ValueError(f"Not a RealSense stream topic: {topic}")
+    return f"{parsed.prefix}/info/camera_info", f"{parsed.prefix}/info"
+
+
+def get_stream_name(topic: str) -> str:
+    """Get the display name of a stream topic's stream (e.g. "Infrared1"), or "" if unknown."""
+    parsed = parse_stream_topic(topic)
+    if parsed is None:
+        return ""
+    known = KNOWN_STREAMS.get((parsed.stream, parsed.index))
+    return known[1] if known else f"{parsed.stream}{parsed.index}"
+
+
+def is_option_value_topic(topic: str) -> bool:
+    """Check whether a topic is a ``/device_N/sensor_M/option/<Option>/value`` topic."""
+    return _OPTION_VALUE_PATTERN.match(topic) is not None
+
+
+def get_options_topic(device: int) -> str:
+    """Get the mapping key of a device's options stream (option values have no single topic)."""
+    return f"/device_{device}/option"
+
+
+def _sensor_info_slot(sensor: int) -> int:
+    return 2 + sensor if 2 + sensor < OPTIONS_SLOT else 3 + sensor
+
+
+def _device_name(device: int, name: str) -> str:
+    # device_0 keeps the names of the fixed single-camera mapping
+    return name if device == 0 else f"Device{device}_{name}"
+
+
+def discover_streams(topics: Iterable[str]) -> list[DiscoveredStream]:
+    """Find the convertible streams of a bag.
+
+    Image, IMU, extrinsic and metadata streams are created for every known
+    ``<Stream>_K`` (see KNOWN_STREAMS); unknown streams are ignored. Each
+    device with option values gets one options stream keyed by
+    get_options_topic().
+
+    Args:
+        topics: Topic names of the bag connections (duplicates are allowed)
+
+    Returns:
+        Streams ordered by stream ID
+
+    Raises:
+        ValueError: If a topic's device index is MAX_DEVICES or higher
+    """
+    streams: dict[str, DiscoveredStream] = {}
+
+    def add(topic: str, base: int, device: int, slot: int,
+            stream_type: str, name: str, recordable_type_id: str = "ForwardCamera") -> None:
+        if device >= MAX_DEVICES:
+            raise ValueError(
+                f"Device index {device} is out of the stream ID range "
+                f"(at most {MAX_DEVICES} devices): {topic}"
+            )
+        streams[topic] = DiscoveredStream(
+            topic=topic,
+            stream_id=base + device * DEVICE_ID_STRIDE + slot,
+            stream_type=stream_type,
+            name=_device_name(device, name),
+            recordable_type_id=recordable_type_id,
+        )
+
+    for topic in topics:
+        if topic in streams:
+            continue
+
+        if match := _DEVICE_INFO_PATTERN.match(topic):
+            device = int(match.group(1))
+            add(topic, INFO_STREAM_BASE, device, DEVICE_INFO_SLOT, "device_info", "Device_Info")
+            continue
+
+        if match := _SENSOR_INFO_PATTERN.match(topic):
+            device, sensor = int(match.group(1)), int(match.group(2))
+            add(topic, INFO_STREAM_BASE, device, _sensor_info_slot(sensor),
+                "sensor_info", f"Sensor{sensor}_Info")
+            continue
+
+        if match := _OPTION_VALUE_PATTERN.match(topic):
+            device = int(match.group(1))
+            options_topic = get_options_topic(device)
+            if options_topic not in streams:
+                add(options_topic, INFO_STREAM_BASE, device, OPTIONS_SLOT, "options", "Options")
+            continue
+
+        parsed = parse_stream_topic(topic)
+        if parsed is None:
+            continue
+        known = KNOWN_STREAMS.get((parsed.stream, parsed.index))
+        if known is None:
+            continue
+        stream_type, name, slot, extrinsic_slot = known
+        recordable_type_id = "MotionSensor" if stream_type.startswith("imu_") else "ForwardCamera"
+
+        if parsed.kind in ("image/data", "imu/data"):
+            add(topic, DATA_STREAM_BASE, parsed.device, slot, stream_type, name, recordable_type_id)
+        elif parsed.kind in ("image/metadata", "imu/metadata"):
+            add(topic, METADATA_STREAM_BASE, parsed.device, slot,
+                "metadata", f"{name}_Metadata", recordable_type_id)
+        elif parsed.kind == "tf/0" and extrinsic_slot is not None:
+            add(topic, DATA_STREAM_BASE, parsed.device, extrinsic_slot,
+                f"transform_{stream_type}", f"{name}_Extrinsic")
+
+    return sorted(streams.values(), key=lambda stream: stream.stream_id)
@@ -0,0 +1,203 @@
+"""Chrome trace_event span export for conversion pipelines.
+
+Code marks spans (``with get_tracer().span("cache_info"):``); when tracing is
+enabled they are written as a Chrome ``trace_event`` JSON file that Perfetto
+(https://ui.perfetto.dev) and chrome://tracing can load. Tracing is off by
+default: get_tracer() then returns a NullTracer whose spans cost one method
+call. It is enabled with start_tracing() (``--trace`` of the CLI tools) or by
+setting the VRS_TRACE environment variable to the output path, in which case
+the file is written when the process exits.
+
+Per-message spans (deserialize, pack, write) use sampled_span(), which records
+only every Nth span of each name; the number of calls per span name is stored
+in the trace's metadata ("span_counts"), so the total time of a sampled span
+is about its mean duration times its count. Follows the Single Responsibility
+Principle (SRP) by focusing solely on recording and writing spans.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Any
+
+# Environment variable enabling tracing for the whole process (value: output path)
+TRACE_ENV_VAR = "VRS_TRACE"
+# Environment variable overriding the per-message sampling interval
+TRACE_SAMPLE_ENV_VAR = "VRS_TRACE_SAMPLE_EVERY"
+
+DEFAULT_SAMPLE_EVERY = 100
+
+_NULL_CONTEXT = nullcontext()
+
+
+class NullTracer:
+    """Tracer used while tracing is disabled (records nothing)"""
+
+    enabled = False
+
+    def span(
+        self, name: str, category: str = "convert", **args: Any
+    ) -> AbstractContextManager[None]:
+        return _NULL_CONTEXT
+
+    def sampled_span(self, name: str, category: str = "message") -> AbstractContextManager[None]:
+        return _NULL_CONTEXT
+
+
+class Tracer:
+    """
+    Records spans as Chrome trace_event "complete" (ph="X") events
+
+    Usage:
+        tracer = Tracer()
+        with tracer.span("open_bag", path="input.bag"):
+            ...
+        tracer.write(Path("trace.json"))
+    """
+
+    enabled = True
+
+    def __init__(self, sample_every: int = DEFAULT_SAMPLE_EVERY) -> None:
+        """
+        Initialize the tracer
+
+        Args:
+            sample_every: Record every Nth sampled_span() of each name (1: all)
+
+        Raises:
+            ValueError: If sample_every is not positive
+        """
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be >= 1, got {sample_every}")
+        self.sample_every = sample_every
+        self.events: list[dict[str, Any]] = []
+        self.span_counts: dict[str, int] = {}  # sampled span name -> number of calls
+        self._pid = os.getpid()
+        self._start_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._thread_names: dict[int, str] = {}
+
+    @contextmanager
+    def span(self, name: str, category: str = "convert", **args: Any) -> Iterator[None]:
+        """Record the enclosed code as one span (args are shown in the span details)"""
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._add_event(name, category, start_ns, time.perf_counter_ns(), args)
+
+    def sampled_span(self, name: str, category: str = "message") -> AbstractContextManager[None]:
+        """Record the enclosed code as a span for every `sample_every`-th call per name"""
+        with self._lock:
+            count = self.span_counts.get(name, 0)
+            self.span_counts[name] = count + 1
+        if count % self.sample_every:
+            return _NULL_CONTEXT
+        return self.span(name, category, sample_every=self.sample_every)
+
+    def _add_event(
+        self, name: str, category: str, start_ns: int, end_ns: int, args: dict[str, Any]
+    ) -> None:
+        thread = threading.current_thread()
+        tid = thread.native_id or 0
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start_ns - self._start_ns) / 1000,  # Microseconds
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": self._pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = {key: _to_json_value(value) for key, value in args.items()}
+        with self._lock:
+            self.events.append(event)
+            self._thread_names.setdefault(tid, thread.name)
+
+    def trace(self) -> dict[str, Any]:
+        """Get the trace as a JSON-serializable Chrome trace_event document"""
+        with self._lock:
+            thread_names = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self._pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+                for tid, name in self._thread_names.items()
+            ]
+            return {
+                "traceEvents": thread_names + list(self.events),
+                "displayTimeUnit": "ms",
+                "otherData": {
+                    "sample_every": self.sample_every,
+                    "span_counts": dict(self.span_counts),
+                },
+            }
+
+    def write(self, path: Path) -> None:
+        """Write the trace as JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.trace(), f)
+
+
+def _to_json_value(value: Any) -> Any:
+    """Keep JSON scalars, convert anything else (e.g. Path) to a string"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+_tracer: Tracer | NullTracer = NullTracer()
+
+
+def get_tracer() -> Tracer | NullTracer:
+    """Get the process-wide tracer (a NullTracer while tracing is disabled)"""
+    return _tracer
+
+
+def start_tracing(sample_every: int = DEFAULT_SAMPLE_EVERY) -> Tracer:
+    """Enable tracing for the process and return the new tracer"""
+    global _tracer
+    _tracer = Tracer(sample_every)
+    return _tracer
+
+
+def stop_tracing(path: Path | None = None) -> Tracer | None:
+    """
+    Disable tracing and optionally write the trace
+
+    Args:
+        path: Output trace file (None: discard)
+
+    Returns:
+        The tracer that was active, or None if tracing was disabled
+    """
+    global _tracer
+    tracer = _tracer
+    _tracer = NullTracer()
+    if not isinstance(tracer, Tracer):
+        return None
+    if path is not None:
+        tracer.write(path)
+    return tracer
+
+
+def _start_tracing_from_env() -> None:
+    """Enable tracing if VRS_TRACE is set; the trace is written at exit"""
+    path = os.environ.get(TRACE_ENV_VAR)
+    if not path:
+        return
+    sample_every = int(os.environ.get(TRACE_SAMPLE_ENV_VAR, DEFAULT_SAMPLE_EVERY))
+    start_tracing(sample_every)
+    atexit.register(stop_tracing, Path(path))
+
+
+_start_tracing_from_env()
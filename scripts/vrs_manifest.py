@@ -0,0 +1,150 @@
+"""Manifest for VRS output split into chunk files.
+
+A chunked recording ``name.vrs`` is stored as independent, self-contained VRS
+files ``name_000.vrs``, ``name_001.vrs``, ... plus a JSON manifest
+``name.manifest.json`` listing the chunks in time order. Each chunk repeats the
+stream configuration records, so chunks can be converted, uploaded and read in
+parallel, while VRSReader can open the manifest as one logical file. This
+module has no VRS dependency so that readers and writers can share it.
+Follows the Single Responsibility Principle (SRP) by focusing solely on the
+manifest format.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_FORMAT = "vrs-chunks"
+MANIFEST_VERSION = 1
+
+
+def get_manifest_path(vrs_path: Path) -> Path:
+    """Get the manifest path of a chunked recording.
+
+    Args:
+        vrs_path: Logical output path (e.g. ``output.vrs``)
+
+    Returns:
+        Manifest path (e.g. ``output.manifest.json``)
+    """
+    return vrs_path.with_name(vrs_path.stem + MANIFEST_SUFFIX)
+
+
+def get_chunk_path(vrs_path: Path, chunk_index: int) -> Path:
+    """Get the path of a chunk file.
+
+    Args:
+        vrs_path: Logical output path (e.g. ``output.vrs``)
+        chunk_index: Zero-based chunk number
+
+    Returns:
+        Chunk path (e.g. ``output_000.vrs``)
+    """
+    return vrs_path.with_name(f"{vrs_path.stem}_{chunk_index:03d}{vrs_path.suffix or '.vrs'}")
+
+
+def is_manifest(path: Path) -> bool:
+    """Check whether a path names a chunk manifest (by file name)."""
+    return path.name.endswith(MANIFEST_SUFFIX)
+
+
+def write_manifest(manifest_path: Path, chunks: list[dict[str, Any]]) -> None:
+    """Write a manifest atomically.
+
+    Args:
+        manifest_path: Destination path
+        chunks: Chunk entries in time order. Each entry holds ``path`` (relative
+            to the manifest), ``start_timestamp``, ``end_timestamp`` (seconds),
+            ``record_count`` and ``payload_bytes``.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    manifest = {
+        "format": MANIFEST_FORMAT,
+        "version": MANIFEST_VERSION,
+        "chunks": chunks,
+    }
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+
+def read_manifest(manifest_path: Path) -> dict[str, Any]:
+    """Read and validate a manifest.
+
+    Args:
+        manifest_path: Path to the ``.manifest.json`` file
+
+    Returns:
+        Manifest dictionary
+
+    Raises:
+        ValueError: If the file is not a supported manifest
+        OSError: If the file cannot be read
+    """
+    with open(manifest_path, encoding="utf-8") as f:
+        try:
+            manifest = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid VRS manifest '{manifest_path}': {e}") from e
+
+    if not isinstance(manifest, dict) or manifest.get("format") != MANIFEST_FORMAT:
+        raise ValueError(f"'{manifest_path}' is not a VRS chunk manifest")
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported VRS manifest version: {manifest.get('version')}")
+    return manifest
+
+
+def get_chunk_paths(manifest_path: Path) -> list[Path]:
+    """Get the chunk file paths listed in a manifest, in time order.
+
+    Raises:
+        ValueError: If the file is not a supported manifest
+        OSError: If the file cannot be read
+    """
+    manifest = read_manifest(manifest_path)
+    return [manifest_path.parent / chunk["path"] for chunk in manifest["chunks"]]
+
+
+def merge_chunked_recordings(part_paths: list[Path], vrs_path: Path) -> list[Path]:
+    """Merge chunked recordings of consecutive time ranges into one.
+
+    The chunk files of each part are renamed, in order, to the chunk paths of
+    vrs_path and a single manifest is written, so no record is read or
+    re-encoded. Parts must cover consecutive time ranges in the given order
+    and live on the same file system as vrs_path. Chunks without records are
+    removed, as are the part manifests.
+
+    Args:
+        part_paths: Logical paths of the parts, in time order
+        vrs_path: Logical path of the merged recording
+
+    Returns:
+        Chunk files of the merged recording, in time order
+
+    Raises:
+        ValueError: If a part manifest is not a supported manifest
+        OSError: If a file cannot be renamed or written
+    """
+    vrs_path = Path(vrs_path)
+    chunks: list[dict[str, Any]] = []
+    chunk_paths: list[Path] = []
+    for part_path in part_paths:
+        part_manifest_path = get_manifest_path(Path(part_path))
+        for chunk in read_manifest(part_manifest_path)["chunks"]:
+            src_path = part_manifest_path.parent / chunk["path"]
+            if chunk["record_count"] == 0:
+                src_path.unlink(missing_ok=True)
+                continue
+            dst_path = get_chunk_path(vrs_path, len(chunk_paths))
+            os.replace(src_path, dst_path)
+            chunks.append({**chunk, "path": dst_path.name})
+            chunk_paths.append(dst_path)
+        part_manifest_path.unlink()
+
+    write_manifest(get_manifest_path(vrs_path), chunks)
+    return chunk_paths
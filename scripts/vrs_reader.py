@@ -7,9 +7,24 @@ which reads VRS (Virtual Reality Stream) files created by Meta.
 from __future__ import annotations
 
 import json
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Iterator
 
+import numpy as np
+
+from scripts.depth_codec import (
+    DEPTH_CODEC_NONE,
+    DEPTH_CODEC_TEMPORAL_ZSTD,
+    decode_depth,
+    decode_temporal_depth,
+    get_keyframe_distance,
+)
+from scripts.time_series import decode_time_series, flatten_time_series
+from scripts.trace_events import get_tracer
+from scripts.vrs_manifest import get_chunk_paths, is_manifest
+from scripts.vrs_summary import StreamStats, merge_stream_stats, parse_stream_stats
+
 try:
     import pyvrs
 except ImportError as e:
@@ -18,11 +33,17 @@ except ImportError as e:
     ) from e
 
 
+# Decoded depth keyframes kept in memory for temporal_zstd random access
+DEFAULT_KEYFRAME_CACHE_SIZE = 8
+
+
 class VRSReader:
     """VRS file reader with Pythonic interface and context manager support.
 
     This class wraps the pyvrs.SyncVRSReader to provide a simple interface
-    for reading VRS files.
+    for reading VRS files. A chunk manifest written by ChunkedVRSWriter
+    (``*.manifest.json``) can be opened as one logical file; records are then
+    read chunk by chunk in time order.
 
     Example:
         >>> with VRSReader("input.vrs") as reader:
@@ -32,11 +53,15 @@ class VRSReader:
         ...         print(record["timestamp"], record["data"])
     """
 
-    def __init__(self, filepath: Path | str) -> None:
+    def __init__(
+        self, filepath: Path | str, keyframe_cache_size: int = DEFAULT_KEYFRAME_CACHE_SIZE
+    ) -> None:
         """Initialize VRS reader and open VRS file.
 
         Args:
-            filepath: Path to the VRS file to read (Path or str)
+            filepath: Path to the VRS file or chunk manifest to read (Path or str)
+            keyframe_cache_size: Number of decoded depth keyframes kept for
+                temporal_zstd streams (bounds random access cost)
 
         Raises:
             FileNotFoundError: If file does not exist
@@ -55,24 +80,56 @@ class VRSReader:
             raise FileNotFoundError(f"VRS file not found: {filepath}")
 
         self._filepath = filepath
-        self._reader: Any = None  # pyvrs.SyncVRSReader instance
-        self._stream_id_mapping: dict[int, str] = {}  # user_id -> vrs_stream_id
+        self._reader: Any = None  # pyvrs.SyncVRSReader instance (first chunk)
+        self._stream_id_mapping: dict[int, str] = {}  # user_id -> vrs_stream_id (first chunk)
+        self._readers: list[Any] = []  # One pyvrs.SyncVRSReader per chunk
+        self._stream_id_mappings: list[dict[int, str]] = []  # Per-chunk stream ID mappings
+        self._configurations: dict[int, dict[str, Any]] = {}  # user_id -> configuration
+        self._data_readers: dict[int, list[Any]] = {}  # user_id -> per-chunk data record readers
+        self._stream_stats: dict[int, StreamStats | None] = {}  # user_id -> stats from tags
+        # (user_id, data record index) -> decoded keyframe, least recently used first
+        self._keyframe_cache: OrderedDict[tuple[int, int], np.ndarray] = OrderedDict()
+        self._keyframe_cache_size = keyframe_cache_size
 
         try:
-            self._reader = pyvrs.SyncVRSReader(str(filepath))
-            # Cache stream ID mapping at initialization (no iteration required)
-            for vrs_stream_id in self._reader.stream_ids:
-                info = self._reader.get_stream_info(vrs_stream_id)
-                flavor = info.get("flavor", "")
-                if "|id:" in flavor:
-                    try:
-                        user_id = int(flavor.split("|id:")[-1])
-                        self._stream_id_mapping[user_id] = vrs_stream_id
-                    except ValueError:
-                        pass
+            paths = get_chunk_paths(filepath) if is_manifest(filepath) else [filepath]
+            if not paths:
+                raise ValueError("manifest lists no chunks")
+            for path in paths:
+                with get_tracer().span("open_vrs", "read", path=path):
+                    reader, mapping = self._open_vrs_file(path)
+                self._readers.append(reader)
+                self._stream_id_mappings.append(mapping)
+            self._reader = self._readers[0]
+            self._stream_id_mapping = self._stream_id_mappings[0]
         except Exception as e:
+            for reader in self._readers:
+                reader.close()
+            self._readers.clear()
             raise RuntimeError(f"Failed to open VRS file '{filepath}': {e}") from e
 
+    @staticmethod
+    def _open_vrs_file(path: Path) -> tuple[Any, dict[int, str]]:
+        """Open one VRS file and build its user_id -> vrs_stream_id mapping.
+
+        VRS assigns instance IDs per process, so every chunk needs its own mapping.
+        """
+        reader = pyvrs.SyncVRSReader(str(path))
+        # Decode PNG/JPEG/JXL image blocks into pixel arrays (raw images are unchanged)
+        reader.set_image_conversion(pyvrs.ImageConversion.DECOMPRESS)
+        # Cache stream ID mapping at initialization (no iteration required)
+        mapping: dict[int, str] = {}
+        for vrs_stream_id in reader.stream_ids:
+            info = reader.get_stream_info(vrs_stream_id)
+            flavor = info.get("flavor", "")
+            if "|id:" in flavor:
+                try:
+                    user_id = int(flavor.split("|id:")[-1])
+                    mapping[user_id] = vrs_stream_id
+                except ValueError:
+                    pass
+        return reader, mapping
+
     def __enter__(self) -> VRSReader:
         """Context manager entry.
 
@@ -152,6 +209,21 @@ class VRSReader:
 
         raise ValueError(f"Stream ID {user_stream_id} not found")
 
+    def _iter_stream_records(self, stream_id: int) -> Iterator[Any]:
+        """Iterate over all records of a stream, chunk by chunk.
+
+        Raises:
+            ValueError: If stream_id not found
+        """
+        self._get_vrs_stream_id(stream_id)
+        for reader, mapping in zip(self._readers, self._stream_id_mappings):
+            vrs_stream_id = mapping.get(stream_id)
+            if vrs_stream_id is None:
+                continue
+            for record in reader:
+                if record.stream_id == vrs_stream_id:
+                    yield record
+
     def read_configuration(self, stream_id: int) -> dict[str, Any]:
         """Read configuration record for the specified stream.
 
@@ -172,31 +244,11 @@ class VRSReader:
             raise ValueError(f"stream_id must be int, got {type(stream_id).__name__}")
 
         try:
-            # Convert user stream_id to VRS stream_id
-            vrs_stream_id = self._get_vrs_stream_id(stream_id)
-
-            # Iterate through all records and find configuration for the stream
-            for record in self._reader:
+            # Iterate through the stream's records and find its configuration
+            for record in self._iter_stream_records(stream_id):
                 # Note: record.record_type is a string, not enum
-                if record.stream_id == vrs_stream_id and record.record_type == "configuration":
-                    # Get data from metadata_blocks (DataLayout)
-                    if record.n_metadata_blocks > 0:
-                        metadata = record.metadata_blocks[0]
-                        # Extract config_json field from metadata
-                        if "config_json" in metadata:
-                            config_json_str = metadata["config_json"]
-                            try:
-                                # Try to decode as JSON
-                                return json.loads(config_json_str)
-                            except json.JSONDecodeError:
-                                # Return as string if not valid JSON
-                                return {"config_json": config_json_str}
-                        else:
-                            # Return metadata directly if no config_json field
-                            return metadata
-                    else:
-                        # No metadata blocks, return empty dict
-                        return {}
+                if record.record_type == "configuration":
+                    return self._parse_configuration_record(record)
 
             # If no configuration found, raise error
             raise ValueError(f"No configuration record found for stream {stream_id}")
@@ -207,6 +259,28 @@ class VRSReader:
                 f"Failed to read configuration for stream {stream_id}: {e}"
             ) from e
 
+    @staticmethod
+    def _parse_configuration_record(record: Any) -> dict[str, Any]:
+        """Convert a pyvrs configuration record into a configuration dictionary."""
+        # Get data from metadata_blocks (DataLayout)
+        if record.n_metadata_blocks > 0:
+            metadata = record.metadata_blocks[0]
+            # Extract config_json field from metadata
+            if "config_json" in metadata:
+                config_json_str = metadata["config_json"]
+                try:
+                    # Try to decode as JSON
+                    return json.loads(config_json_str)
+                except json.JSONDecodeError:
+                    # Return as string if not valid JSON
+                    return {"config_json": config_json_str}
+            else:
+                # Return metadata directly if no config_json field
+                return metadata
+        else:
+            # No metadata blocks, return empty dict
+            return {}
+
     def read_data_records(self, stream_id: int) -> Iterator[dict[str, Any]]:
         """Read all data records for the specified stream.
 
@@ -214,7 +288,12 @@ class VRSReader:
             stream_id: Target stream ID (user-specified)
 
         Yields:
-            Dictionary with 'timestamp' and 'data' keys for each record
+            Dictionary with 'timestamp' and 'data' keys for each record.
+            Records of image streams also contain 'image', a numpy array
+            shaped (height, width[, channels]) decoded by pyvrs. Records of
+            motion streams also contain 'timestamps' (N,) and 'samples' (N, 3).
+            Depth frames written with a depth codec are decoded transparently
+            ('data' holds the raw 16-bit frame, 'image' a (height, width) array).
 
         Raises:
             ValueError: If stream_id doesn't exist
@@ -227,27 +306,25 @@ class VRSReader:
             raise ValueError(f"stream_id must be int, got {type(stream_id).__name__}")
 
         try:
-            # Convert user stream_id to VRS stream_id
-            vrs_stream_id = self._get_vrs_stream_id(stream_id)
-
-            for record in self._reader:
+            # The configuration record precedes the stream's data records (in
+            # every chunk), so the depth codec is known before the first frame
+            config: dict[str, Any] = {}
+            index = 0
+            tracer = get_tracer()
+            for record in self._iter_stream_records(stream_id):
                 # Note: record.record_type is a string, not enum
-                if record.stream_id == vrs_stream_id and record.record_type == "data":
-                    # Get data from custom_blocks (CUSTOM block)
-                    data = b""
-                    if record.n_custom_blocks > 0:
-                        # custom_blocks[0] contains the raw data
-                        custom_block = record.custom_blocks[0]
-                        if isinstance(custom_block, bytes):
-                            data = custom_block
-                        elif hasattr(custom_block, 'data'):
-                            data = custom_block.data
-                        # Otherwise, data remains empty bytes
-
-                    yield {
-                        "timestamp": record.timestamp,
-                        "data": data,
-                    }
+                if record.record_type == "configuration":
+                    config = self._parse_configuration_record(record)
+                elif record.record_type == "data":
+                    with tracer.sampled_span("decode_record", "read"):
+                        if config.get("depth_codec") == DEPTH_CODEC_TEMPORAL_ZSTD:
+                            decoded = self._decode_temporal_depth_record(
+                                stream_id, index, record, config
+                            )
+                        else:
+                            decoded = self._decode_data_record(record, config)
+                    yield decoded
+                    index += 1
         except ValueError:
             raise
         except Exception as e:
@@ -255,9 +332,283 @@ class VRSReader:
                 f"Failed to read data records for stream {stream_id}: {e}"
             ) from e
 
+    @staticmethod
+    def _decode_data_record(record: Any, config: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Convert a pyvrs data record into a record dictionary.
+
+        Image streams (written with VRSWriter.add_image_stream) carry an image
+        content block, which pyvrs returns as a typed, shaped numpy array;
+        motion streams (VRSWriter.add_motion_stream) carry sample vectors in
+        their DataLayout; other streams carry the payload in a CUSTOM block,
+        which is decoded when the stream configuration names a depth codec.
+        """
+        if record.n_image_blocks > 0:
+            image = np.asarray(record.image_blocks[0])
+            return {
+                "timestamp": record.timestamp,
+                "data": image.tobytes(),
+                "image": image,
+            }
+
+        if record.n_metadata_blocks > 0 and "samples" in record.metadata_blocks[0]:
+            metadata = record.metadata_blocks[0]
+            samples = np.asarray(metadata["samples"], dtype=np.float64).reshape(-1, 3)
+            return {
+                "timestamp": record.timestamp,
+                # Little-endian (x, y, z) doubles, same layout as legacy '<ddd' records
+                "data": samples.astype("<f8").tobytes(),
+                "timestamps": np.asarray(metadata["timestamps"], dtype=np.float64),
+                "samples": samples,
+            }
+
+        data = VRSReader._get_custom_block_data(record)
+
+        config = config or {}
+        depth_codec = config.get("depth_codec", DEPTH_CODEC_NONE)
+        if depth_codec not in (DEPTH_CODEC_NONE, DEPTH_CODEC_TEMPORAL_ZSTD) and data:
+            image = decode_depth(data, int(config["width"]), int(config["height"]), depth_codec)
+            return {
+                "timestamp": record.timestamp,
+                "data": image.tobytes(),
+                "image": image,
+            }
+
+        return {
+            "timestamp": record.timestamp,
+            "data": data,
+        }
+
+    @staticmethod
+    def _get_custom_block_data(record: Any) -> bytes:
+        """Get the payload of a record's CUSTOM block (empty bytes if none)."""
+        # Get data from custom_blocks (CUSTOM block)
+        data = b""
+        if record.n_custom_blocks > 0:
+            # custom_blocks[0] contains the raw data
+            custom_block = record.custom_blocks[0]
+            if isinstance(custom_block, bytes):
+                data = custom_block
+            elif hasattr(custom_block, 'data'):
+                data = custom_block.data
+            # Otherwise, data remains empty bytes
+        return bytes(data)
+
+    def _decode_temporal_depth_record(
+        self, stream_id: int, index: int, record: Any, config: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Decode a temporal_zstd depth record from its keyframe.
+
+        Keyframes are cached (LRU), so sequential reads decode each keyframe
+        once and random access reads at most one extra record.
+        """
+        data = self._get_custom_block_data(record)
+        width, height = int(config["width"]), int(config["height"])
+
+        distance = get_keyframe_distance(data)
+        keyframe = None
+        if distance > 0:
+            keyframe = self._get_keyframe(stream_id, index - distance, width, height)
+
+        image = decode_temporal_depth(data, width, height, keyframe)
+        if distance == 0:
+            self._cache_keyframe((stream_id, index), image)
+
+        return {
+            "timestamp": record.timestamp,
+            "data": image.tobytes(),
+            "image": image,
+        }
+
+    def _get_keyframe(self, stream_id: int, index: int, width: int, height: int) -> np.ndarray:
+        """Get a decoded keyframe from the cache, reading it from the file on a miss."""
+        key = (stream_id, index)
+        if key in self._keyframe_cache:
+            self._keyframe_cache.move_to_end(key)
+            return self._keyframe_cache[key]
+
+        record = self._get_data_record(stream_id, index)
+        keyframe = decode_temporal_depth(self._get_custom_block_data(record), width, height)
+        self._cache_keyframe(key, keyframe)
+        return keyframe
+
+    def _cache_keyframe(self, key: tuple[int, int], keyframe: np.ndarray) -> None:
+        """Insert a decoded keyframe, evicting the least recently used ones."""
+        self._keyframe_cache[key] = keyframe
+        self._keyframe_cache.move_to_end(key)
+        while len(self._keyframe_cache) > self._keyframe_cache_size:
+            self._keyframe_cache.popitem(last=False)
+
+    def _get_data_readers(self, stream_id: int) -> list[Any]:
+        """Get indexable pyvrs readers over the data records of a stream, one per chunk."""
+        if stream_id not in self._data_readers:
+            self._get_vrs_stream_id(stream_id)
+            self._data_readers[stream_id] = [
+                reader.filtered_by_fields(stream_ids=mapping[stream_id], record_types="data")
+                for reader, mapping in zip(self._readers, self._stream_id_mappings)
+                if stream_id in mapping
+            ]
+        return self._data_readers[stream_id]
+
+    def _get_data_record(self, stream_id: int, index: int) -> Any:
+        """Get a data record of a stream by its index across all chunks.
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        if index >= 0:
+            for data_reader in self._get_data_readers(stream_id):
+                if index < len(data_reader):
+                    return data_reader[index]
+                index -= len(data_reader)
+        raise IndexError(f"Data record index out of range for stream {stream_id}")
+
+    def read_data_record(self, stream_id: int, index: int) -> dict[str, Any]:
+        """Read one data record of a stream by index (random access).
+
+        Depth frames are decoded like in read_data_records(); for temporal_zstd
+        streams only the frame and (on a cache miss) its keyframe are read.
+
+        Args:
+            stream_id: Target stream ID (user-specified)
+            index: Index of the data record within the stream
+
+        Returns:
+            Record dictionary (same keys as read_data_records())
+
+        Raises:
+            ValueError: If stream_id doesn't exist
+            IndexError: If index is out of range
+            RuntimeError: If reader is not open or read fails
+        """
+        if self._reader is None:
+            raise RuntimeError("VRS file is not open")
+
+        if stream_id not in self._configurations:
+            self._configurations[stream_id] = self.read_configuration(stream_id)
+        config = self._configurations[stream_id]
+
+        record = self._get_data_record(stream_id, index)
+
+        try:
+            if config.get("depth_codec") == DEPTH_CODEC_TEMPORAL_ZSTD:
+                return self._decode_temporal_depth_record(stream_id, index, record, config)
+            return self._decode_data_record(record, config)
+        except ValueError:
+            raise
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to read data record {index} of stream {stream_id}: {e}"
+            ) from e
+
+    def read_imu_samples(self, stream_id: int) -> tuple[np.ndarray, np.ndarray]:
+        """Read all samples of a motion stream as arrays.
+
+        Batched records are flattened, so the result does not depend on the
+        writer's samples-per-record setting.
+
+        Args:
+            stream_id: Target motion stream ID (user-specified)
+
+        Returns:
+            Tuple of (timestamps (N,) in seconds, samples (N, 3))
+
+        Raises:
+            ValueError: If stream_id doesn't exist or is not a motion stream
+            RuntimeError: If reader is not open or read fails
+        """
+        timestamps: list[np.ndarray] = []
+        samples: list[np.ndarray] = []
+        for record in self.read_data_records(stream_id):
+            if "samples" not in record:
+                raise ValueError(f"Stream {stream_id} is not a motion stream")
+            timestamps.append(record["timestamps"])
+            samples.append(record["samples"])
+
+        if not samples:
+            return np.zeros(0, dtype=np.float64), np.zeros((0, 3), dtype=np.float64)
+        return np.concatenate(timestamps), np.concatenate(samples)
+
+    def read_time_series(self, stream_id: int) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """Read an option or metadata stream as one series per column.
+
+        Options streams hold one row per change (columns "sensor_N/Option"),
+        metadata streams one row per frame (columns are metadata keys such as
+        "Actual Exposure" or "Frame Counter").
+
+        Args:
+            stream_id: Target options/metadata stream ID (user-specified)
+
+        Returns:
+            Column name -> (timestamps (N,) in seconds, values (N,)); numeric
+            columns are float64 arrays, others object arrays
+
+        Raises:
+            ValueError: If stream_id doesn't exist or is not a time-series stream
+            RuntimeError: If reader is not open or read fails
+        """
+        batches = [
+            decode_time_series(record["data"]) for record in self.read_data_records(stream_id)
+        ]
+        return flatten_time_series(batches)
+
+    def get_file_tags(self) -> dict[str, str]:
+        """Get the file tags (e.g. source bag and converter version).
+
+        For chunked output the tags of the first chunk are returned; all
+        chunks carry the same file tags.
+
+        Returns:
+            Dictionary of file tags
+
+        Raises:
+            RuntimeError: If reader is not open
+        """
+        if self._reader is None:
+            raise RuntimeError("VRS file is not open")
+
+        return dict(self._reader.file_tags)
+
+    def get_stream_stats(self, stream_id: int) -> StreamStats | None:
+        """Get the data record statistics stored in the stream tags.
+
+        Reads only the file headers, so it takes constant time regardless of
+        the number of records. Chunk statistics are merged.
+
+        Args:
+            stream_id: Target stream ID (user-specified)
+
+        Returns:
+            Stream statistics, or None if the file was written without them
+
+        Raises:
+            ValueError: If stream_id doesn't exist
+            RuntimeError: If reader is not open
+        """
+        if self._reader is None:
+            raise RuntimeError("VRS file is not open")
+
+        if stream_id not in self._stream_stats:
+            self._get_vrs_stream_id(stream_id)
+            chunk_stats: list[StreamStats] = []
+            for reader, mapping in zip(self._readers, self._stream_id_mappings):
+                if stream_id not in mapping:
+                    continue
+                stats = parse_stream_stats(reader.stream_tags.get(mapping[stream_id], {}))
+                if stats is None:
+                    # Written without statistics (or partially); callers fall back to scanning
+                    self._stream_stats[stream_id] = None
+                    break
+                chunk_stats.append(stats)
+            else:
+                self._stream_stats[stream_id] = merge_stream_stats(chunk_stats)
+        return self._stream_stats[stream_id]
+
     def get_record_count(self, stream_id: int) -> int:
         """Get the number of data records for the specified stream.
 
+        Uses the statistics stored in the stream tags when present; otherwise
+        the stream's records are scanned.
+
         Args:
             stream_id: Target stream ID (user-specified)
 
@@ -271,14 +622,15 @@ class VRSReader:
         if self._reader is None:
             raise RuntimeError("VRS file is not open")
 
-        try:
-            # Convert user stream_id to VRS stream_id
-            vrs_stream_id = self._get_vrs_stream_id(stream_id)
+        stats = self.get_stream_stats(stream_id)
+        if stats is not None:
+            return stats.record_count
 
+        try:
             count = 0
-            for record in self._reader:
+            for record in self._iter_stream_records(stream_id):
                 # Note: record.record_type is a string, not enum
-                if record.stream_id == vrs_stream_id and record.record_type == "data":
+                if record.record_type == "data":
                     count += 1
             return count
         except Exception as e:
@@ -292,10 +644,14 @@ class VRSReader:
         This method is called automatically when using the context manager.
         """
         if self._reader is not None:
-            try:
-                self._reader.close()
-            except Exception:
-                # Ignore close errors
-                pass
-            finally:
-                self._reader = None
+            for reader in self._readers:
+                try:
+                    reader.close()
+                except Exception:
+                    # Ignore close errors
+                    pass
+            self._reader = None
+            self._readers.clear()
+            self._data_readers.clear()
+            self._stream_stats.clear()
+            self._keyframe_cache.clear()
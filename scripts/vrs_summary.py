@@ -0,0 +1,167 @@
+"""Summary statistics stored as VRS file and stream tags.
+
+VRSWriter keeps running per-stream statistics (record count, first/last
+timestamp, payload bytes, min/max gap between records) and writes them as a
+JSON stream tag at close, together with file tags describing the source bag
+and converter. Tags live in the VRS file header, so VRSReader and
+inspect_vrs.py can show counts and durations without reading any record.
+This module has no VRS dependency so that readers and writers can share it.
+Follows the Single Responsibility Principle (SRP) by focusing solely on the
+summary format.
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+# Stream tag holding StreamStats as JSON
+STREAM_STATS_TAG = "realsense_vrs.stats"
+
+# File tags describing the conversion source
+SOURCE_PATH_TAG = "realsense_vrs.source_path"
+SOURCE_SIZE_TAG = "realsense_vrs.source_size"
+SOURCE_SHA256_TAG = "realsense_vrs.source_sha256"
+CONVERTER_VERSION_TAG = "realsense_vrs.converter_version"
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass
+class StreamStats:
+    """Running statistics of the data records of one stream.
+
+    Gaps are differences between consecutive record timestamps in write
+    order; they are None until the stream has two records.
+    """
+
+    record_count: int = 0
+    first_timestamp: float | None = None
+    last_timestamp: float | None = None
+    payload_bytes: int = 0
+    min_gap: float | None = None
+    max_gap: float | None = None
+
+    def update(self, timestamp: float, payload_bytes: int) -> None:
+        """Account for one data record.
+
+        Args:
+            timestamp: Record timestamp in seconds
+            payload_bytes: Size of the record payload
+        """
+        if self.last_timestamp is not None:
+            gap = timestamp - self.last_timestamp
+            self.min_gap = gap if self.min_gap is None else min(self.min_gap, gap)
+            self.max_gap = gap if self.max_gap is None else max(self.max_gap, gap)
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamp
+        self.last_timestamp = timestamp
+        self.record_count += 1
+        self.payload_bytes += payload_bytes
+
+    @property
+    def duration(self) -> float:
+        """Time between the first and last record in seconds (0 if empty)."""
+        if self.first_timestamp is None or self.last_timestamp is None:
+            return 0.0
+        return self.last_timestamp - self.first_timestamp
+
+    def to_tag(self) -> str:
+        """Serialize to a stream tag value."""
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_tag(cls, value: str) -> "StreamStats":
+        """Parse a stream tag value written by to_tag().
+
+        Raises:
+            ValueError: If the value is not a valid stats tag
+        """
+        try:
+            fields = json.loads(value)
+            return cls(**fields)
+        except (json.JSONDecodeError, TypeError) as e:
+            raise ValueError(f"Invalid stream stats tag: {e}") from e
+
+
+def merge_stream_stats(chunk_stats: list[StreamStats]) -> StreamStats:
+    """Combine the statistics of consecutive chunks of one stream.
+
+    Args:
+        chunk_stats: Per-chunk statistics in time order
+
+    Returns:
+        Statistics of the whole stream, including gaps across chunk boundaries
+    """
+    merged = StreamStats()
+    for stats in chunk_stats:
+        if stats.record_count == 0:
+            continue
+        assert stats.first_timestamp is not None
+        gaps = [
+            g
+            for g in (stats.min_gap, stats.max_gap, merged.min_gap, merged.max_gap)
+            if g is not None
+        ]
+        if merged.last_timestamp is not None:
+            gaps.append(stats.first_timestamp - merged.last_timestamp)
+        if gaps:
+            merged.min_gap = min(gaps)
+            merged.max_gap = max(gaps)
+        if merged.first_timestamp is None:
+            merged.first_timestamp = stats.first_timestamp
+        merged.last_timestamp = stats.last_timestamp
+        merged.record_count += stats.record_count
+        merged.payload_bytes += stats.payload_bytes
+    return merged
+
+
+def compute_file_sha256(path: Path) -> str:
+    """Compute the SHA-256 of a file, reading it in blocks.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(_HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_source_tags(
+    source_path: Path, converter_version: str, compute_hash: bool = True
+) -> dict[str, str]:
+    """Build the file tags describing a conversion source.
+
+    Args:
+        source_path: Path to the source ROSbag
+        converter_version: Version of the converter writing the file
+        compute_hash: Whether to hash the whole source file (reads it once more)
+
+    Returns:
+        Dictionary of file tags
+
+    Raises:
+        OSError: If the source file cannot be read
+    """
+    tags = {
+        SOURCE_PATH_TAG: str(source_path),
+        SOURCE_SIZE_TAG: str(source_path.stat().st_size),
+        CONVERTER_VERSION_TAG: converter_version,
+    }
+    if compute_hash:
+        tags[SOURCE_SHA256_TAG] = compute_file_sha256(source_path)
+    return tags
+
+
+def parse_stream_stats(tags: dict[str, Any]) -> StreamStats | None:
+    """Get the statistics from a stream's tags, or None if absent or invalid."""
+    value = tags.get(STREAM_STATS_TAG)
+    if value is None:
+        return None
+    try:
+        return StreamStats.from_tag(value)
+    except ValueError:
+        return None
@@ -7,9 +7,14 @@ which wrap the VRS C++ library's RecordFileWriter class.
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
+from scripts.trace_events import get_tracer
+from scripts.vrs_manifest import get_chunk_path, get_manifest_path, write_manifest
+from scripts.vrs_summary import STREAM_STATS_TAG, StreamStats, merge_stream_stats
+
 try:
     import pyvrs_writer
 except ImportError as e:
@@ -19,11 +24,40 @@ except ImportError as e:
     ) from e
 
 
+# Bytes per pixel of the pixel formats supported by add_image_stream()
+PIXEL_FORMAT_BYTES = {
+    "RGB8": 3,
+    "BGR8": 3,
+    "GREY8": 1,
+    "GREY16": 2,
+}
+
+# Image codec -> VRS ImageFormat of compressed image streams (see add_image_stream())
+IMAGE_CODEC_FORMATS = {
+    "png": "PNG",
+    "jpeg": "JPG",
+    "jxl": "JXL",
+}
+
+# Payload bytes counted per motion sample: timestamp + (x, y, z) doubles
+MOTION_SAMPLE_BYTES = 32
+
+
 class VRSWriter:
     """VRS file writer with Pythonic interface and context manager support.
 
     This class wraps the pyvrs_writer C++ bindings to provide a simple
-    interface for creating VRS files and writing sensor data.
+    interface for creating VRS files and writing sensor data. Per-stream
+    statistics (see get_stream_stats()) are kept while writing and stored as
+    stream tags at close, so readers can summarize a file without reading its
+    records.
+
+    By default all records are kept in memory and written at close(). In
+    durable mode (``flush_interval_sec``) the file is created at the first
+    data record and records are flushed to disk every few seconds, so a crash
+    loses at most the last interval; recover_vrs_file() rebuilds the index of
+    such a file. File tags must then be set before the first data record, and
+    stream statistics are not stored as tags (the header is already written).
 
     Example:
         >>> with VRSWriter("output.vrs") as writer:
@@ -32,14 +66,16 @@ class VRSWriter:
         ...     writer.write_data(1001, 0.0, b"image_data")
     """
 
-    def __init__(self, filepath: Path | str) -> None:
+    def __init__(self, filepath: Path | str, flush_interval_sec: float | None = None) -> None:
         """Initialize VRS writer and create VRS file.
 
         Args:
             filepath: Path to the VRS file to create (Path or str)
+            flush_interval_sec: Flush records to disk every N seconds (durable
+                mode); None keeps all records in memory until close()
 
         Raises:
-            ValueError: If filepath is invalid
+            ValueError: If filepath or flush_interval_sec is invalid
             RuntimeError: If VRS file creation fails
         """
         if isinstance(filepath, str):
@@ -48,12 +84,21 @@ class VRSWriter:
         if not isinstance(filepath, Path):
             raise ValueError(f"filepath must be Path or str, got {type(filepath).__name__}")
 
+        if flush_interval_sec is not None and flush_interval_sec <= 0:
+            raise ValueError(f"flush_interval_sec must be positive, got {flush_interval_sec}")
+
         self._filepath = filepath
+        self._durable = flush_interval_sec is not None
         self._writer: Any = None  # pyvrs_writer.VRSWriter instance
         self._stream_ids: set[int] = set()  # Track added stream IDs
+        self._image_frame_sizes: dict[int, int] = {}  # stream_id -> bytes per frame
+        self._motion_stream_ids: set[int] = set()  # Streams added by add_motion_stream
+        self._stream_stats: dict[int, StreamStats] = {}  # stream_id -> data record statistics
 
         try:
-            self._writer = pyvrs_writer.VRSWriter(str(filepath))  # type: ignore[attr-defined]
+            self._writer = pyvrs_writer.VRSWriter(  # type: ignore[attr-defined]
+                str(filepath), flush_interval_sec or 0.0
+            )
         except Exception as e:
             raise RuntimeError(f"Failed to create VRS file '{filepath}': {e}") from e
 
@@ -91,6 +136,131 @@ class VRSWriter:
             ValueError: If stream_id is invalid or already exists
             RuntimeError: If VRS file is not open or stream addition fails
         """
+        self._check_new_stream(stream_id, stream_name)
+
+        try:
+            assert self._writer is not None
+            self._writer.add_stream(stream_id, self._encode_stream_name(stream_id, stream_name))
+            self._stream_ids.add(stream_id)  # Track successfully added stream
+            self._stream_stats[stream_id] = StreamStats()
+        except Exception as e:
+            raise RuntimeError(f"Failed to add stream {stream_id} '{stream_name}': {e}") from e
+
+    def add_image_stream(
+        self,
+        stream_id: int,
+        stream_name: str,
+        pixel_format: str,
+        width: int,
+        height: int,
+        stride: int = 0,
+        image_codec: str = "raw",
+    ) -> None:
+        """Add a new image stream to the VRS file.
+
+        Data records of image streams carry a VRS image content block
+        (instead of an opaque custom block), so pyvrs and vrsplayer can decode
+        frames natively. For "raw" streams every data payload must be exactly
+        one frame; for compressed streams ("png", "jpeg", "jxl") every payload
+        must be one complete encoded image file (see scripts.image_codec).
+
+        Args:
+            stream_id: Unique stream identifier (positive integer)
+            stream_name: Human-readable stream name
+            pixel_format: One of PIXEL_FORMAT_BYTES ("RGB8", "BGR8", "GREY8", "GREY16")
+            width: Image width in pixels
+            height: Image height in pixels
+            stride: Bytes per row (0 = width * bytes per pixel, raw only)
+            image_codec: "raw" or one of IMAGE_CODEC_FORMATS
+
+        Raises:
+            ValueError: If arguments are invalid or stream_id already exists
+            RuntimeError: If VRS file is not open or stream addition fails
+        """
+        self._check_new_stream(stream_id, stream_name)
+
+        if pixel_format not in PIXEL_FORMAT_BYTES:
+            raise ValueError(
+                f"pixel_format must be one of {sorted(PIXEL_FORMAT_BYTES)}, got {pixel_format}"
+            )
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Image size must be positive, got {width}x{height}")
+        if stride == 0:
+            stride = width * PIXEL_FORMAT_BYTES[pixel_format]
+        if stride < width * PIXEL_FORMAT_BYTES[pixel_format]:
+            raise ValueError(f"stride {stride} is too small for {width} {pixel_format} pixels")
+        if image_codec != "raw" and image_codec not in IMAGE_CODEC_FORMATS:
+            raise ValueError(
+                f"image_codec must be 'raw' or one of {sorted(IMAGE_CODEC_FORMATS)}, "
+                f"got {image_codec}"
+            )
+
+        try:
+            assert self._writer is not None
+            if image_codec == "raw":
+                self._writer.add_image_stream(
+                    stream_id,
+                    self._encode_stream_name(stream_id, stream_name),
+                    pixel_format,
+                    width,
+                    height,
+                    stride,
+                )
+                self._image_frame_sizes[stream_id] = stride * height
+            else:
+                # Encoded frames are variable-size, so no frame size check
+                self._writer.add_encoded_image_stream(
+                    stream_id,
+                    self._encode_stream_name(stream_id, stream_name),
+                    IMAGE_CODEC_FORMATS[image_codec],
+                    width,
+                    height,
+                )
+            self._stream_ids.add(stream_id)
+            self._stream_stats[stream_id] = StreamStats()
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to add image stream {stream_id} '{stream_name}': {e}"
+            ) from e
+
+    def add_motion_stream(self, stream_id: int, stream_name: str) -> None:
+        """Add a new motion sensor (IMU) stream to the VRS file.
+
+        Data records of motion streams hold a typed DataLayout with a
+        ``timestamps`` vector and a ``samples`` vector of 3D points, so one
+        record can carry a batch of samples and readers can decode them
+        without ``struct``. Use write_motion_samples() to write data.
+
+        Args:
+            stream_id: Unique stream identifier (positive integer)
+            stream_name: Human-readable stream name
+
+        Raises:
+            ValueError: If stream_id is invalid or already exists
+            RuntimeError: If VRS file is not open or stream addition fails
+        """
+        self._check_new_stream(stream_id, stream_name)
+
+        try:
+            assert self._writer is not None
+            self._writer.add_motion_stream(
+                stream_id, self._encode_stream_name(stream_id, stream_name)
+            )
+            self._stream_ids.add(stream_id)
+            self._stream_stats[stream_id] = StreamStats()
+            self._motion_stream_ids.add(stream_id)
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to add motion stream {stream_id} '{stream_name}': {e}"
+            ) from e
+
+    def _check_new_stream(self, stream_id: int, stream_name: str) -> None:
+        """Validate arguments shared by all add_*_stream methods.
+
+        Raises:
+            ValueError: If stream_id is invalid or already exists
+            RuntimeError: If VRS file is not open
+        """
         if not self.is_open():
             raise RuntimeError("VRS file is not open")
 
@@ -104,15 +274,13 @@ class VRSWriter:
         if stream_id in self._stream_ids:
             raise ValueError(f"Stream ID {stream_id} already exists. Stream IDs must be unique.")
 
-        try:
-            assert self._writer is not None
-            # Encode stream_id in stream_name (flavor) for later retrieval by VRSReader
-            # Format: "stream_name|id:stream_id"
-            encoded_name = f"{stream_name}|id:{stream_id}"
-            self._writer.add_stream(stream_id, encoded_name)
-            self._stream_ids.add(stream_id)  # Track successfully added stream
-        except Exception as e:
-            raise RuntimeError(f"Failed to add stream {stream_id} '{stream_name}': {e}") from e
+    @staticmethod
+    def _encode_stream_name(stream_id: int, stream_name: str) -> str:
+        """Encode stream_id in stream_name (flavor) for later retrieval by VRSReader.
+
+        Format: "stream_name|id:stream_id"
+        """
+        return f"{stream_name}|id:{stream_id}"
 
     def write_configuration(self, stream_id: int, config_data: dict[str, Any]) -> None:
         """Write a Configuration record for the specified stream.
@@ -183,39 +351,168 @@ class VRSWriter:
             raise ValueError(f"timestamp must be non-negative, got {timestamp}")
 
         # Convert bytes to list[int] if necessary (pyvrs_writer expects list[int])
-        if isinstance(data, bytes):
-            data_list = list(data)
-        elif isinstance(data, list):
-            data_list = data
-        else:
-            raise ValueError(f"data must be bytes or list[int], got {type(data).__name__}")
+        tracer = get_tracer()
+        with tracer.sampled_span("pack_payload", "write"):
+            if isinstance(data, bytes):
+                data_list = list(data)
+            elif isinstance(data, list):
+                data_list = data
+            else:
+                raise ValueError(f"data must be bytes or list[int], got {type(data).__name__}")
 
         if not data_list:
             raise ValueError("data must not be empty")
 
+        if stream_id in self._motion_stream_ids:
+            raise ValueError(
+                f"Stream {stream_id} is a motion stream. Use write_motion_samples() instead."
+            )
+
+        frame_size = self._image_frame_sizes.get(stream_id)
+        if frame_size is not None and len(data_list) != frame_size:
+            raise ValueError(
+                f"Image stream {stream_id} expects {frame_size} bytes per frame, "
+                f"got {len(data_list)}"
+            )
+
         try:
             assert self._writer is not None
-            self._writer.write_data(stream_id, float(timestamp), data_list)
+            with tracer.sampled_span("write_record", "write"):
+                self._writer.write_data(stream_id, float(timestamp), data_list)
+            self._stream_stats[stream_id].update(float(timestamp), len(data_list))
         except Exception as e:
             raise RuntimeError(
                 f"Failed to write data for stream {stream_id} at {timestamp}s: {e}"
             ) from e
 
+    def write_motion_samples(
+        self,
+        stream_id: int,
+        timestamps: Sequence[float],
+        samples: Sequence[Sequence[float]],
+    ) -> None:
+        """Write a batch of motion samples as one Data record.
+
+        The record timestamp is the timestamp of the first sample.
+
+        Args:
+            stream_id: Target motion stream ID (see add_motion_stream())
+            timestamps: Per-sample timestamps in seconds (non-decreasing)
+            samples: Per-sample (x, y, z) values, e.g. an (N, 3) array
+
+        Raises:
+            ValueError: If stream_id is not a motion stream or the batch is invalid
+            RuntimeError: If VRS file is not open or write fails
+        """
+        if not self.is_open():
+            raise RuntimeError("VRS file is not open")
+
+        if stream_id not in self._motion_stream_ids:
+            raise ValueError(
+                f"Stream ID {stream_id} is not a motion stream. Call add_motion_stream() first."
+            )
+
+        timestamp_list = [float(t) for t in timestamps]
+        sample_list = [[float(v) for v in sample] for sample in samples]
+
+        if not timestamp_list:
+            raise ValueError("timestamps must not be empty")
+
+        if len(timestamp_list) != len(sample_list):
+            raise ValueError(
+                f"timestamps and samples must have the same length, "
+                f"got {len(timestamp_list)} and {len(sample_list)}"
+            )
+
+        if any(len(sample) != 3 for sample in sample_list):
+            raise ValueError("Each sample must have exactly 3 values (x, y, z)")
+
+        if timestamp_list[0] < 0:
+            raise ValueError(f"timestamp must be non-negative, got {timestamp_list[0]}")
+
+        try:
+            assert self._writer is not None
+            with get_tracer().sampled_span("write_motion_record", "write"):
+                self._writer.write_motion_samples(
+                    stream_id, timestamp_list[0], timestamp_list, sample_list
+                )
+            self._stream_stats[stream_id].update(
+                timestamp_list[0], len(sample_list) * MOTION_SAMPLE_BYTES
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to write motion samples for stream {stream_id} "
+                f"at {timestamp_list[0]}s: {e}"
+            ) from e
+
+    def get_stream_stats(self, stream_id: int) -> StreamStats:
+        """Get the statistics of the data records written to a stream so far.
+
+        Args:
+            stream_id: Target stream ID
+
+        Returns:
+            Running statistics (updated by later writes; do not modify)
+
+        Raises:
+            ValueError: If stream_id doesn't exist
+        """
+        if stream_id not in self._stream_stats:
+            raise ValueError(f"Stream ID {stream_id} does not exist")
+        return self._stream_stats[stream_id]
+
+    def set_file_tag(self, tag_name: str, tag_value: str) -> None:
+        """Set a file tag, stored in the VRS file header at close.
+
+        Args:
+            tag_name: Tag name
+            tag_value: Tag value
+
+        Raises:
+            ValueError: If tag_name or tag_value is not a string
+            RuntimeError: If VRS file is not open or the tag cannot be set
+        """
+        if not self.is_open():
+            raise RuntimeError("VRS file is not open")
+
+        if not isinstance(tag_name, str) or not tag_name:
+            raise ValueError(f"tag_name must be a non-empty str, got {tag_name!r}")
+
+        if not isinstance(tag_value, str):
+            raise ValueError(f"tag_value must be str, got {type(tag_value).__name__}")
+
+        try:
+            assert self._writer is not None
+            self._writer.set_file_tag(tag_name, tag_value)
+        except Exception as e:
+            raise RuntimeError(f"Failed to set file tag '{tag_name}': {e}") from e
+
     def close(self) -> None:
         """Close the VRS file.
 
         This must be called to finalize the VRS file. Alternatively, use the
-        context manager (with statement) for automatic cleanup.
+        context manager (with statement) for automatic cleanup. The statistics
+        of every stream are written as its ``realsense_vrs.stats`` tag (except
+        in durable mode).
 
         Raises:
             RuntimeError: If close fails
         """
         if self._writer is not None and self.is_open():
             try:
-                self._writer.close()
+                with get_tracer().span("writer_close", "write", path=self._filepath):
+                    if not self._durable:
+                        for stream_id, stats in self._stream_stats.items():
+                            self._writer.set_stream_tag(stream_id, STREAM_STATS_TAG, stats.to_tag())
+                    self._writer.close()
             except Exception as e:
                 raise RuntimeError(f"Failed to close VRS file: {e}") from e
 
+    @property
+    def durable(self) -> bool:
+        """Whether records are flushed to disk periodically."""
+        return self._durable
+
     def is_open(self) -> bool:
         """Check if the VRS file is currently open.
 
@@ -228,3 +525,398 @@ class VRSWriter:
             return bool(self._writer.is_open())
         except Exception:
             return False
+
+
+def recover_vrs_file(source: Path | str, destination: Path | str | None = None) -> Path:
+    """Recover a VRS file that was not closed cleanly (e.g. after a crash).
+
+    Files written in durable mode hold every flushed record but may lack the
+    trailing index. The records are scanned, and all readable ones are copied
+    into a new file with a complete index.
+
+    Args:
+        source: Path to the partial VRS file
+        destination: Path of the recovered file (default: ``<name>.recovered.vrs``)
+
+    Returns:
+        Path of the recovered file
+
+    Raises:
+        FileNotFoundError: If source does not exist
+        ValueError: If destination equals source
+        RuntimeError: If the file cannot be read or written
+    """
+    source = Path(source)
+    if not source.exists():
+        raise FileNotFoundError(f"VRS file not found: {source}")
+
+    if destination is None:
+        destination = source.with_name(f"{source.stem}.recovered{source.suffix or '.vrs'}")
+    destination = Path(destination)
+
+    if destination.resolve() == source.resolve():
+        raise ValueError("destination must differ from source")
+
+    try:
+        pyvrs_writer.recover_file(str(source), str(destination))  # type: ignore[attr-defined]
+    except Exception as e:
+        raise RuntimeError(f"Failed to recover VRS file '{source}': {e}") from e
+    return destination
+
+
+class ChunkedVRSWriter:
+    """VRS writer that splits its output into self-contained chunk files.
+
+    Data is written to ``name_000.vrs``, ``name_001.vrs``, ... A new chunk is
+    started when the current one spans ``chunk_duration_sec`` seconds of
+    record timestamps or holds ``chunk_size_bytes`` bytes of payload. Every
+    chunk repeats all streams and their latest configuration records, so each
+    one can be read on its own. At close a manifest (``name.manifest.json``)
+    listing the chunks is written; VRSReader opens it as one logical file.
+
+    Chunks are split by the timestamp of the record being written, so records
+    should be written in (roughly) increasing timestamp order.
+
+    Example:
+        >>> with ChunkedVRSWriter("output.vrs", chunk_duration_sec=60.0) as writer:
+        ...     writer.add_stream(1001, "RGB Camera")
+        ...     writer.write_configuration(1001, {"width": 640, "height": 480})
+        ...     writer.write_data(1001, 0.0, b"image_data")
+    """
+
+    def __init__(
+        self,
+        filepath: Path | str,
+        chunk_duration_sec: float | None = None,
+        chunk_size_bytes: int | None = None,
+        flush_interval_sec: float | None = None,
+        completed_chunks: list[dict[str, Any]] | None = None,
+        completed_stream_stats: dict[int, list[StreamStats]] | None = None,
+    ) -> None:
+        """Initialize the writer and create the first chunk file.
+
+        Args:
+            filepath: Logical output path; chunks and manifest are created next to it
+            chunk_duration_sec: Maximum time span of a chunk (None = unlimited)
+            chunk_size_bytes: Maximum payload bytes of a chunk (None = unlimited)
+            flush_interval_sec: Durable mode of each chunk (see VRSWriter)
+            completed_chunks: Manifest entries of chunk files already written by an
+                interrupted conversion; writing resumes with the next chunk
+            completed_stream_stats: Per-stream statistics of completed_chunks
+
+        Raises:
+            ValueError: If filepath or a chunk limit is invalid
+            RuntimeError: If VRS file creation fails
+        """
+        if isinstance(filepath, str):
+            filepath = Path(filepath)
+
+        if not isinstance(filepath, Path):
+            raise ValueError(f"filepath must be Path or str, got {type(filepath).__name__}")
+
+        if chunk_duration_sec is not None and chunk_duration_sec <= 0:
+            raise ValueError(f"chunk_duration_sec must be positive, got {chunk_duration_sec}")
+
+        if chunk_size_bytes is not None and chunk_size_bytes <= 0:
+            raise ValueError(f"chunk_size_bytes must be positive, got {chunk_size_bytes}")
+
+        self._filepath = filepath
+        self._chunk_duration_sec = chunk_duration_sec
+        self._chunk_size_bytes = chunk_size_bytes
+        self._flush_interval_sec = flush_interval_sec
+
+        # Stream definitions (add_*_stream method name, args, kwargs) replayed in each chunk
+        self._stream_definitions: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+        self._configurations: dict[int, dict[str, Any]] = {}  # stream_id -> latest config
+        self._file_tags: dict[str, str] = {}  # File tags replayed in each chunk
+
+        # Manifest entries, statistics and paths of finished chunks
+        self._chunks: list[dict[str, Any]] = list(completed_chunks or [])
+        self._chunk_stream_stats: dict[int, list[StreamStats]] = {
+            stream_id: list(stats) for stream_id, stats in (completed_stream_stats or {}).items()
+        }
+        self._chunk_paths: list[Path] = [filepath.parent / chunk["path"] for chunk in self._chunks]
+        self._writer: VRSWriter | None = None
+        self._closed = False
+
+        # Statistics of the current chunk
+        self._chunk_start: float | None = None
+        self._chunk_end: float | None = None
+        self._chunk_records = 0
+        self._chunk_bytes = 0
+
+        self._open_chunk()
+
+    def __enter__(self) -> ChunkedVRSWriter:
+        """Context manager entry.
+
+        Returns:
+            self
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any,
+    ) -> None:
+        """Context manager exit. Automatically closes the last chunk."""
+        self.close()
+
+    @property
+    def chunk_paths(self) -> list[Path]:
+        """Paths of all chunk files created so far."""
+        return list(self._chunk_paths)
+
+    @property
+    def completed_chunks(self) -> list[dict[str, Any]]:
+        """Manifest entries of the finished chunks (all but the current one)."""
+        return [dict(chunk) for chunk in self._chunks]
+
+    @property
+    def completed_stream_stats(self) -> dict[int, list[StreamStats]]:
+        """Per-stream statistics of the finished chunks, in chunk order."""
+        return {stream_id: list(stats) for stream_id, stats in self._chunk_stream_stats.items()}
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path of the manifest written at close."""
+        return get_manifest_path(self._filepath)
+
+    def _open_chunk(self) -> None:
+        """Create the next chunk file and replay stream definitions and configurations."""
+        chunk_path = get_chunk_path(self._filepath, len(self._chunk_paths))
+        self._writer = VRSWriter(chunk_path, self._flush_interval_sec)
+        self._chunk_paths.append(chunk_path)
+        self._chunk_start = None
+        self._chunk_end = None
+        self._chunk_records = 0
+        self._chunk_bytes = 0
+
+        for method_name, args, kwargs in self._stream_definitions:
+            getattr(self._writer, method_name)(*args, **kwargs)
+        for stream_id, config_data in self._configurations.items():
+            self._writer.write_configuration(stream_id, config_data)
+        for tag_name, tag_value in self._file_tags.items():
+            self._writer.set_file_tag(tag_name, tag_value)
+
+    def _close_chunk(self) -> None:
+        """Close the current chunk file and record its manifest entry."""
+        assert self._writer is not None
+        self._writer.close()
+        for stream_id in self._get_stream_ids():
+            self._chunk_stream_stats.setdefault(stream_id, []).append(
+                self._writer.get_stream_stats(stream_id)
+            )
+        self._chunks.append({
+            "path": self._chunk_paths[-1].name,
+            "start_timestamp": self._chunk_start,
+            "end_timestamp": self._chunk_end,
+            "record_count": self._chunk_records,
+            "payload_bytes": self._chunk_bytes,
+        })
+        self._writer = None
+
+    def needs_new_chunk(self, timestamp: float) -> bool:
+        """Check whether a record at timestamp would start a new chunk.
+
+        Callers that keep state tied to a chunk (e.g. depth keyframes) can use
+        this with start_new_chunk() to split at a point of their choosing.
+
+        Args:
+            timestamp: Timestamp in seconds of the next record
+
+        Returns:
+            True if the current chunk is full
+        """
+        if self._chunk_records == 0:
+            return False
+        if (
+            self._chunk_duration_sec is not None
+            and self._chunk_start is not None
+            and timestamp - self._chunk_start >= self._chunk_duration_sec
+        ):
+            return True
+        return self._chunk_size_bytes is not None and self._chunk_bytes >= self._chunk_size_bytes
+
+    def start_new_chunk(self) -> None:
+        """Close the current chunk and continue writing into a new one.
+
+        Raises:
+            RuntimeError: If the writer is closed
+        """
+        if not self.is_open():
+            raise RuntimeError("VRS file is not open")
+        self._close_chunk()
+        if self._flush_interval_sec is not None:
+            # Durable mode: keep the manifest current so finished chunks survive a crash
+            self._write_manifest()
+        self._open_chunk()
+
+    def _add_stream_definition(self, method_name: str, *args: Any, **kwargs: Any) -> None:
+        """Add a stream to the current chunk and remember it for later chunks."""
+        if not self.is_open():
+            raise RuntimeError("VRS file is not open")
+        assert self._writer is not None
+        getattr(self._writer, method_name)(*args, **kwargs)
+        self._stream_definitions.append((method_name, args, kwargs))
+
+    def add_stream(self, stream_id: int, stream_name: str) -> None:
+        """Add a new stream to all chunks (see VRSWriter.add_stream())."""
+        self._add_stream_definition("add_stream", stream_id, stream_name)
+
+    def add_image_stream(
+        self,
+        stream_id: int,
+        stream_name: str,
+        pixel_format: str,
+        width: int,
+        height: int,
+        stride: int = 0,
+        image_codec: str = "raw",
+    ) -> None:
+        """Add a new image stream to all chunks (see VRSWriter.add_image_stream())."""
+        self._add_stream_definition(
+            "add_image_stream",
+            stream_id,
+            stream_name,
+            pixel_format,
+            width,
+            height,
+            stride,
+            image_codec=image_codec,
+        )
+
+    def add_motion_stream(self, stream_id: int, stream_name: str) -> None:
+        """Add a new motion sensor stream to all chunks (see VRSWriter.add_motion_stream())."""
+        self._add_stream_definition("add_motion_stream", stream_id, stream_name)
+
+    def write_configuration(self, stream_id: int, config_data: dict[str, Any]) -> None:
+        """Write a Configuration record; it is repeated at the start of later chunks.
+
+        Raises:
+            ValueError: If stream_id doesn't exist or config_data is not serializable
+            RuntimeError: If the writer is closed or write fails
+        """
+        if not self.is_open():
+            raise RuntimeError("VRS file is not open")
+        assert self._writer is not None
+        self._writer.write_configuration(stream_id, config_data)
+        self._configurations[stream_id] = config_data
+
+    def _before_record(self, timestamp: float) -> None:
+        """Roll over to a new chunk if the current one is full."""
+        if not self.is_open():
+            raise RuntimeError("VRS file is not open")
+        if self.needs_new_chunk(timestamp):
+            self.start_new_chunk()
+
+    def _after_record(self, timestamp: float, payload_bytes: int) -> None:
+        """Update the statistics of the current chunk."""
+        if self._chunk_start is None or timestamp < self._chunk_start:
+            self._chunk_start = timestamp
+        if self._chunk_end is None or timestamp > self._chunk_end:
+            self._chunk_end = timestamp
+        self._chunk_records += 1
+        self._chunk_bytes += payload_bytes
+
+    def write_data(self, stream_id: int, timestamp: float, data: bytes | list[int]) -> None:
+        """Write a Data record into the current chunk (see VRSWriter.write_data()).
+
+        Raises:
+            ValueError: If stream_id doesn't exist, timestamp is negative, or data is empty
+            RuntimeError: If the writer is closed or write fails
+        """
+        self._before_record(timestamp)
+        assert self._writer is not None
+        self._writer.write_data(stream_id, timestamp, data)
+        self._after_record(timestamp, len(data))
+
+    def write_motion_samples(
+        self,
+        stream_id: int,
+        timestamps: Sequence[float],
+        samples: Sequence[Sequence[float]],
+    ) -> None:
+        """Write a batch of motion samples into the current chunk.
+
+        See VRSWriter.write_motion_samples().
+
+        Raises:
+            ValueError: If stream_id is not a motion stream or the batch is invalid
+            RuntimeError: If the writer is closed or write fails
+        """
+        if len(timestamps) == 0:
+            raise ValueError("timestamps must not be empty")
+        timestamp = float(timestamps[0])
+        self._before_record(timestamp)
+        assert self._writer is not None
+        self._writer.write_motion_samples(stream_id, timestamps, samples)
+        self._after_record(timestamp, len(samples) * MOTION_SAMPLE_BYTES)
+
+    def _get_stream_ids(self) -> list[int]:
+        """IDs of the streams defined so far (the first argument of every add_*_stream call)."""
+        return [args[0] for _, args, _ in self._stream_definitions]
+
+    def get_stream_stats(self, stream_id: int) -> StreamStats:
+        """Get the statistics of the data records written to a stream, over all chunks.
+
+        Args:
+            stream_id: Target stream ID
+
+        Returns:
+            Statistics merged across chunks (a snapshot)
+
+        Raises:
+            ValueError: If stream_id doesn't exist
+        """
+        if stream_id not in self._get_stream_ids():
+            raise ValueError(f"Stream ID {stream_id} does not exist")
+        chunk_stats = list(self._chunk_stream_stats.get(stream_id, []))
+        if self._writer is not None:
+            chunk_stats.append(self._writer.get_stream_stats(stream_id))
+        return merge_stream_stats(chunk_stats)
+
+    def set_file_tag(self, tag_name: str, tag_value: str) -> None:
+        """Set a file tag on the current and all later chunks.
+
+        Stream statistics are kept per chunk by each chunk's VRSWriter.
+
+        Raises:
+            ValueError: If tag_name or tag_value is not a string
+            RuntimeError: If the writer is closed or the tag cannot be set
+        """
+        if not self.is_open():
+            raise RuntimeError("VRS file is not open")
+        assert self._writer is not None
+        self._writer.set_file_tag(tag_name, tag_value)
+        self._file_tags[tag_name] = tag_value
+
+    def close(self) -> None:
+        """Close the last chunk and write the manifest.
+
+        Raises:
+            RuntimeError: If close fails
+        """
+        if self._closed:
+            return
+        self._close_chunk()
+        # Only after the last chunk is closed, so a failed close can be retried
+        self._closed = True
+        self._write_manifest()
+
+    def _write_manifest(self) -> None:
+        """Write the manifest listing the finished chunks."""
+        try:
+            write_manifest(self.manifest_path, self._chunks)
+        except OSError as e:
+            raise RuntimeError(f"Failed to write VRS manifest '{self.manifest_path}': {e}") from e
+
+    def is_open(self) -> bool:
+        """Check if the writer is open.
+
+        Returns:
+            True until close() is called
+        """
+        return not self._closed and self._writer is not None and self._writer.is_open()
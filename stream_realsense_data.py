@@ -16,15 +16,20 @@ Usage:
 
     # Show first N messages
     python stream_realsense_data.py data/rosbag/d435i_walk_around.bag --limit 10
+
+    # Report peak memory and top Python allocation sites
+    python stream_realsense_data.py data/rosbag/d435i_walk_around.bag --profile-memory
 """
 
 import argparse
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Iterator, Any
 from dataclasses import dataclass
 from enum import Enum
 
+from scripts.memory_profile import MemoryProfiler
 from scripts.rosbag_reader import RosbagReader
 from scripts.timestamp_handler import (
     ros_timestamp_to_datetime,
@@ -112,47 +117,42 @@ def stream_sensor_data(
         all_topics = reader.get_available_topics()
 
         # Filter topics by sensor type
-        selected_topics = []
+        selected_topics: dict[str, SensorType] = {}
         for topic in all_topics:
             sensor_type = classify_topic(topic)
             if sensor_type is not None:
                 if sensor_types is None or sensor_type in sensor_types:
-                    selected_topics.append((topic, sensor_type))
+                    selected_topics[topic] = sensor_type
 
         if not selected_topics:
             return
 
-        # Collect all messages from all topics
-        all_messages: list[SensorMessage] = []
-
-        for topic, sensor_type in selected_topics:
-            for msg_data in reader.read_messages(topic):
-                timestamp_ns = msg_data["timestamp"]
-                timestamp_sec = ros_timestamp_to_seconds(timestamp_ns)
-
-                # Apply time filtering
-                if start_time is not None and timestamp_sec < start_time:
-                    continue
-                if end_time is not None and timestamp_sec >= end_time:
-                    continue
-
-                sensor_msg = SensorMessage(
-                    timestamp_ns=timestamp_ns,
-                    timestamp_sec=timestamp_sec,
-                    sensor_type=sensor_type,
-                    topic=topic,
-                    msgtype=msg_data["msgtype"],
-                    data=msg_data["data"],
-                )
-                all_messages.append(sensor_msg)
-
-        # Sort by timestamp
-        all_messages.sort()
-
-        # Yield messages (with optional limit)
+        # Resolve the time window (relative to bag start) to absolute timestamps
+        # so the reader can seek via the chunk index instead of scanning
+        bag_start_ns = reader.get_start_time()
+        start_ns = None
+        stop_ns = None
+        if start_time is not None:
+            start_ns = bag_start_ns + int(start_time * 1e9)
+        if end_time is not None:
+            stop_ns = bag_start_ns + int(end_time * 1e9)
+
+        # Single chronological pass over all selected topics (no buffering/sorting)
         count = 0
-        for msg in all_messages:
-            yield msg
+        for msg_data in reader.read_messages(
+            list(selected_topics), start_ns=start_ns, stop_ns=stop_ns
+        ):
+            timestamp_ns = msg_data["timestamp"]
+            topic = msg_data["connection"].topic
+
+            yield SensorMessage(
+                timestamp_ns=timestamp_ns,
+                timestamp_sec=ros_timestamp_to_seconds(timestamp_ns),
+                sensor_type=selected_topics[topic],
+                topic=topic,
+                msgtype=msg_data["msgtype"],
+                data=msg_data["data"],
+            )
             count += 1
             if limit is not None and count >= limit:
                 break
@@ -179,6 +179,9 @@ Examples:
 
   # Save to file
   %(prog)s data/rosbag/d435i_walk_around.bag > output.log
+
+  # Memory profile (summary on stderr, report in d435i_walk_around.memory.json)
+  %(prog)s data/rosbag/d435i_walk_around.bag --format csv --profile-memory > /dev/null
         """,
     )
 
@@ -233,6 +236,16 @@ Examples:
         help="Enable verbose output (to stderr)",
     )
 
+    parser.add_argument(
+        "--profile-memory",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="REPORT",
+        help="Sample RSS and trace Python allocations while streaming; writes a JSON "
+        "report (default: BAGFILE.memory.json) and a summary to stderr",
+    )
+
     args = parser.parse_args()
 
     # Validate input
@@ -263,6 +276,12 @@ Examples:
             )
         print(file=sys.stderr)
 
+    # Memory profiling (report written even if streaming fails)
+    profiler = None
+    if args.profile_memory is not None:
+        profiler = MemoryProfiler()
+        profiler.start()
+
     # Stream data
     try:
         # Print header
@@ -273,47 +292,50 @@ Examples:
             first = True
 
         count = 0
-        for msg in stream_sensor_data(
+        messages = stream_sensor_data(
             args.bagfile,
             start_time=args.start,
             end_time=args.end,
             sensor_types=sensor_types,
             limit=args.limit,
-        ):
-            count += 1
-
-            if args.format == "human":
-                dt = ros_timestamp_to_datetime(msg.timestamp_ns)
-                print(
-                    f"[{msg.timestamp_sec:10.6f}s] "
-                    f"{msg.sensor_type.value:6s} | "
-                    f"{format_timestamp_iso(dt)} | "
-                    f"{msg.topic}"
-                )
-            elif args.format == "csv":
-                dt = ros_timestamp_to_datetime(msg.timestamp_ns)
-                print(
-                    f"{msg.timestamp_sec:.6f},"
-                    f"{format_timestamp_iso(dt)},"
-                    f"{msg.sensor_type.value},"
-                    f"{msg.topic},"
-                    f"{msg.msgtype}"
-                )
-            elif args.format == "json":
-                import json
-
-                dt = ros_timestamp_to_datetime(msg.timestamp_ns)
-                entry = {
-                    "timestamp_sec": msg.timestamp_sec,
-                    "timestamp_iso": format_timestamp_iso(dt),
-                    "sensor_type": msg.sensor_type.value,
-                    "topic": msg.topic,
-                    "msgtype": msg.msgtype,
-                }
-                if not first:
-                    print(",")
-                print(f"  {json.dumps(entry)}", end="")
-                first = False
+        )
+        stage = profiler.stage("stream_messages") if profiler is not None else nullcontext()
+        with stage:
+            for msg in messages:
+                count += 1
+
+                if args.format == "human":
+                    dt = ros_timestamp_to_datetime(msg.timestamp_ns)
+                    print(
+                        f"[{msg.timestamp_sec:10.6f}s] "
+                        f"{msg.sensor_type.value:6s} | "
+                        f"{format_timestamp_iso(dt)} | "
+                        f"{msg.topic}"
+                    )
+                elif args.format == "csv":
+                    dt = ros_timestamp_to_datetime(msg.timestamp_ns)
+                    print(
+                        f"{msg.timestamp_sec:.6f},"
+                        f"{format_timestamp_iso(dt)},"
+                        f"{msg.sensor_type.value},"
+                        f"{msg.topic},"
+                        f"{msg.msgtype}"
+                    )
+                elif args.format == "json":
+                    import json
+
+                    dt = ros_timestamp_to_datetime(msg.timestamp_ns)
+                    entry = {
+                        "timestamp_sec": msg.timestamp_sec,
+                        "timestamp_iso": format_timestamp_iso(dt),
+                        "sensor_type": msg.sensor_type.value,
+                        "topic": msg.topic,
+                        "msgtype": msg.msgtype,
+                    }
+                    if not first:
+                        print(",")
+                    print(f"  {json.dumps(entry)}", end="")
+                    first = False
 
         if args.format == "json":
             print("\n]")
@@ -331,6 +353,18 @@ Examples:
             traceback.print_exc()
         return 1
 
+    finally:
+        if profiler is not None:
+            profiler.stop()
+            report_path = (
+                Path(args.profile_memory)
+                if args.profile_memory
+                else args.bagfile.with_suffix(".memory.json")
+            )
+            profiler.write_report(report_path)
+            print(f"\nMemory profile ({report_path}):", file=sys.stderr)
+            print(profiler.format_summary(), file=sys.stderr)
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -1,8 +1,10 @@
 """Pytest configuration and shared fixtures."""
 
-import pytest
 from pathlib import Path
 
+import numpy as np
+import pytest
+
 
 @pytest.fixture
 def data_dir() -> Path:
@@ -11,9 +13,9 @@ def data_dir() -> Path:
 
 
 @pytest.fixture
-def rosbag_path(data_dir: Path) -> Path:
-    """Return the path to the primary test ROSbag file (outdoor scene with IMU)."""
-    return data_dir / "rosbag" / "d435i_walk_around.bag"
+def rosbag_path(synthetic_rosbag_path: Path) -> Path:
+    """Return the path to the primary test ROSbag file (synthetic D435i bag with IMU)."""
+    return synthetic_rosbag_path
 
 
 @pytest.fixture
@@ -25,3 +27,77 @@ def sample_rosbag_paths(data_dir: Path) -> dict[str, Path]:
         "walking": rosbag_dir / "sample_d435i.bag",
         "user_data": rosbag_dir / "20251119_112125.bag",
     }
+
+
+@pytest.fixture
+def small_rosbag_path(tmp_path: Path) -> Path:
+    """Write a small ROS1 bag with two IMU topics and return its path.
+
+    Accel and Gyro messages are written at 10 Hz for 1 second, starting at
+    t = 1000 s (Accel) and t = 1000.05 s (Gyro).
+    """
+    from rosbags.rosbag1 import Writer
+    from rosbags.typesys import Stores, get_typestore
+
+    typestore = get_typestore(Stores.ROS1_NOETIC)
+    imu_type = typestore.types["sensor_msgs/msg/Imu"]
+    header_type = typestore.types["std_msgs/msg/Header"]
+    time_type = typestore.types["builtin_interfaces/msg/Time"]
+    vector3_type = typestore.types["geometry_msgs/msg/Vector3"]
+    quaternion_type = typestore.types["geometry_msgs/msg/Quaternion"]
+
+    bag_path = tmp_path / "small.bag"
+    topics = {
+        "/device_0/sensor_2/Accel_0/imu/data": 0,
+        "/device_0/sensor_2/Gyro_0/imu/data": 50_000_000,
+    }
+    with Writer(bag_path) as writer:
+        connections = {
+            topic: writer.add_connection(topic, imu_type.__msgtype__, typestore=typestore)
+            for topic in topics
+        }
+        for i in range(10):
+            for topic, offset_ns in topics.items():
+                timestamp_ns = 1_000_000_000_000 + i * 100_000_000 + offset_ns
+                msg = imu_type(
+                    header=header_type(
+                        seq=i,
+                        stamp=time_type(sec=timestamp_ns // 10**9, nanosec=timestamp_ns % 10**9),
+                        frame_id="0",
+                    ),
+                    orientation=quaternion_type(x=0.0, y=0.0, z=0.0, w=1.0),
+                    orientation_covariance=np.zeros(9),
+                    angular_velocity=vector3_type(x=0.1 * i, y=0.2 * i, z=0.3 * i),
+                    angular_velocity_covariance=np.zeros(9),
+                    linear_acceleration=vector3_type(x=1.0 * i, y=2.0 * i, z=9.8),
+                    linear_acceleration_covariance=np.zeros(9),
+                )
+                writer.write(
+                    connections[topic],
+                    timestamp_ns,
+                    typestore.serialize_ros1(msg, imu_type.__msgtype__),
+                )
+    return bag_path
+
+
+@pytest.fixture
+def synthetic_rosbag_path(tmp_path: Path) -> Path:
+    """Write a small synthetic D435i bag and return its path.
+
+    0.5 s of 64x48 Color/Depth at 30 fps plus IMU, info, option and
+    metadata topics (see scripts.synthetic_bag).
+    """
+    from scripts.synthetic_bag import SyntheticBagConfig, generate_synthetic_bag
+
+    bag_path = tmp_path / "synthetic_d435i.bag"
+    generate_synthetic_bag(
+        bag_path,
+        SyntheticBagConfig(
+            duration_sec=0.5,
+            color_width=64,
+            color_height=48,
+            depth_width=64,
+            depth_height=48,
+        ),
+    )
+    return bag_path
@@ -0,0 +1,81 @@
+"""Tests for the persistent ROS bag sidecar index."""
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+
+class TestBagIndex:
+    """Test cases for building, persisting and validating bag indexes."""
+
+    def test_reader_creates_sidecar_on_first_open(self, small_rosbag_path: Path) -> None:
+        """Test that RosbagReader writes the .bagidx sidecar on first use."""
+        from scripts.bag_index import get_index_path
+        from scripts.rosbag_reader import RosbagReader
+
+        index_path = get_index_path(small_rosbag_path)
+        assert not index_path.exists()
+
+        with RosbagReader(small_rosbag_path) as reader:
+            reader.get_available_topics()
+
+        assert index_path.exists()
+        assert index_path.name == "small.bagidx"
+
+    def test_sidecar_is_loaded_without_opening_bag(self, small_rosbag_path: Path) -> None:
+        """Test that a valid sidecar answers summary queries without the bag reader."""
+        from scripts.rosbag_reader import RosbagReader
+
+        with RosbagReader(small_rosbag_path) as reader:
+            expected_info = reader.get_topics_info()
+
+        with RosbagReader(small_rosbag_path) as reader:
+            assert reader.get_topics_info() == expected_info
+            assert reader.get_duration() > 0.9
+            assert reader._reader is None
+
+    def test_index_contents(self, small_rosbag_path: Path) -> None:
+        """Test per-topic counts, time ranges and timestamp arrays."""
+        from scripts.rosbag_reader import RosbagReader
+
+        topic = "/device_0/sensor_2/Gyro_0/imu/data"
+        with RosbagReader(small_rosbag_path) as reader:
+            assert reader.get_message_count(topic) == 10
+            assert reader.get_topic_time_range(topic) == (
+                1_000_050_000_000,
+                1_000_950_000_000,
+            )
+            timestamps = reader.get_message_timestamps(topic)
+            assert timestamps.dtype == np.int64
+            assert len(timestamps) == 10
+            assert reader.get_topic_time_range("/missing") is None
+            assert reader.get_message_count("/missing") == 0
+
+    def test_stale_sidecar_is_rebuilt(self, small_rosbag_path: Path) -> None:
+        """Test that a sidecar whose bag mtime changed is rebuilt."""
+        from scripts.bag_index import BagIndex, get_index_path
+        from scripts.rosbag_reader import RosbagReader
+
+        with RosbagReader(small_rosbag_path) as reader:
+            reader.get_available_topics()
+
+        stat = small_rosbag_path.stat()
+        os.utime(small_rosbag_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with RosbagReader(small_rosbag_path) as reader:
+            reader.get_available_topics()
+            assert reader._reader is not None
+
+        index = BagIndex.load(get_index_path(small_rosbag_path))
+        assert index.is_valid_for(small_rosbag_path)
+
+    def test_index_disabled(self, small_rosbag_path: Path) -> None:
+        """Test that use_index=False keeps the index in memory only."""
+        from scripts.bag_index import get_index_path
+        from scripts.rosbag_reader import RosbagReader
+
+        with RosbagReader(small_rosbag_path, use_index=False) as reader:
+            assert len(reader.get_available_topics()) == 2
+
+        assert not get_index_path(small_rosbag_path).exists()
@@ -0,0 +1,111 @@
+"""Tests for the benchmark harness (results format and baseline comparison)."""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.harness import (
+    BenchmarkResult,
+    compare_results,
+    load_results,
+    run_isolated,
+    write_results,
+)
+
+
+def _result(name: str, seconds: float, mb_per_sec: float) -> BenchmarkResult:
+    result = BenchmarkResult(name=name)
+    result.add("seconds", seconds, "s")
+    result.add("mb_per_sec", mb_per_sec, "MB/s", higher_is_better=True)
+    return result
+
+
+def _answer_case(name: str) -> BenchmarkResult:
+    """Module-level case for run_isolated()."""
+    result = BenchmarkResult(name=name)
+    result.add("answer", 42, "")
+    return result
+
+
+def _failing_case(name: str) -> BenchmarkResult:
+    raise RuntimeError("boom")
+
+
+class TestCompareResults:
+    """Test cases for compare_results()."""
+
+    def test_no_regression_within_threshold(self) -> None:
+        """Test that small changes are not regressions."""
+        baseline = [_result("convert[10MB]", 1.0, 100.0)]
+        current = [_result("convert[10MB]", 1.05, 96.0)]
+
+        assert compare_results(current, baseline, threshold=0.10) == []
+
+    def test_regression_direction(self) -> None:
+        """Test that slower times and lower throughput are both regressions."""
+        baseline = [_result("convert[10MB]", 1.0, 100.0)]
+        current = [_result("convert[10MB]", 1.5, 50.0)]
+
+        regressions = {r.metric: r for r in compare_results(current, baseline, threshold=0.10)}
+
+        assert regressions["seconds"].change == pytest.approx(0.5)
+        assert regressions["mb_per_sec"].change == pytest.approx(0.5)
+
+    def test_improvements_are_not_regressions(self) -> None:
+        """Test that faster results pass."""
+        baseline = [_result("convert[10MB]", 1.0, 100.0)]
+        current = [_result("convert[10MB]", 0.5, 200.0)]
+
+        assert compare_results(current, baseline) == []
+
+    def test_missing_and_failed_cases_are_skipped(self) -> None:
+        """Test that only cases present and successful on both sides are compared."""
+        baseline = [_result("convert[10MB]", 1.0, 100.0), _result("read[10MB]", 1.0, 100.0)]
+        current = [
+            BenchmarkResult(name="convert[10MB]", error="skipped"),
+            _result("inspect[10MB]", 9.0, 1.0),
+        ]
+
+        assert compare_results(current, baseline) == []
+
+
+class TestResultsFile:
+    """Test cases for write_results() / load_results()."""
+
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        """Test that results survive a JSON roundtrip."""
+        results = [
+            _result("convert[10MB]", 1.0, 100.0),
+            BenchmarkResult(name="read[10MB]", error="x"),
+        ]
+        path = tmp_path / "results.json"
+
+        write_results(path, results, {"sizes_mb": [10]})
+
+        assert load_results(path) == results
+
+    def test_invalid_file(self, tmp_path: Path) -> None:
+        """Test that other JSON files are rejected."""
+        path = tmp_path / "other.json"
+        path.write_text('{"format": "vrs-chunks"}')
+
+        with pytest.raises(ValueError):
+            load_results(path)
+
+
+class TestRunIsolated:
+    """Test cases for run_isolated()."""
+
+    def test_adds_peak_rss(self) -> None:
+        """Test that a case runs in a worker and reports its peak RSS."""
+        result = run_isolated("case", _answer_case, "case")
+
+        assert result.error is None
+        assert result.metrics["answer"].value == 42
+        assert result.metrics["peak_rss_mb"].value > 0
+
+    def test_failure_is_recorded(self) -> None:
+        """Test that an exception becomes an error result."""
+        result = run_isolated("failing", _failing_case, "failing")
+
+        assert result.error is not None and "boom" in result.error
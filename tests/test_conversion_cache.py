@@ -0,0 +1,190 @@
+"""Tests for the content-addressed conversion cache."""
+
+import os
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from scripts import conversion_cache
+from scripts.conversion_cache import (
+    OUTPUT_FORMAT_VERSION,
+    SAMPLE_BLOCK_SIZE,
+    ConversionCache,
+    compute_cache_key,
+    fingerprint_bag,
+)
+from scripts.rosbag_to_vrs_converter import (
+    RosbagToVRSConverter,
+    create_rgbd_config,
+    with_color_codec,
+)
+from scripts.vrs_manifest import get_manifest_path, read_manifest, write_manifest
+
+RESULT = {
+    "input_bag_size": 1000,
+    "output_vrs_size": 400,
+    "compression_ratio": 0.4,
+    "total_messages": 20,
+    "messages_per_stream": {1001: 10, 1002: 10},
+    "duration_sec": 1.0,
+    "conversion_time_sec": 2.0,
+    "output_files": [],
+    "cache_hit": False,
+}
+
+
+def _write_output(path: Path, size: int) -> Path:
+    path.write_bytes(os.urandom(size))
+    return path
+
+
+def _write_chunked_output(vrs_path: Path, sizes: list[int]) -> list[Path]:
+    chunk_paths = [
+        _write_output(vrs_path.with_name(f"{vrs_path.stem}_{i:03d}.vrs"), size)
+        for i, size in enumerate(sizes)
+    ]
+    write_manifest(
+        get_manifest_path(vrs_path),
+        [
+            {"path": path.name, "start_timestamp": float(i), "end_timestamp": i + 0.9,
+             "record_count": 1, "payload_bytes": size}
+            for i, (path, size) in enumerate(zip(chunk_paths, sizes))
+        ],
+    )
+    return chunk_paths
+
+
+class TestFingerprint:
+    """Test cases for fingerprint_bag() and compute_cache_key()."""
+
+    def test_sampled_blocks(self, tmp_path: Path) -> None:
+        """Test that sampled blocks are hashed and bytes between them are not."""
+        path = _write_output(tmp_path / "a.bag", 64 * SAMPLE_BLOCK_SIZE)
+        fingerprint = fingerprint_bag(path, sample_blocks=4)
+        data = bytearray(path.read_bytes())
+
+        # Byte inside the last sampled block
+        data[-1] ^= 0xFF
+        path.write_bytes(data)
+        changed_last = fingerprint_bag(path, sample_blocks=4)
+        # Byte between sampled blocks: only a full hash notices it
+        data[-1] ^= 0xFF
+        data[2 * SAMPLE_BLOCK_SIZE] ^= 0xFF
+        path.write_bytes(data)
+
+        assert changed_last != fingerprint
+        assert fingerprint_bag(path, sample_blocks=4) == fingerprint
+        assert fingerprint_bag(path, sample_blocks=0) != fingerprint_bag(
+            _write_output(tmp_path / "b.bag", 1), sample_blocks=0
+        )
+        with pytest.raises(ValueError):
+            fingerprint_bag(path, sample_blocks=1)
+
+    def test_cache_key_covers_output_options(self) -> None:
+        """Test that the key changes with output options, but not with verbosity or threads."""
+        config = create_rgbd_config()
+        key = compute_cache_key("bag", config)
+
+        assert compute_cache_key("bag", replace(config, verbose=True, encoder_threads=8)) == key
+        assert compute_cache_key("other", config) != key
+        assert compute_cache_key("bag", replace(config, compression="zstd")) != key
+        # Parallel conversions write chunked output even without chunk limits
+        assert compute_cache_key("bag", config, parallel=True) != key
+        assert compute_cache_key("bag", replace(
+            config, topic_mapping=with_color_codec(config.topic_mapping, "png")
+        )) != key
+
+    def test_cache_key_covers_output_format_version(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that bumping the output format version invalidates existing keys."""
+        config = create_rgbd_config()
+        key = compute_cache_key("bag", config)
+
+        monkeypatch.setattr(conversion_cache, "OUTPUT_FORMAT_VERSION", OUTPUT_FORMAT_VERSION + 1)
+
+        assert compute_cache_key("bag", config) != key
+
+
+class TestConversionCache:
+    """Test cases for ConversionCache."""
+
+    def test_store_and_restore(self, tmp_path: Path) -> None:
+        """Test that a stored output is copied to a new path with its result."""
+        cache = ConversionCache(tmp_path / "cache")
+        output = _write_output(tmp_path / "first.vrs", 400)
+
+        assert cache.restore("key", tmp_path / "second.vrs") is None
+        assert cache.store("key", RESULT, output, [output], chunked=False)
+        assert not cache.store("key", RESULT, output, [output], chunked=False)
+        restored = cache.restore("key", tmp_path / "second.vrs")
+
+        assert restored is not None
+        assert restored["output_files"] == [str(tmp_path / "second.vrs")]
+        assert restored["total_messages"] == 20
+        assert "cache_hit" not in restored
+        assert (tmp_path / "second.vrs").read_bytes() == output.read_bytes()
+
+    def test_chunked_output(self, tmp_path: Path) -> None:
+        """Test that chunks and the manifest are renamed after the requested output."""
+        cache = ConversionCache(tmp_path / "cache")
+        chunks = _write_chunked_output(tmp_path / "first.vrs", [100, 200])
+        cache.store("key", RESULT, tmp_path / "first.vrs", chunks, chunked=True)
+
+        restored = cache.restore("key", tmp_path / "second.vrs")
+
+        assert restored is not None
+        assert restored["output_files"] == [
+            str(tmp_path / "second_000.vrs"), str(tmp_path / "second_001.vrs")
+        ]
+        manifest = read_manifest(tmp_path / "second.manifest.json")
+        assert [chunk["path"] for chunk in manifest["chunks"]] == [
+            "second_000.vrs", "second_001.vrs"
+        ]
+        assert (tmp_path / "second_001.vrs").read_bytes() == chunks[1].read_bytes()
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Test that the least recently used entries are evicted above the size limit."""
+        cache = ConversionCache(tmp_path / "cache", max_size_bytes=3500)
+        output = _write_output(tmp_path / "out.vrs", 1000)
+        cache.store("a", RESULT, output, [output], chunked=False)
+        cache.store("b", RESULT, output, [output], chunked=False)
+        os.utime(tmp_path / "cache" / "a" / "result.json", (1, 1))
+        os.utime(tmp_path / "cache" / "b" / "result.json", (2, 2))
+        cache.restore("a", tmp_path / "restored.vrs")  # "a" becomes the most recent
+
+        cache.store("c", RESULT, output, [output], chunked=False)
+
+        assert sorted(path.name for path in (tmp_path / "cache").iterdir()) == ["a", "c"]
+        assert cache.size_bytes() <= 3500
+        # Outputs larger than the whole cache are not stored
+        large = _write_output(tmp_path / "large.vrs", 4000)
+        assert not cache.store("d", RESULT, large, [large], chunked=False)
+
+    def test_damaged_entry_is_a_miss(self, tmp_path: Path) -> None:
+        """Test that an entry with missing files is removed and reported as a miss."""
+        cache = ConversionCache(tmp_path / "cache")
+        output = _write_output(tmp_path / "out.vrs", 10)
+        cache.store("key", RESULT, output, [output], chunked=False)
+        (tmp_path / "cache" / "key" / "output.vrs").unlink()
+
+        assert cache.restore("key", tmp_path / "restored.vrs") is None
+        assert not (tmp_path / "cache" / "key").exists()
+
+
+def test_converter_cache_hit(synthetic_rosbag_path: Path, tmp_path: Path) -> None:
+    """Test that the converter returns a cached output without converting."""
+    cache = ConversionCache(tmp_path / "cache")
+    config = create_rgbd_config()
+    output = _write_output(tmp_path / "cached.vrs", 400)
+    key = cache.get_key(synthetic_rosbag_path, config)
+    cache.store(key, RESULT, output, [output], chunked=False)
+    converter = RosbagToVRSConverter(
+        synthetic_rosbag_path, tmp_path / "out.vrs", config, cache=cache
+    )
+
+    result = converter.convert()
+
+    assert result.cache_hit
+    assert result.messages_per_stream == {1001: 10, 1002: 10}
+    assert result.output_files == [str(tmp_path / "out.vrs")]
+    assert (tmp_path / "out.vrs").read_bytes() == output.read_bytes()
@@ -0,0 +1,115 @@
+"""Tests for resumable conversion checkpoints."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts.conversion_checkpoint import (
+    ConversionCheckpoint,
+    get_checkpoint_path,
+    read_checkpoint,
+    write_checkpoint,
+)
+from scripts.rosbag_to_vrs_converter import RosbagToVRSConverter, create_rgbd_imu_config
+from scripts.vrs_summary import StreamStats
+
+
+def _checkpoint(conversion_key: str = "key") -> ConversionCheckpoint:
+    return ConversionCheckpoint(
+        conversion_key=conversion_key,
+        resume_timestamp=2_000_000_000,
+        resume_skip=1,
+        chunks=[{"path": "out_000.vrs", "start_timestamp": 0.0, "end_timestamp": 1.9,
+                 "record_count": 3, "payload_bytes": 12}],
+        chunk_stream_stats={1001: [StreamStats(3, 0.0, 1.9, 12, 0.9, 1.0)]},
+        total_messages=3,
+        messages_per_stream={1001: 3},
+        option_values={"/device_0/sensor_1/option/Exposure/value": 100.0},
+        metadata={"messages": {}},
+    )
+
+
+def _chunked_config():
+    config = create_rgbd_imu_config()
+    config.chunk_duration_sec = 0.2
+    config.checkpoint = True
+    return config
+
+
+class TestConversionCheckpoint:
+    """Test cases for the checkpoint format."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test that a checkpoint is read back unchanged, with integer stream IDs."""
+        path = get_checkpoint_path(tmp_path / "out.vrs")
+        write_checkpoint(path, _checkpoint())
+
+        checkpoint = read_checkpoint(path)
+
+        assert path.name == "out.checkpoint.json"
+        assert checkpoint == _checkpoint()
+        assert checkpoint.last_timestamps() == {1001: 1.9}
+        assert json.loads(path.read_text())["last_timestamps"] == {"1001": 1.9}
+
+    def test_invalid_checkpoint(self, tmp_path: Path) -> None:
+        """Test that files that are not checkpoints are rejected."""
+        path = tmp_path / "out.checkpoint.json"
+        path.write_text('{"format": "vrs-chunks"}')
+        with pytest.raises(ValueError):
+            read_checkpoint(path)
+
+        path.write_text("{")
+        with pytest.raises(ValueError):
+            read_checkpoint(path)
+
+
+class TestConverterCheckpoint:
+    """Test cases for checkpointing in RosbagToVRSConverter."""
+
+    def test_requires_chunked_output(self, synthetic_rosbag_path: Path, tmp_path: Path) -> None:
+        """Test that checkpointing a single-file conversion is rejected."""
+        config = create_rgbd_imu_config()
+        config.checkpoint = True
+        converter = RosbagToVRSConverter(synthetic_rosbag_path, tmp_path / "out.vrs", config)
+
+        with pytest.raises(ValueError, match="chunked"):
+            converter.convert()
+
+    def test_metadata_caches_round_trip(self, synthetic_rosbag_path: Path, tmp_path: Path) -> None:
+        """Test that exported pre-pass caches restore the same messages without the pre-pass."""
+        converter = RosbagToVRSConverter(
+            synthetic_rosbag_path, tmp_path / "out.vrs", create_rgbd_imu_config()
+        )
+        converter._run_cache_passes(converter._open_rosbag())
+        metadata = json.loads(json.dumps(converter._export_metadata_caches()))
+
+        resumed = RosbagToVRSConverter(
+            synthetic_rosbag_path, tmp_path / "out.vrs", create_rgbd_imu_config()
+        )
+        resumed._import_metadata_caches(resumed._open_rosbag(), metadata)
+
+        for cache_name in ("camera_info_cache", "transform_cache", "stream_info_cache"):
+            assert resumed._stats[cache_name].keys() == converter._stats[cache_name].keys()
+        topic = "/device_0/sensor_1/Color_0/info/camera_info"
+        assert list(resumed._stats["camera_info_cache"][topic].K) == list(
+            converter._stats["camera_info_cache"][topic].K
+        )
+        assert resumed._stats["options_cache"] == converter._stats["options_cache"]
+        assert resumed._stats["device_info_cache"] == converter._stats["device_info_cache"]
+
+    def test_load_checkpoint(self, synthetic_rosbag_path: Path, tmp_path: Path) -> None:
+        """Test that only a checkpoint of the same bag and configuration is resumed."""
+        converter = RosbagToVRSConverter(
+            synthetic_rosbag_path, tmp_path / "out.vrs", _chunked_config()
+        )
+        assert converter._load_checkpoint() is None
+        path = get_checkpoint_path(tmp_path / "out.vrs")
+
+        write_checkpoint(path, _checkpoint(converter._conversion_key))
+        assert converter._load_checkpoint() == _checkpoint(converter._conversion_key)
+
+        other_config = _chunked_config()
+        other_config.compression = "zstd"
+        other = RosbagToVRSConverter(synthetic_rosbag_path, tmp_path / "out.vrs", other_config)
+        assert other._load_checkpoint() is None
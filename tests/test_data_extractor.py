@@ -1,8 +1,9 @@
 """Tests for RealSense data extraction functionality."""
 
-import pytest
 from pathlib import Path
+
 import numpy as np
+import pytest
 
 
 class TestDataExtractor:
@@ -153,9 +154,10 @@ class TestDataExtractor:
 
     def test_extract_with_timestamp_conversion(self, rosbag_path: Path) -> None:
         """Test that extracted data includes properly converted timestamps."""
+        from datetime import datetime
+
         from scripts.data_extractor import DataExtractor
         from scripts.rosbag_reader import RosbagReader
-        from datetime import datetime
 
         extractor = DataExtractor()
         reader = RosbagReader(rosbag_path)
@@ -185,3 +187,203 @@ class TestDataExtractor:
 
         with pytest.raises((ValueError, TypeError, Exception)):
             extractor.extract_image(invalid_data, "invalid/MessageType")
+
+
+def _serialize_image(
+    width: int, height: int, encoding: str, pixels: np.ndarray, step: int | None = None
+) -> bytes:
+    """Serialize a sensor_msgs/Image message in ROS1 format."""
+    from rosbags.typesys import Stores, get_typestore
+
+    typestore = get_typestore(Stores.ROS1_NOETIC)
+    image_type = typestore.types["sensor_msgs/msg/Image"]
+    header_type = typestore.types["std_msgs/msg/Header"]
+    time_type = typestore.types["builtin_interfaces/msg/Time"]
+
+    row_bytes = pixels.reshape(height, -1).view(np.uint8)
+    if step is None:
+        step = row_bytes.shape[1]
+    padded = np.zeros((height, step), dtype=np.uint8)
+    padded[:, : row_bytes.shape[1]] = row_bytes
+
+    msg = image_type(
+        header=header_type(seq=1, stamp=time_type(sec=5, nanosec=7), frame_id="camera"),
+        height=height,
+        width=width,
+        encoding=encoding,
+        is_bigendian=0,
+        step=step,
+        data=padded.reshape(-1),
+    )
+    return bytes(typestore.serialize_ros1(msg, image_type.__msgtype__))
+
+
+class TestImageDecoding:
+    """Test cases for decoding sensor_msgs/Image payloads into arrays."""
+
+    @pytest.mark.parametrize(
+        ("encoding", "dtype", "channels"),
+        [
+            ("rgb8", np.uint8, 3),
+            ("bgr8", np.uint8, 3),
+            ("16UC1", np.uint16, 1),
+            ("mono16", np.uint16, 1),
+            ("mono8", np.uint8, 1),
+            ("y8", np.uint8, 1),
+        ],
+    )
+    def test_decode_supported_encodings(self, encoding: str, dtype: type, channels: int) -> None:
+        """Test that supported encodings decode into correctly shaped arrays."""
+        from scripts.data_extractor import DataExtractor
+
+        shape = (3, 4, channels) if channels > 1 else (3, 4)
+        pixels = np.arange(np.prod(shape), dtype=dtype).reshape(shape)
+        rawdata = _serialize_image(4, 3, encoding, pixels)
+
+        image = DataExtractor().extract_image(rawdata, "sensor_msgs/msg/Image", 1_000)
+
+        assert image["width"] == 4
+        assert image["height"] == 3
+        assert image["encoding"] == encoding
+        assert image["frame_id"] == "camera"
+        assert image["header_timestamp_ns"] == 5_000_000_007
+        assert image["data"].dtype == dtype
+        assert image["data"].shape == shape
+        np.testing.assert_array_equal(image["data"], pixels)
+
+    def test_decode_is_zero_copy_with_row_padding(self) -> None:
+        """Test that padded rows are exposed as a strided view over the buffer."""
+        from scripts.data_extractor import DataExtractor
+
+        pixels = np.arange(12, dtype=np.uint16).reshape(3, 4)
+        rawdata = bytearray(_serialize_image(4, 3, "16UC1", pixels, step=10))
+
+        image = DataExtractor().extract_image(rawdata, "sensor_msgs/msg/Image")
+
+        np.testing.assert_array_equal(image["data"], pixels)
+        assert np.shares_memory(image["data"], np.frombuffer(rawdata, dtype=np.uint8))
+
+    def test_unsupported_encoding(self) -> None:
+        """Test that unsupported encodings raise ValueError."""
+        from scripts.data_extractor import DataExtractor
+
+        rawdata = _serialize_image(2, 2, "bayer_rggb8", np.zeros((2, 2), dtype=np.uint8))
+
+        with pytest.raises(ValueError, match="Unsupported image encoding"):
+            DataExtractor().extract_image(rawdata, "sensor_msgs/msg/Image")
+
+    def test_step_shorter_than_row(self) -> None:
+        """Test that a step shorter than one row of pixels raises ValueError."""
+        from scripts.data_extractor import DataExtractor
+
+        # 2 bytes per row for 2 16-bit pixels (4 bytes)
+        rawdata = _serialize_image(2, 2, "16UC1", np.zeros((2, 2), dtype=np.uint8))
+
+        with pytest.raises(ValueError, match="Image step too small"):
+            DataExtractor().extract_image(rawdata, "sensor_msgs/msg/Image")
+
+    def test_extract_images_batch(self) -> None:
+        """Test batch extraction over reader-style message dictionaries."""
+        from scripts.data_extractor import DataExtractor
+
+        messages = [
+            {
+                "timestamp": i * 1_000_000_000,
+                "msgtype": "sensor_msgs/msg/Image",
+                "data": memoryview(
+                    _serialize_image(2, 2, "mono8", np.full((2, 2), i, dtype=np.uint8))
+                ),
+            }
+            for i in range(3)
+        ]
+
+        images = list(DataExtractor().extract_images(messages))
+
+        assert [int(image["data"][0, 0]) for image in images] == [0, 1, 2]
+        assert images[2]["timestamp"].second == 2
+
+    def test_extract_images_rejects_non_image(self) -> None:
+        """Test that batch extraction validates message types."""
+        from scripts.data_extractor import DataExtractor
+
+        messages = [{"msgtype": "sensor_msgs/msg/Imu", "data": b"", "timestamp": 0}]
+
+        with pytest.raises(ValueError):
+            list(DataExtractor().extract_images(messages))
+
+
+class TestImuBatchExtraction:
+    """Test cases for vectorized sensor_msgs/Imu decoding."""
+
+    def test_extract_imu_decodes_values(self, small_rosbag_path: Path) -> None:
+        """Test that extract_imu returns the serialized vector values."""
+        from scripts.data_extractor import DataExtractor
+        from scripts.rosbag_reader import RosbagReader
+
+        with RosbagReader(small_rosbag_path) as reader:
+            msg = list(reader.read_messages("/device_0/sensor_2/Gyro_0/imu/data"))[3]
+
+        imu_data = DataExtractor().extract_imu(msg["data"], msg["msgtype"])
+
+        assert imu_data["angular_velocity"]["x"] == pytest.approx(0.3)
+        assert imu_data["angular_velocity"]["z"] == pytest.approx(0.9)
+        assert imu_data["linear_acceleration"]["z"] == pytest.approx(9.8)
+
+    def test_extract_imu_batch(self, small_rosbag_path: Path) -> None:
+        """Test decoding all IMU messages of a bag into (N, 3) arrays."""
+        from scripts.data_extractor import DataExtractor
+        from scripts.rosbag_reader import RosbagReader
+
+        with RosbagReader(small_rosbag_path) as reader:
+            messages = list(reader.read_messages("/device_0/sensor_2/Accel_0/imu/data"))
+
+        batch = DataExtractor().extract_imu_batch([msg["data"] for msg in messages])
+
+        assert batch["timestamp_ns"].dtype == np.int64
+        assert batch["linear_acceleration"].shape == (10, 3)
+        assert batch["angular_velocity"].shape == (10, 3)
+        np.testing.assert_array_equal(
+            batch["timestamp_ns"], [msg["timestamp"] for msg in messages]
+        )
+        np.testing.assert_allclose(batch["linear_acceleration"][:, 0], np.arange(10.0))
+        np.testing.assert_allclose(batch["linear_acceleration"][:, 2], 9.8)
+        np.testing.assert_allclose(batch["angular_velocity"][:, 1], 0.2 * np.arange(10))
+
+    def test_extract_imu_batch_mixed_frame_ids(self) -> None:
+        """Test that messages with different header lengths keep their order."""
+        from rosbags.typesys import Stores, get_typestore
+
+        from scripts.data_extractor import DataExtractor
+
+        typestore = get_typestore(Stores.ROS1_NOETIC)
+        imu_type = typestore.types["sensor_msgs/msg/Imu"]
+        header_type = typestore.types["std_msgs/msg/Header"]
+        time_type = typestore.types["builtin_interfaces/msg/Time"]
+        vector3_type = typestore.types["geometry_msgs/msg/Vector3"]
+        quaternion_type = typestore.types["geometry_msgs/msg/Quaternion"]
+
+        rawdatas = []
+        for i, frame_id in enumerate(["a", "long_frame", "b"]):
+            msg = imu_type(
+                header=header_type(seq=i, stamp=time_type(sec=i, nanosec=0), frame_id=frame_id),
+                orientation=quaternion_type(x=0.0, y=0.0, z=0.0, w=1.0),
+                orientation_covariance=np.zeros(9),
+                angular_velocity=vector3_type(x=float(i), y=0.0, z=0.0),
+                angular_velocity_covariance=np.zeros(9),
+                linear_acceleration=vector3_type(x=0.0, y=float(i), z=0.0),
+                linear_acceleration_covariance=np.zeros(9),
+            )
+            rawdatas.append(bytes(typestore.serialize_ros1(msg, imu_type.__msgtype__)))
+
+        batch = DataExtractor().extract_imu_batch(rawdatas)
+
+        np.testing.assert_array_equal(batch["timestamp_ns"], [0, 1_000_000_000, 2_000_000_000])
+        np.testing.assert_array_equal(batch["angular_velocity"][:, 0], [0.0, 1.0, 2.0])
+        np.testing.assert_array_equal(batch["linear_acceleration"][:, 1], [0.0, 1.0, 2.0])
+
+    def test_extract_imu_batch_rejects_truncated(self) -> None:
+        """Test that truncated messages raise ValueError."""
+        from scripts.data_extractor import DataExtractor
+
+        with pytest.raises(ValueError):
+            DataExtractor().extract_imu_batch([b"\x00" * 20])
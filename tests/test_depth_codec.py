@@ -0,0 +1,150 @@
+"""Tests for the lossless depth frame codecs."""
+
+import numpy as np
+import pytest
+
+from scripts.depth_codec import (
+    TemporalDepthEncoder,
+    decode_depth,
+    decode_temporal_depth,
+    encode_depth,
+    get_keyframe_distance,
+    is_keyframe,
+)
+
+
+def _make_depth_frame(width: int = 64, height: int = 48) -> np.ndarray:
+    """Create a smooth depth frame with noise, holes and extreme values."""
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[0:height, 0:width]
+    frame = (1000 + 4 * x + 2 * y + rng.normal(0, 3, (height, width))).astype(np.uint16)
+    frame[10:20, 5:15] = 0  # Invalid depth (hole)
+    frame[0, -1] = 65535
+    return frame
+
+
+class TestDepthCodec:
+    """Test cases for encode_depth/decode_depth."""
+
+    @pytest.mark.parametrize("codec", ["none", "delta_zstd"])
+    def test_roundtrip_is_lossless(self, codec: str) -> None:
+        """Test that every codec reproduces the frame exactly."""
+        frame = _make_depth_frame()
+
+        encoded = encode_depth(frame, codec)
+        decoded = decode_depth(encoded, frame.shape[1], frame.shape[0], codec)
+
+        assert decoded.dtype == np.uint16
+        np.testing.assert_array_equal(decoded, frame)
+
+    def test_roundtrip_random_frame(self) -> None:
+        """Test lossless roundtrip on incompressible data (large residuals wrap)."""
+        frame = np.random.default_rng(1).integers(0, 65536, (8, 16), dtype=np.uint16)
+
+        decoded = decode_depth(encode_depth(frame, "delta_zstd"), 16, 8, "delta_zstd")
+
+        np.testing.assert_array_equal(decoded, frame)
+
+    def test_delta_zstd_compresses_smooth_depth(self) -> None:
+        """Test that delta_zstd is much smaller than the raw frame."""
+        frame = _make_depth_frame(320, 240)
+
+        encoded = encode_depth(frame, "delta_zstd")
+
+        assert len(encoded) * 2 < frame.nbytes
+
+    def test_none_codec_is_raw_little_endian(self) -> None:
+        """Test that the 'none' codec stores the raw 16UC1 bytes."""
+        frame = _make_depth_frame()
+
+        assert encode_depth(frame, "none") == frame.astype("<u2").tobytes()
+
+    def test_unknown_codec(self) -> None:
+        """Test that unknown codec names are rejected."""
+        frame = _make_depth_frame()
+
+        with pytest.raises(ValueError):
+            encode_depth(frame, "rvl")
+        with pytest.raises(ValueError):
+            decode_depth(b"", 1, 1, "rvl")
+
+    def test_invalid_frame(self) -> None:
+        """Test that non-uint16 or non-2D frames are rejected."""
+        with pytest.raises(ValueError):
+            encode_depth(np.zeros((4, 4), dtype=np.uint8), "delta_zstd")
+        with pytest.raises(ValueError):
+            encode_depth(np.zeros(16, dtype=np.uint16), "delta_zstd")
+
+    def test_size_mismatch(self) -> None:
+        """Test that decoding with the wrong resolution fails."""
+        frame = _make_depth_frame()
+
+        with pytest.raises(ValueError):
+            decode_depth(encode_depth(frame, "none"), 10, 10, "none")
+
+
+class TestTemporalDepthCodec:
+    """Test cases for the keyframe + XOR residual temporal codec."""
+
+    @staticmethod
+    def _make_sequence(count: int) -> list[np.ndarray]:
+        """Create a mostly static sequence where a small region changes per frame."""
+        frames = []
+        for i in range(count):
+            frame = _make_depth_frame()
+            frame[30:34, 40 + i : 44 + i] = 500 + i
+            frames.append(frame)
+        return frames
+
+    def test_keyframe_interval(self) -> None:
+        """Test that keyframes are emitted every keyframe_interval frames."""
+        encoder = TemporalDepthEncoder(keyframe_interval=4)
+        encoded = [encoder.encode(frame) for frame in self._make_sequence(9)]
+
+        assert [is_keyframe(data) for data in encoded] == [
+            True, False, False, False, True, False, False, False, True
+        ]
+        assert [get_keyframe_distance(data) for data in encoded[:4]] == [0, 1, 2, 3]
+
+    def test_roundtrip_from_keyframe(self) -> None:
+        """Test that every frame decodes losslessly from its keyframe alone."""
+        frames = self._make_sequence(10)
+        encoder = TemporalDepthEncoder(keyframe_interval=5)
+        encoded = [encoder.encode(frame) for frame in frames]
+        height, width = frames[0].shape
+
+        for index, data in enumerate(encoded):
+            keyframe_index = index - get_keyframe_distance(data)
+            keyframe = decode_temporal_depth(encoded[keyframe_index], width, height)
+            decoded = decode_temporal_depth(data, width, height, keyframe)
+            np.testing.assert_array_equal(decoded, frames[index])
+
+    def test_delta_frames_are_small(self) -> None:
+        """Test that residuals of a static scene are much smaller than keyframes."""
+        encoder = TemporalDepthEncoder(keyframe_interval=30)
+        keyframe_data, delta_data = (encoder.encode(f) for f in self._make_sequence(2))
+
+        assert len(delta_data) * 5 < len(keyframe_data)
+
+    def test_resolution_change_forces_keyframe(self) -> None:
+        """Test that a frame with a different resolution becomes a keyframe."""
+        encoder = TemporalDepthEncoder(keyframe_interval=30)
+        encoder.encode(_make_depth_frame(64, 48))
+
+        assert is_keyframe(encoder.encode(_make_depth_frame(32, 24)))
+
+    def test_delta_frame_requires_keyframe(self) -> None:
+        """Test that decoding a delta frame without its keyframe fails."""
+        encoder = TemporalDepthEncoder(keyframe_interval=30)
+        frames = self._make_sequence(2)
+        encoder.encode(frames[0])
+
+        with pytest.raises(ValueError):
+            decode_temporal_depth(encoder.encode(frames[1]), 64, 48)
+
+    def test_stateless_functions_reject_temporal_codec(self) -> None:
+        """Test that encode_depth/decode_depth refuse temporal_zstd."""
+        with pytest.raises(ValueError):
+            encode_depth(_make_depth_frame(), "temporal_zstd")
+        with pytest.raises(ValueError):
+            TemporalDepthEncoder(keyframe_interval=0)
@@ -0,0 +1,116 @@
+"""Tests for image codecs and the ordered encoder pool."""
+
+import random
+import time
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from scripts.image_codec import (  # noqa: E402
+    OrderedEncoderPool,
+    decode_image,
+    encode_image,
+    is_codec_available,
+)
+
+
+def _make_color_frame(width: int = 64, height: int = 48) -> np.ndarray:
+    """Create a smooth RGB gradient frame."""
+    y, x = np.mgrid[0:height, 0:width]
+    return np.stack(
+        [x * 255 // width, y * 255 // height, (x + y) * 127 // (width + height)], axis=-1
+    ).astype(np.uint8)
+
+
+class TestImageCodec:
+    """Test cases for encode_image/decode_image."""
+
+    def test_png_roundtrip_is_lossless(self) -> None:
+        """Test that png reproduces an RGB frame exactly (channel order kept)."""
+        frame = _make_color_frame()
+
+        decoded = decode_image(encode_image(frame, "png"))
+
+        np.testing.assert_array_equal(decoded, frame)
+
+    def test_png_roundtrip_16bit(self) -> None:
+        """Test that png stores 16-bit depth frames losslessly."""
+        frame = np.arange(64 * 48, dtype=np.uint16).reshape(48, 64) * 13
+
+        decoded = decode_image(encode_image(frame, "png"))
+
+        assert decoded.dtype == np.uint16
+        np.testing.assert_array_equal(decoded, frame)
+
+    def test_jpeg_is_close_and_smaller(self) -> None:
+        """Test that jpeg is lossy but close, and smaller than raw."""
+        frame = _make_color_frame(320, 240)
+
+        encoded = encode_image(frame, "jpeg", quality=90)
+        decoded = decode_image(encoded)
+
+        assert len(encoded) < frame.nbytes
+        assert decoded.shape == frame.shape
+        assert np.abs(decoded.astype(int) - frame.astype(int)).mean() < 3
+
+    def test_bgr_channel_order(self) -> None:
+        """Test that BGR input frames are stored with correct colors."""
+        frame = _make_color_frame()
+
+        decoded = decode_image(encode_image(frame[..., ::-1], "png", channel_order="BGR"))
+
+        np.testing.assert_array_equal(decoded, frame)
+
+    def test_invalid_arguments(self) -> None:
+        """Test that unknown codecs and 16-bit jpeg are rejected."""
+        with pytest.raises(ValueError):
+            encode_image(_make_color_frame(), "raw")
+        with pytest.raises(ValueError):
+            encode_image(np.zeros((4, 4), dtype=np.uint16), "jpeg")
+
+    def test_is_codec_available(self) -> None:
+        """Test codec availability checks."""
+        assert is_codec_available("raw")
+        assert is_codec_available("png")
+        assert not is_codec_available("bmp")
+
+
+class TestOrderedEncoderPool:
+    """Test cases for OrderedEncoderPool."""
+
+    @staticmethod
+    def _slow_identity(value: int) -> int:
+        time.sleep(random.uniform(0, 0.005))
+        return value
+
+    def test_results_keep_submission_order(self) -> None:
+        """Test that results are returned in submission order."""
+        results = []
+        with OrderedEncoderPool(max_workers=4) as pool:
+            for i in range(50):
+                results.extend(pool.submit(i, self._slow_identity, i * 10))
+            results.extend(pool.drain())
+
+        assert results == [(i, i * 10) for i in range(50)]
+
+    def test_pending_jobs_are_bounded(self) -> None:
+        """Test that submit() collects jobs once max_pending is exceeded."""
+        with OrderedEncoderPool(max_workers=2, max_pending=3) as pool:
+            collected = 0
+            for i in range(10):
+                collected += len(pool.submit(i, self._slow_identity, i))
+                assert i + 1 - collected <= 3
+            assert collected + len(pool.drain()) == 10
+
+    def test_job_exception_is_raised(self) -> None:
+        """Test that an exception in a job is raised to the caller."""
+
+        def fail() -> None:
+            raise ValueError("encode failed")
+
+        with OrderedEncoderPool(max_workers=1) as pool:
+            with pytest.raises(ValueError):
+                pool.submit(0, fail)
+                pool.drain()
@@ -0,0 +1,89 @@
+"""Tests for MemoryProfiler (per-stage RSS and tracemalloc profiling)."""
+
+import json
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from scripts.memory_profile import MemoryProfiler, get_rss_bytes
+
+
+def test_get_rss_bytes() -> None:
+    """Test that the RSS of the test process is reported."""
+    assert get_rss_bytes() > 0
+
+
+class TestMemoryProfiler:
+    """Test cases for MemoryProfiler."""
+
+    def test_invalid_arguments(self) -> None:
+        """Test that non-positive settings are rejected."""
+        with pytest.raises(ValueError):
+            MemoryProfiler(sample_interval_sec=0)
+        with pytest.raises(ValueError):
+            MemoryProfiler(top_allocations=0)
+
+    def test_stage_requires_start(self) -> None:
+        """Test that stages cannot be measured before start()."""
+        profiler = MemoryProfiler()
+
+        with pytest.raises(RuntimeError):
+            with profiler.stage("load"):
+                pass
+
+    def test_stage_records_held_allocation(self) -> None:
+        """Test that memory held at the end of a stage is traced to its source line."""
+        with MemoryProfiler(sample_interval_sec=0.01) as profiler:
+            with profiler.stage("allocate"):
+                held = [bytearray(1024) for _ in range(2048)]
+
+        assert len(held) == 2048
+        stage = profiler.stages[0]
+        assert stage.name == "allocate"
+        assert stage.traced_end_mb >= 2.0
+        assert stage.traced_peak_mb >= stage.traced_end_mb
+        assert stage.rss_peak_mb >= max(stage.rss_start_mb, stage.rss_end_mb)
+        assert any(__file__ in site.location for site in stage.top_allocations)
+
+    def test_nested_stages(self) -> None:
+        """Test that nested stages are recorded inner first and attributed in samples."""
+        with MemoryProfiler(sample_interval_sec=0.01) as profiler:
+            with profiler.stage("outer"):
+                with profiler.stage("inner"):
+                    pass
+
+        assert [stage.name for stage in profiler.stages] == ["inner", "outer"]
+        outer = profiler.stages[1]
+        assert outer.start_sec <= profiler.stages[0].start_sec
+        assert {"inner", "outer"} <= {stage for _, _, stage in profiler.samples}
+
+    def test_stop_restores_tracemalloc(self) -> None:
+        """Test that tracing is stopped only if the profiler started it."""
+        with MemoryProfiler():
+            assert tracemalloc.is_tracing()
+        assert not tracemalloc.is_tracing()
+
+        tracemalloc.start()
+        try:
+            with MemoryProfiler():
+                pass
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+    def test_write_report(self, tmp_path: Path) -> None:
+        """Test that the JSON report contains stages, growth and samples."""
+        with MemoryProfiler(sample_interval_sec=0.01) as profiler:
+            with profiler.stage("convert"):
+                pass
+        path = tmp_path / "memory.json"
+
+        profiler.write_report(path)
+
+        report = json.loads(path.read_text())
+        assert report["peak_rss_mb"] == pytest.approx(profiler.peak_rss_mb)
+        assert report["stages"][0]["name"] == "convert"
+        assert "rss_growth_mb" in report["stages"][0]
+        assert len(report["samples"]) >= 2
+        assert "convert" in profiler.format_summary()
@@ -0,0 +1,181 @@
+"""Tests for Prometheus-format conversion metrics."""
+
+import pickle
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from scripts.image_codec import OrderedEncoderPool
+from scripts.metrics import CONTENT_TYPE, ConversionMetrics, MetricsRegistry
+from scripts.rosbag_to_vrs_converter import RosbagToVRSConverter, create_rgbd_config
+
+
+class TestMetricsRegistry:
+    """Test cases for MetricsRegistry and its metric types."""
+
+    def test_render_counter_and_gauge(self) -> None:
+        """Test HELP/TYPE lines, label formatting and escaping."""
+        registry = MetricsRegistry()
+        messages = registry.counter("messages_total", "Messages", ["stream_type"])
+        depth = registry.gauge("queue_depth", "Queue depth")
+
+        messages.labels(stream_type="color").inc()
+        messages.labels(stream_type="color").inc(2)
+        messages.labels(stream_type='a"b\\c').inc()
+        depth.set(3)
+        depth.dec()
+
+        lines = registry.render().splitlines()
+        assert lines[:2] == ["# HELP messages_total Messages", "# TYPE messages_total counter"]
+        assert 'messages_total{stream_type="color"} 3.0' in lines
+        assert 'messages_total{stream_type="a\\"b\\\\c"} 1.0' in lines
+        assert "# TYPE queue_depth gauge" in lines
+        assert "queue_depth 2.0" in lines
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Test that bucket counts include smaller buckets and end with +Inf, sum and count."""
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency", buckets=[0.1, 1.0])
+
+        for value in (0.05, 0.1, 0.5, 2.0):
+            latency.observe(value)
+
+        lines = registry.render().splitlines()
+        assert lines[2:] == [
+            'latency_seconds_bucket{le="0.1"} 2',
+            'latency_seconds_bucket{le="1.0"} 3',
+            'latency_seconds_bucket{le="+Inf"} 4',
+            "latency_seconds_sum 2.65",
+            "latency_seconds_count 4",
+        ]
+
+    def test_invalid_usage(self) -> None:
+        """Test that wrong labels, negative counter increments and duplicate names are rejected."""
+        registry = MetricsRegistry()
+        messages = registry.counter("messages_total", "Messages", ["stream_type"])
+
+        with pytest.raises(ValueError):
+            messages.labels(queue="encoder")
+        with pytest.raises(ValueError):
+            messages.inc()  # Labels required
+        with pytest.raises(ValueError):
+            messages.labels(stream_type="color").inc(-1)
+        with pytest.raises(ValueError):
+            registry.gauge("messages_total", "Duplicate")
+        with pytest.raises(ValueError):
+            registry.histogram("latency_seconds", "Latency", buckets=[1.0, 0.5])
+
+    def test_write_textfile(self, tmp_path: Path) -> None:
+        """Test that the textfile is replaced without leaving temporary files."""
+        registry = MetricsRegistry()
+        registry.gauge("rss_bytes", "RSS").set(1024)
+        path = tmp_path / "vrs.prom"
+        path.write_text("stale\n")
+
+        registry.write_textfile(path)
+
+        assert path.read_text() == registry.render()
+        assert [p.name for p in tmp_path.iterdir()] == ["vrs.prom"]
+
+    def test_serve(self) -> None:
+        """Test that /metrics is served over HTTP and other paths are not found."""
+        registry = MetricsRegistry()
+        registry.counter("bags_total", "Bags").inc()
+        server = registry.serve(0)
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            with urllib.request.urlopen(f"{url}/metrics", timeout=5) as response:
+                assert response.headers["Content-Type"] == CONTENT_TYPE
+                assert "bags_total 1.0" in response.read().decode("utf-8")
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"{url}/other", timeout=5)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestConversionMetrics:
+    """Test cases for ConversionMetrics."""
+
+    def test_record_message_and_output(self) -> None:
+        """Test per-stream-type message, byte and latency metrics."""
+        metrics = ConversionMetrics()
+
+        metrics.record_message("color", 1000, 0.002)
+        metrics.record_message("color", 1000, 0.004)
+        metrics.record_message("accel", 40, 0.00005)
+        metrics.record_output("color", 1500)
+
+        text = metrics.registry.render()
+        assert 'realsense_vrs_messages_total{stream_type="color"} 2.0' in text
+        assert 'realsense_vrs_input_bytes_total{stream_type="color"} 2000.0' in text
+        assert 'realsense_vrs_output_bytes_total{stream_type="color"} 1500.0' in text
+        assert 'realsense_vrs_write_latency_seconds_count{stream_type="accel"} 1' in text
+        assert (
+            'realsense_vrs_write_latency_seconds_bucket{stream_type="color",le="0.005"} 2' in text
+        )
+
+    def test_record_success_and_failure(self) -> None:
+        """Test bag counters, duration, output size and last success time."""
+        metrics = ConversionMetrics()
+
+        metrics.record_success(12.5, 4096, 1_700_000_000.0)
+        metrics.record_failure()
+
+        text = metrics.registry.render()
+        assert 'realsense_vrs_bags_total{status="success"} 1.0' in text
+        assert 'realsense_vrs_bags_total{status="failure"} 1.0' in text
+        assert "realsense_vrs_conversion_duration_seconds_sum 12.5" in text
+        assert "realsense_vrs_output_file_bytes_total 4096.0" in text
+        assert "realsense_vrs_last_success_timestamp_seconds 1700000000.0" in text
+        assert "realsense_vrs_rss_bytes 0.0" not in text
+
+    def test_merge_streams(self) -> None:
+        """Test that per-stream-type metrics of another process are added."""
+        worker = ConversionMetrics()
+        worker.record_message("color", 1000, 0.002)
+        worker.record_message("accel", 40, 2.0)
+        worker.record_output("color", 1500)
+        worker.record_success(1.0, 10, 0.0)  # Bag metrics are not merged
+        metrics = ConversionMetrics()
+        metrics.record_message("color", 1000, 0.004)
+
+        metrics.merge_streams(pickle.loads(pickle.dumps(worker.snapshot_streams())))
+
+        text = metrics.registry.render()
+        assert 'realsense_vrs_messages_total{stream_type="color"} 2.0' in text
+        assert 'realsense_vrs_input_bytes_total{stream_type="accel"} 40.0' in text
+        assert 'realsense_vrs_output_bytes_total{stream_type="color"} 1500.0' in text
+        assert (
+            'realsense_vrs_write_latency_seconds_bucket{stream_type="color",le="0.005"} 2' in text
+        )
+        assert 'realsense_vrs_write_latency_seconds_bucket{stream_type="accel",le="+Inf"} 1' in text
+        assert 'realsense_vrs_write_latency_seconds_sum{stream_type="accel"} 2.0' in text
+        assert "realsense_vrs_bags_total{" not in text
+
+    def test_converter_counts_failure(self, tmp_path: Path) -> None:
+        """Test that a failed conversion is counted and the error is re-raised."""
+        metrics = ConversionMetrics()
+        converter = RosbagToVRSConverter(
+            tmp_path / "missing.bag", tmp_path / "out.vrs", create_rgbd_config(), metrics=metrics
+        )
+
+        with pytest.raises(FileNotFoundError):
+            converter.convert()
+
+        assert 'realsense_vrs_bags_total{status="failure"} 1.0' in metrics.registry.render()
+
+
+def test_encoder_pool_pending() -> None:
+    """Test that the encoder pool reports the number of jobs in flight."""
+    release = threading.Event()
+    with OrderedEncoderPool(max_workers=1, max_pending=4) as pool:
+        assert pool.pending == 0
+        pool.submit("a", lambda: release.wait(5) and 3)
+        assert pool.pending == 1
+        release.set()
+        assert pool.drain() == [("a", 3)]
+        assert pool.pending == 0
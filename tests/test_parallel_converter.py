@@ -0,0 +1,128 @@
+"""Tests for parallel conversion of time ranges of a bag."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from scripts.bag_index import BagIndex
+from scripts.parallel_converter import ParallelRosbagToVRSConverter, get_parts_dir
+from scripts.rosbag_reader import RosbagReader
+from scripts.rosbag_to_vrs_converter import RosbagToVRSConverter, create_rgbd_imu_config
+
+
+def _index(chunk_sizes: list[int], chunk_start_ns: list[int]) -> BagIndex:
+    """Build an index of chunks with the given sizes and start times (in file order)."""
+    positions = np.cumsum([0, *chunk_sizes[:-1]]).astype(np.int64) + 100
+    return BagIndex(
+        bag_size=int(positions[-1]) + chunk_sizes[-1],
+        bag_mtime_ns=0,
+        start_ns=min(chunk_start_ns),
+        end_ns=max(chunk_start_ns) + 99,
+        topics=[],
+        msgtypes=[],
+        counts=np.zeros(0, dtype=np.int64),
+        first_ns=np.zeros(0, dtype=np.int64),
+        last_ns=np.zeros(0, dtype=np.int64),
+        topic_offsets=np.zeros(1, dtype=np.int64),
+        timestamps=np.zeros(0, dtype=np.int64),
+        chunk_positions=positions,
+        chunk_start_ns=np.array(chunk_start_ns, dtype=np.int64),
+        chunk_end_ns=np.array(chunk_start_ns, dtype=np.int64) + 99,
+    )
+
+
+class TestSplitTimeRanges:
+    """Test cases for BagIndex.split_time_ranges()."""
+
+    def test_balanced_by_chunk_bytes(self) -> None:
+        """Test that boundaries are chunk start times splitting the bytes evenly."""
+        index = _index([10, 10, 10, 10, 40], [0, 100, 200, 300, 400])
+
+        assert index.split_time_ranges(1) == [(0, 500)]
+        assert index.split_time_ranges(2) == [(0, 400), (400, 500)]
+        assert index.split_time_ranges(4) == [(0, 200), (200, 400), (400, 500)]
+        with pytest.raises(ValueError):
+            index.split_time_ranges(0)
+
+    def test_chunks_out_of_time_order(self) -> None:
+        """Test that ranges are in time order even if the chunks in the file are not."""
+        index = _index([10, 10, 10, 10], [300, 0, 200, 100])
+
+        assert index.split_time_ranges(2) == [(0, 200), (200, 400)]
+        assert index.split_time_ranges(8) == [(0, 100), (100, 200), (200, 300), (300, 400)]
+
+    def test_ranges_cover_every_message(self, synthetic_rosbag_path: Path) -> None:
+        """Test that each message of a bag falls into exactly one range."""
+        with RosbagReader(synthetic_rosbag_path) as reader:
+            ranges = reader.get_time_ranges(4)
+            index = reader._get_index()
+
+        counts = [
+            int(np.count_nonzero((index.timestamps >= start) & (index.timestamps < stop)))
+            for start, stop in ranges
+        ]
+        assert sum(counts) == len(index.timestamps)
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+
+
+class TestParallelConverter:
+    """Test cases for ParallelRosbagToVRSConverter and time-range conversion."""
+
+    def test_run_prepass(self, synthetic_rosbag_path: Path, tmp_path: Path) -> None:
+        """Test that the pre-pass result carries the caches and the source tags."""
+        converter = RosbagToVRSConverter(
+            synthetic_rosbag_path, tmp_path / "out.vrs", create_rgbd_imu_config()
+        )
+        metadata = converter.run_prepass()
+
+        part = RosbagToVRSConverter(
+            synthetic_rosbag_path, tmp_path / "part.vrs", create_rgbd_imu_config(),
+            metadata_caches=metadata,
+        )
+        part._import_metadata_caches(part._open_rosbag(), metadata)
+
+        assert metadata["source_tags"] == converter._get_source_tags()
+        assert "camera_info_cache" in metadata["messages"]
+        assert (
+            part._stats["camera_info_cache"].keys() == converter._stats["camera_info_cache"].keys()
+        )
+
+    def test_invalid_time_range(self, synthetic_rosbag_path: Path, tmp_path: Path) -> None:
+        """Test that empty time ranges and checkpointed time ranges are rejected."""
+        config = create_rgbd_imu_config()
+        converter = RosbagToVRSConverter(
+            synthetic_rosbag_path, tmp_path / "out.vrs", config, time_range=(10, 10)
+        )
+        with pytest.raises(ValueError, match="time_range"):
+            converter.convert()
+
+        config.chunk_duration_sec = 1.0
+        config.checkpoint = True
+        converter = RosbagToVRSConverter(
+            synthetic_rosbag_path, tmp_path / "out.vrs", config, time_range=(0, 10)
+        )
+        with pytest.raises(ValueError, match="time_range"):
+            converter.convert()
+
+    def test_invalid_input(self, synthetic_rosbag_path: Path, tmp_path: Path) -> None:
+        """Test that ROS2 directories, single-file output and checkpointing are rejected."""
+        config = create_rgbd_imu_config()
+        config.chunk_duration_sec = 1.0
+        converter = ParallelRosbagToVRSConverter(tmp_path, tmp_path / "out.vrs", config)
+        with pytest.raises(ValueError, match="ROS1"):
+            converter.convert()
+
+        converter = ParallelRosbagToVRSConverter(
+            synthetic_rosbag_path, tmp_path / "out.vrs", create_rgbd_imu_config()
+        )
+        with pytest.raises(ValueError, match="chunked output"):
+            converter.convert()
+
+        config.checkpoint = True
+        converter = ParallelRosbagToVRSConverter(
+            synthetic_rosbag_path, tmp_path / "out.vrs", config
+        )
+        with pytest.raises(ValueError, match="checkpoint"):
+            converter.convert()
+        assert not get_parts_dir(tmp_path / "out.vrs").exists()
@@ -0,0 +1,116 @@
+"""Tests for the conversion progress reporter."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts.progress import ProgressReporter, format_duration
+from scripts.rosbag_to_vrs_converter import RosbagToVRSConverter, create_rgbd_imu_config
+
+
+class FakeClock:
+    """Clock advancing by `step` seconds per call"""
+
+    def __init__(self, step: float) -> None:
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+def _json_reports(output: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+class TestProgressReporter:
+    """Test cases for ProgressReporter."""
+
+    def test_invalid_arguments(self) -> None:
+        """Test that unknown formats and negative intervals are rejected."""
+        with pytest.raises(ValueError):
+            ProgressReporter(output_format="xml")
+        with pytest.raises(ValueError):
+            ProgressReporter(interval_sec=-1.0)
+
+    def test_reports_are_rate_limited(self) -> None:
+        """Test that at most one report is written per interval."""
+        output = io.StringIO()
+        progress = ProgressReporter("json", interval_sec=1.0, output=output, clock=FakeClock(0.25))
+        progress.start({1001: 30})
+
+        for _ in range(30):
+            progress.update(1001, 100)
+        progress.finish()
+
+        reports = _json_reports(output)
+        assert [report["event"] for report in reports] == ["progress"] * 7 + ["done"]
+        assert reports[-1]["messages"] == 30
+        assert reports[-1]["fraction"] == pytest.approx(1.0)
+        assert reports[-1]["eta_sec"] == pytest.approx(0.0)
+
+    def test_fraction_weights_streams_by_message_size(self) -> None:
+        """Test that remaining data is estimated with each stream's mean message size."""
+        output = io.StringIO()
+        progress = ProgressReporter("json", interval_sec=100.0, output=output, clock=FakeClock(1.0))
+        progress.start({1001: 10, 1003: 1000}, {1001: "Color", 1003: "Accel"})
+
+        # Half of the images, none of the IMU samples: about half of the data
+        for _ in range(5):
+            progress.update(1001, 1_000_000)
+        progress.update(1003, 10)
+        snapshot = progress.snapshot()
+
+        assert snapshot.fraction == pytest.approx(0.5, abs=0.01)
+        assert snapshot.eta_sec is not None and snapshot.eta_sec > 0
+        assert snapshot.streams[1003].name == "Accel"
+        assert snapshot.rss_mb > 0
+
+    def test_text_output(self) -> None:
+        """Test that the status line shows progress of streams with many messages."""
+        output = io.StringIO()
+        progress = ProgressReporter("text", output=output, clock=FakeClock(1.0))
+        progress.start({1001: 2, 2001: 1}, {1001: "Color", 2001: "Device_Info"})
+
+        progress.update(1001, 1024 * 1024)
+        progress.update(2001, 10)
+        progress.update(1001, 1024 * 1024)
+        progress.finish()
+
+        last_line = output.getvalue().splitlines()[-1]
+        assert "3/3 msgs" in last_line
+        assert "Color:2/2" in last_line
+        assert "Device_Info" not in last_line
+
+
+def test_format_duration() -> None:
+    """Test H:MM:SS formatting of ETAs."""
+    assert format_duration(3725.4) == "1:02:05"
+    assert format_duration(None) == "--:--:--"
+
+
+def test_converter_progress_totals(synthetic_rosbag_path: Path, tmp_path: Path) -> None:
+    """Test that stream totals come from the bag index, with option topics summed per stream."""
+    converter = RosbagToVRSConverter(
+        synthetic_rosbag_path, tmp_path / "out.vrs", create_rgbd_imu_config()
+    )
+    progress = ProgressReporter("json", output=io.StringIO())
+
+    reader = converter._open_rosbag()
+    with reader:
+        connections = [
+            c for c in reader.connections if converter._get_stream_config(c.topic) is not None
+        ]
+        converter._start_progress(progress, connections)
+        expected = sum(c.msgcount for c in connections)
+
+    snapshot = progress.snapshot()
+    assert snapshot.total_messages == expected
+    assert snapshot.streams[1001].name == "RealSense_D435i_Color"
+    assert snapshot.streams[1001].total == sum(
+        c.msgcount for c in connections if c.topic == "/device_0/sensor_1/Color_0/image/data"
+    )
+    assert snapshot.streams[2005].total > 1  # All option value topics of device_0
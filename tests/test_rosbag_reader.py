@@ -121,3 +121,51 @@ class TestRosbagReader:
 
             assert isinstance(count, int)
             assert count >= 0
+
+    def test_get_start_time(self, small_rosbag_path: Path) -> None:
+        """Test retrieving the first message timestamp of the bag."""
+        from scripts.rosbag_reader import RosbagReader
+
+        with RosbagReader(small_rosbag_path) as reader:
+            assert reader.get_start_time() == 1_000_000_000_000
+
+    def test_read_messages_time_window(self, small_rosbag_path: Path) -> None:
+        """Test that start_ns/stop_ns restrict messages to [start, stop)."""
+        from scripts.rosbag_reader import RosbagReader
+
+        topic = "/device_0/sensor_2/Accel_0/imu/data"
+        start_ns = 1_000_300_000_000
+        stop_ns = 1_000_600_000_000
+
+        with RosbagReader(small_rosbag_path) as reader:
+            messages = list(reader.read_messages(topic, start_ns=start_ns, stop_ns=stop_ns))
+
+        timestamps = [msg["timestamp"] for msg in messages]
+        assert timestamps == [1_000_300_000_000, 1_000_400_000_000, 1_000_500_000_000]
+
+    def test_read_messages_multiple_topics_single_pass(self, small_rosbag_path: Path) -> None:
+        """Test that multiple topics are merged chronologically in one pass."""
+        from scripts.rosbag_reader import RosbagReader
+
+        with RosbagReader(small_rosbag_path) as reader:
+            topics = reader.filter_topics("imu/data")
+            messages = list(reader.read_messages(topics))
+            all_messages = list(reader.read_messages(None))
+
+        assert len(messages) == 20
+        assert {msg["connection"].topic for msg in messages} == set(topics)
+        timestamps = [msg["timestamp"] for msg in messages]
+        assert timestamps == sorted(timestamps)
+        assert len(all_messages) == 20
+
+    def test_read_messages_as_memoryview(self, small_rosbag_path: Path) -> None:
+        """Test that raw data can be yielded as zero-copy memoryviews."""
+        from scripts.rosbag_reader import RosbagReader
+
+        topic = "/device_0/sensor_2/Accel_0/imu/data"
+        with RosbagReader(small_rosbag_path) as reader:
+            as_bytes = [msg["data"] for msg in reader.read_messages(topic)]
+            as_views = [msg["data"] for msg in reader.read_messages(topic, as_memoryview=True)]
+
+        assert all(isinstance(view, memoryview) for view in as_views)
+        assert [bytes(view) for view in as_views] == as_bytes
@@ -1,48 +1,18 @@
 """
 Test cases for ROSbag to VRS Converter (Phase 4A: Color + Depth)
 
-TDD RED Phase: Test cases created before implementation.
+Conversions run on the synthetic D435i bag (see scripts.synthetic_bag).
 """
-import pytest
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Dict
-
-
-# Data classes (must be imported from actual implementation later)
-@dataclass
-class StreamConfig:
-    """Stream configuration"""
-    stream_id: int
-    stream_type: str  # "color", "depth", "imu_accel", "imu_gyro"
-    recordable_type_id: str  # "ForwardCamera", "MotionSensor"
-    flavor: str
-
-
-@dataclass
-class ConverterConfig:
-    """Converter configuration"""
-    topic_mapping: Dict[str, StreamConfig]
-    phase: str  # "4A", "4B", "4C"
-    compression: str = "lz4"
-    verbose: bool = False
 
+import pytest
 
-@dataclass
-class ConversionResult:
-    """Conversion result statistics"""
-    input_bag_size: int  # bytes
-    output_vrs_size: int  # bytes
-    compression_ratio: float
-    total_messages: int
-    messages_per_stream: Dict[int, int]  # stream_id -> count
-    duration_sec: float
-    conversion_time_sec: float
+from scripts.rosbag_to_vrs_converter import ConversionResult, ConverterConfig, StreamConfig
 
 
 # Fixtures
 @pytest.fixture
-def phase_4a_mapping() -> Dict[str, StreamConfig]:
+def phase_4a_mapping() -> dict[str, StreamConfig]:
     """Phase 4A topic mapping (Color + Depth only)"""
     return {
         "/device_0/sensor_1/Color_0/image/data": StreamConfig(
@@ -72,9 +42,9 @@ def phase_4a_config(phase_4a_mapping) -> ConverterConfig:
 
 
 @pytest.fixture
-def sample_rosbag_path() -> Path:
-    """Path to sample ROSbag file (may not exist yet)"""
-    return Path("/home/user/realsense_rosbag_vrs_sandbox/data/rosbag/d435i_sample_data.bag")
+def sample_rosbag_path(synthetic_rosbag_path) -> Path:
+    """Path to a sample ROSbag file (synthetic D435i bag)"""
+    return synthetic_rosbag_path
 
 
 # Test cases
@@ -121,8 +91,6 @@ def test_converter_initialization(sample_rosbag_path, phase_4a_config, tmp_path)
 
 def test_converter_convert_creates_vrs_file(sample_rosbag_path, phase_4a_config, tmp_path):
     """Converter.convert() creates a VRS file"""
-    pytest.skip("Requires actual ROSbag file")
-
     from scripts.rosbag_to_vrs_converter import RosbagToVRSConverter
 
     vrs_path = tmp_path / "output.vrs"
@@ -136,8 +104,6 @@ def test_converter_convert_creates_vrs_file(sample_rosbag_path, phase_4a_config,
 
 def test_converter_result_has_statistics(sample_rosbag_path, phase_4a_config, tmp_path):
     """ConversionResult contains expected statistics"""
-    pytest.skip("Requires actual ROSbag file")
-
     from scripts.rosbag_to_vrs_converter import RosbagToVRSConverter
 
     vrs_path = tmp_path / "output.vrs"
@@ -154,8 +120,6 @@ def test_converter_result_has_statistics(sample_rosbag_path, phase_4a_config, tm
 
 def test_converted_vrs_has_correct_streams(sample_rosbag_path, phase_4a_config, tmp_path):
     """Converted VRS file has correct stream IDs (1001, 1002)"""
-    pytest.skip("Requires actual ROSbag file")
-
     from scripts.rosbag_to_vrs_converter import RosbagToVRSConverter
     from scripts.vrs_reader import VRSReader
 
@@ -172,8 +136,6 @@ def test_converted_vrs_has_correct_streams(sample_rosbag_path, phase_4a_config,
 
 def test_converted_vrs_has_configuration_records(sample_rosbag_path, phase_4a_config, tmp_path):
     """Converted VRS file has Configuration records for each stream"""
-    pytest.skip("Requires actual ROSbag file")
-
     from scripts.rosbag_to_vrs_converter import RosbagToVRSConverter
     from scripts.vrs_reader import VRSReader
 
@@ -199,8 +161,6 @@ def test_converted_vrs_has_configuration_records(sample_rosbag_path, phase_4a_co
 
 def test_converted_vrs_has_data_records(sample_rosbag_path, phase_4a_config, tmp_path):
     """Converted VRS file has Data records"""
-    pytest.skip("Requires actual ROSbag file")
-
     from scripts.rosbag_to_vrs_converter import RosbagToVRSConverter
     from scripts.vrs_reader import VRSReader
 
@@ -210,11 +170,11 @@ def test_converted_vrs_has_data_records(sample_rosbag_path, phase_4a_config, tmp
 
     with VRSReader(vrs_path) as reader:
         # Color stream data
-        color_records = reader.read_data_records(1001)
+        color_records = list(reader.read_data_records(1001))
         assert len(color_records) > 0
 
         # Depth stream data
-        depth_records = reader.read_data_records(1002)
+        depth_records = list(reader.read_data_records(1002))
         assert len(depth_records) > 0
 
 
@@ -233,8 +193,6 @@ def test_converter_error_on_missing_rosbag(phase_4a_config, tmp_path):
 
 def test_converter_error_on_invalid_output_path(sample_rosbag_path, phase_4a_config):
     """Converter raises error when output path is invalid"""
-    pytest.skip("Requires actual ROSbag file")
-
     from scripts.rosbag_to_vrs_converter import RosbagToVRSConverter
 
     invalid_vrs = Path("/invalid/directory/output.vrs")
@@ -243,3 +201,51 @@ def test_converter_error_on_invalid_output_path(sample_rosbag_path, phase_4a_con
 
     with pytest.raises((OSError, PermissionError)):
         converter.convert()
+
+
+def test_option_and_metadata_topics_are_mapped(tmp_path):
+    """Option value topics map to the options stream; metadata topics have their own streams"""
+    from scripts.rosbag_to_vrs_converter import RosbagToVRSConverter, create_rgbd_imu_config
+
+    converter = RosbagToVRSConverter(
+        tmp_path / "input.bag", tmp_path / "output.vrs", create_rgbd_imu_config()
+    )
+
+    options = converter._get_stream_config("/device_0/sensor_1/option/Exposure/value")
+    assert options is not None and options.stream_id == 2005
+    assert converter._get_stream_config("/device_0/sensor_1/option/Exposure/description") is None
+
+    metadata = converter._get_stream_config("/device_0/sensor_1/Color_0/image/metadata")
+    assert metadata is not None and metadata.stream_type == "metadata"
+
+
+def test_discovered_mapping_matches_fixed_mapping():
+    """Discovered device_0 streams match RGBD_IMU_STREAMS; other devices get their own streams"""
+    from scripts.rosbag_to_vrs_converter import (
+        RGBD_IMU_STREAMS,
+        RGBD_STREAMS,
+        RosbagToVRSConverter,
+        create_rgbd_imu_config,
+        discover_topic_mapping,
+    )
+
+    topics = [topic for topic in RGBD_IMU_STREAMS if not topic.endswith("/option")]
+    topics += ["/device_0/sensor_1/option/Exposure/value", "/device_1/sensor_1/option/Gain/value"]
+    topics += ["/device_1/sensor_1/Color_0/image/data"]
+
+    mapping = discover_topic_mapping(topics)
+    for topic, stream_config in RGBD_IMU_STREAMS.items():
+        if stream_config.stream_type != "options":
+            assert mapping[topic] == stream_config
+    assert mapping["/device_1/sensor_1/Color_0/image/data"].stream_id == 1101
+    assert set(discover_topic_mapping(topics, include_imu=False)) == set(RGBD_STREAMS) | {
+        "/device_1/sensor_1/Color_0/image/data"
+    }
+
+    # Option values are routed to the options stream of their own device
+    config = create_rgbd_imu_config()
+    config.topic_mapping = mapping
+    converter = RosbagToVRSConverter(Path("input.bag"), Path("output.vrs"), config)
+    exposure_config = converter._get_stream_config("/device_0/sensor_1/option/Exposure/value")
+    assert exposure_config.stream_id == 2005
+    assert converter._get_stream_config("/device_1/sensor_1/option/Gain/value").stream_id == 2105
@@ -0,0 +1,39 @@
+"""Tests for the stream_realsense_data script."""
+
+from pathlib import Path
+
+
+class TestStreamSensorData:
+    """Test cases for chronological sensor data streaming."""
+
+    def test_time_window_is_relative_to_bag_start(self, small_rosbag_path: Path) -> None:
+        """Test that --start/--end are interpreted as seconds from bag start."""
+        from stream_realsense_data import SensorType, stream_sensor_data
+
+        messages = list(
+            stream_sensor_data(
+                small_rosbag_path,
+                start_time=0.2,
+                end_time=0.4,
+                sensor_types=[SensorType.ACCEL, SensorType.GYRO],
+            )
+        )
+
+        offsets_ms = [round((msg.timestamp_ns - 1_000_000_000_000) / 1e6) for msg in messages]
+        assert offsets_ms == [200, 250, 300, 350]
+        assert [msg.sensor_type for msg in messages] == [
+            SensorType.ACCEL,
+            SensorType.GYRO,
+            SensorType.ACCEL,
+            SensorType.GYRO,
+        ]
+
+    def test_no_window_streams_everything(self, small_rosbag_path: Path) -> None:
+        """Test that all messages are streamed in order without a window."""
+        from stream_realsense_data import stream_sensor_data
+
+        messages = list(stream_sensor_data(small_rosbag_path))
+
+        assert len(messages) == 20
+        timestamps = [msg.timestamp_ns for msg in messages]
+        assert timestamps == sorted(timestamps)
@@ -0,0 +1,130 @@
+"""Tests for the synthetic RealSense bag generator."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from rosbags.highlevel import AnyReader
+
+from scripts.synthetic_bag import (
+    SyntheticBagConfig,
+    duration_for_size,
+    estimate_bag_bytes_per_second,
+    generate_synthetic_bag,
+)
+
+SMALL = {"color_width": 32, "color_height": 24, "depth_width": 32, "depth_height": 24}
+
+
+class TestGenerateSyntheticBag:
+    """Test cases for generate_synthetic_bag()."""
+
+    def test_topics_and_counts(self, synthetic_rosbag_path: Path) -> None:
+        """Test that the bag has the D435i topic layout and expected message counts."""
+        with AnyReader([synthetic_rosbag_path]) as reader:
+            topics = {c.topic: c.msgcount for c in reader.connections}
+
+        assert topics["/device_0/sensor_1/Color_0/image/data"] == 15
+        assert topics["/device_0/sensor_0/Depth_0/image/data"] == 15
+        assert topics["/device_0/sensor_2/Accel_0/imu/data"] == 31
+        assert topics["/device_0/sensor_2/Gyro_0/imu/data"] == 100
+        assert topics["/device_0/info"] == 9
+        for stream in ("sensor_0/Depth_0", "sensor_1/Color_0"):
+            assert f"/device_0/{stream}/info/camera_info" in topics
+            assert f"/device_0/{stream}/info" in topics
+            assert f"/device_0/{stream}/tf/0" in topics
+            assert f"/device_0/{stream}/image/metadata" in topics
+        assert "/device_0/sensor_0/option/Exposure/value" in topics
+        assert "/device_0/sensor_0/option/Exposure/description" in topics
+
+    def test_messages_deserialize(self, synthetic_rosbag_path: Path) -> None:
+        """Test that frames and info messages have the configured shape."""
+        with AnyReader([synthetic_rosbag_path]) as reader:
+            messages = {}
+            for connection, _, rawdata in reader.messages():
+                if connection.topic not in messages:
+                    messages[connection.topic] = reader.deserialize(rawdata, connection.msgtype)
+
+        depth = messages["/device_0/sensor_0/Depth_0/image/data"]
+        assert (depth.width, depth.height, depth.encoding) == (64, 48, "mono16")
+        assert len(depth.data) == 64 * 48 * 2
+        color = messages["/device_0/sensor_1/Color_0/image/data"]
+        assert (color.encoding, len(color.data)) == ("rgb8", 64 * 48 * 3)
+        stream_info = messages["/device_0/sensor_1/Color_0/info"]
+        assert (stream_info.fps, stream_info.encoding) == (30, "rgb8")
+        camera_info = messages["/device_0/sensor_0/Depth_0/info/camera_info"]
+        assert (camera_info.width, camera_info.height) == (64, 48)
+
+    def test_deterministic(self, tmp_path: Path) -> None:
+        """Test that the same configuration produces identical bags."""
+        config = SyntheticBagConfig(duration_sec=0.2, **SMALL)
+        generate_synthetic_bag(tmp_path / "a.bag", config)
+        generate_synthetic_bag(tmp_path / "b.bag", config)
+
+        assert (tmp_path / "a.bag").read_bytes() == (tmp_path / "b.bag").read_bytes()
+
+    def test_frames_change_over_time(self, tmp_path: Path) -> None:
+        """Test that consecutive depth frames differ (the pattern scrolls)."""
+        bag_path = tmp_path / "scroll.bag"
+        generate_synthetic_bag(
+            bag_path, SyntheticBagConfig(duration_sec=0.1, metadata=False, **SMALL)
+        )
+
+        with AnyReader([bag_path]) as reader:
+            connections = [
+                c for c in reader.connections if c.topic == "/device_0/sensor_0/Depth_0/image/data"
+            ]
+            frames = [
+                np.frombuffer(bytes(reader.deserialize(raw, c.msgtype).data), dtype="<u2")
+                for c, _, raw in reader.messages(connections=connections)
+            ]
+
+        assert len(frames) == 3
+        assert not np.array_equal(frames[0], frames[1])
+
+    @pytest.mark.parametrize("compression", ["bz2", "lz4"])
+    def test_compression(self, tmp_path: Path, compression: str) -> None:
+        """Test that compressed bags are readable."""
+        bag_path = tmp_path / f"{compression}.bag"
+        counts = generate_synthetic_bag(
+            bag_path, SyntheticBagConfig(duration_sec=0.1, compression=compression, **SMALL)
+        )
+
+        with AnyReader([bag_path]) as reader:
+            assert sum(c.msgcount for c in reader.connections) == sum(counts.values())
+
+    def test_multi_device_infrared(self, tmp_path: Path) -> None:
+        """Test that every device gets its own topics, including Infrared 1/2."""
+        bag_path = tmp_path / "rig.bag"
+        counts = generate_synthetic_bag(
+            bag_path, SyntheticBagConfig(duration_sec=0.1, devices=2, infrared=True, **SMALL)
+        )
+
+        for device in (0, 1):
+            for index in (1, 2):
+                assert counts[f"/device_{device}/sensor_0/Infrared_{index}/image/data"] == 3
+                assert f"/device_{device}/sensor_0/Infrared_{index}/info/camera_info" in counts
+
+    def test_invalid_config(self, tmp_path: Path) -> None:
+        """Test that invalid settings and existing outputs are rejected."""
+        with pytest.raises(ValueError):
+            generate_synthetic_bag(tmp_path / "x.bag", SyntheticBagConfig(compression="zstd"))
+        with pytest.raises(ValueError):
+            generate_synthetic_bag(tmp_path / "y.bag", SyntheticBagConfig(devices=0))
+
+        existing = tmp_path / "existing.bag"
+        existing.touch()
+        with pytest.raises(FileExistsError):
+            generate_synthetic_bag(existing)
+
+
+def test_duration_for_size() -> None:
+    """Test that the duration estimate scales with the target size."""
+    config = SyntheticBagConfig()
+
+    assert duration_for_size(config, 10**9) == pytest.approx(
+        10**9 / estimate_bag_bytes_per_second(config)
+    )
+    assert duration_for_size(config, 2 * 10**9) == pytest.approx(
+        2 * duration_for_size(config, 10**9)
+    )
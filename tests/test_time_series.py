@@ -0,0 +1,101 @@
+"""Tests for columnar option/metadata time-series records."""
+
+import numpy as np
+import pytest
+
+from scripts.time_series import (
+    TimeSeriesBuffer,
+    decode_time_series,
+    encode_time_series,
+    flatten_time_series,
+    parse_metadata_value,
+)
+
+
+class TestTimeSeriesRecord:
+    """Test cases for the record payload format."""
+
+    def test_roundtrip(self) -> None:
+        """Test encoding and decoding a batch with missing values."""
+        timestamps = [0.0, 0.033]
+        columns = {"Frame Counter": [1, 2], "Actual Exposure": [8500, None]}
+
+        assert decode_time_series(encode_time_series(timestamps, columns)) == (
+            timestamps,
+            columns,
+        )
+
+    def test_column_length_mismatch(self) -> None:
+        """Test that columns must have one value per row."""
+        with pytest.raises(ValueError):
+            encode_time_series([0.0, 1.0], {"Gain": [16]})
+
+    def test_invalid_payload(self) -> None:
+        """Test that other payloads are rejected."""
+        with pytest.raises(ValueError):
+            decode_time_series(b"\x00\x01")
+        with pytest.raises(ValueError):
+            decode_time_series(b'{"values": []}')
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("8500", 8500),
+            ("1.5", 1.5),
+            ("RS2_TIMESTAMP_DOMAIN_HARDWARE_CLOCK", "RS2_TIMESTAMP_DOMAIN_HARDWARE_CLOCK"),
+        ],
+    )
+    def test_parse_metadata_value(self, text: str, expected: object) -> None:
+        """Test that numeric metadata strings become numbers."""
+        assert parse_metadata_value(text) == expected
+
+
+class TestTimeSeriesBuffer:
+    """Test cases for grouping messages into rows and batches."""
+
+    def test_rows_grouped_by_timestamp(self) -> None:
+        """Test that values with the same timestamp form one row."""
+        buffer = TimeSeriesBuffer(batch_size=2)
+
+        assert buffer.add(0.0, "Frame Counter", 1) is None
+        assert buffer.add(0.0, "Gain Level", 16) is None
+        assert buffer.add(0.1, "Frame Counter", 2) is None
+        # Third row starts: the two complete rows are returned
+        batch = buffer.add(0.2, "Frame Counter", 3)
+
+        assert batch == ([0.0, 0.1], {"Frame Counter": [1, 2], "Gain Level": [16, None]})
+        assert len(buffer) == 1
+        assert buffer.pop() == ([0.2], {"Frame Counter": [3]})
+        assert buffer.pop() is None
+
+    def test_one_row_per_batch(self) -> None:
+        """Test that batch_size=1 emits each row once the next one starts."""
+        buffer = TimeSeriesBuffer(batch_size=1)
+
+        assert buffer.add(1.0, "sensor_1/Exposure", 100.0) is None
+        assert buffer.add(2.0, "sensor_1/Exposure", 200.0) == (
+            [1.0],
+            {"sensor_1/Exposure": [100.0]},
+        )
+
+    def test_invalid_batch_size(self) -> None:
+        """Test that batch_size must be positive."""
+        with pytest.raises(ValueError):
+            TimeSeriesBuffer(batch_size=0)
+
+
+def test_flatten_time_series() -> None:
+    """Test combining batches into per-column series without missing values."""
+    batches = [
+        ([0.0, 0.1], {"Gain": [16, None], "Domain": ["HW", "HW"]}),
+        ([0.2], {"Gain": [32]}),
+    ]
+
+    series = flatten_time_series(batches)
+
+    timestamps, values = series["Gain"]
+    np.testing.assert_array_equal(timestamps, [0.0, 0.2])
+    np.testing.assert_array_equal(values, [16.0, 32.0])
+    assert values.dtype == np.float64
+    assert series["Domain"][1].dtype == object
+    assert list(series["Domain"][1]) == ["HW", "HW"]
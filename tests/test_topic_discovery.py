@@ -0,0 +1,137 @@
+"""Tests for stream discovery from RealSense bag topic names."""
+
+import pytest
+
+from scripts.topic_discovery import (
+    MAX_DEVICES,
+    discover_streams,
+    get_device_index,
+    get_info_topics,
+    get_stream_name,
+    is_option_value_topic,
+    parse_stream_topic,
+)
+
+
+def _device_topics(device: int) -> list[str]:
+    """Topics of one D435i recording with infrared streams."""
+    prefix = f"/device_{device}"
+    return [
+        f"{prefix}/info",
+        f"{prefix}/sensor_0/info",
+        f"{prefix}/sensor_0/Depth_0/image/data",
+        f"{prefix}/sensor_0/Depth_0/image/metadata",
+        f"{prefix}/sensor_0/Depth_0/info",
+        f"{prefix}/sensor_0/Depth_0/info/camera_info",
+        f"{prefix}/sensor_0/Depth_0/tf/0",
+        f"{prefix}/sensor_0/Infrared_1/image/data",
+        f"{prefix}/sensor_0/Infrared_1/tf/0",
+        f"{prefix}/sensor_0/Infrared_2/image/data",
+        f"{prefix}/sensor_0/option/Exposure/value",
+        f"{prefix}/sensor_0/option/Exposure/description",
+        f"{prefix}/sensor_1/info",
+        f"{prefix}/sensor_1/Color_0/image/data",
+        f"{prefix}/sensor_1/Color_0/tf/0",
+        f"{prefix}/sensor_1/option/Gain/value",
+        f"{prefix}/sensor_2/Accel_0/imu/data",
+        f"{prefix}/sensor_2/Gyro_0/imu/data",
+    ]
+
+
+class TestTopicParsing:
+    """Test cases for topic name helpers."""
+
+    def test_parse_stream_topic(self) -> None:
+        """Test splitting a stream topic into its parts."""
+        parsed = parse_stream_topic("/device_1/sensor_0/Infrared_2/image/data")
+
+        assert parsed is not None
+        assert (parsed.device, parsed.sensor, parsed.stream, parsed.index) == (1, 0, "Infrared", 2)
+        assert parsed.kind == "image/data"
+        assert parsed.prefix == "/device_1/sensor_0/Infrared_2"
+
+    def test_parse_non_stream_topics(self) -> None:
+        """Test that info and option topics are not stream topics."""
+        assert parse_stream_topic("/device_0/info") is None
+        assert parse_stream_topic("/device_0/sensor_0/info") is None
+        assert parse_stream_topic("/file_version") is None
+
+    def test_get_info_topics(self) -> None:
+        """Test pairing a data topic with its CameraInfo and StreamInfo topics."""
+        assert get_info_topics("/device_2/sensor_1/Color_0/image/data") == (
+            "/device_2/sensor_1/Color_0/info/camera_info",
+            "/device_2/sensor_1/Color_0/info",
+        )
+        with pytest.raises(ValueError):
+            get_info_topics("/device_0/info")
+
+    def test_device_index_and_names(self) -> None:
+        """Test device index, stream name and option topic helpers."""
+        assert get_device_index("/device_3/sensor_0/Depth_0/tf/0") == 3
+        assert get_device_index("/device_0/info") == 0
+        assert get_device_index("/file_version") is None
+        assert get_stream_name("/device_0/sensor_0/Infrared_1/tf/0") == "Infrared1"
+        assert get_stream_name("/device_0/sensor_1/Color_0/tf/0") == "Color"
+        assert is_option_value_topic("/device_1/sensor_0/option/Laser Power/value")
+        assert not is_option_value_topic("/device_1/sensor_0/option/Laser Power/description")
+
+
+class TestDiscoverStreams:
+    """Test cases for discover_streams()."""
+
+    def test_single_device_ids(self) -> None:
+        """Test that device_0 keeps the stream IDs of the fixed D435i mapping."""
+        streams = {s.topic: s for s in discover_streams(_device_topics(0))}
+
+        assert streams["/device_0/sensor_1/Color_0/image/data"].stream_id == 1001
+        assert streams["/device_0/sensor_0/Depth_0/image/data"].stream_id == 1002
+        assert streams["/device_0/sensor_2/Accel_0/imu/data"].stream_id == 1003
+        assert streams["/device_0/sensor_2/Gyro_0/imu/data"].stream_id == 1004
+        assert streams["/device_0/sensor_0/Depth_0/tf/0"].stream_id == 1005
+        assert streams["/device_0/sensor_1/Color_0/tf/0"].stream_id == 1006
+        assert streams["/device_0/info"].stream_id == 2001
+        assert streams["/device_0/sensor_1/info"].stream_id == 2003
+        assert streams["/device_0/option"].stream_id == 2005
+        assert streams["/device_0/sensor_0/Depth_0/image/metadata"].stream_id == 3002
+
+    def test_infrared_streams(self) -> None:
+        """Test that both infrared streams and their extrinsics are found."""
+        streams = {s.topic: s for s in discover_streams(_device_topics(0))}
+
+        ir1 = streams["/device_0/sensor_0/Infrared_1/image/data"]
+        ir2 = streams["/device_0/sensor_0/Infrared_2/image/data"]
+        assert (ir1.stream_id, ir1.stream_type, ir1.name) == (1007, "infrared", "Infrared1")
+        assert (ir2.stream_id, ir2.name) == (1008, "Infrared2")
+        tf = streams["/device_0/sensor_0/Infrared_1/tf/0"]
+        assert (tf.stream_id, tf.stream_type) == (1009, "transform_infrared")
+
+    def test_multi_device_ids_are_stable(self) -> None:
+        """Test that each device adds 100 to the IDs, independent of topic order."""
+        topics = _device_topics(0) + _device_topics(1) + _device_topics(3)
+        streams = discover_streams(topics)
+        reversed_streams = discover_streams(list(reversed(topics)))
+
+        assert streams == reversed_streams
+        ids = [s.stream_id for s in streams]
+        assert len(ids) == len(set(ids))
+        by_topic = {s.topic: s for s in streams}
+        color = by_topic["/device_1/sensor_1/Color_0/image/data"]
+        assert (color.stream_id, color.name) == (1101, "Device1_Color")
+        assert by_topic["/device_3/option"].stream_id == 2305
+        assert by_topic["/device_3/sensor_2/Gyro_0/imu/data"].recordable_type_id == "MotionSensor"
+
+    def test_device_index_out_of_range(self) -> None:
+        """Test that device indices whose IDs would overlap the next range are rejected."""
+        assert discover_streams(_device_topics(MAX_DEVICES - 1))
+        with pytest.raises(ValueError, match="device_10"):
+            discover_streams(_device_topics(MAX_DEVICES))
+
+    def test_unknown_topics_are_ignored(self) -> None:
+        """Test that unknown streams and non-stream topics produce no streams."""
+        topics = [
+            "/file_version",
+            "/device_0/sensor_0/Confidence_0/image/data",
+            "/device_0/sensor_2/Accel_0/tf/0",
+            "/device_0/sensor_0/Depth_0/info/camera_info",
+        ]
+        assert discover_streams(topics) == []
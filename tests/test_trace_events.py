@@ -0,0 +1,112 @@
+"""Tests for Chrome trace_event span export."""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from scripts.rosbag_to_vrs_converter import RosbagToVRSConverter, create_rgbd_config
+from scripts.trace_events import NullTracer, Tracer, get_tracer, start_tracing, stop_tracing
+
+
+@pytest.fixture
+def tracer() -> Iterator[Tracer]:
+    """Process-wide tracer, disabled again after the test"""
+    yield start_tracing(sample_every=1)
+    stop_tracing()
+
+
+class TestTracer:
+    """Test cases for Tracer."""
+
+    def test_invalid_sample_every(self) -> None:
+        """Test that a non-positive sampling interval is rejected."""
+        with pytest.raises(ValueError):
+            Tracer(sample_every=0)
+
+    def test_span_event(self) -> None:
+        """Test that a span becomes a complete event with JSON-safe args."""
+        tracer = Tracer()
+
+        with tracer.span("open_bag", path=Path("input.bag")):
+            pass
+
+        event = tracer.events[0]
+        assert event["name"] == "open_bag"
+        assert event["ph"] == "X"
+        assert event["dur"] >= 0
+        assert event["args"] == {"path": "input.bag"}
+
+    def test_span_recorded_on_exception(self) -> None:
+        """Test that a span is recorded even if the enclosed code fails."""
+        tracer = Tracer()
+
+        with pytest.raises(RuntimeError):
+            with tracer.span("close"):
+                raise RuntimeError("boom")
+
+        assert [event["name"] for event in tracer.events] == ["close"]
+
+    def test_sampled_span(self) -> None:
+        """Test that every Nth sampled span is recorded and all calls are counted."""
+        tracer = Tracer(sample_every=10)
+
+        for _ in range(25):
+            with tracer.sampled_span("deserialize"):
+                pass
+
+        assert len(tracer.events) == 3
+        assert tracer.span_counts == {"deserialize": 25}
+        assert tracer.events[0]["args"] == {"sample_every": 10}
+
+    def test_write(self, tmp_path: Path) -> None:
+        """Test that the trace file is a Chrome trace_event document."""
+        tracer = Tracer(sample_every=1)
+        with tracer.span("convert"):
+            with tracer.sampled_span("write_record", "write"):
+                pass
+        path = tmp_path / "trace.json"
+
+        tracer.write(path)
+
+        document = json.loads(path.read_text())
+        names = [event["name"] for event in document["traceEvents"]]
+        assert names == ["thread_name", "write_record", "convert"]
+        assert document["otherData"]["span_counts"] == {"write_record": 1}
+
+
+class TestProcessTracer:
+    """Test cases for start_tracing() / stop_tracing()."""
+
+    def test_disabled_by_default(self) -> None:
+        """Test that tracing is off unless started."""
+        assert isinstance(get_tracer(), NullTracer)
+        assert stop_tracing() is None
+
+    def test_start_and_stop(self, tmp_path: Path) -> None:
+        """Test that stop_tracing() writes the trace and disables tracing."""
+        tracer = start_tracing()
+        assert get_tracer() is tracer
+        with get_tracer().span("convert"):
+            pass
+        path = tmp_path / "trace.json"
+
+        assert stop_tracing(path) is tracer
+        assert isinstance(get_tracer(), NullTracer)
+        assert path.exists()
+
+    def test_converter_spans(
+        self, tracer: Tracer, synthetic_rosbag_path: Path, tmp_path: Path
+    ) -> None:
+        """Test that the converter traces opening the bag and its stages."""
+        converter = RosbagToVRSConverter(
+            synthetic_rosbag_path, tmp_path / "out.vrs", create_rgbd_config()
+        )
+
+        reader = converter._open_rosbag()
+        with converter._stage("cache_info"):
+            converter._cache_camera_info(reader)
+
+        assert [event["name"] for event in tracer.events] == ["open_bag", "cache_info"]
+        assert len(converter._stats["camera_info_cache"]) == 2
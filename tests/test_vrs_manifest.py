@@ -0,0 +1,87 @@
+"""Tests for the chunked VRS output manifest."""
+
+from pathlib import Path
+
+import pytest
+
+from scripts.vrs_manifest import (
+    get_chunk_path,
+    get_chunk_paths,
+    get_manifest_path,
+    is_manifest,
+    merge_chunked_recordings,
+    read_manifest,
+    write_manifest,
+)
+
+
+class TestVRSManifest:
+    """Test cases for manifest paths and persistence."""
+
+    def test_paths(self, tmp_path: Path) -> None:
+        """Test chunk and manifest naming next to the logical output path."""
+        vrs_path = tmp_path / "output.vrs"
+
+        assert get_chunk_path(vrs_path, 0) == tmp_path / "output_000.vrs"
+        assert get_chunk_path(vrs_path, 12) == tmp_path / "output_012.vrs"
+        assert get_manifest_path(vrs_path) == tmp_path / "output.manifest.json"
+        assert is_manifest(get_manifest_path(vrs_path))
+        assert not is_manifest(vrs_path)
+
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        """Test that written chunk entries are read back in order."""
+        manifest_path = tmp_path / "output.manifest.json"
+        chunks = [
+            {"path": "output_000.vrs", "start_timestamp": 0.0, "end_timestamp": 9.9,
+             "record_count": 300, "payload_bytes": 1000},
+            {"path": "output_001.vrs", "start_timestamp": 10.0, "end_timestamp": 12.5,
+             "record_count": 75, "payload_bytes": 250},
+        ]
+
+        write_manifest(manifest_path, chunks)
+
+        assert read_manifest(manifest_path)["chunks"] == chunks
+        assert get_chunk_paths(manifest_path) == [
+            tmp_path / "output_000.vrs",
+            tmp_path / "output_001.vrs",
+        ]
+        assert not (tmp_path / "output.manifest.json.tmp").exists()
+
+    def test_invalid_manifest(self, tmp_path: Path) -> None:
+        """Test that files that are not manifests are rejected."""
+        not_json = tmp_path / "a.manifest.json"
+        not_json.write_text("not json")
+        other_json = tmp_path / "b.manifest.json"
+        other_json.write_text('{"format": "something-else"}')
+
+        with pytest.raises(ValueError):
+            read_manifest(not_json)
+        with pytest.raises(ValueError):
+            read_manifest(other_json)
+
+    def test_merge_chunked_recordings(self, tmp_path: Path) -> None:
+        """Test that part chunks are renamed in order and empty chunks are dropped."""
+        parts_dir = tmp_path / ".output.parts"
+        parts_dir.mkdir()
+        part_paths = [parts_dir / "part_000.vrs", parts_dir / "part_001.vrs"]
+        for part_index, (part_path, record_counts) in enumerate(zip(part_paths, [[3, 2], [0, 4]])):
+            chunks = []
+            for i, record_count in enumerate(record_counts):
+                chunk_path = get_chunk_path(part_path, i)
+                chunk_path.write_bytes(bytes([part_index, i]))
+                start = float(part_index * 10 + i)
+                chunks.append({"path": chunk_path.name, "start_timestamp": start,
+                               "end_timestamp": start + 0.9, "record_count": record_count,
+                               "payload_bytes": 2})
+            write_manifest(get_manifest_path(part_path), chunks)
+
+        chunk_paths = merge_chunked_recordings(part_paths, tmp_path / "output.vrs")
+
+        assert chunk_paths == [tmp_path / f"output_00{i}.vrs" for i in range(3)]
+        assert [path.read_bytes() for path in chunk_paths] == [
+            b"\x00\x00", b"\x00\x01", b"\x01\x01"
+        ]
+        manifest = read_manifest(tmp_path / "output.manifest.json")
+        assert [chunk["path"] for chunk in manifest["chunks"]] == [p.name for p in chunk_paths]
+        assert [chunk["start_timestamp"] for chunk in manifest["chunks"]] == [0.0, 1.0, 11.0]
+        assert list(parts_dir.iterdir()) == []
@@ -100,3 +100,191 @@ def test_file_not_found() -> None:
 
     with pytest.raises((FileNotFoundError, ValueError, RuntimeError)):
         VRSReader("/nonexistent/path/to/file.vrs")
+
+
+def test_read_image_stream_records(tmp_path: Path) -> None:
+    """画像ストリームのDataレコードが型付き画像として読み込めること."""
+    import numpy as np
+
+    from scripts.vrs_reader import VRSReader
+    from scripts.vrs_writer import VRSWriter
+
+    frame = np.arange(4 * 2, dtype=np.uint16).reshape(2, 4)
+    vrs_file = tmp_path / "image.vrs"
+    with VRSWriter(vrs_file) as writer:
+        writer.add_image_stream(1002, "Depth", "GREY16", 4, 2)
+        writer.write_configuration(1002, {"width": 4, "height": 2, "encoding": "16UC1"})
+        writer.write_data(1002, 0.0, frame.tobytes())
+
+    with VRSReader(vrs_file) as reader:
+        records = list(reader.read_data_records(1002))
+        assert len(records) == 1
+        assert records[0]["data"] == frame.tobytes()
+        np.testing.assert_array_equal(records[0]["image"].reshape(2, 4), frame)
+
+
+def test_read_imu_samples(tmp_path: Path) -> None:
+    """バッチ化されたIMUレコードがサンプル配列として読み込めること."""
+    import numpy as np
+
+    from scripts.vrs_reader import VRSReader
+    from scripts.vrs_writer import VRSWriter
+
+    timestamps = np.arange(5) * 0.0025
+    samples = np.arange(15, dtype=np.float64).reshape(5, 3)
+    vrs_file = tmp_path / "imu.vrs"
+    with VRSWriter(vrs_file) as writer:
+        writer.add_motion_stream(1003, "Accel")
+        writer.write_configuration(1003, {"sensor_type": "accelerometer"})
+        writer.write_motion_samples(1003, timestamps[:3], samples[:3])
+        writer.write_motion_samples(1003, timestamps[3:], samples[3:])
+
+    with VRSReader(vrs_file) as reader:
+        records = list(reader.read_data_records(1003))
+        assert len(records) == 2
+        assert records[1]["timestamp"] == timestamps[3]
+        np.testing.assert_array_equal(records[0]["samples"], samples[:3])
+
+        read_timestamps, read_samples = reader.read_imu_samples(1003)
+        np.testing.assert_allclose(read_timestamps, timestamps)
+        np.testing.assert_array_equal(read_samples, samples)
+
+
+def test_read_encoded_depth_records(tmp_path: Path) -> None:
+    """深度コーデックで符号化されたフレームが透過的に復号されること."""
+    import numpy as np
+
+    from scripts.depth_codec import encode_depth
+    from scripts.vrs_reader import VRSReader
+    from scripts.vrs_writer import VRSWriter
+
+    frame = np.arange(4 * 2, dtype=np.uint16).reshape(2, 4) * 1000
+    vrs_file = tmp_path / "depth.vrs"
+    with VRSWriter(vrs_file) as writer:
+        writer.add_stream(1002, "Depth")
+        writer.write_configuration(
+            1002, {"width": 4, "height": 2, "encoding": "16UC1", "depth_codec": "delta_zstd"}
+        )
+        writer.write_data(1002, 0.0, encode_depth(frame, "delta_zstd"))
+
+    with VRSReader(vrs_file) as reader:
+        records = list(reader.read_data_records(1002))
+        assert len(records) == 1
+        assert records[0]["data"] == frame.tobytes()
+        np.testing.assert_array_equal(records[0]["image"], frame)
+
+
+def test_read_png_image_stream_records(tmp_path: Path) -> None:
+    """PNG圧縮画像ストリームがpyvrsにより画素配列へ復号されること."""
+    import numpy as np
+
+    from scripts.image_codec import encode_image
+    from scripts.vrs_reader import VRSReader
+    from scripts.vrs_writer import VRSWriter
+
+    frame = np.arange(4 * 2 * 3, dtype=np.uint8).reshape(2, 4, 3)
+    vrs_file = tmp_path / "png.vrs"
+    with VRSWriter(vrs_file) as writer:
+        writer.add_image_stream(1001, "Color", "RGB8", 4, 2, image_codec="png")
+        writer.write_configuration(1001, {"width": 4, "height": 2, "image_codec": "png"})
+        writer.write_data(1001, 0.0, encode_image(frame, "png"))
+
+    with VRSReader(vrs_file) as reader:
+        records = list(reader.read_data_records(1001))
+        assert len(records) == 1
+        np.testing.assert_array_equal(records[0]["image"].reshape(2, 4, 3), frame)
+
+
+def test_random_access_temporal_depth_records(tmp_path: Path) -> None:
+    """temporal_zstdの深度フレームをキーフレームから任意の順序で復元できること."""
+    import numpy as np
+
+    from scripts.depth_codec import TemporalDepthEncoder
+    from scripts.vrs_reader import VRSReader
+    from scripts.vrs_writer import VRSWriter
+
+    frames = [np.full((2, 4), 1000 + i, dtype=np.uint16) for i in range(7)]
+    encoder = TemporalDepthEncoder(keyframe_interval=3)
+    vrs_file = tmp_path / "temporal.vrs"
+    with VRSWriter(vrs_file) as writer:
+        writer.add_stream(1002, "Depth")
+        writer.write_configuration(
+            1002, {"width": 4, "height": 2, "depth_codec": "temporal_zstd"}
+        )
+        for i, frame in enumerate(frames):
+            writer.write_data(1002, i * 0.033, encoder.encode(frame))
+
+    with VRSReader(vrs_file, keyframe_cache_size=1) as reader:
+        for index in (5, 1, 6, 0, 3):
+            record = reader.read_data_record(1002, index)
+            np.testing.assert_array_equal(record["image"], frames[index])
+
+        sequential = [record["image"] for record in reader.read_data_records(1002)]
+        np.testing.assert_array_equal(np.stack(sequential), np.stack(frames))
+
+
+def test_read_chunked_manifest(tmp_path: Path) -> None:
+    """マニフェストを1つの論理ファイルとして読み込めること."""
+    from scripts.vrs_reader import VRSReader
+    from scripts.vrs_writer import ChunkedVRSWriter
+
+    with ChunkedVRSWriter(tmp_path / "out.vrs", chunk_duration_sec=1.0) as writer:
+        writer.add_stream(1001, "Stream")
+        writer.write_configuration(1001, {"test": "config"})
+        for i in range(5):
+            writer.write_data(1001, i * 0.5, bytes([i]))
+
+    with VRSReader(writer.manifest_path) as reader:
+        assert reader.get_stream_ids() == [1001]
+        assert reader.read_configuration(1001) == {"test": "config"}
+        assert reader.get_record_count(1001) == 5
+        records = list(reader.read_data_records(1001))
+        assert [record["data"] for record in records] == [bytes([i]) for i in range(5)]
+        assert reader.read_data_record(1001, 3)["data"] == bytes([3])
+
+
+def test_read_summary_tags(tmp_path: Path) -> None:
+    """ファイルタグとストリーム統計タグをレコードを読まずに取得できること."""
+    from scripts.vrs_reader import VRSReader
+    from scripts.vrs_writer import VRSWriter
+
+    vrs_file = tmp_path / "tags.vrs"
+    with VRSWriter(vrs_file) as writer:
+        writer.add_stream(1001, "Stream")
+        writer.set_file_tag("realsense_vrs.source_path", "input.bag")
+        for i in range(3):
+            writer.write_data(1001, i * 0.1, b"data")
+
+    with VRSReader(vrs_file) as reader:
+        assert reader.get_file_tags()["realsense_vrs.source_path"] == "input.bag"
+        stats = reader.get_stream_stats(1001)
+        assert stats is not None
+        assert stats.record_count == 3
+        assert stats.payload_bytes == 12
+        assert stats.last_timestamp == pytest.approx(0.2)
+        assert reader.get_record_count(1001) == 3
+
+
+def test_read_time_series(tmp_path: Path) -> None:
+    """列形式のオプション/メタデータレコードを列ごとの時系列として読めること."""
+    from scripts.time_series import encode_time_series
+    from scripts.vrs_reader import VRSReader
+    from scripts.vrs_writer import VRSWriter
+
+    vrs_file = tmp_path / "metadata.vrs"
+    with VRSWriter(vrs_file) as writer:
+        writer.add_stream(3001, "Color_Metadata")
+        writer.write_configuration(3001, {"info_type": "metadata"})
+        writer.write_data(
+            3001, 0.0, encode_time_series([0.0, 0.033], {"Frame Counter": [1, 2]})
+        )
+        writer.write_data(
+            3001, 0.066, encode_time_series([0.066], {"Frame Counter": [3], "Gain Level": [16]})
+        )
+
+    with VRSReader(vrs_file) as reader:
+        series = reader.read_time_series(3001)
+        timestamps, values = series["Frame Counter"]
+        assert list(timestamps) == pytest.approx([0.0, 0.033, 0.066])
+        assert list(values) == [1.0, 2.0, 3.0]
+        assert list(series["Gain Level"][1]) == [16.0]
@@ -0,0 +1,97 @@
+"""Tests for VRS summary statistics tags."""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from scripts.vrs_summary import (
+    CONVERTER_VERSION_TAG,
+    SOURCE_PATH_TAG,
+    SOURCE_SHA256_TAG,
+    SOURCE_SIZE_TAG,
+    STREAM_STATS_TAG,
+    StreamStats,
+    get_source_tags,
+    merge_stream_stats,
+    parse_stream_stats,
+)
+
+
+class TestStreamStats:
+    """Test cases for running stream statistics."""
+
+    def test_update(self) -> None:
+        """Test count, time range, bytes and gaps after several records."""
+        stats = StreamStats()
+        for timestamp in (1.0, 1.1, 1.3, 1.35):
+            stats.update(timestamp, 100)
+
+        assert stats.record_count == 4
+        assert stats.first_timestamp == 1.0
+        assert stats.last_timestamp == 1.35
+        assert stats.payload_bytes == 400
+        assert stats.min_gap == pytest.approx(0.05)
+        assert stats.max_gap == pytest.approx(0.2)
+        assert stats.duration == pytest.approx(0.35)
+
+    def test_empty(self) -> None:
+        """Test that an empty stream has no time range or gaps."""
+        stats = StreamStats()
+        assert stats.duration == 0.0
+        assert stats.min_gap is None
+
+    def test_tag_roundtrip(self) -> None:
+        """Test serialization to and from a stream tag."""
+        stats = StreamStats()
+        stats.update(0.5, 10)
+        stats.update(1.0, 20)
+
+        assert StreamStats.from_tag(stats.to_tag()) == stats
+        assert parse_stream_stats({STREAM_STATS_TAG: stats.to_tag()}) == stats
+
+    def test_parse_missing_or_invalid(self) -> None:
+        """Test that files without (valid) stats tags yield None."""
+        assert parse_stream_stats({}) is None
+        assert parse_stream_stats({STREAM_STATS_TAG: "not json"}) is None
+        assert parse_stream_stats({STREAM_STATS_TAG: '{"unknown": 1}'}) is None
+
+    def test_merge_includes_chunk_boundary_gap(self) -> None:
+        """Test merging per-chunk statistics of one stream."""
+        first, empty, second = StreamStats(), StreamStats(), StreamStats()
+        for timestamp in (0.0, 0.1, 0.2):
+            first.update(timestamp, 1)
+        for timestamp in (0.7, 0.75):
+            second.update(timestamp, 2)
+
+        merged = merge_stream_stats([first, empty, second])
+
+        assert merged.record_count == 5
+        assert merged.first_timestamp == 0.0
+        assert merged.last_timestamp == 0.75
+        assert merged.payload_bytes == 7
+        assert merged.min_gap == pytest.approx(0.05)
+        assert merged.max_gap == pytest.approx(0.5)
+
+
+class TestSourceTags:
+    """Test cases for source bag file tags."""
+
+    def test_source_tags(self, tmp_path: Path) -> None:
+        """Test path, size, hash and converter version tags."""
+        bag = tmp_path / "input.bag"
+        bag.write_bytes(b"rosbag" * 1000)
+
+        tags = get_source_tags(bag, "1.2.3")
+
+        assert tags[SOURCE_PATH_TAG] == str(bag)
+        assert tags[SOURCE_SIZE_TAG] == "6000"
+        assert tags[SOURCE_SHA256_TAG] == hashlib.sha256(b"rosbag" * 1000).hexdigest()
+        assert tags[CONVERTER_VERSION_TAG] == "1.2.3"
+
+    def test_source_tags_without_hash(self, tmp_path: Path) -> None:
+        """Test that hashing can be skipped."""
+        bag = tmp_path / "input.bag"
+        bag.write_bytes(b"rosbag")
+
+        assert SOURCE_SHA256_TAG not in get_source_tags(bag, "1.2.3", compute_hash=False)
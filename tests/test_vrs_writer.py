@@ -121,3 +121,225 @@ def test_write_data_before_adding_stream(tmp_path: Path) -> None:
         # ストリーム追加なしでデータ書き込み
         with pytest.raises((ValueError, RuntimeError)):
             writer.write_data(1001, 0.0, b"data")
+
+
+def test_add_image_stream(tmp_path: Path) -> None:
+    """画像ストリームを追加してフレームを書き込めること."""
+    from scripts.vrs_writer import VRSWriter
+
+    vrs_file = tmp_path / "test.vrs"
+    with VRSWriter(vrs_file) as writer:
+        writer.add_image_stream(1001, "Color", "RGB8", 4, 2)
+        writer.write_data(1001, 0.0, bytes(4 * 2 * 3))
+
+
+def test_image_stream_stats(tmp_path: Path) -> None:
+    """画像ストリームへの書き込みでストリーム統計が更新されること."""
+    from scripts.vrs_writer import VRSWriter
+
+    with VRSWriter(tmp_path / "image_stats.vrs") as writer:
+        writer.add_image_stream(1001, "Color", "RGB8", 4, 2)
+        writer.add_image_stream(1002, "Color PNG", "RGB8", 4, 2, image_codec="png")
+        writer.write_data(1001, 0.0, bytes(4 * 2 * 3))
+        writer.write_data(1001, 0.1, bytes(4 * 2 * 3))
+        writer.write_data(1002, 0.0, b"png")
+
+        stats = writer.get_stream_stats(1001)
+        assert stats.record_count == 2
+        assert stats.payload_bytes == 2 * 4 * 2 * 3
+        assert writer.get_stream_stats(1002).record_count == 1
+
+
+def test_image_stream_rejects_wrong_frame_size(tmp_path: Path) -> None:
+    """画像ストリームにサイズの異なるフレームを書き込むとエラーになること."""
+    from scripts.vrs_writer import VRSWriter
+
+    vrs_file = tmp_path / "test.vrs"
+    with VRSWriter(vrs_file) as writer:
+        writer.add_image_stream(1002, "Depth", "GREY16", 4, 2)
+        with pytest.raises(ValueError):
+            writer.write_data(1002, 0.0, bytes(4 * 2))
+
+
+def test_add_image_stream_invalid_pixel_format(tmp_path: Path) -> None:
+    """未対応のPixelFormatでエラーが発生すること."""
+    from scripts.vrs_writer import VRSWriter
+
+    vrs_file = tmp_path / "test.vrs"
+    with VRSWriter(vrs_file) as writer:
+        with pytest.raises(ValueError):
+            writer.add_image_stream(1001, "Color", "YUV", 4, 2)
+
+
+def test_write_motion_samples(tmp_path: Path) -> None:
+    """IMUストリームに複数サンプルを1レコードとして書き込めること."""
+    from scripts.vrs_writer import VRSWriter
+
+    vrs_file = tmp_path / "test.vrs"
+    with VRSWriter(vrs_file) as writer:
+        writer.add_motion_stream(1003, "Accel")
+        writer.write_motion_samples(1003, [0.0, 0.0025], [(0.1, 0.2, 9.8), (0.1, 0.3, 9.7)])
+
+
+def test_motion_stream_rejects_invalid_batch(tmp_path: Path) -> None:
+    """IMUストリームへの不正な書き込みでエラーが発生すること."""
+    from scripts.vrs_writer import VRSWriter
+
+    vrs_file = tmp_path / "test.vrs"
+    with VRSWriter(vrs_file) as writer:
+        writer.add_motion_stream(1003, "Accel")
+        # timestampsとsamplesの長さが異なる
+        with pytest.raises(ValueError):
+            writer.write_motion_samples(1003, [0.0], [(0.1, 0.2, 9.8), (0.1, 0.3, 9.7)])
+        # 3軸でないサンプル
+        with pytest.raises(ValueError):
+            writer.write_motion_samples(1003, [0.0], [(0.1, 0.2)])
+        # バイト列のデータ書き込みは不可
+        with pytest.raises(ValueError):
+            writer.write_data(1003, 0.0, b"data")
+
+
+def test_chunked_writer_splits_by_duration(tmp_path: Path) -> None:
+    """時間でチャンク分割され、各チャンクに設定が繰り返し書かれること."""
+    from scripts.vrs_manifest import read_manifest
+    from scripts.vrs_writer import ChunkedVRSWriter
+
+    vrs_file = tmp_path / "out.vrs"
+    with ChunkedVRSWriter(vrs_file, chunk_duration_sec=1.0) as writer:
+        writer.add_stream(1001, "Stream")
+        writer.write_configuration(1001, {"test": "config"})
+        for i in range(5):
+            writer.write_data(1001, i * 0.5, b"data")
+
+    assert writer.chunk_paths == [tmp_path / f"out_00{i}.vrs" for i in range(3)]
+    assert all(path.exists() for path in writer.chunk_paths)
+
+    chunks = read_manifest(tmp_path / "out.manifest.json")["chunks"]
+    assert [chunk["record_count"] for chunk in chunks] == [2, 2, 1]
+    assert chunks[1]["start_timestamp"] == 1.0
+
+
+def test_chunked_writer_splits_by_size(tmp_path: Path) -> None:
+    """ペイロードサイズでチャンク分割されること."""
+    from scripts.vrs_writer import ChunkedVRSWriter
+
+    vrs_file = tmp_path / "out.vrs"
+    with ChunkedVRSWriter(vrs_file, chunk_size_bytes=8) as writer:
+        writer.add_stream(1001, "Stream")
+        for i in range(4):
+            writer.write_data(1001, float(i), b"data")
+
+    assert len(writer.chunk_paths) == 2
+
+
+def test_chunked_writer_resumes_after_completed_chunks(tmp_path: Path) -> None:
+    """中断した変換の完了済みチャンクの次から書き込みを再開できること."""
+    from scripts.vrs_manifest import read_manifest
+    from scripts.vrs_writer import ChunkedVRSWriter
+
+    vrs_file = tmp_path / "out.vrs"
+    with ChunkedVRSWriter(vrs_file, chunk_duration_sec=1.0) as writer:
+        writer.add_stream(1001, "Stream")
+        for i in range(3):
+            writer.write_data(1001, i * 0.5, b"data")
+        completed_chunks = writer.completed_chunks
+        completed_stream_stats = writer.completed_stream_stats
+
+    with ChunkedVRSWriter(
+        vrs_file,
+        chunk_duration_sec=1.0,
+        completed_chunks=completed_chunks,
+        completed_stream_stats=completed_stream_stats,
+    ) as writer:
+        writer.add_stream(1001, "Stream")
+        writer.write_data(1001, 1.0, b"data")
+        assert writer.get_stream_stats(1001).record_count == 3
+
+    assert writer.chunk_paths == [tmp_path / "out_000.vrs", tmp_path / "out_001.vrs"]
+    chunks = read_manifest(tmp_path / "out.manifest.json")["chunks"]
+    assert [chunk["record_count"] for chunk in chunks] == [2, 1]
+
+
+def test_chunked_writer_close_can_be_retried(tmp_path: Path) -> None:
+    """最後のチャンクのクローズに失敗しても、書き込み中のまま再度クローズできること."""
+    from scripts.vrs_manifest import read_manifest
+    from scripts.vrs_writer import ChunkedVRSWriter
+
+    vrs_file = tmp_path / "out.vrs"
+    writer = ChunkedVRSWriter(vrs_file, chunk_duration_sec=1.0)
+    writer.add_stream(1001, "Stream")
+    writer.write_data(1001, 0.0, b"data")
+
+    chunk_writer = writer._writer
+    assert chunk_writer is not None
+    close_chunk = chunk_writer.close
+
+    def failing_close() -> None:
+        raise RuntimeError("disk full")
+
+    chunk_writer.close = failing_close  # type: ignore[method-assign]
+    with pytest.raises(RuntimeError, match="disk full"):
+        writer.close()
+    assert writer.is_open()
+
+    chunk_writer.close = close_chunk  # type: ignore[method-assign]
+    writer.close()
+    assert not writer.is_open()
+    assert [chunk["record_count"] for chunk in read_manifest(writer.manifest_path)["chunks"]] == [1]
+
+
+def test_stream_stats(tmp_path: Path) -> None:
+    """書き込み中にストリームごとの統計が更新されること."""
+    from scripts.vrs_writer import VRSWriter
+
+    with VRSWriter(tmp_path / "stats.vrs") as writer:
+        writer.add_stream(1001, "Stream")
+        writer.write_data(1001, 0.0, b"abcd")
+        writer.write_data(1001, 0.5, b"ef")
+        writer.set_file_tag("source", "input.bag")
+
+        stats = writer.get_stream_stats(1001)
+        assert stats.record_count == 2
+        assert stats.payload_bytes == 6
+        assert stats.min_gap == 0.5
+
+        with pytest.raises(ValueError):
+            writer.get_stream_stats(9999)
+
+
+def test_durable_writer_and_recover(tmp_path: Path) -> None:
+    """耐久モードで書いたファイルを復旧できること."""
+    from scripts.vrs_reader import VRSReader
+    from scripts.vrs_writer import VRSWriter, recover_vrs_file
+
+    vrs_file = tmp_path / "durable.vrs"
+    with VRSWriter(vrs_file, flush_interval_sec=0.1) as writer:
+        assert writer.durable
+        writer.add_stream(1001, "Stream")
+        writer.set_file_tag("source", "input.bag")
+        writer.write_configuration(1001, {"test": "config"})
+        for i in range(3):
+            writer.write_data(1001, i * 0.1, b"data")
+
+    recovered = recover_vrs_file(vrs_file)
+    assert recovered == tmp_path / "durable.recovered.vrs"
+
+    with VRSReader(recovered) as reader:
+        assert reader.read_configuration(1001) == {"test": "config"}
+        assert reader.get_record_count(1001) == 3
+
+
+def test_durable_writer_invalid_interval(tmp_path: Path) -> None:
+    """フラッシュ間隔が正でない場合はValueErrorが発生すること."""
+    from scripts.vrs_writer import VRSWriter
+
+    with pytest.raises(ValueError):
+        VRSWriter(tmp_path / "durable.vrs", flush_interval_sec=0)
+
+
+def test_recover_missing_file(tmp_path: Path) -> None:
+    """存在しないファイルの復旧はFileNotFoundErrorが発生すること."""
+    from scripts.vrs_writer import recover_vrs_file
+
+    with pytest.raises(FileNotFoundError):
+        recover_vrs_file(tmp_path / "missing.vrs")